@@ -110,10 +110,11 @@ export default function WorkQueuePage() {
       <DndContext sensors={sensors} collisionDetection={closestCenter} onDragEnd={handleDragEnd}>
         <SortableContext items={issues.map((i) => i.id)} strategy={verticalListSortingStrategy}>
           <div className="space-y-2">
-            {issues.map((issue) => (
+            {issues.map((issue, index) => (
               <SortableIssueCard
                 key={issue.id}
                 issue={issue}
+                position={index + 1}
                 onRemove={() => handleRemoveFromQueue(issue.id)}
                 onView={() => router.push(`/issues/${issue.id}`)}
               />
@@ -142,7 +143,7 @@ export default function WorkQueuePage() {
                     Next Issue to Work On
                   </CardTitle>
                   <CardDescription className="mt-1">
-                    Rank #{nextIssue.work_rank} • {nextIssue.type}
+                    Next in queue • {nextIssue.type}
                   </CardDescription>
                 </div>
                 <div className="flex gap-2">
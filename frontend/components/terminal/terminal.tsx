@@ -105,6 +105,8 @@ export function Terminal({ sessionId, onClose }: TerminalProps) {
     // Connect WebSocket
     const wsUrl = getTerminalWebSocketUrl(sessionId);
     const ws = new WebSocket(wsUrl);
+    // Output arrives as binary frames of raw PTY bytes
+    ws.binaryType = "arraybuffer";
 
     ws.onopen = () => {
       setIsConnected(true);
@@ -112,6 +114,10 @@ export function Terminal({ sessionId, onClose }: TerminalProps) {
     };
 
     ws.onmessage = (event) => {
+      if (event.data instanceof ArrayBuffer) {
+        term.write(new Uint8Array(event.data));
+        return;
+      }
       try {
         const data = JSON.parse(event.data);
         if (data.type === "output" && data.data) {
@@ -20,11 +20,12 @@ interface Issue {
 
 interface SortableIssueCardProps {
   issue: Issue;
+  position: number;
   onRemove: () => void;
   onView: () => void;
 }
 
-export function SortableIssueCard({ issue, onRemove, onView }: SortableIssueCardProps) {
+export function SortableIssueCard({ issue, position, onRemove, onView }: SortableIssueCardProps) {
   const {
     attributes,
     listeners,
@@ -54,10 +55,10 @@ export function SortableIssueCard({ issue, onRemove, onView }: SortableIssueCard
               <GripVertical className="h-5 w-5 text-muted-foreground" />
             </button>
 
-            {/* Rank Badge */}
+            {/* Queue position (work_rank is a sparse sort key) */}
             <div className="flex-shrink-0 mt-1">
               <Badge variant="outline" className="font-mono">
-                #{issue.work_rank}
+                #{position}
               </Badge>
             </div>
 
@@ -0,0 +1,25 @@
+-- Migration: Add deduplication fingerprint to job_postings
+-- Description: Persists the company|title|location fingerprint and the
+--              normalized company name used as a blocking key, so duplicate
+--              detection is an indexed lookup instead of a fuzzy table scan.
+--              Existing rows are filled in by
+--              JobDeduplicationService.backfill_fingerprints().
+-- Date: 2026-10-16
+
+ALTER TABLE job_postings
+ADD COLUMN IF NOT EXISTS fingerprint VARCHAR(64);
+
+ALTER TABLE job_postings
+ADD COLUMN IF NOT EXISTS company_key VARCHAR(255);
+
+COMMENT ON COLUMN job_postings.fingerprint IS
+'SHA256 of normalized company|title|location. Equal fingerprints are exact duplicates.';
+
+COMMENT ON COLUMN job_postings.company_key IS
+'Normalized company name. Candidate block for fuzzy duplicate matching.';
+
+CREATE INDEX IF NOT EXISTS idx_job_postings_fingerprint
+ON job_postings(fingerprint);
+
+CREATE INDEX IF NOT EXISTS idx_job_postings_company_key
+ON job_postings(company_key, created_at);
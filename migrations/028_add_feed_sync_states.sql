@@ -0,0 +1,18 @@
+-- Migration: Add feed_sync_states table
+-- Description: Stores the ETag and Last-Modified validators returned by RSS
+--              feeds (podcasts and literature), so refreshes can send
+--              conditional requests and skip feeds that answer 304.
+-- Date: 2026-10-16
+
+CREATE TABLE IF NOT EXISTS feed_sync_states (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    feed_url VARCHAR(2048) NOT NULL UNIQUE,
+    etag VARCHAR(512),
+    last_modified VARCHAR(128),
+    last_checked_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_feed_sync_states_feed_url
+ON feed_sync_states(feed_url);
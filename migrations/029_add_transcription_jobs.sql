@@ -0,0 +1,26 @@
+-- Migration: Add transcription_jobs table
+-- Description: Persistent queue for podcast transcription. Tracks status,
+--              attempts and errors per episode so batch runs report progress
+--              and interrupted runs can be resumed.
+-- Date: 2026-10-16
+
+CREATE TABLE IF NOT EXISTS transcription_jobs (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    episode_id UUID NOT NULL REFERENCES podcast_episodes(id) ON DELETE CASCADE,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    model_size VARCHAR(20) NOT NULL DEFAULT 'base',
+    language VARCHAR(10),
+    beam_size INTEGER NOT NULL DEFAULT 5,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error_message TEXT,
+    started_at TIMESTAMP WITH TIME ZONE,
+    completed_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_transcription_jobs_episode_id
+ON transcription_jobs(episode_id);
+
+CREATE INDEX IF NOT EXISTS idx_transcription_jobs_status
+ON transcription_jobs(status);
@@ -0,0 +1,18 @@
+-- Migration: Turn webhook_deliveries into a delivery outbox
+-- Description: Events are queued as pending deliveries and sent by a
+--              background dispatcher instead of inside the request.
+--              Adds opt-in batching per webhook and an index for the
+--              dispatcher's due-delivery scan.
+-- Date: 2026-10-16
+
+ALTER TABLE webhooks
+ADD COLUMN IF NOT EXISTS batch_events BOOLEAN NOT NULL DEFAULT false;
+
+-- Pending rows written before the outbox existed have no schedule yet
+UPDATE webhook_deliveries
+SET next_retry_at = created_at
+WHERE status = 'pending' AND next_retry_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_webhook_deliveries_due
+ON webhook_deliveries(next_retry_at)
+WHERE status IN ('pending', 'retrying');
@@ -0,0 +1,36 @@
+-- Migration: Full-text search over documents, issues and projects
+-- Description: Adds a generated, weighted tsvector column (title weighted
+--              above body) and a GIN index to each searchable table, so
+--              SearchService can rank matches with ts_rank_cd instead of
+--              scanning with ILIKE '%term%'.
+-- Date: 2026-10-16
+
+ALTER TABLE documents
+ADD COLUMN IF NOT EXISTS search_vector tsvector
+GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(content, '')), 'B')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_documents_search_vector
+ON documents USING GIN (search_vector);
+
+ALTER TABLE issues
+ADD COLUMN IF NOT EXISTS search_vector tsvector
+GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(description, '')), 'B')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_issues_search_vector
+ON issues USING GIN (search_vector);
+
+ALTER TABLE projects
+ADD COLUMN IF NOT EXISTS search_vector tsvector
+GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(description, '')), 'B')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_projects_search_vector
+ON projects USING GIN (search_vector);
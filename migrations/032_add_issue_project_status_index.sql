@@ -0,0 +1,9 @@
+-- Migration: Composite index for per-project issue status counts
+-- Description: Project statistics are computed with a single
+--              GROUP BY project_id, status aggregate. This index lets
+--              PostgreSQL answer it with an index-only scan instead of
+--              reading every issue row.
+-- Date: 2026-10-16
+
+CREATE INDEX IF NOT EXISTS idx_issues_project_status
+ON issues (project_id, status);
@@ -0,0 +1,15 @@
+-- Migration: Indexes for keyset pagination of issues and documents
+-- Description: List endpoints page with WHERE (created_at, id) < cursor
+--              (or (work_rank, id) > cursor for the work queue order)
+--              instead of OFFSET. These indexes match those orderings so
+--              each page is a short index range scan.
+-- Date: 2026-10-16
+
+CREATE INDEX IF NOT EXISTS idx_issues_created_at_id
+ON issues (created_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_issues_work_rank_id
+ON issues (work_rank, id);
+
+CREATE INDEX IF NOT EXISTS idx_documents_created_at_id
+ON documents (created_at, id);
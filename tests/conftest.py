@@ -8,7 +8,7 @@ import tempfile
 
 from httpx import AsyncClient
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -53,6 +53,38 @@ async def test_engine():
     await engine.dispose()
 
 
+@pytest.fixture
+async def sqlite_session_factory():
+    """Create in-memory SQLite databases holding only the given tables.
+
+    The full metadata can't be created on SQLite (it has PostgreSQL ARRAY
+    columns), so tests build just the tables they use, given as models or
+    Table objects:
+
+        factory = await sqlite_session_factory(Project, Issue)
+    """
+    engines = []
+
+    async def create(*tables) -> async_sessionmaker[AsyncSession]:
+        engine = create_async_engine(
+            TEST_DATABASE_URL,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+        engines.append(engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                Base.metadata.create_all,
+                tables=[getattr(table, "__table__", table) for table in tables],
+            )
+        return async_sessionmaker(engine, expire_on_commit=False)
+
+    yield create
+
+    for engine in engines:
+        await engine.dispose()
+
+
 @pytest.fixture
 async def test_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
     """Create test database session."""
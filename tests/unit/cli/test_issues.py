@@ -242,14 +242,14 @@ class TestIssueCLI:
     def test_search_issues_success(self, mock_get_service):
         """Test searching issues."""
         mock_service = AsyncMock()
-        mock_service.search_issues_by_title.return_value = [self.sample_issue]
+        mock_service.search_issues.return_value = [self.sample_issue]
         mock_get_service.return_value = mock_service
 
         result = self.runner.invoke(issues_group, ["search", "Sample"])
 
         assert result.exit_code == 0
         assert self.sample_issue.title in result.output
-        mock_service.search_issues_by_title.assert_called_once_with("Sample")
+        mock_service.search_issues.assert_called_once_with("Sample")
 
 
 class TestIssueCLIWorkflow:
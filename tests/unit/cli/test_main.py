@@ -2,11 +2,12 @@
 
 import os
 import tempfile
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from click.testing import CliRunner
 
 from turbo.cli.main import cli
+from turbo.core.schemas.search import SearchResponse
 
 
 class TestMainCLI:
@@ -333,32 +334,43 @@ class TestSearchCommand:
         """Set up test fixtures."""
         self.runner = CliRunner()
 
-    @patch("turbo.cli.commands.search.get_project_service")
-    @patch("turbo.cli.commands.search.get_issue_service")
-    @patch("turbo.cli.commands.search.get_document_service")
-    def test_search_all(
-        self, mock_doc_service, mock_issue_service, mock_project_service
-    ):
+    @patch("turbo.cli.commands.search.get_tag_service")
+    @patch("turbo.cli.commands.search.SearchService")
+    def test_search_all(self, mock_search_service, mock_tag_service):
         """Test searching across all entities."""
         # Mock search results
-        mock_project_service.return_value.search_projects_by_name.return_value = []
-        mock_issue_service.return_value.search_issues_by_title.return_value = []
-        mock_doc_service.return_value.search_documents.return_value = []
+        mock_search_service.return_value.search = AsyncMock(
+            return_value=SearchResponse(
+                query="test query", results=[], total=0, limit=20, offset=0
+            )
+        )
+        mock_tag_service.return_value.search_tags_by_name = AsyncMock(return_value=[])
 
         result = self.runner.invoke(cli, ["search", "test query"])
 
         assert result.exit_code == 0
-        assert "Search results" in result.output
+        assert "No results found" in result.output
+        mock_search_service.return_value.search.assert_awaited_once_with(
+            "test query", entity_types=None, limit=20
+        )
 
-    @patch("turbo.cli.commands.search.get_project_service")
-    def test_search_projects_only(self, mock_project_service):
+    @patch("turbo.cli.commands.search.get_tag_service")
+    @patch("turbo.cli.commands.search.SearchService")
+    def test_search_projects_only(self, mock_search_service, mock_tag_service):
         """Test searching projects only."""
-        mock_project_service.return_value.search_projects_by_name.return_value = []
+        mock_search_service.return_value.search = AsyncMock(
+            return_value=SearchResponse(
+                query="test query", results=[], total=0, limit=20, offset=0
+            )
+        )
 
         result = self.runner.invoke(cli, ["search", "test query", "--type", "projects"])
 
         assert result.exit_code == 0
-        mock_project_service.return_value.search_projects_by_name.assert_called_once()
+        mock_search_service.return_value.search.assert_awaited_once_with(
+            "test query", entity_types=["project"], limit=20
+        )
+        mock_tag_service.return_value.search_tags_by_name.assert_not_called()
 
 
 class TestCompletionCommand:
@@ -0,0 +1,84 @@
+"""Unit tests for the batch API endpoint."""
+
+import asyncio
+
+import httpx
+from fastapi import APIRouter, FastAPI
+
+from turbo.api.v1.endpoints import batch
+
+
+def _app() -> tuple[FastAPI, dict]:
+    """App with the batch route and a small counter resource."""
+    state = {"value": 0, "active": 0, "peak": 0}
+    router = APIRouter(prefix="/api/v1")
+    router.include_router(batch.router)
+
+    @router.get("/counter")
+    async def read_counter():
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.05)
+        state["active"] -= 1
+        return {"value": state["value"]}
+
+    @router.post("/counter")
+    async def add_counter(body: dict):
+        state["value"] += body["by"]
+        return {"value": state["value"]}
+
+    app = FastAPI()
+    app.include_router(router)
+    return app, state
+
+
+async def _post_batch(app: FastAPI, operations: list[dict]) -> list[dict]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post("/api/v1/batch", json={"operations": operations})
+    assert response.status_code == 200
+    return response.json()["results"]
+
+
+async def test_reads_run_concurrently_and_writes_in_order():
+    """Reads between writes run together and see the earlier writes."""
+    app, state = _app()
+
+    results = await _post_batch(
+        app,
+        [
+            {"id": "a", "path": "/counter"},
+            {"id": "b", "path": "/counter"},
+            {"id": "c", "method": "POST", "path": "/counter", "body": {"by": 2}},
+            {"id": "d", "path": "/counter"},
+            {"id": "e", "path": "/missing"},
+        ],
+    )
+
+    assert state["peak"] == 2
+    assert [(r["id"], r["status_code"]) for r in results] == [
+        ("a", 200),
+        ("b", 200),
+        ("c", 200),
+        ("d", 200),
+        ("e", 404),
+    ]
+    assert [r["body"].get("value") for r in results[:4]] == [0, 0, 2, 2]
+
+
+async def test_nested_batch_rejected():
+    """A batch cannot contain another batch, however its path is spelled."""
+    app, state = _app()
+    nested = {"operations": [{"method": "POST", "path": "/counter", "body": {"by": 1}}]}
+
+    results = await _post_batch(
+        app,
+        [
+            {"method": "POST", "path": path, "body": nested}
+            for path in ("/batch", "/%62atch", "/../v1/batch")
+        ],
+    )
+
+    assert [r["status_code"] for r in results] == [400, 400, 400]
+    assert results[1]["body"] == {"detail": "Nested batch requests are not allowed"}
+    assert state["value"] == 0
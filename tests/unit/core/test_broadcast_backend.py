@@ -0,0 +1,218 @@
+"""Unit tests for cross-process broadcast backends."""
+
+import asyncio
+import fcntl
+import json
+import threading
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from turbo.core.services.agent_activity import AgentActivityTracker, AgentStatus
+from turbo.core.services.broadcast_backend import (
+    BroadcastBackend,
+    PostgresBroadcastBackend,
+    UnixBroadcastBackend,
+)
+from turbo.core.services.websocket_manager import ConnectionManager
+from turbo.utils.config import WebSocketSettings
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent: list[str] = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data: str):
+        self.sent.append(data)
+
+    async def close(self, code: int = 1000):
+        pass
+
+
+class RecordingBackend(BroadcastBackend):
+    """Captures published messages instead of sending them anywhere."""
+
+    def __init__(self):
+        super().__init__()
+        self.published: list[tuple[str, dict]] = []
+
+    def publish(self, channel: str, data: dict) -> None:
+        self.published.append((channel, data))
+
+    async def _send(self, message: str) -> None:
+        pass
+
+    def deliver_to(self, peer: BroadcastBackend) -> None:
+        """Hand everything published so far to ``peer`` as a transport would."""
+        for channel, data in self.published:
+            peer._receive(json.dumps({"o": self.origin, "c": channel, "d": data}))
+        self.published.clear()
+
+
+async def _wait_for(condition, timeout: float = 2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+async def unix_pair(tmp_path):
+    """Two workers sharing a Unix socket relay hosted by the first."""
+    path = str(tmp_path / "broadcast.sock")
+    first, second = UnixBroadcastBackend(path), UnixBroadcastBackend(path)
+    await first.start()
+    await second.start()
+    yield first, second
+    await second.stop()
+    await first.stop()
+
+
+async def test_unix_relay_reaches_peer_sockets(unix_pair):
+    """A broadcast in one worker reaches sockets held by another, once."""
+    first, second = unix_pair
+    settings = WebSocketSettings()
+    sender, receiver = ConnectionManager(settings), ConnectionManager(settings)
+    sender.bind_backend(first)
+    receiver.bind_backend(second)
+    local, remote = FakeWebSocket(), FakeWebSocket()
+    await sender.connect(local, "issue", "1")
+    await receiver.connect(remote, "issue", "1")
+
+    await sender.send_comment_created("issue", "1", {"id": "c1"})
+
+    await _wait_for(lambda: remote.sent and local.sent)
+    assert remote.sent == local.sent
+    assert json.loads(remote.sent[0])["type"] == "comment_created"
+
+
+async def test_unix_relay_failover(unix_pair):
+    """When the hosting worker stops, a peer takes over the relay."""
+    first, second = unix_pair
+    received = []
+    second.subscribe("test:", lambda channel, data: received.append(data))
+
+    await first.stop()
+    third = UnixBroadcastBackend(first._path)
+    await _wait_for(lambda: second._writer is not None and second._relay is not None)
+    await third.start()
+    try:
+        third.publish("test:x", {"n": 1})
+        await _wait_for(lambda: received)
+        assert received == [{"n": 1}]
+    finally:
+        await third.stop()
+
+
+async def test_unix_relay_stop_ends_client_handlers(tmp_path):
+    """Stopping the relay cancels and awaits its connection handlers."""
+    backend = UnixBroadcastBackend(str(tmp_path / "broadcast.sock"))
+    await backend.start()
+    relay = backend._relay
+    await _wait_for(lambda: relay._handlers)
+    handlers = set(relay._handlers)
+
+    await relay.stop()
+
+    assert all(task.done() for task in handlers)
+    assert not relay._handlers
+    await backend.stop()
+
+
+async def test_relay_election_waits_off_the_event_loop(tmp_path):
+    """Waiting for another worker's election lock does not block the loop."""
+    path = str(tmp_path / "broadcast.sock")
+    backend = UnixBroadcastBackend(path)
+
+    with open(f"{path}.lock", "w") as held:
+        fcntl.flock(held, fcntl.LOCK_EX)
+        # Released from a thread, so a loop blocked on the lock still recovers
+        release = threading.Timer(0.3, fcntl.flock, (held, fcntl.LOCK_UN))
+        release.start()
+        start = asyncio.create_task(backend.start())
+        started = time.monotonic()
+        await asyncio.sleep(0.05)
+        assert time.monotonic() - started < 0.25
+        assert not start.done()
+        release.join()
+    try:
+        await asyncio.wait_for(start, timeout=1)
+        assert backend._relay is not None
+    finally:
+        await backend.stop()
+
+
+def test_postgres_chunks_large_messages():
+    """Messages over the NOTIFY limit are chunked and reassembled."""
+    sender = PostgresBroadcastBackend("postgresql://localhost/turbo", "turbo")
+    receiver = PostgresBroadcastBackend("postgresql://localhost/turbo", "turbo")
+    received = []
+    receiver.subscribe("ws:", lambda channel, data: received.append((channel, data)))
+
+    data = {"payload": "x\"é" * 5000}
+    message = json.dumps({"o": sender.origin, "c": "ws:issue:1", "d": data})
+    notifications = sender._split(message)
+
+    assert len(notifications) > 1
+    assert all(len(n.encode()) < 8000 for n in notifications)
+    for notification in reversed(notifications):
+        receiver._on_notify(None, 0, "turbo", notification)
+    sender._on_notify(None, 0, "turbo", notifications[0])
+
+    assert received == [("issue:1", data)]
+
+
+async def test_concurrent_reconnects_share_one_connection():
+    """A reconnect waiting on another one reuses its connection."""
+
+    class CountingBackend(BroadcastBackend):
+        connects = 0
+
+        async def _connect(self) -> None:
+            await asyncio.sleep(0.01)
+            self.connects += 1
+
+        async def _send(self, message: str) -> None:
+            pass
+
+    backend = CountingBackend()
+
+    assert await asyncio.gather(backend._reconnect(), backend._reconnect()) == [True, True]
+    assert backend.connects == 1
+
+
+async def test_postgres_send_skips_when_reconnect_fails():
+    """A failed reconnect drops the message instead of using a missing connection."""
+    backend = PostgresBroadcastBackend("postgresql://localhost/turbo", "turbo")
+    backend._reconnect = AsyncMock(return_value=False)
+
+    await backend._send("{}")
+
+    backend._reconnect.assert_awaited_once()
+
+
+def test_tracker_state_replicates():
+    """Sessions started and finished in one worker appear in its peers."""
+    backend, peer_backend = RecordingBackend(), RecordingBackend()
+    tracker, peer = AgentActivityTracker(), AgentActivityTracker()
+    tracker.bind_backend(backend)
+    peer.bind_backend(peer_backend)
+
+    session_id = tracker.create_session("issue", "1", entity_title="Fix it")
+    tracker.update_status(session_id, AgentStatus.PROCESSING)
+    backend.deliver_to(peer_backend)
+
+    assert peer.get_session(session_id).status == AgentStatus.PROCESSING
+    assert peer.get_session(session_id).entity_title == "Fix it"
+
+    tracker.complete_session(session_id, input_tokens=10, output_tokens=5)
+    backend.deliver_to(peer_backend)
+
+    assert peer.get_all_active() == []
+    assert peer.get_recent()[0].input_tokens == 10
+    assert peer.get_stats()["total_tokens"] == 15
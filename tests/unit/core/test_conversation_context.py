@@ -0,0 +1,101 @@
+"""Unit tests for conversation context assembly."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+from turbo.core.models.project import Project
+from turbo.core.services.conversation_context import (
+    ContextBudget,
+    ConversationContextManager,
+    user_context_cache,
+)
+
+
+def _message(index: int, content: str = "hello") -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(), message_type="user", content=f"{content} {index}", created_at=None
+    )
+
+
+def _manager(messages: list, calls: list) -> ConversationContextManager:
+    """Context manager whose stages record their calls and take 0.1s each."""
+    manager = ConversationContextManager(
+        db=None, memory_service=None, graph_service=object()
+    )
+
+    def stage(name, result):
+        async def run(*args, **kwargs):
+            calls.append(name)
+            await asyncio.sleep(0.1)
+            return result
+
+        return run
+
+    manager._get_messages = stage("messages", messages)
+    manager._get_memories = stage("memories", [])
+    manager._get_user_context = stage(
+        "user_context", {"active_projects": [{"name": "Turbo"}], "active_issues": []}
+    )
+    manager._get_summary = stage("summary", None)
+    manager._get_related_entities = stage("graph", {"issues": [{"title": "Related"}]})
+    return manager
+
+
+async def test_independent_stages_run_concurrently():
+    """Both stage groups run in parallel: two rounds, not five stages."""
+    calls = []
+    manager = _manager([_message(i) for i in range(25)], calls)
+
+    started = time.monotonic()
+    context = await manager.build_context("staff", uuid4(), "What next?")
+
+    assert time.monotonic() - started < 0.35
+    assert set(calls) == {"messages", "memories", "user_context", "summary", "graph"}
+    assert len(context["recent_messages"]) == 5
+    assert context["related_entities"] == {"issues": [{"title": "Related"}]}
+    assert context["metadata"]["estimated_tokens"] > 0
+
+
+async def test_budget_skips_low_priority_fetches():
+    """Once recent messages fill the budget, summary and graph are not fetched."""
+    calls = []
+    manager = _manager([_message(i, "x" * 400) for i in range(25)], calls)
+
+    context = await manager.build_context(
+        "staff", uuid4(), "What next?", max_tokens=250
+    )
+
+    assert "summary" not in calls and "graph" not in calls
+    assert 0 < len(context["recent_messages"]) < 5
+    assert context["recent_messages"][-1]["content"].endswith(" 24")
+    assert context["user_context"] == {"active_projects": [], "active_issues": []}
+    assert context["metadata"]["estimated_tokens"] <= 250
+
+
+def test_budget_keeps_items_in_order():
+    """Trailing items are kept when trimming from the end."""
+    budget = ContextBudget(max_tokens=15)
+
+    assert budget.take_items(["a" * 20, "b" * 20], keep_last=True) == ["a" * 20, "b" * 20]
+    assert budget.exhausted is False
+    assert budget.take_items(["c" * 20, "d" * 4, "e" * 4], keep_last=True) == ["e" * 4]
+    assert budget.exhausted is True
+
+
+async def test_user_context_cache_invalidated_on_commit(sqlite_session_factory):
+    """Committing a watched model drops cached contexts; flushing alone does not."""
+    factory = await sqlite_session_factory(Project)
+
+    staff_id = uuid4()
+    user_context_cache.set(staff_id, {"active_projects": []}, user_context_cache.generation)
+    assert user_context_cache.get(staff_id) is not None
+
+    async with factory() as session:
+        session.add(Project(name="Turbo", project_key="TURBO", description="Project", status="active"))
+        await session.flush()
+        assert user_context_cache.get(staff_id) is not None
+        await session.commit()
+
+    assert user_context_cache.get(staff_id) is None
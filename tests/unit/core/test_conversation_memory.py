@@ -0,0 +1,186 @@
+"""Unit tests for memory retrieval scoring and deferred access updates."""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from turbo.core.services import conversation_memory
+from turbo.core.services.conversation_memory import (
+    ConversationMemoryService,
+    MemoryAccessBuffer,
+    MemoryMatrixCache,
+    cosine_similarity,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_embedding_model():
+    """Keep the service from loading a real sentence transformer."""
+    with patch.object(conversation_memory, "get_embedding_service", MagicMock()):
+        yield
+
+
+def _result(one=None, rows=None, scalars=None) -> MagicMock:
+    result = MagicMock()
+    result.one.return_value = one
+    result.all.return_value = rows
+    result.scalars.return_value.all.return_value = scalars
+    return result
+
+
+def _memories(count: int) -> list[SimpleNamespace]:
+    """Memories with random embeddings, importance and ages."""
+    rng = np.random.default_rng(7)
+    now = datetime.utcnow()
+    return [
+        SimpleNamespace(
+            id=uuid4(),
+            embedding=rng.normal(size=8).tolist(),
+            importance=float(rng.uniform(0.2, 1.0)),
+            # An hour past whole days, so age in days is unambiguous
+            first_mentioned_at=now - timedelta(days=int(rng.integers(0, 90)), hours=1),
+        )
+        for _ in range(count)
+    ]
+
+
+def _session_factory() -> tuple[MagicMock, AsyncMock]:
+    session = AsyncMock()
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=session)
+    factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    return factory, session
+
+
+async def test_matrix_is_cached_until_memories_change():
+    """The matrix is reloaded only when the probe signature changes."""
+    memories = _memories(3)
+    newest = max(m.first_mentioned_at for m in memories)
+    db = MagicMock()
+    db.execute = AsyncMock(
+        side_effect=[
+            _result(one=(3, newest)),
+            _result(rows=memories),
+            _result(one=(3, newest)),
+            _result(one=(4, newest)),
+            _result(rows=memories),
+        ]
+    )
+    cache = MemoryMatrixCache()
+    entity_id = uuid4()
+
+    first = await cache.get(db, "staff", entity_id)
+    assert await cache.get(db, "staff", entity_id) is first
+    reloaded = await cache.get(db, "staff", entity_id)
+
+    assert reloaded is not first
+    assert db.execute.await_count == 5
+    assert first.memory_ids == [m.id for m in memories]
+    np.testing.assert_allclose(np.linalg.norm(first.embeddings, axis=1), 1.0, rtol=1e-5)
+
+
+async def test_vectorized_scoring_ranks_like_per_memory_scoring():
+    """Matrix scoring selects and orders memories as the per-row formula does."""
+    memories = _memories(40)
+    query = np.random.default_rng(11).normal(size=8).tolist()
+    limit, min_relevance, decay_days = 5, 0.02, 30
+
+    expected = []
+    for memory in memories:
+        days_old = (datetime.utcnow() - memory.first_mentioned_at).days
+        relevance = (
+            cosine_similarity(query, memory.embedding)
+            * memory.importance
+            * np.exp(-days_old / decay_days)
+        )
+        if relevance >= min_relevance:
+            expected.append((memory.id, relevance))
+    expected.sort(key=lambda item: item[1], reverse=True)
+    assert len(expected) > limit
+
+    db = MagicMock()
+    db.execute = AsyncMock(
+        side_effect=[
+            _result(one=(40, None)),
+            _result(rows=memories),
+            _result(scalars=list(reversed(memories))),
+        ]
+    )
+    embedder = MagicMock(aembed=AsyncMock(return_value=query))
+    with (
+        patch.object(conversation_memory, "get_embedding_service", return_value=embedder),
+        patch.object(conversation_memory, "memory_matrix_cache", MemoryMatrixCache()),
+        patch.object(conversation_memory, "memory_access_buffer") as buffer,
+    ):
+        service = ConversationMemoryService(db)
+        relevant = await service.get_relevant_memories(
+            "staff",
+            uuid4(),
+            "query",
+            limit=limit,
+            min_relevance=min_relevance,
+            decay_days=decay_days,
+        )
+
+    assert [m.id for m in relevant] == [memory_id for memory_id, _ in expected[:limit]]
+    buffer.record.assert_called_once_with([m.id for m in relevant])
+
+
+async def test_access_buffer_flushes_pending_counts_on_stop():
+    """Stopping the buffer writes accumulated hits in one batch."""
+    factory, session = _session_factory()
+    buffer = MemoryAccessBuffer(max_pending=100, flush_interval=3600, session_factory=factory)
+    first, second = uuid4(), uuid4()
+
+    buffer.record([first])
+    buffer.record([first, second])
+    session.execute.assert_not_called()
+
+    await buffer.stop()
+
+    assert buffer.pending == 0
+    (_, params), _ = session.execute.call_args
+    assert {p["memory_id"]: p["hits"] for p in params} == {first: 2, second: 1}
+    session.commit.assert_awaited_once()
+
+
+async def test_access_buffer_flushes_periodically():
+    """A started buffer writes pending hits without waiting for new accesses."""
+    factory, session = _session_factory()
+    buffer = MemoryAccessBuffer(max_pending=100, flush_interval=0.01, session_factory=factory)
+    await buffer.start()
+    buffer.record([uuid4()])
+
+    async def flushed():
+        while not session.commit.await_count:
+            await asyncio.sleep(0.01)
+
+    try:
+        await asyncio.wait_for(flushed(), timeout=1)
+    finally:
+        await buffer.stop()
+    assert buffer.pending == 0
+
+
+async def test_access_buffer_keeps_counts_when_flush_fails():
+    """A failed write leaves the hits pending for the next flush."""
+    factory, session = _session_factory()
+    session.execute.side_effect = RuntimeError("database unavailable")
+    buffer = MemoryAccessBuffer(flush_interval=3600, session_factory=factory)
+    memory_id = uuid4()
+    buffer.record([memory_id, memory_id])
+
+    assert await buffer.flush() == 0
+
+    assert buffer.pending == 1
+    session.execute.side_effect = None
+    assert await buffer.flush() == 1
+    (_, params), _ = session.execute.call_args
+    assert params == [
+        {"memory_id": memory_id, "hits": 2, "accessed_at": params[0]["accessed_at"]}
+    ]
@@ -0,0 +1,146 @@
+"""Unit tests for streaming export and batched import."""
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from turbo.core.models.issue import Issue
+from turbo.core.models.project import Project
+from turbo.core.models.tag import Tag
+from turbo.core.services.data_exchange import DataExchangeService, export_columns
+from turbo.core.utils.data_formats import open_export_writer, read_import_records
+
+
+@pytest.fixture
+async def source_session(sqlite_session_factory):
+    """Workspace with two projects, three issues and a tag."""
+    factory = await sqlite_session_factory(Project, Issue, Tag)
+    async with factory() as session:
+        projects = [
+            Project(name=f"Project {i}", project_key=f"PRJ{i}", description="d")
+            for i in range(2)
+        ]
+        session.add_all(projects)
+        await session.flush()
+        session.add_all(
+            [
+                Issue(
+                    project_id=projects[i % 2].id,
+                    title=f"Issue {i}",
+                    description="d",
+                    issue_key=f"PRJ{i % 2}-{i}",
+                )
+                for i in range(3)
+            ]
+            + [Tag(name="backend", color="#123456")]
+        )
+        await session.commit()
+        yield session
+
+
+@pytest.fixture
+async def target_session(sqlite_session_factory):
+    """Empty workspace to import into."""
+    factory = await sqlite_session_factory(Project, Issue, Tag)
+    async with factory() as session:
+        yield session
+
+
+async def _count(session, model):
+    return await session.scalar(select(func.count()).select_from(model))
+
+
+async def _export(session, tmp_path, export_format, batch_size=2):
+    service = DataExchangeService(session, batch_size=batch_size)
+    output_path = tmp_path / f"export.{export_format}"
+    with open_export_writer(
+        export_format, output_path, {"export_type": "all"}, split_files=True
+    ) as writer:
+        for entity_type in ("projects", "issues", "tags"):
+            writer.start(entity_type, export_columns(entity_type))
+            async for rows in service.stream_batches(entity_type):
+                assert len(rows) <= batch_size
+                writer.write(rows)
+    return writer.files
+
+
+@pytest.mark.parametrize("export_format", ["ndjson", "json", "csv"])
+async def test_round_trip(source_session, target_session, tmp_path, export_format):
+    """Exported rows import into an empty workspace with ids and keys intact."""
+    files = await _export(source_session, tmp_path, export_format)
+    records = [r for path in files for r in read_import_records(path)]
+
+    stats = await DataExchangeService(target_session, batch_size=2).import_records(
+        records
+    )
+
+    assert {k: s.imported for k, s in stats.items()} == {
+        "projects": 2,
+        "issues": 3,
+        "tags": 1,
+    }
+    assert not any(s.errors for s in stats.values())
+    source_ids = set(await source_session.scalars(select(Issue.id)))
+    assert set(await target_session.scalars(select(Issue.id))) == source_ids
+
+
+async def test_children_written_after_parents(source_session, target_session, tmp_path):
+    """Issues listed before their projects still insert once projects flush."""
+    files = await _export(source_session, tmp_path, "ndjson")
+    records = list(read_import_records(files[0]))
+    records.sort(key=lambda r: r[0] != "issues")
+
+    stats = await DataExchangeService(target_session, batch_size=1).import_records(
+        records
+    )
+
+    assert stats["issues"].imported == 3
+    assert await _count(target_session, Project) == 2
+
+
+async def test_skip_existing(source_session, tmp_path):
+    """Rows matching an existing id or natural key, or repeated, are skipped."""
+    files = await _export(source_session, tmp_path, "ndjson")
+    records = list(read_import_records(files[0]))
+    new_tag = {"name": "frontend", "color": "#654321"}
+    records += [("tags", new_tag), ("tags", dict(new_tag))]
+
+    stats = await DataExchangeService(source_session).import_records(
+        records, skip_existing=True
+    )
+
+    assert stats["projects"].imported == 0
+    assert stats["projects"].skipped == 2
+    assert stats["issues"].skipped == 3
+    assert (stats["tags"].imported, stats["tags"].skipped) == (1, 2)
+    assert await _count(source_session, Tag) == 2
+
+
+async def test_invalid_rows_reported(target_session):
+    """Rows missing required fields are counted as errors, not inserted."""
+    records = [
+        ("projects", {"name": "No key", "description": "d"}),
+        ("issues", {"title": "Orphan", "description": "d"}),
+        ("tags", {"name": "ok", "color": "#000000"}),
+    ]
+
+    stats = await DataExchangeService(target_session).import_records(records)
+
+    assert "missing required field 'project_key'" in stats["projects"].errors[0]
+    assert "no project_id" in stats["issues"].errors[0]
+    assert stats["tags"].imported == 1
+
+
+async def test_failed_import_rolls_back(target_session):
+    """A database error leaves no rows from earlier batches behind."""
+    records = [
+        ("tags", {"name": "dup", "color": "#000000"}),
+        ("tags", {"name": "other", "color": "#000000"}),
+        ("tags", {"name": "dup", "color": "#ffffff"}),
+    ]
+
+    with pytest.raises(IntegrityError):
+        await DataExchangeService(target_session, batch_size=2).import_records(
+            records
+        )
+
+    assert await _count(target_session, Tag) == 0
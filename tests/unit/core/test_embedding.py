@@ -0,0 +1,93 @@
+"""Unit tests for the shared embedding service."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from turbo.core.services.embedding import EmbeddingDiskCache, EmbeddingService
+
+
+class FakeModel:
+    """Stand-in SentenceTransformer that records encode calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        return np.array([[len(text), text.count("a"), 1.0] for text in texts])
+
+
+@pytest.fixture
+def fake_model():
+    """Fake embedding model."""
+    return FakeModel()
+
+
+@pytest.fixture
+def service(fake_model):
+    """Embedding service wired to the fake model, without a disk cache."""
+    service = EmbeddingService("fake-model", batch_window_ms=20)
+    service._model = fake_model
+    return service
+
+
+class TestEmbeddingService:
+    """Test caching and batching in EmbeddingService."""
+
+    def test_encode_matches_sentence_transformer_shapes(self, service):
+        """Single strings give 1-D vectors, lists give 2-D arrays."""
+        assert service.encode("abc").shape == (3,)
+        assert service.encode(["a", "bb"]).shape == (2, 3)
+        assert service.embed("abc") == [3.0, 1.0, 1.0]
+
+    def test_repeated_text_is_encoded_once(self, service, fake_model):
+        """Identical content is served from the cache."""
+        service.encode(["alpha", "beta", "alpha"])
+        service.encode("alpha")
+
+        assert fake_model.calls == [["alpha", "beta"]]
+        assert service.misses == 2
+        assert service.hits == 2
+
+    def test_lru_evicts_oldest(self, fake_model):
+        """The in-memory cache is bounded."""
+        service = EmbeddingService("fake-model", cache_size=2)
+        service._model = fake_model
+
+        service.encode(["a", "b", "c"])
+        service.encode("a")
+
+        assert fake_model.calls == [["a", "b", "c"], ["a"]]
+
+    async def test_concurrent_requests_are_coalesced(self, service, fake_model):
+        """Async requests within the batch window share one encode call."""
+        vectors = await asyncio.gather(
+            service.aembed("one"), service.aembed("two"), service.aembed("three")
+        )
+
+        assert fake_model.calls == [["one", "two", "three"]]
+        assert vectors[2] == [5.0, 0.0, 1.0]
+
+    async def test_aembed_many(self, service, fake_model):
+        """Bulk embedding runs as a single batch."""
+        vectors = await service.aembed_many(["x", "yy"])
+
+        assert vectors == [[1.0, 0.0, 1.0], [2.0, 0.0, 1.0]]
+        assert fake_model.calls == [["x", "yy"]]
+
+    def test_disk_cache_survives_new_service(self, tmp_path, fake_model):
+        """Vectors persisted on disk are reused by a fresh service instance."""
+        disk_cache = EmbeddingDiskCache(tmp_path / "embeddings.sqlite")
+        first = EmbeddingService("fake-model", disk_cache=disk_cache)
+        first._model = fake_model
+        first.encode(["cached text"])
+
+        second = EmbeddingService("fake-model", disk_cache=disk_cache)
+        second._model = fake_model
+        vector = second.encode("cached text")
+
+        assert fake_model.calls == [["cached text"]]
+        assert vector.tolist() == [11.0, 1.0, 1.0]
+        disk_cache.close()
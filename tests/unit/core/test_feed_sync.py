@@ -0,0 +1,118 @@
+"""Unit tests for conditional feed fetching and podcast feed refresh."""
+
+import httpx
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from turbo.core.models import FeedSyncState, PodcastEpisode, PodcastShow
+from turbo.core.repositories.feed_sync import FeedSyncStateRepository
+from turbo.core.repositories.podcast import (
+    PodcastEpisodeRepository,
+    PodcastShowRepository,
+)
+from turbo.core.services.feed_sync import FeedSyncService
+from turbo.core.services.podcast import PodcastService
+
+FEED_URL = "https://podcast.example.com/feed.xml"
+BROKEN_FEED_URL = "https://broken.example.com/feed.xml"
+RSS = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Example</title>
+<item><title>Ep 2</title><guid>ep-2</guid>
+  <enclosure url="https://podcast.example.com/2.mp3" type="audio/mpeg" length="1"/></item>
+<item><title>Ep 1</title><guid>ep-1</guid>
+  <enclosure url="https://podcast.example.com/1.mp3" type="audio/mpeg" length="1"/></item>
+<item><title>Ep 1 again</title><guid>ep-1</guid>
+  <enclosure url="https://podcast.example.com/1.mp3" type="audio/mpeg" length="1"/></item>
+</channel></rss>"""
+
+
+@pytest.fixture
+async def podcast_session(sqlite_session_factory):
+    """SQLite session with the podcast and feed sync tables."""
+    factory = await sqlite_session_factory(PodcastShow, PodcastEpisode, FeedSyncState)
+    async with factory() as session:
+        yield session
+
+
+@pytest.fixture
+def feed_requests(monkeypatch):
+    """Serve RSS from a mock transport and record the requests made."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.host == "broken.example.com":
+            return httpx.Response(500)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=RSS, headers={"ETag": '"v1"'})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(
+        "turbo.core.services.feed_sync.get_http_client", lambda: client
+    )
+    return requests
+
+
+async def test_refresh_subscribed_shows(podcast_session: AsyncSession, feed_requests):
+    """New GUIDs are inserted once, failures are isolated, and 304s skip work."""
+    show = PodcastShow(title="Example", feed_url=FEED_URL)
+    broken = PodcastShow(title="Broken", feed_url=BROKEN_FEED_URL)
+    podcast_session.add_all([show, broken])
+    await podcast_session.flush()
+    podcast_session.add(
+        PodcastEpisode(
+            show_id=show.id,
+            title="Ep 1",
+            audio_url="https://podcast.example.com/1.mp3",
+            guid="ep-1",
+        )
+    )
+    await podcast_session.commit()
+
+    service = PodcastService(
+        PodcastShowRepository(podcast_session),
+        PodcastEpisodeRepository(podcast_session),
+        FeedSyncService(FeedSyncStateRepository(podcast_session)),
+    )
+
+    results = {r.show_id: r for r in await service.refresh_subscribed_shows(2)}
+    assert results[show.id].status == "updated"
+    assert results[show.id].new_episodes == 1
+    assert results[broken.id].status == "failed"
+
+    guids = await podcast_session.scalars(
+        select(PodcastEpisode.guid).where(PodcastEpisode.show_id == show.id)
+    )
+    assert sorted(guids.all()) == ["ep-1", "ep-2"]
+    state = await podcast_session.scalar(
+        select(FeedSyncState).where(FeedSyncState.feed_url == FEED_URL)
+    )
+    assert state.etag == '"v1"'
+
+    results = {r.show_id: r for r in await service.refresh_subscribed_shows()}
+    assert results[show.id].status == "not_modified"
+    assert results[show.id].new_episodes == 0
+    conditional = [r for r in feed_requests if r.url.host == "podcast.example.com"]
+    assert conditional[-1].headers["If-None-Match"] == '"v1"'
+
+
+async def test_limited_fetch_is_unconditional(
+    podcast_session: AsyncSession, feed_requests
+):
+    """Limited fetches download the feed and do not store validators."""
+    show = PodcastShow(title="Example", feed_url=FEED_URL)
+    podcast_session.add(show)
+    await podcast_session.commit()
+    service = PodcastService(
+        PodcastShowRepository(podcast_session),
+        PodcastEpisodeRepository(podcast_session),
+        FeedSyncService(FeedSyncStateRepository(podcast_session)),
+    )
+
+    episodes = await service.fetch_episodes_from_feed(show.id, limit=1)
+
+    assert [episode.guid for episode in episodes] == ["ep-2"]
+    assert episodes[0].created_at is not None
+    assert await podcast_session.scalar(select(FeedSyncState)) is None
@@ -0,0 +1,253 @@
+"""Unit tests for issue auto-ranking and the in-memory dependency graph."""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from turbo.core.models import Issue
+from turbo.core.models.associations import issue_dependencies
+from turbo.core.repositories.issue import IssueRepository
+from turbo.core.repositories.issue_dependency import IssueDependencyRepository
+from turbo.core.services.issue import IssueService
+from turbo.core.services.issue_ranking import (
+    RANK_SPACING,
+    rank_between,
+    rank_issues,
+    score_issues,
+)
+from turbo.core.utils.dependency_graph import DependencyGraph
+
+NOW = datetime(2025, 6, 1, tzinfo=timezone.utc)
+
+
+class TestDependencyGraph:
+    """Test DependencyGraph traversal helpers."""
+
+    def test_direct_neighbours(self):
+        """Blockers and dependents follow edge direction."""
+        a, b, c = uuid4(), uuid4(), uuid4()
+        graph = DependencyGraph([(a, b), (a, c)])
+
+        assert graph.dependents_of(a) == {b, c}
+        assert graph.blockers_of(b) == {a}
+        assert graph.blockers_of(a) == set()
+
+    def test_descendant_counts_are_distinct(self):
+        """Diamond-shaped graphs count shared descendants once."""
+        a, b, c, d = uuid4(), uuid4(), uuid4(), uuid4()
+        graph = DependencyGraph([(a, b), (a, c), (b, d), (c, d)])
+
+        counts = graph.descendant_counts()
+
+        assert counts[a] == 3
+        assert counts[b] == 1
+        assert counts[d] == 0
+
+    def test_topological_order(self):
+        """Every blocker precedes the issues it blocks."""
+        a, b, c = uuid4(), uuid4(), uuid4()
+        graph = DependencyGraph([(b, c), (a, b)])
+
+        order = graph.topological_order()
+
+        assert order.index(a) < order.index(b) < order.index(c)
+
+
+class TestRankIssues:
+    """Test vectorized auto-rank scoring."""
+
+    def test_scores_match_ranking_rules(self):
+        """Priority, age, blocker penalty and dependency boost all apply."""
+        critical, low, blocker, blocked = uuid4(), uuid4(), uuid4(), uuid4()
+        graph = DependencyGraph([(blocker, blocked)])
+
+        scores = score_issues(
+            [critical, low, blocker, blocked],
+            ["critical", "low", "medium", "high"],
+            [NOW, NOW - timedelta(days=100), NOW - timedelta(days=4), NOW],
+            graph,
+            now=NOW,
+        )
+
+        assert scores.tolist() == [100.0, 30.0, 32.0, 35.0]
+
+    def test_transitive_weight_rewards_indirect_blocking(self):
+        """Issues at the root of long chains rank higher with transitive weight."""
+        root, middle, leaf, other = uuid4(), uuid4(), uuid4(), uuid4()
+        graph = DependencyGraph([(root, middle), (middle, leaf)])
+        args = (
+            [other, root],
+            ["medium", "medium"],
+            [NOW, NOW],
+            graph,
+        )
+
+        assert rank_issues(*args, now=NOW) == [root, other]
+        assert score_issues(*args, now=NOW)[1] == 30.0
+        assert score_issues(*args, now=NOW, transitive_weight=2.0)[1] == 32.0
+
+    def test_rank_between(self):
+        """Moves take a free key between neighbours, or ask for a renumber."""
+        assert rank_between(1024, 2048) == 1536
+        assert rank_between(None, 4) == 2
+        assert rank_between(7, None) == 7 + RANK_SPACING
+        assert rank_between(3, 4) is None
+        assert rank_between(None, 1) is None
+
+
+@pytest.fixture
+async def ranking_session(sqlite_session_factory):
+    """SQLite session with only the tables auto-ranking touches."""
+    factory = await sqlite_session_factory(Issue, issue_dependencies)
+    async with factory() as session:
+        yield session
+
+
+async def test_auto_rank_issues_writes_ranks_in_bulk(ranking_session: AsyncSession):
+    """auto_rank_issues ranks eligible issues and skips closed ones."""
+    issues = {
+        name: Issue(
+            title=name,
+            description=name,
+            status=status,
+            priority=priority,
+            created_at=NOW,
+        )
+        for name, status, priority in [
+            ("low", "open", "low"),
+            ("critical", "in_progress", "critical"),
+            ("blocker", "open", "medium"),
+            ("closed", "closed", "critical"),
+        ]
+    }
+    ranking_session.add_all(issues.values())
+    await ranking_session.commit()
+
+    dependency_repository = IssueDependencyRepository(ranking_session)
+    await dependency_repository.create_dependency(
+        issues["blocker"].id, issues["closed"].id
+    )
+    await dependency_repository.create_dependency(issues["blocker"].id, issues["low"].id)
+    await ranking_session.commit()
+
+    service = IssueService(
+        issue_repository=IssueRepository(ranking_session),
+        project_repository=None,
+        milestone_repository=None,
+        dependency_repository=dependency_repository,
+    )
+
+    ids = {name: issue.id for name, issue in issues.items()}
+
+    ranked = await service.auto_rank_issues()
+
+    ranking_session.expire_all()
+    ranks = {
+        name: (await ranking_session.get(Issue, issue_id)).work_rank
+        for name, issue_id in ids.items()
+    }
+    assert ranked == 3
+    assert ranks == {"critical": 1, "blocker": 2, "low": 3, "closed": None}
+
+
+@pytest.mark.parametrize("use_graph_cache", [False, True])
+async def test_dependency_traversal(ranking_session: AsyncSession, use_graph_cache):
+    """Cycle checks, chains and closures agree for CTE and cached lookups."""
+    a, b, c, d, other = uuid4(), uuid4(), uuid4(), uuid4(), uuid4()
+    repository = IssueDependencyRepository(
+        ranking_session, use_graph_cache=use_graph_cache
+    )
+    for blocking, blocked in [(a, b), (b, c), (c, d), (other, c)]:
+        await repository.create_dependency(blocking, blocked)
+
+    with pytest.raises(ValueError, match="circular"):
+        await repository.create_dependency(d, a)
+    with pytest.raises(ValueError, match="circular"):
+        await repository.create_dependency(a, a)
+
+    chain = await repository.get_dependency_chain(c)
+    assert set(chain[:-1]) == {a, b, other}
+    assert chain.index(a) < chain.index(b)
+    assert chain[-1] == c
+
+    closure = await repository.get_dependency_closure(b)
+    assert closure == {"upstream": [a], "downstream": [c, d]}
+
+    dependencies = await repository.get_all_dependencies(c)
+    assert set(dependencies["blocking"]) == {b, other}
+    assert dependencies["blocked_by"] == [d]
+
+
+def _ranking_service(session: AsyncSession) -> IssueService:
+    return IssueService(
+        issue_repository=IssueRepository(session),
+        project_repository=None,
+        milestone_repository=None,
+        dependency_repository=IssueDependencyRepository(session),
+    )
+
+
+async def _add_ranked_issues(session: AsyncSession, ranks: list[int]) -> list:
+    issues = [
+        Issue(title=f"issue {rank}", description="ranked", work_rank=rank)
+        for rank in ranks
+    ]
+    session.add_all(issues)
+    await session.commit()
+    return [issue.id for issue in issues]
+
+
+async def test_bulk_rerank_returns_updated_rows(ranking_session: AsyncSession):
+    """Unknown IDs are skipped and updated issues come back in one pass."""
+    first, second = await _add_ranked_issues(ranking_session, [1, 2])
+    service = _ranking_service(ranking_session)
+
+    issues = await service.bulk_rerank(
+        [
+            {"issue_id": str(first), "rank": 2},
+            {"issue_id": str(second), "rank": 1},
+            {"issue_id": str(uuid4()), "rank": 3},
+        ]
+    )
+
+    assert {issue.id: issue.work_rank for issue in issues} == {first: 2, second: 1}
+    assert all(issue.last_ranked_at is not None for issue in issues)
+
+
+async def test_move_in_queue(ranking_session: AsyncSession):
+    """Moves write one row when there is a gap and renumber when there isn't."""
+    a, b, c = await _add_ranked_issues(ranking_session, [1, 2, 3])
+    service = _ranking_service(ranking_session)
+
+    # 1, 2, 3 are adjacent: moving c after a renumbers the queue
+    moved = await service.move_in_queue(c, after_issue_id=a)
+    assert {i.id: i.work_rank for i in moved} == {
+        a: RANK_SPACING,
+        c: 2 * RANK_SPACING,
+        b: 3 * RANK_SPACING,
+    }
+
+    # Now there is room, so moving b to the top touches only b
+    moved = await service.move_in_queue(b)
+    assert [(i.id, i.work_rank) for i in moved] == [(b, RANK_SPACING // 2)]
+
+    assert await IssueRepository(ranking_session).get_ranked_ids() == [b, a, c]
+
+
+async def test_set_work_rank_takes_a_queue_position(ranking_session: AsyncSession):
+    """Positions are translated into sparse keys between the new neighbours."""
+    a, b, c = await _add_ranked_issues(
+        ranking_session, [RANK_SPACING, 2 * RANK_SPACING, 3 * RANK_SPACING]
+    )
+    service = _ranking_service(ranking_session)
+
+    moved = await service.set_work_rank(c, 1)
+    assert moved.work_rank == RANK_SPACING // 2
+
+    # Positions past the end of the queue place the issue last
+    await service.set_work_rank(a, 99)
+    await service.set_work_rank(b, 2)
+
+    assert await IssueRepository(ranking_session).get_ranked_ids() == [c, b, a]
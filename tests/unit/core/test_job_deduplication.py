@@ -0,0 +1,125 @@
+"""Unit tests for batched job deduplication."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from turbo.core.services.job_deduplication import JobDeduplicationService
+from turbo.core.services.job_scrapers import ScrapedJob
+
+
+def _scraped(
+    company: str, title: str, location: str | None = None, **kwargs
+) -> ScrapedJob:
+    return ScrapedJob(
+        source=kwargs.get("source", "remotive"),
+        source_url="https://example.com/job",
+        external_id=kwargs.get("external_id", str(uuid4())),
+        company_name=company,
+        job_title=title,
+        location=location,
+    )
+
+
+def _posting(company: str, title: str, location: str | None = None, **kwargs):
+    keys = JobDeduplicationService.dedup_keys(company, title, location)
+    return SimpleNamespace(
+        id=uuid4(),
+        source=kwargs.get("source", "indeed"),
+        external_id=kwargs.get("external_id"),
+        company_name=company,
+        job_title=title,
+        location=location,
+        **keys,
+    )
+
+
+@pytest.fixture
+def mock_job_posting_repository():
+    """Repository returning no matches unless a test configures it."""
+    repository = AsyncMock()
+    repository.get_by_external_ids.return_value = []
+    repository.get_by_fingerprints.return_value = []
+    repository.get_dedup_candidates.return_value = []
+    return repository
+
+
+class TestSimilarityMatrix:
+    """Test vectorized similarity scoring."""
+
+    def test_matches_pairwise_similarity(self):
+        """cdist scoring agrees with calculate_job_similarity."""
+        jobs = [
+            ("Acme Inc", "Sr Python Engineer", "Remote"),
+            ("Globex", "Data Scientist", "Berlin"),
+            ("", "Engineer", None),
+        ]
+        normalized = [
+            JobDeduplicationService.normalize_job_fields(*job) for job in jobs
+        ]
+
+        matrix = JobDeduplicationService.similarity_matrix(normalized, normalized)
+
+        expected = [
+            [
+                JobDeduplicationService.calculate_job_similarity(
+                    dict(zip(("company_name", "job_title", "location"), a)),
+                    dict(zip(("company_name", "job_title", "location"), b)),
+                )
+                for b in jobs
+            ]
+            for a in jobs
+        ]
+        np.testing.assert_allclose(matrix, expected, atol=1e-5)
+
+
+class TestFindDuplicates:
+    """Test batch duplicate detection."""
+
+    async def test_exact_and_fuzzy_matches(self, mock_job_posting_repository):
+        """External IDs and fingerprints match exactly, others fuzzily."""
+        by_external_id = _posting(
+            "Initech", "QA Lead", source="remotive", external_id="42"
+        )
+        by_fingerprint = _posting("Acme, Inc.", "Senior Python Engineer", "Remote")
+        fuzzy = _posting("Globex", "Senior Data Scientist", "Berlin")
+        mock_job_posting_repository.get_by_external_ids.return_value = [by_external_id]
+        mock_job_posting_repository.get_by_fingerprints.return_value = [by_fingerprint]
+        mock_job_posting_repository.get_dedup_candidates.return_value = [fuzzy]
+        service = JobDeduplicationService(mock_job_posting_repository)
+
+        results = await service.find_duplicates(
+            [
+                _scraped("Initech", "Anything", external_id="42"),
+                _scraped("ACME inc", "Sr Python Engineer", "Anywhere"),
+                _scraped("Globex", "Senior Data Scientists", "Berlin"),
+                _scraped("Umbrella", "Chemist", "Raccoon City"),
+            ]
+        )
+
+        assert results[0] == (True, by_external_id, 1.0)
+        assert results[1] == (True, by_fingerprint, 1.0)
+        assert results[2][:2] == (True, fuzzy)
+        assert results[2][2] > service.LIKELY_DUPLICATE_THRESHOLD
+        assert results[3] == (False, None, 0.0)
+
+        # One candidate query for the whole batch, blocked on company
+        mock_job_posting_repository.get_dedup_candidates.assert_awaited_once()
+        company_keys = mock_job_posting_repository.get_dedup_candidates.call_args.args[0]
+        assert company_keys == ["globex", "umbrella"]
+
+    async def test_find_duplicate_by_fingerprint(self, mock_job_posting_repository):
+        """Fingerprint lookup returns the stored posting."""
+        posting = _posting("Acme", "Engineer", "Remote")
+        mock_job_posting_repository.get_by_fingerprints.return_value = [posting]
+        service = JobDeduplicationService(mock_job_posting_repository)
+
+        found = await service.find_duplicate_by_fingerprint("ACME", "engineer", "worldwide")
+
+        assert found is posting
+        mock_job_posting_repository.get_by_fingerprints.assert_awaited_once_with(
+            [posting.fingerprint]
+        )
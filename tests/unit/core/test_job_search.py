@@ -0,0 +1,120 @@
+"""Unit tests for concurrent job search execution."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from turbo.core.services.job_scrapers import BaseScraper, ScrapedJob
+from turbo.core.services.job_search import JobSearchService
+
+
+class FakeScraper(BaseScraper):
+    """Scraper returning canned jobs after a delay."""
+
+    def __init__(self, name: str, jobs: list[ScrapedJob], delay: float):
+        self.name = name
+        self.jobs = jobs
+        self.delay = delay
+        super().__init__(rate_limit_delay=0)
+
+    def _get_source_name(self) -> str:
+        return self.name
+
+    async def search_jobs(self, keywords=None, locations=None, remote_only=False, limit=50):
+        await asyncio.sleep(self.delay)
+        return self.jobs
+
+    async def get_job_details(self, job_url: str):
+        return None
+
+
+def _job(source: str, company: str, title: str) -> ScrapedJob:
+    return ScrapedJob(
+        source=source,
+        source_url=f"https://{source}.example.com/{uuid4()}",
+        external_id=str(uuid4()),
+        company_name=company,
+        job_title=title,
+        location="Remote",
+    )
+
+
+@pytest.fixture
+def job_search_service():
+    """JobSearchService with mocked repositories and scoring."""
+    posting_repo = AsyncMock()
+    posting_repo.get_without_fingerprint.return_value = []
+    posting_repo.get_by_external_ids.return_value = []
+    posting_repo.get_by_fingerprints.return_value = []
+    posting_repo.get_dedup_candidates.return_value = []
+
+    criteria = SimpleNamespace(
+        id=uuid4(),
+        job_titles=["engineer"],
+        locations=["Remote"],
+        exclude_onsite=True,
+        enabled_sources=None,
+        search_frequency_hours=24,
+    )
+    criteria_repo = AsyncMock()
+    criteria_repo.get_by_id.return_value = criteria
+
+    histories = {}
+
+    def create_history(data):
+        histories[data.source] = SimpleNamespace(id=uuid4(), **data.model_dump())
+        return histories[data.source]
+
+    history_repo = AsyncMock()
+    history_repo._session = AsyncMock()
+    history_repo.create.side_effect = create_history
+
+    service = JobSearchService(posting_repo, criteria_repo, history_repo)
+    service._score_job = lambda job, criteria: (80.0, {})
+    service.histories = histories
+    return service
+
+
+async def test_sources_run_concurrently(job_search_service, monkeypatch):
+    """Runs take as long as the slowest source; postings are inserted once."""
+    monkeypatch.setattr(
+        "turbo.core.services.job_search.JobSearchHistoryResponse.model_validate",
+        lambda history: history,
+    )
+    job_search_service._scrapers = {
+        "alpha": FakeScraper("alpha", [_job("alpha", "Acme", "Python Engineer")], 0.2),
+        "beta": FakeScraper(
+            "beta",
+            [
+                _job("beta", "Acme Inc", "Python Engineer"),
+                _job("beta", "Globex", "Data Engineer"),
+            ],
+            0.2,
+        ),
+        "slow": FakeScraper("slow", [], 5),
+    }
+
+    started = time.monotonic()
+    await job_search_service.execute_search(
+        uuid4(), sources=["alpha", "beta", "slow"], timeout=0.5
+    )
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1.5
+    histories = job_search_service.histories
+    assert histories["alpha"].status == "completed"
+    assert histories["beta"].status == "completed"
+    assert histories["slow"].status == "failed"
+    assert "Timed out" in histories["slow"].error_message
+
+    create_many = job_search_service._job_posting_repo.create_many
+    create_many.assert_awaited_once()
+    postings = create_many.call_args.args[0]
+    # The Acme job appears on both sources but is saved once
+    assert len(postings) == 2
+    exact = [histories[s].jobs_duplicate_exact for s in ("alpha", "beta")]
+    assert sum(exact) == 1
@@ -0,0 +1,82 @@
+"""Unit tests for My Queue section loading and cached counts."""
+
+from uuid import uuid4
+
+import pytest
+from turbo.core.models.action_approval import ActionApproval
+from turbo.core.models.issue import Issue
+from turbo.core.models.project import Project
+from turbo.core.models.review_request import ReviewRequest
+from turbo.core.services.my_queue import (
+    MyQueueCountsCache,
+    MyQueueService,
+    my_queue_counts_cache,
+)
+
+
+@pytest.fixture
+async def session_factory(sqlite_session_factory):
+    """Project with five open issues, two closed ones and one pending approval."""
+    factory = await sqlite_session_factory(Project, Issue, ActionApproval, ReviewRequest)
+    async with factory() as session:
+        project = Project(name="Queue", project_key="QUE", description="d")
+        session.add(project)
+        await session.flush()
+        session.add_all(
+            [
+                Issue(
+                    project_id=project.id,
+                    title=f"Issue {i}",
+                    description="d",
+                    status="open" if i < 5 else "closed",
+                )
+                for i in range(7)
+            ]
+            + [_approval()]
+        )
+        await session.commit()
+    return factory
+
+
+def _approval() -> ActionApproval:
+    return ActionApproval(
+        action_type="close_issue",
+        action_description="Close it",
+        action_params={},
+        entity_type="issue",
+        entity_id=uuid4(),
+    )
+
+
+async def test_counts_use_every_pending_item(session_factory):
+    """Counts cover the whole backlog while sections stop at the limit."""
+    service = MyQueueService(session_factory, MyQueueCountsCache())
+
+    queue = await service.get_queue(limit=2)
+
+    assert len(queue["assigned_issues"]) == 2
+    assert len(queue["action_approvals"]) == 1
+    assert queue["review_requests"] == []
+    assert queue["counts"]["assigned_issues"] == 5
+    assert queue["counts"]["action_approvals"] == 1
+    assert queue["counts"]["total"] == 6
+
+
+async def test_counts_are_cached_until_queue_items_change(session_factory):
+    """Cached counts are served until a commit touches a queue model."""
+    my_queue_counts_cache.invalidate()
+    service = MyQueueService(session_factory)
+
+    counts = await service.get_counts()
+    assert counts["action_approvals"] == 1
+    # Callers get a copy; changing it leaves the cached counts alone
+    counts["action_approvals"] = 99
+    assert my_queue_counts_cache.get()["action_approvals"] == 1
+    assert (await service.get_counts())["action_approvals"] == 1
+
+    async with session_factory() as session:
+        session.add(_approval())
+        await session.commit()
+
+    assert my_queue_counts_cache.get() is None
+    assert (await service.get_counts())["action_approvals"] == 2
@@ -0,0 +1,143 @@
+"""Unit tests for keyset pagination and field selection in repositories."""
+
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import inspect
+
+from turbo.api.dependencies import get_issue_service
+from turbo.api.v1.endpoints import issues
+from turbo.core.models.issue import Issue
+from turbo.core.models.project import Project
+from turbo.core.repositories.issue import IssueRepository
+from turbo.core.services.issue import IssueService
+from turbo.utils.exceptions import ValidationError
+
+
+@pytest.fixture
+async def issue_repo(sqlite_session_factory):
+    """Seven issues, created in pairs sharing a timestamp; every other one ranked."""
+    factory = await sqlite_session_factory(Project, Issue)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    async with factory() as session:
+        project = Project(name="Paging", project_key="PAGE", description="d")
+        session.add(project)
+        await session.flush()
+        session.add_all(
+            [
+                Issue(
+                    project_id=project.id,
+                    title=f"Issue {i}",
+                    description="x" * 1000,
+                    status="open" if i % 3 else "closed",
+                    work_rank=(7 - i) * 1000 if i % 2 == 0 else None,
+                    # Pairs share created_at, so the id has to break ties
+                    created_at=start + timedelta(minutes=i // 2),
+                    updated_at=start,
+                )
+                for i in range(7)
+            ]
+        )
+        await session.commit()
+    # A fresh session, so field selection isn't hidden by the identity map
+    async with factory() as session:
+        yield IssueRepository(session)
+
+
+async def _walk(repo: IssueRepository, **kwargs) -> list[list[Issue]]:
+    pages, cursor = [], None
+    while True:
+        page = await repo.get_page(limit=3, cursor=cursor, **kwargs)
+        pages.append(page.items)
+        if page.next_cursor is None:
+            return pages
+        cursor = page.next_cursor
+
+
+async def test_pages_cover_every_issue_once_newest_first(issue_repo):
+    """Walking the cursors visits each issue exactly once, in order."""
+    pages = await _walk(issue_repo)
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    issues = [issue for page in pages for issue in page]
+    assert len({issue.id for issue in issues}) == 7
+    keys = [(issue.created_at, issue.id) for issue in issues]
+    assert keys == sorted(keys, reverse=True)
+
+
+async def test_work_rank_order_skips_unranked_issues(issue_repo):
+    """The work queue order pages ranked issues by ascending rank."""
+    pages = await _walk(issue_repo, order="work_rank")
+
+    ranks = [issue.work_rank for page in pages for issue in page]
+    assert ranks == [1000, 3000, 5000, 7000]
+
+
+async def test_criteria_and_fields(issue_repo):
+    """Filters apply to every page and unrequested columns stay unloaded."""
+    criteria = issue_repo.list_criteria(status="closed")
+    page = await issue_repo.get_page(*criteria, limit=10, fields=["title"])
+
+    assert sorted(issue.title for issue in page.items) == [
+        "Issue 0",
+        "Issue 3",
+        "Issue 6",
+    ]
+    assert "description" in inspect(page.items[0]).unloaded
+    assert page.next_cursor is None
+
+
+async def test_iter_pages_yields_everything(issue_repo):
+    """iter_pages follows the cursors until the listing is exhausted."""
+    batches = [batch async for batch in issue_repo.iter_pages(page_size=2)]
+
+    assert [len(batch) for batch in batches] == [2, 2, 2, 1]
+
+
+async def test_rejects_bad_cursor_order_and_fields(issue_repo):
+    """Malformed input is reported as a validation error, not a SQL error."""
+    page = await issue_repo.get_page(limit=1)
+
+    with pytest.raises(ValidationError):
+        await issue_repo.get_page(limit=1, cursor="not-a-cursor")
+    with pytest.raises(ValidationError):
+        await issue_repo.get_page(limit=1, cursor=page.next_cursor, order="work_rank")
+    with pytest.raises(ValidationError):
+        await issue_repo.get_page(limit=1, order="title")
+    with pytest.raises(ValidationError):
+        await issue_repo.get_page(limit=1, fields=["nope"])
+
+
+async def _get_issues(repo: IssueRepository, **params) -> httpx.Response:
+    app = FastAPI()
+    app.include_router(issues.router, prefix="/api/v1/issues")
+    app.dependency_overrides[get_issue_service] = lambda: IssueService(
+        repo, None, None, None
+    )
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get("/api/v1/issues/", params=params)
+
+
+async def test_plain_limit_keeps_the_original_listing(issue_repo):
+    """Only cursor, fields or order switch the endpoint to keyset pages."""
+    plain = await _get_issues(issue_repo, limit=3)
+    keyset = await _get_issues(issue_repo, limit=3, order="created_at")
+    first_page = await issue_repo.get_page(limit=3)
+
+    assert plain.status_code == 200
+    assert len(plain.json()) == 3
+    assert "X-Next-Cursor" not in plain.headers
+    assert keyset.status_code == 200
+    assert [i["id"] for i in keyset.json()] == [str(i.id) for i in first_page.items]
+    assert "X-Next-Cursor" in keyset.headers
+
+
+async def test_stream_rejects_paging_parameters(issue_repo):
+    """A streamed listing returns everything, so limit and cursor are refused."""
+    response = await _get_issues(issue_repo, stream=True, limit=3, cursor="abc")
+
+    assert response.status_code == 422
+    assert response.json() == {"detail": "limit, cursor cannot be combined with stream"}
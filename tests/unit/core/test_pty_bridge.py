@@ -0,0 +1,118 @@
+"""Unit tests for the event-driven PTY output bridge."""
+
+import asyncio
+import os
+
+import pytest
+
+from turbo.core.services.pty_bridge import PtyBridge
+
+
+@pytest.fixture
+async def pipe():
+    """A pipe standing in for the PTY: the bridge reads, the test writes."""
+    read_fd, write_fd = os.pipe()
+    yield read_fd, write_fd
+    for fd in (read_fd, write_fd):
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+async def test_output_is_coalesced_into_frames(pipe):
+    """Writes inside one frame window arrive as a single frame."""
+    read_fd, write_fd = pipe
+    bridge = PtyBridge(read_fd)
+    _, subscription = bridge.subscribe()
+
+    for chunk in (b"ls\r\n", b"file-a  ", b"file-b\r\n"):
+        os.write(write_fd, chunk)
+        await asyncio.sleep(0)
+
+    frame = await asyncio.wait_for(subscription.get(), timeout=1)
+    assert frame == b"ls\r\nfile-a  file-b\r\n"
+    bridge.close()
+
+
+async def test_large_output_flushes_without_waiting(pipe):
+    """A burst past the frame size is sent as soon as it is read."""
+    read_fd, write_fd = pipe
+    bridge = PtyBridge(read_fd)
+    bridge.FRAME_INTERVAL = 60
+    _, subscription = bridge.subscribe()
+
+    os.write(write_fd, b"x" * PtyBridge.FRAME_MAX_BYTES)
+
+    frame = await asyncio.wait_for(subscription.get(), timeout=1)
+    assert len(frame) == PtyBridge.FRAME_MAX_BYTES
+    bridge.close()
+
+
+async def test_reconnecting_client_replays_scrollback(pipe):
+    """New subscribers get recent output first, capped at the ring size."""
+    read_fd, write_fd = pipe
+    bridge = PtyBridge(read_fd, scrollback_bytes=8)
+    _, first = bridge.subscribe()
+
+    os.write(write_fd, b"0123456789")
+    await asyncio.wait_for(first.get(), timeout=1)
+
+    scrollback, second = bridge.subscribe()
+    assert scrollback == b"23456789"
+
+    os.write(write_fd, b"next")
+    assert await asyncio.wait_for(second.get(), timeout=1) == b"next"
+    bridge.close()
+
+
+async def test_eof_ends_subscriptions(pipe):
+    """When the shell exits, buffered output is delivered and streams end."""
+    read_fd, write_fd = pipe
+    bridge = PtyBridge(read_fd)
+    _, subscription = bridge.subscribe()
+
+    os.write(write_fd, b"bye\r\n")
+    os.close(write_fd)
+
+    assert await asyncio.wait_for(subscription.get(), timeout=1) == b"bye\r\n"
+    assert await asyncio.wait_for(subscription.get(), timeout=1) is None
+    assert bridge.closed
+
+
+async def test_lagging_client_is_dropped(pipe):
+    """A client that stops reading is ended instead of buffering forever."""
+    read_fd, write_fd = pipe
+    bridge = PtyBridge(read_fd)
+    bridge.MAX_PENDING_FRAMES = 2
+    _, lagging = bridge.subscribe()
+
+    for _ in range(3):
+        os.write(write_fd, b"tick")
+        await asyncio.sleep(PtyBridge.FRAME_INTERVAL * 4)
+
+    assert lagging.overflowed
+    assert await lagging.get() is None
+    bridge.close()
+
+
+async def test_busy_output_is_read_in_bounded_chunks(pipe):
+    """Each wakeup reads one chunk, so a chatty shell cannot starve the loop."""
+    read_fd, write_fd = pipe
+    bridge = PtyBridge(read_fd)
+    bridge.READ_SIZE = 4
+    bridge.FRAME_INTERVAL = 60
+    _, subscription = bridge.subscribe()
+
+    async def pending(size: int):
+        while len(bridge._pending) < size:
+            await asyncio.sleep(0)
+
+    os.write(write_fd, b"y\n" * 32)
+    await asyncio.wait_for(pending(1), timeout=1)
+    assert len(bridge._pending) < 64
+    # Later wakeups pick up the rest
+    await asyncio.wait_for(pending(64), timeout=1)
+
+    bridge.close()
+    assert await asyncio.wait_for(subscription.get(), timeout=1) == b"y\n" * 32
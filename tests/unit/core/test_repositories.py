@@ -5,7 +5,7 @@ from uuid import uuid4
 import pytest
 from sqlalchemy.exc import IntegrityError
 
-from turbo.core.models import Project
+from turbo.core.models import Issue, Project
 from turbo.core.repositories import (
     BaseRepository,
     DocumentRepository,
@@ -366,6 +366,42 @@ class TestIssueRepository:
         closed_titles = [issue.title for issue in closed_issues]
         assert "Closed Issue" in closed_titles
 
+    @pytest.mark.asyncio
+    async def test_get_status_counts(self, sqlite_session_factory):
+        """Test counting issues per project and status in one query."""
+        factory = await sqlite_session_factory(Project, Issue)
+        async with factory() as session:
+            project = Project(name="Counted", project_key="CNT", description="d")
+            other_project = Project(name="Other", project_key="OTH", description="d")
+            session.add_all([project, other_project])
+            await session.flush()
+            session.add_all(
+                [
+                    Issue(
+                        project_id=owner.id,
+                        title=f"{status} issue",
+                        description="Counted",
+                        status=status,
+                    )
+                    for owner, status in [
+                        (project, "open"),
+                        (project, "closed"),
+                        (project, "closed"),
+                        (other_project, "in_progress"),
+                    ]
+                ]
+            )
+            await session.commit()
+
+            counts = await IssueRepository(session).get_status_counts(
+                [project.id, other_project.id, uuid4()]
+            )
+
+        assert counts == {
+            project.id: {"open": 1, "closed": 2},
+            other_project.id: {"in_progress": 1},
+        }
+
     @pytest.mark.asyncio
     async def test_update_issue(self, issue_repo, sample_issue):
         """Test updating an issue."""
@@ -0,0 +1,115 @@
+"""Unit tests for batched resume deduplication."""
+
+import numpy as np
+import pytest
+
+from turbo.core.services.resume_deduplicator import ResumeDeduplicatorService
+
+
+class FakeEmbedder:
+    """Maps known descriptions to fixed vectors and records each call."""
+
+    def __init__(self, vectors: dict[str, list[float]]):
+        self.vectors = vectors
+        self.calls: list[list[str]] = []
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        self.calls.append(texts)
+        return np.array([self.vectors[t] for t in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def deduplicator():
+    service = ResumeDeduplicatorService()
+    service.embedder = None
+    return service
+
+
+def test_skills_collapse_case_and_aws_aliases(deduplicator):
+    """Case variants and AWS aliases keep the first spelling seen."""
+    skills = ["Python", "python", "Lambda", "AWS Lambda", "Docker"]
+
+    assert deduplicator.deduplicate_skills(skills) == ["Python", "Lambda", "Docker"]
+
+
+async def test_projects_merge_on_semantic_similarity(deduplicator):
+    """Differently named projects with matching descriptions and stack merge."""
+    deduplicator.embedder = FakeEmbedder(
+        {
+            "Tracks issues for teams": [1.0, 0.0],
+            "Issue tracking for small teams, with a CLI": [0.99, 0.05],
+            "Static site generator": [0.0, 1.0],
+        }
+    )
+    projects = [
+        {
+            "name": "Turbo",
+            "description": "Tracks issues for teams",
+            "technologies": ["python", "fastapi"],
+        },
+        {"name": "Site builder", "description": "Static site generator", "technologies": ["go"]},
+        {
+            "name": "Task tracker",
+            "description": "Issue tracking for small teams, with a CLI",
+            "technologies": ["python", "fastapi", "typer"],
+            "url": "https://example.com",
+        },
+    ]
+
+    unique = await deduplicator.deduplicate_projects_with_graph(projects)
+
+    assert [p["name"] for p in unique] == ["Turbo", "Site builder"]
+    assert unique[0]["description"] == "Issue tracking for small teams, with a CLI"
+    assert sorted(unique[0]["technologies"]) == ["fastapi", "python", "typer"]
+    assert unique[0]["url"] == "https://example.com"
+    # Every description is embedded in a single batch
+    assert len(deduplicator.embedder.calls) == 1
+
+
+def test_project_duplicates_are_clustered_transitively(deduplicator):
+    """A project matching either member of a cluster joins that cluster."""
+    projects = [
+        {"name": "Resume Builder", "technologies": ["python"]},
+        {"name": "Job Board", "technologies": ["vue"]},
+        {"name": "Resume Builder Tool", "technologies": ["python", "react"]},
+        # Too far from "Resume Builder" on its own, close to "Resume Builder Tool"
+        {"name": "Resume Builder Tool Kit", "technologies": ["react"]},
+    ]
+
+    unique = deduplicator.deduplicate_projects(projects)
+
+    assert [p["name"] for p in unique] == ["Resume Builder", "Job Board"]
+    assert sorted(unique[0]["technologies"]) == ["python", "react"]
+
+
+def test_unnamed_projects_still_merge(deduplicator):
+    """Projects without a name match each other, but not named projects."""
+    projects = [
+        {"name": "", "technologies": ["go"]},
+        {"name": "Job Board", "technologies": ["vue"]},
+        {"name": "", "technologies": ["rust"]},
+    ]
+
+    unique = deduplicator.deduplicate_projects(projects)
+
+    assert [p["name"] for p in unique] == ["", "Job Board"]
+    assert sorted(unique[0]["technologies"]) == ["go", "rust"]
+
+
+def test_experiences_match_within_company_and_start_date(deduplicator):
+    """Similar titles merge only at the same company and start date."""
+    experiences = [
+        {"company": "Acme", "title": "Senior Engineer", "start_date": "2020-01", "description": "Built"},
+        {"company": "Acme", "title": "Senior Engineer II", "start_date": "2020-01", "description": "Built APIs"},
+        {"company": "Acme", "title": "Senior Engineer", "start_date": "2018-01", "description": "Earlier"},
+        {"company": "Globex", "title": "Senior Engineer", "start_date": "2020-01", "description": "Other"},
+    ]
+
+    unique = deduplicator.deduplicate_experiences(experiences)
+
+    assert [(e["company"], e["start_date"]) for e in unique] == [
+        ("Acme", "2020-01"),
+        ("Acme", "2018-01"),
+        ("Globex", "2020-01"),
+    ]
+    assert unique[0]["description"] == "Built APIs"
@@ -0,0 +1,188 @@
+"""Unit tests for the full-text search index, SearchService and hybrid search."""
+
+import asyncio
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import delete
+from turbo.api.dependencies import get_issue_service
+from turbo.api.v1.endpoints import issues
+from turbo.core.database.search_index import install_search_index
+from turbo.core.models.document import Document
+from turbo.core.models.issue import Issue
+from turbo.core.models.project import Project
+from turbo.core.repositories.issue import IssueRepository
+from turbo.core.schemas.graph import GraphSearchResponse, GraphSearchResult
+from turbo.core.services.issue import IssueService
+from turbo.core.services.hybrid_search import (
+    HybridSearchCache,
+    HybridSearchService,
+    reciprocal_rank_fusion,
+)
+from turbo.core.services.search import SearchService
+
+
+@pytest.fixture
+async def session(sqlite_session_factory):
+    """SQLite session with the searchable tables and their FTS5 index."""
+    factory = await sqlite_session_factory(Project, Issue, Document)
+    async with factory() as session:
+        project = Project(
+            name="Authentication revamp",
+            project_key="AUTH",
+            description="Replace the login flow",
+            status="active",
+        )
+        session.add(project)
+        await session.flush()
+        session.add_all(
+            [
+                Issue(
+                    project_id=project.id,
+                    title="Fix flaky test",
+                    description="Authentication tokens expire during the suite",
+                ),
+                Document(
+                    project_id=project.id,
+                    title="Release notes",
+                    document_key="AUTH-D1",
+                    document_number=1,
+                    content="Routine changes. " * 50 + "The authentication service moved.",
+                ),
+            ]
+        )
+        await session.commit()
+
+        # Rows written before the index exists are backfilled
+        async with session.bind.begin() as conn:
+            await conn.run_sync(install_search_index)
+        yield session
+
+
+async def test_ranks_across_entities_with_snippets(session):
+    """Title matches rank first; snippets highlight the matched words."""
+    response = await SearchService(session).search("authentication")
+
+    assert response.total == 3
+    assert [r.entity_type for r in response.results][0] == "project"
+    assert {r.entity_type for r in response.results} == {"project", "issue", "document"}
+    document = next(r for r in response.results if r.entity_type == "document")
+    assert "<mark>authentication</mark>" in document.snippet
+    assert len(document.snippet) < 200
+
+
+async def test_index_follows_writes_and_paginates(session):
+    """Inserts, updates and deletes are reflected; paging keeps the total."""
+    service = SearchService(session)
+    issue = Issue(title="Authenticate webhooks", description="Sign payloads")
+    session.add(issue)
+    await session.commit()
+
+    page = await service.search("authentic", limit=2, offset=2)
+    assert (page.total, len(page.results)) == (4, 2)
+
+    issue.title = "Sign webhooks"
+    await session.commit()
+    assert (await service.search("authentic")).total == 3
+
+    await session.execute(delete(Issue).where(Issue.id == issue.id))
+    await session.commit()
+    assert await service.search_ids("sign", "issue") == []
+
+
+async def test_query_syntax_is_not_interpreted(session):
+    """Operators and quotes in user input are treated as plain words."""
+    service = SearchService(session)
+
+    response = await service.search('"login" flow*', entity_types=["project"])
+    assert [r.title for r in response.results] == ["Authentication revamp"]
+    assert (await service.search("***")).total == 0
+
+
+async def test_issue_search_endpoint_uses_the_index(session):
+    """/issues/search matches descriptions through the full-text index."""
+    app = FastAPI()
+    app.include_router(issues.router, prefix="/api/v1/issues")
+    app.dependency_overrides[get_issue_service] = lambda: IssueService(
+        IssueRepository(session), None, None, None
+    )
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/v1/issues/search", params={"query": "tokens"})
+
+    assert response.status_code == 200
+    assert [issue["title"] for issue in response.json()] == ["Fix flaky test"]
+
+
+class FakeGraph:
+    """Graph service returning fixed semantic hits after a delay."""
+
+    def __init__(self, results=None, error=None):
+        self.results = results or []
+        self.error = error
+        self.calls = 0
+
+    async def search(self, query):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        if self.error:
+            raise self.error
+        return GraphSearchResponse(
+            query=query.query, results=self.results, total_results=0, execution_time_ms=0
+        )
+
+
+def test_reciprocal_rank_fusion():
+    """Items ranked well by both lists beat items ranked first by one."""
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["b", "d", "a"]], k=60)
+
+    assert [item for item, _ in fused] == ["b", "a", "d", "c"]
+    assert fused[0][1] == pytest.approx(1 / 62 + 1 / 61)
+
+
+async def test_hybrid_fuses_lexical_and_semantic(session):
+    """Semantic-only hits join the ranking; shared hits keep both ranks."""
+    lexical = await SearchService(session).search("authentication")
+    project = next(r for r in lexical.results if r.entity_type == "project")
+    only_semantic = GraphSearchResult(
+        entity_id=uuid4(),
+        entity_type="issue",
+        content="Users get logged out\nSessions expire early",
+        relevance_score=0.9,
+        metadata={"title": "Random logouts"},
+    )
+    shared = GraphSearchResult(
+        entity_id=project.entity_id,
+        entity_type="project",
+        content="Authentication revamp",
+        relevance_score=0.8,
+    )
+    graph = FakeGraph([only_semantic, shared])
+    service = HybridSearchService(session, graph, cache=HybridSearchCache())
+
+    response = await service.search("Authentication", limit=10)
+
+    assert response.sources == ["lexical", "semantic"]
+    assert response.results[0].entity_id == project.entity_id
+    assert (response.results[0].lexical_rank, response.results[0].semantic_rank) == (1, 2)
+    logouts = next(r for r in response.results if r.entity_id == only_semantic.entity_id)
+    assert (logouts.title, logouts.lexical_rank) == ("Random logouts", None)
+    assert len(response.results) == 4
+
+    again = await service.search("  authentication ", limit=10)
+    assert again.cached is True and graph.calls == 1
+    assert again.results == response.results
+
+
+async def test_hybrid_falls_back_to_lexical(session):
+    """An unreachable graph leaves full-text results only."""
+    service = HybridSearchService(
+        session, FakeGraph(error=ConnectionError("down")), cache=HybridSearchCache()
+    )
+
+    response = await service.search("authentication", entity_types=["issue"])
+
+    assert response.sources == ["lexical"]
+    assert [r.entity_type for r in response.results] == ["issue"]
@@ -276,20 +276,10 @@ class TestProjectService:
             id=project_id, name="Test Project", description="Test", status="active"
         )
 
-        issues = [
-            Issue(
-                id=uuid4(),
-                title=f"Issue {i}",
-                description=f"Desc {i}",
-                status="open" if i < 2 else "closed",
-                type="bug",
-                project_id=project_id,
-            )
-            for i in range(5)
-        ]
-
         mock_project_repository.get_by_id.return_value = project
-        mock_issue_repository.get_by_project.return_value = issues
+        mock_issue_repository.get_status_counts.return_value = {
+            project_id: {"open": 2, "closed": 3}
+        }
 
         # Act
         result = await project_service.get_project_statistics(project_id)
@@ -299,9 +289,10 @@ class TestProjectService:
         assert result["total_issues"] == 5
         assert result["open_issues"] == 2
         assert result["closed_issues"] == 3
+        assert result["in_progress_issues"] == 0
         assert result["completion_rate"] == 60.0  # 3/5 * 100
         mock_project_repository.get_by_id.assert_called_once_with(project_id)
-        mock_issue_repository.get_by_project.assert_called_once_with(project_id)
+        mock_issue_repository.get_status_counts.assert_called_once_with([project_id])
 
     @pytest.mark.asyncio
     async def test_archive_project(self, project_service, mock_project_repository):
@@ -0,0 +1,104 @@
+"""Unit tests for in-process chat prompt building and background memory extraction."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from turbo.core.models.settings import Setting
+from turbo.core.models.staff import Staff
+from turbo.core.services import streaming
+from turbo.core.services.conversation_context import ConversationContextManager
+from turbo.utils.exceptions import StaffNotFoundError
+
+
+@pytest.fixture
+async def db_session(sqlite_session_factory):
+    """SQLite session with the staff and settings tables."""
+    factory = await sqlite_session_factory(Staff, Setting)
+    async with factory() as session:
+        yield session
+
+
+async def test_api_key_read_from_settings_table(db_session):
+    """The stored key is read directly, without calling the API over HTTP."""
+    db_session.add(Setting(key="anthropic_api_key", value={"api_key": "sk-stored"}))
+    await db_session.commit()
+
+    assert await streaming.get_anthropic_api_key(db_session) == "sk-stored"
+
+
+async def test_prompt_built_from_repositories(db_session, monkeypatch):
+    """Staff and context come from the session; the message count drives extraction."""
+    staff = Staff(
+        handle="chief",
+        name="Chief of Staff",
+        description="Leads",
+        persona="Direct and pragmatic",
+        role_type="leadership",
+        capabilities=["planning"],
+    )
+    db_session.add(staff)
+    await db_session.commit()
+
+    async def fake_context(self, entity_type, entity_id, current_message):
+        return {
+            "recent_messages": [{"message_type": "user", "content": current_message}],
+            "conversation_summary": None,
+            "key_facts": [],
+            "related_entities": {},
+            "memories": [],
+            "user_context": {"active_projects": [], "active_issues": []},
+            "entities_discussed": {},
+            "total_message_count": 20,
+            "metadata": {},
+        }
+
+    monkeypatch.setattr(ConversationContextManager, "build_context", fake_context)
+
+    prompt = await streaming.build_conversation_prompt(
+        db_session, "staff", staff.id, "What should we ship?", "sk-test"
+    )
+
+    assert prompt.entity["name"] == "Chief of Staff"
+    assert "Direct and pragmatic" in prompt.system_prompt
+    assert "What should we ship?" in prompt.user_prompt
+    assert prompt.message_count == 20
+
+    with pytest.raises(StaffNotFoundError):
+        await streaming.build_conversation_prompt(
+            db_session, "staff", uuid4(), "Hello", "sk-test"
+        )
+
+
+async def test_memory_extraction_runs_once_per_conversation(monkeypatch):
+    """Extraction runs in the background and is not stacked for one conversation."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+    calls = []
+
+    async def fake_extract(self, entity_type, entity_id, force=False):
+        calls.append(entity_id)
+        started.set()
+        await release.wait()
+
+    monkeypatch.setattr(
+        ConversationContextManager, "trigger_memory_extraction", fake_extract
+    )
+    worker = streaming.MemoryExtractionWorker(
+        session_factory=async_sessionmaker(
+            create_async_engine("sqlite+aiosqlite:///:memory:")
+        )
+    )
+    entity_id = uuid4()
+
+    task = worker.submit("staff", entity_id, "sk-test")
+    await started.wait()
+    assert worker.submit("staff", entity_id, "sk-test") is None
+
+    release.set()
+    await task
+    assert calls == [entity_id]
+    assert worker.submit("staff", entity_id, "sk-test") is not None
+    await worker.stop()
@@ -0,0 +1,126 @@
+"""Unit tests for the transcription job queue and worker pipeline."""
+
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from turbo.core.models import PodcastEpisode, PodcastShow, TranscriptionJob
+from turbo.core.services.transcription import (
+    TranscriptionService,
+    TranscriptionWorkerPool,
+)
+
+
+class FakeWorkerPool(TranscriptionWorkerPool):
+    """Worker pool that 'decodes' by sleeping instead of running Whisper."""
+
+    def __init__(self, num_workers: int, delay: float):
+        super().__init__(num_workers=num_workers, cpu_threads=1)
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+
+    async def transcribe(self, audio_path, language=None, beam_size=5):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return f"transcript of {audio_path.read_text()}", {"segments": []}
+
+
+@pytest.fixture
+async def transcription_session(sqlite_session_factory):
+    """SQLite session with the podcast and transcription job tables."""
+    factory = await sqlite_session_factory(PodcastShow, PodcastEpisode, TranscriptionJob)
+    async with factory() as session:
+        yield session
+
+
+async def _add_episodes(session: AsyncSession, count: int) -> list:
+    show = PodcastShow(title="Show", feed_url="https://example.com/feed.xml")
+    session.add(show)
+    await session.flush()
+    episodes = [
+        PodcastEpisode(
+            show_id=show.id,
+            title=f"Episode {index}",
+            audio_url=f"https://example.com/{index}.mp3",
+        )
+        for index in range(count)
+    ]
+    session.add_all(episodes)
+    await session.commit()
+    return [episode.id for episode in episodes]
+
+
+def _service(session: AsyncSession, pool: FakeWorkerPool, monkeypatch):
+    async def fake_download(audio_url, temp_dir):
+        if audio_url.endswith("/broken.mp3"):
+            raise ValueError("404 Not Found")
+        await asyncio.sleep(0.05)
+        path = temp_dir / "audio.mp3"
+        path.write_text(audio_url)
+        return path
+
+    service = TranscriptionService(
+        session, enable_diarization=False, worker_pool=pool
+    )
+    monkeypatch.setattr(service, "download_audio", fake_download)
+    return service
+
+
+async def test_batch_runs_in_parallel(transcription_session, monkeypatch):
+    """Episodes are spread over the workers and failures are recorded per job."""
+    episode_ids = await _add_episodes(transcription_session, 5)
+    broken = await transcription_session.get(PodcastEpisode, episode_ids[-1])
+    broken.audio_url = "https://example.com/broken.mp3"
+    await transcription_session.commit()
+    pool = FakeWorkerPool(num_workers=2, delay=0.3)
+    service = _service(transcription_session, pool, monkeypatch)
+
+    started = time.monotonic()
+    results = await service.transcribe_multiple_episodes(episode_ids)
+    elapsed = time.monotonic() - started
+
+    # Four decodes on two workers take two rounds, not four
+    assert elapsed < 1.0
+    assert pool.peak == 2
+    assert [results[i]["success"] for i in episode_ids] == [True] * 4 + [False]
+    assert "404" in results[episode_ids[-1]]["error"]
+    assert results[episode_ids[0]]["episode"].transcript.startswith("transcript of")
+    assert await service.get_job_progress() == {
+        "pending": 0,
+        "downloading": 0,
+        "transcribing": 0,
+        "completed": 4,
+        "failed": 1,
+        "total": 5,
+    }
+
+
+async def test_resume_interrupted_jobs(transcription_session, monkeypatch):
+    """Jobs left running by a crashed process are picked up again."""
+    first, second = await _add_episodes(transcription_session, 2)
+    transcription_session.add_all(
+        [
+            TranscriptionJob(episode_id=first, status="transcribing", attempts=1),
+            TranscriptionJob(episode_id=second, status="pending"),
+        ]
+    )
+    await transcription_session.commit()
+    service = _service(
+        transcription_session, FakeWorkerPool(num_workers=2, delay=0), monkeypatch
+    )
+
+    results = await service.resume_jobs()
+
+    assert set(results) == {first, second}
+    assert all(result["success"] for result in results.values())
+    jobs = await transcription_session.scalars(select(TranscriptionJob))
+    assert {(job.status, job.attempts) for job in jobs} == {
+        ("completed", 2),
+        ("completed", 1),
+    }
@@ -0,0 +1,100 @@
+"""Unit tests for the local knowledge graph vector index."""
+
+import numpy as np
+import pytest
+
+from turbo.core.services.vector_index import LocalVectorIndex, top_k_indices
+
+
+@pytest.fixture
+def vectors():
+    """Deterministic random embeddings."""
+    rng = np.random.default_rng(42)
+    return rng.normal(size=(500, 32)).astype(np.float32)
+
+
+class TestLocalVectorIndex:
+    """Test LocalVectorIndex search and maintenance."""
+
+    def test_exact_search_matches_brute_force(self, vectors):
+        """Exact mode returns the same ranking as a full cosine scan."""
+        index = LocalVectorIndex(initial_capacity=8)
+        for i, vector in enumerate(vectors):
+            index.upsert("issue", str(i), vector.tolist())
+
+        query = vectors[7] + 0.1
+        hits = index.search(query.tolist(), k=5)
+
+        normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        expected = np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:5]
+        assert [int(entity_id) for _, entity_id, _ in hits] == expected.tolist()
+        assert hits[0][2] >= hits[-1][2]
+
+    def test_entity_type_filter_and_exclude(self, vectors):
+        """Type filters and exclusions are applied before top-k selection."""
+        index = LocalVectorIndex()
+        for i, vector in enumerate(vectors[:20]):
+            index.upsert("issue" if i % 2 else "document", str(i), vector.tolist())
+
+        hits = index.search(
+            vectors[3].tolist(), k=20, entity_types=["issue"], exclude=("issue", "3")
+        )
+
+        assert len(hits) == 9
+        assert all(entity_type == "issue" for entity_type, _, _ in hits)
+        assert "3" not in {entity_id for _, entity_id, _ in hits}
+        assert index.search(vectors[3].tolist(), k=5, entity_types=["note"]) == []
+        # An empty filter means no filter, as on the Neo4j index
+        assert len(index.search(vectors[3].tolist(), k=20, entity_types=[])) == 20
+
+    def test_upsert_replaces_and_remove_compacts(self, vectors):
+        """Re-indexing an entity replaces its vector; removal keeps others findable."""
+        index = LocalVectorIndex()
+        index.upsert("issue", "a", vectors[0].tolist())
+        index.upsert("issue", "b", vectors[1].tolist())
+        index.upsert("issue", "a", vectors[2].tolist())
+
+        assert len(index) == 2
+        assert index.search(vectors[2].tolist(), k=1)[0][1] == "a"
+
+        assert index.remove("issue", "a") is True
+        assert index.remove("issue", "a") is False
+        assert len(index) == 1
+        assert index.search(vectors[1].tolist(), k=5)[0][1] == "b"
+
+    def test_min_score_threshold(self, vectors):
+        """Results below the similarity threshold are dropped."""
+        index = LocalVectorIndex()
+        for i, vector in enumerate(vectors[:50]):
+            index.upsert("issue", str(i), vector.tolist())
+
+        hits = index.search(vectors[0].tolist(), k=50, min_score=0.99)
+
+        assert [entity_id for _, entity_id, _ in hits] == ["0"]
+
+    def test_ivf_partitioning_keeps_nearest_neighbours(self, vectors):
+        """Past the threshold the index partitions and still finds near duplicates."""
+        index = LocalVectorIndex(ivf_threshold=200, nprobe=4)
+        for i, vector in enumerate(vectors):
+            index.upsert("issue", str(i), vector.tolist())
+
+        assert index.is_partitioned
+        for i in range(0, 500, 50):
+            hits = index.search((vectors[i] * 1.01).tolist(), k=1)
+            assert hits[0][1] == str(i)
+
+    def test_dimension_mismatch_raises(self):
+        """Vectors must share the first vector's dimensionality."""
+        index = LocalVectorIndex()
+        index.upsert("issue", "a", [1.0, 0.0, 0.0])
+
+        with pytest.raises(ValueError):
+            index.upsert("issue", "b", [1.0, 0.0])
+
+
+def test_top_k_indices_orders_best_first():
+    """top_k_indices returns the highest scores in descending order."""
+    scores = np.array([0.1, 0.9, 0.5, 0.7])
+
+    assert top_k_indices(scores, 2).tolist() == [1, 3]
+    assert top_k_indices(scores, 10).tolist() == [1, 3, 2, 0]
@@ -0,0 +1,143 @@
+"""Unit tests for the webhook outbox dispatcher."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from sqlalchemy import func, select
+from turbo.core.models.note import Note
+from turbo.core.models.webhook import Webhook, WebhookDelivery
+from turbo.core.repositories.webhook import WebhookRepository
+from turbo.core.services import webhook_service
+from turbo.core.services.webhook_dispatcher import WebhookDispatcher, webhook_dispatcher
+from turbo.utils.config import WebhookSettings
+
+
+@pytest.fixture
+async def session_factory(sqlite_session_factory):
+    """SQLite session factory with the webhook tables and notes."""
+    return await sqlite_session_factory(Webhook, WebhookDelivery, Note)
+
+
+@pytest.fixture
+def receiver(monkeypatch):
+    """Mock webhook receiver; /down answers 500, others 200 after a short delay."""
+    state = {"requests": [], "active": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        state["requests"].append(request)
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.02)
+        state["active"] -= 1
+        if request.url.path == "/down":
+            return httpx.Response(500, text="boom")
+        return httpx.Response(200, text="ok")
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(webhook_service, "get_http_client", lambda: client)
+    return state
+
+
+async def _queue(session_factory, path: str, count: int, **webhook_fields) -> Webhook:
+    async with session_factory() as session:
+        webhook = Webhook(
+            name=path,
+            url=f"https://hooks.example.com{path}",
+            secret="s" * 16,
+            events=["issue.created"],
+            **webhook_fields,
+        )
+        session.add(webhook)
+        await session.flush()
+        repository = WebhookRepository(session)
+        for index in range(count):
+            await repository.enqueue_deliveries(
+                [webhook], "issue.created", {"n": index}, commit=False
+            )
+        await session.commit()
+        return webhook
+
+
+async def _deliveries(session_factory, webhook: Webhook) -> list[WebhookDelivery]:
+    async with session_factory() as session:
+        result = await session.scalars(
+            select(WebhookDelivery).where(WebhookDelivery.webhook_id == webhook.id)
+        )
+        return list(result)
+
+
+async def test_dispatch_limits_concurrency_per_endpoint(session_factory, receiver):
+    """Deliveries to one endpoint never exceed its concurrency limit."""
+    webhook = await _queue(session_factory, "/single", 6)
+    dispatcher = WebhookDispatcher(
+        session_factory, WebhookSettings(max_per_endpoint=2)
+    )
+
+    await asyncio.gather(*await dispatcher.dispatch_due())
+
+    assert len(receiver["requests"]) == 6
+    assert receiver["peak"] == 2
+    assert {d.status for d in await _deliveries(session_factory, webhook)} == {"success"}
+    assert await dispatcher.dispatch_due() == []
+
+
+async def test_batching_webhook_gets_events_envelope(session_factory, receiver):
+    """Opted-in receivers get several events per request."""
+    webhook = await _queue(session_factory, "/batch", 5, batch_events=True)
+    dispatcher = WebhookDispatcher(
+        session_factory, WebhookSettings(max_batch_size=3)
+    )
+
+    await asyncio.gather(*await dispatcher.dispatch_due())
+
+    bodies = [json.loads(r.content) for r in receiver["requests"]]
+    assert sorted(len(body["events"]) for body in bodies) == [2, 3]
+    assert receiver["requests"][0].headers["X-Webhook-Event"] == "batch"
+    deliveries = await _deliveries(session_factory, webhook)
+    assert all(d.status == "success" and d.delivered_at for d in deliveries)
+
+
+async def test_failed_delivery_backs_off(session_factory, receiver):
+    """A failing endpoint is rescheduled with backoff instead of retried at once."""
+    webhook = await _queue(session_factory, "/down", 1, max_retries=2)
+    dispatcher = WebhookDispatcher(session_factory, WebhookSettings())
+
+    await asyncio.gather(*await dispatcher.dispatch_due())
+
+    (delivery,) = await _deliveries(session_factory, webhook)
+    assert (delivery.status, delivery.attempt_number) == ("retrying", 2)
+    assert delivery.response_status_code == 500
+    # Not due again until the backoff has passed
+    assert await dispatcher.dispatch_due() == []
+
+
+async def test_events_share_the_entity_transaction(session_factory):
+    """Deliveries queued with commit=False are kept or discarded with the entity."""
+    webhook = await _queue(session_factory, "/notes", 0)
+
+    async def emit(session, commit: bool) -> None:
+        repository = WebhookRepository(session)
+        repository.get_webhooks_for_event = AsyncMock(return_value=[webhook])
+        session.add(Note(title="Draft"))
+        await webhook_service.WebhookService(repository).emit_event(
+            "note.created", {"title": "Draft"}, commit=False
+        )
+        await (session.commit() if commit else session.rollback())
+
+    async def count(model) -> int:
+        async with session_factory() as session:
+            return await session.scalar(select(func.count()).select_from(model))
+
+    with patch.object(webhook_dispatcher, "wake") as wake:
+        async with session_factory() as session:
+            await emit(session, commit=False)
+        assert (await count(Note), await count(WebhookDelivery)) == (0, 0)
+        wake.assert_not_called()
+
+        async with session_factory() as session:
+            await emit(session, commit=True)
+        assert (await count(Note), await count(WebhookDelivery)) == (1, 1)
+        wake.assert_called_once()
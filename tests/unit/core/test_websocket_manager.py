@@ -0,0 +1,138 @@
+"""Unit tests for queued, coalescing websocket broadcasts."""
+
+import asyncio
+import json
+
+from turbo.core.services.websocket_manager import ConnectionManager
+from turbo.utils.config import WebSocketSettings
+
+
+class FakeWebSocket:
+    """Records sent text; sends block while ``gate`` is cleared."""
+
+    def __init__(self, blocked: bool = False):
+        self.sent: list[str] = []
+        self.closed_with: int | None = None
+        self.gate = asyncio.Event()
+        if not blocked:
+            self.gate.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data: str):
+        await self.gate.wait()
+        self.sent.append(data)
+
+    async def wait_for_sent(self, count: int):
+        """Wait until ``count`` messages have been sent."""
+
+        async def sent():
+            while len(self.sent) < count:
+                await asyncio.sleep(0)
+
+        await asyncio.wait_for(sent(), timeout=1)
+
+    async def close(self, code: int = 1000):
+        self.closed_with = code
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def _manager(**overrides) -> ConnectionManager:
+    return ConnectionManager(WebSocketSettings(**{"send_queue_size": 4, **overrides}))
+
+
+async def test_slow_client_does_not_block_broadcast():
+    """Broadcast returns at once; the fast client receives the shared payload."""
+    manager = _manager()
+    fast, slow = FakeWebSocket(), FakeWebSocket(blocked=True)
+    await manager.connect(fast, "issue", "1")
+    await manager.connect(slow, "issue", "1")
+
+    await asyncio.wait_for(
+        manager.send_comment_created("issue", "1", {"id": "c1"}), timeout=0.1
+    )
+    await _settle()
+
+    assert [json.loads(m)["type"] for m in fast.sent] == ["comment_created"]
+    assert slow.sent == []
+    slow.gate.set()
+    await slow.wait_for_sent(1)
+    assert slow.sent == fast.sent
+
+
+async def test_drop_oldest_when_queue_full():
+    """A full queue sheds its oldest messages and counts the drops."""
+    manager = _manager()
+    slow = FakeWebSocket(blocked=True)
+    await manager.connect(slow, "issue", "1")
+
+    for i in range(10):
+        await manager.send_comment_deleted("issue", "1", str(i))
+    await _settle()
+    slow.gate.set()
+    await slow.wait_for_sent(4)
+
+    ids = [json.loads(m)["data"]["id"] for m in slow.sent]
+    assert ids == ["6", "7", "8", "9"]
+    room = manager.get_metrics()["issue:1"]
+    assert room["dropped"] == 6
+    assert room["connections"][0]["max_queue_depth"] == 4
+
+
+async def test_disconnect_policy_drops_slow_client():
+    """Under the disconnect policy a client that falls behind is closed."""
+    manager = _manager(slow_consumer_policy="disconnect")
+    fast, slow = FakeWebSocket(), FakeWebSocket(blocked=True)
+    await manager.connect(fast, "issue", "1")
+    await manager.connect(slow, "issue", "1")
+
+    for i in range(10):
+        await manager.send_comment_deleted("issue", "1", str(i))
+        await _settle()
+
+    await fast.wait_for_sent(10)
+
+    assert slow.closed_with == 1013
+    assert list(manager.rooms["issue:1"]) == [fast]
+    assert manager.get_metrics()["issue:1"]["slow_disconnects"] == 1
+
+
+async def test_typing_events_coalesce():
+    """Pending typing updates for the same author collapse to the latest."""
+    manager = _manager()
+    socket = FakeWebSocket(blocked=True)
+    await manager.connect(socket, "issue", "1")
+
+    await manager.send_comment_created("issue", "1", {"id": "c1"})
+    await _settle()
+    for _ in range(3):
+        await manager.send_ai_typing_start("issue", "1")
+        await manager.send_ai_typing_stop("issue", "1")
+    socket.gate.set()
+    await socket.wait_for_sent(2)
+
+    assert [json.loads(m)["type"] for m in socket.sent] == [
+        "comment_created",
+        "ai_typing_stop",
+    ]
+    assert manager.get_metrics()["issue:1"]["coalesced"] == 5
+
+
+async def test_disconnect_cleans_up_room():
+    """Leaving the last connection removes the room and its metrics."""
+    manager = _manager()
+    socket = FakeWebSocket()
+    await manager.connect_agent_activity(socket)
+    await manager.send_personal(socket, "pong")
+    await socket.wait_for_sent(1)
+
+    manager.disconnect_agent_activity(socket)
+
+    assert socket.sent == ["pong"]
+    assert manager.rooms == {}
+    assert manager.get_metrics() == {}
@@ -0,0 +1,78 @@
+"""Unit tests for MCP server tool dispatch."""
+
+import json
+
+import httpx
+import pytest
+
+pytest.importorskip("mcp")
+
+from turbo import mcp_server  # noqa: E402
+
+
+@pytest.fixture
+def api_requests(monkeypatch):
+    """Route the shared API client to a mock transport."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=[{"id": "p1", "name": "Turbo"}])
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(mcp_server, "_api_client", client)
+    return requests
+
+
+def test_every_listed_tool_has_a_handler():
+    """The tool list and the handler registry cover the same names."""
+    names = [tool.name for tool in mcp_server.TOOLS]
+
+    assert len(names) == len(set(names))
+    assert set(names) == set(mcp_server.TOOL_HANDLERS)
+
+
+async def test_call_tool_reuses_shared_client(api_requests):
+    """Tool calls dispatch by name over the one long-lived client."""
+    first = await mcp_server.call_tool("list_projects", {})
+    await mcp_server.call_tool("list_projects", {"status": "active"})
+
+    assert json.loads(first[0].text) == [{"id": "p1", "name": "Turbo"}]
+    assert [r.url.params.get("status") for r in api_requests] == [None, "active"]
+    assert mcp_server.get_api_client() is mcp_server._api_client
+
+
+async def test_unknown_tool():
+    """Unknown names are reported without touching the API."""
+    result = await mcp_server.call_tool("no_such_tool", {})
+
+    assert result[0].text == "Unknown tool: no_such_tool"
+
+
+async def test_batch_runs_tools_and_reports_each_result(api_requests):
+    """Batch returns one result per call, including per-call errors."""
+    result = await mcp_server.call_tool(
+        "batch",
+        {
+            "operations": [
+                {"tool": "list_projects"},
+                {"tool": "no_such_tool", "arguments": {}},
+                {"tool": "list_projects", "arguments": {"status": "active"}},
+            ]
+        },
+    )
+
+    results = json.loads(result[0].text)
+    assert [r["tool"] for r in results] == ["list_projects", "no_such_tool", "list_projects"]
+    assert json.loads(results[0]["result"]) == [{"id": "p1", "name": "Turbo"}]
+    assert results[1]["result"] == "Unknown tool: no_such_tool"
+    assert len(api_requests) == 2
+
+
+async def test_batch_cannot_nest():
+    """A batch call inside a batch is refused."""
+    result = await mcp_server.call_tool(
+        "batch", {"operations": [{"tool": "batch", "arguments": {}}]}
+    )
+
+    assert result[0].text == "Error: batch operations cannot be nested"
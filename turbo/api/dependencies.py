@@ -4,6 +4,7 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from turbo.core.database import get_db_session
+from turbo.core.database.connection import get_session_factory
 from turbo.core.repositories import (
     DocumentRepository,
     InitiativeRepository,
@@ -35,7 +36,9 @@ from turbo.core.services import (
 from turbo.core.services.company import CompanyService
 from turbo.core.services.job_application import JobApplicationService
 from turbo.core.services.network_contact import NetworkContactService
+from turbo.core.services.my_queue import MyQueueService
 from turbo.core.services.note import NoteService
+from turbo.core.services.search import SearchService
 from turbo.core.services.mentor import MentorService
 from turbo.core.services.mentor_context import MentorContextService
 from turbo.core.services.staff import StaffService
@@ -133,6 +136,18 @@ def get_git_worktree_service(
 
 
 # Service dependencies
+def get_search_service(
+    session: AsyncSession = Depends(get_db_session),
+) -> SearchService:
+    """Get full-text search service."""
+    return SearchService(session)
+
+
+def get_my_queue_service() -> MyQueueService:
+    """Get My Queue service; it opens a session per concurrently loaded section."""
+    return MyQueueService(get_session_factory())
+
+
 def get_project_service(
     project_repo: ProjectRepository = Depends(get_project_repository),
     issue_repo: IssueRepository = Depends(get_issue_repository),
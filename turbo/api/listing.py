@@ -0,0 +1,105 @@
+"""Shared handling for keyset-paginated, field-selectable list endpoints.
+
+List endpoints accept:
+
+- ``cursor``: continue from a previous page; the cursor for the next page is
+  returned in the ``X-Next-Cursor`` header, which is absent on the last page
+- ``fields``: comma-separated columns to return; only those are loaded
+- ``order``: the keyset ordering to page through
+- ``stream``: return every match as one JSON array, written page by page
+
+Any of ``cursor``, ``fields`` or ``order`` selects keyset pagination, with
+``limit`` as the page size. A request with only ``limit`` and ``offset``
+keeps the endpoint's original listing and ordering.
+"""
+
+from collections.abc import AsyncIterator, Callable
+import json
+from typing import Any
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from turbo.core.database.connection import get_session_factory
+from turbo.core.repositories.base import BaseRepository
+from turbo.core.repositories.pagination import Page, select_fields
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_PAGE_SIZE = 50
+STREAM_PAGE_SIZE = 500
+
+
+def parse_fields(
+    fields: str | None, schema: type[BaseModel], model: type
+) -> list[str] | None:
+    """Validate a ``fields`` parameter against the response schema's columns."""
+    if not fields:
+        return None
+    names = list(dict.fromkeys(n.strip() for n in fields.split(",") if n.strip()))
+    allowed = schema.model_fields.keys() & inspect(model).column_attrs.keys()
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown field(s): {', '.join(unknown)}. "
+            f"Available: {', '.join(sorted(allowed))}",
+        )
+    return names or None
+
+
+def to_item(obj: Any, schema: type[BaseModel], fields: list[str] | None) -> Any:
+    """Full response model, or just the requested fields."""
+    return select_fields(obj, fields) if fields else schema.model_validate(obj)
+
+
+def page_response(page: Page) -> JSONResponse:
+    """JSON list of the page's items with the next cursor in a header."""
+    response = JSONResponse(jsonable_encoder(page.items))
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return response
+
+
+def reject_stream_paging(**params: Any) -> None:
+    """Refuse paging parameters on a streamed listing, which returns every match."""
+    given = [name for name, value in params.items() if value is not None]
+    if given:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"{', '.join(given)} cannot be combined with stream",
+        )
+
+
+def stream_listing(
+    repository_class: Callable[[AsyncSession], BaseRepository],
+    filters: dict[str, Any],
+    schema: type[BaseModel],
+    order: str,
+    fields: list[str] | None,
+) -> StreamingResponse:
+    """Stream every record matching ``filters`` as one JSON array.
+
+    Records are read a keyset page at a time on a session owned by the
+    stream, so memory stays flat however many rows match.
+    """
+
+    async def body() -> AsyncIterator[bytes]:
+        yield b"["
+        first = True
+        async with get_session_factory()() as session:
+            repository = repository_class(session)
+            criteria = repository.list_criteria(**filters)
+            async for batch in repository.iter_pages(
+                *criteria, page_size=STREAM_PAGE_SIZE, order=order, fields=fields
+            ):
+                items = jsonable_encoder([to_item(obj, schema, fields) for obj in batch])
+                chunk = ",".join(json.dumps(item) for item in items)
+                yield (chunk if first else "," + chunk).encode()
+                first = False
+        yield b"]"
+
+    return StreamingResponse(body(), media_type="application/json")
@@ -6,6 +6,7 @@ from turbo.api.v1.endpoints import (
     action_approvals,
     agents,
     ai,
+    batch,
     blueprints,
     calendar,
     calendar_events,
@@ -37,6 +38,7 @@ from turbo.api.v1.endpoints import (
     resumes,
     saved_filters,
     script_runs,
+    search,
     settings,
     skills,
     subagents,
@@ -56,6 +58,7 @@ router = APIRouter(prefix="/api/v1")
 router.include_router(action_approvals.router)
 router.include_router(agents.router, tags=["agents"])
 router.include_router(ai.router, prefix="/ai", tags=["ai"])
+router.include_router(batch.router, tags=["batch"])
 router.include_router(projects.router, prefix="/projects", tags=["projects"])
 router.include_router(issues.router, prefix="/issues", tags=["issues"])
 router.include_router(work_queue.router, prefix="/work-queue", tags=["work-queue"])
@@ -84,6 +87,7 @@ router.include_router(calendar_events.router, prefix="/calendar-events", tags=["
 router.include_router(skills.router, prefix="/skills", tags=["skills"])
 router.include_router(resumes.router, prefix="/resumes", tags=["resumes"])
 router.include_router(script_runs.router, prefix="/script-runs", tags=["script-runs"])
+router.include_router(search.router, tags=["search"])
 router.include_router(settings.router, tags=["settings"])
 router.include_router(subagents.router)
 router.include_router(terminal.router)
@@ -0,0 +1,85 @@
+"""Batch API endpoint."""
+
+import asyncio
+from collections.abc import Iterator
+
+import httpx
+from fastapi import APIRouter, HTTPException, Request, status
+
+from turbo.core.schemas import BatchOperation, BatchRequest, BatchResponse, BatchResult
+
+router = APIRouter()
+
+API_PREFIX = "/api/v1"
+
+# Set on every dispatched operation, so a batch routed to itself is refused
+# however its path was spelled
+BATCH_MARKER_HEADER = "X-Turbo-Batch-Operation"
+
+
+@router.post("/batch", response_model=BatchResponse)
+async def run_batch(batch_request: BatchRequest, request: Request) -> BatchResponse:
+    """
+    Run several API operations in one round trip.
+
+    Operations are dispatched in-process to this app's own routes, so each
+    gets the usual validation and response models. Consecutive GET
+    operations run concurrently, each on its own pooled database session
+    (one AsyncSession cannot run queries concurrently). Other methods run
+    alone and in order, so they see the effect of earlier operations.
+
+    Results come back in operation order. A failing operation reports its
+    status code and error body without affecting the rest.
+    """
+    if BATCH_MARKER_HEADER in request.headers:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Nested batch requests are not allowed",
+        )
+
+    transport = httpx.ASGITransport(app=request.app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url=str(request.base_url),
+        headers={BATCH_MARKER_HEADER: "1"},
+    ) as client:
+        results: list[BatchResult] = []
+        for group in _group_operations(batch_request.operations):
+            results.extend(
+                await asyncio.gather(*(_run_operation(client, op) for op in group))
+            )
+    return BatchResponse(results=results)
+
+
+def _group_operations(
+    operations: list[BatchOperation],
+) -> Iterator[list[BatchOperation]]:
+    """Split operations into runs of concurrent reads and single writes."""
+    reads: list[BatchOperation] = []
+    for operation in operations:
+        if operation.method == "GET":
+            reads.append(operation)
+            continue
+        if reads:
+            yield reads
+            reads = []
+        yield [operation]
+    if reads:
+        yield reads
+
+
+async def _run_operation(
+    client: httpx.AsyncClient, operation: BatchOperation
+) -> BatchResult:
+    """Dispatch one operation and capture its response."""
+    response = await client.request(
+        operation.method,
+        f"{API_PREFIX}{operation.path}",
+        params=operation.params,
+        json=operation.body if operation.method != "GET" else None,
+    )
+    try:
+        body = response.json() if response.content else None
+    except ValueError:
+        body = response.text
+    return BatchResult(id=operation.id, status_code=response.status_code, body=body)
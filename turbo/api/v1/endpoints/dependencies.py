@@ -9,6 +9,7 @@ from turbo.api.dependencies import get_db_session
 from turbo.core.repositories.issue_dependency import IssueDependencyRepository
 from turbo.core.schemas.issue_dependency import (
     DependencyChain,
+    DependencyClosure,
     IssueDependencies,
     IssueDependencyCreate,
     IssueDependencyResponse,
@@ -122,4 +123,25 @@ async def get_dependency_chain(
     """
     repo = IssueDependencyRepository(session)
     chain = await repo.get_dependency_chain(issue_id)
-    return DependencyChain(issue_id=issue_id, chain=chain)
\ No newline at end of file
+    return DependencyChain(issue_id=issue_id, chain=chain)
+
+
+@router.get("/{issue_id}/closure", response_model=DependencyClosure)
+async def get_dependency_closure(
+    issue_id: UUID,
+    session: AsyncSession = Depends(get_db_session),
+) -> DependencyClosure:
+    """Get every issue upstream and downstream of an issue.
+
+    Both directions are resolved with a single query.
+
+    Args:
+        issue_id: ID of the issue
+        session: Database session
+
+    Returns:
+        Upstream and downstream issues, each in topological order
+    """
+    repo = IssueDependencyRepository(session)
+    closure = await repo.get_dependency_closure(issue_id)
+    return DependencyClosure(issue_id=issue_id, **closure)
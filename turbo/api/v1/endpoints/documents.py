@@ -9,6 +9,15 @@ from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, Up
 from pydantic import BaseModel
 
 from turbo.api.dependencies import get_document_service, get_project_service, get_tag_service
+from turbo.api.listing import (
+    DEFAULT_PAGE_SIZE,
+    page_response,
+    parse_fields,
+    reject_stream_paging,
+    stream_listing,
+)
+from turbo.core.models.document import Document
+from turbo.core.repositories.document import DocumentRepository
 from turbo.core.schemas import DocumentCreate, DocumentResponse, DocumentUpdate, ProjectCreate, TagCreate
 from turbo.core.services import DocumentService, ProjectService, TagService
 from turbo.utils.exceptions import (
@@ -94,9 +103,47 @@ async def get_documents(
     work_company: str | None = Query(None),
     limit: int | None = Query(None, ge=1, le=100),
     offset: int | None = Query(None, ge=0),
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
+    order: str | None = Query(None, pattern="^created_at$"),
+    fields: str | None = Query(None, description="Comma-separated fields to return"),
+    stream: bool = Query(False, description="Stream every match as one JSON array"),
     document_service: DocumentService = Depends(get_document_service),
-) -> list[DocumentResponse]:
-    """Get all documents with optional filtering by type, format, project, or workspace."""
+) -> list[DocumentResponse] | Response:
+    """Get all documents with optional filtering by type, format, project, or workspace.
+
+    With ``cursor``, ``fields`` or ``order`` (and no ``offset``) results are
+    keyset paginated newest first, ``limit`` at a time: filters combine, and
+    the cursor for the next page is returned in the ``X-Next-Cursor`` header.
+    Leave ``content`` out of ``fields`` to list documents without loading
+    their bodies. A plain ``limit`` keeps the unpaginated listing.
+    """
+    filters = {
+        "document_type": type_filter,
+        "document_format": format_filter,
+        "project_id": project_id,
+        "workspace": workspace,
+        "work_company": work_company,
+    }
+    selected = parse_fields(fields, DocumentResponse, Document)
+    if stream:
+        reject_stream_paging(limit=limit, offset=offset, cursor=cursor)
+        return stream_listing(
+            DocumentRepository, filters, DocumentResponse, "created_at", selected
+        )
+    if offset is None and (cursor or selected or order):
+        try:
+            page = await document_service.get_documents_page(
+                limit=limit or DEFAULT_PAGE_SIZE,
+                cursor=cursor,
+                fields=selected,
+                **filters,
+            )
+        except TurboValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+            ) from e
+        return page_response(page)
+
     # Workspace filtering takes precedence
     if workspace and workspace != "all":
         return await document_service.get_documents_by_workspace(
@@ -2,10 +2,19 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from pydantic import BaseModel
 
 from turbo.api.dependencies import get_issue_service
+from turbo.api.listing import (
+    DEFAULT_PAGE_SIZE,
+    page_response,
+    parse_fields,
+    reject_stream_paging,
+    stream_listing,
+)
+from turbo.core.models.issue import Issue
+from turbo.core.repositories.issue import IssueRepository
 from turbo.core.schemas import IssueCreate, IssueResponse, IssueUpdate, TagResponse
 from turbo.core.services import IssueService
 from turbo.utils.exceptions import (
@@ -71,6 +80,16 @@ async def create_issue(
         )
 
 
+# Declared before /{issue_id_or_key}, which would otherwise match "search"
+@router.get("/search", response_model=list[IssueResponse])
+async def search_issues(
+    query: str = Query(..., min_length=1),
+    issue_service: IssueService = Depends(get_issue_service),
+) -> list[IssueResponse]:
+    """Search issues by title and description."""
+    return await issue_service.search_issues(query)
+
+
 @router.get("/{issue_id_or_key}", response_model=IssueResponse)
 async def get_issue(
     issue_id_or_key: str, issue_service: IssueService = Depends(get_issue_service)
@@ -108,9 +127,49 @@ async def get_issues(
     work_company: str | None = Query(None),
     limit: int | None = Query(None, ge=1, le=100),
     offset: int | None = Query(None, ge=0),
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
+    order: str | None = Query(None, pattern="^(created_at|work_rank)$"),
+    fields: str | None = Query(None, description="Comma-separated fields to return"),
+    stream: bool = Query(False, description="Stream every match as one JSON array"),
     issue_service: IssueService = Depends(get_issue_service),
-) -> list[IssueResponse]:
-    """Get all issues with optional filtering by status, assignee, project, and workspace."""
+) -> list[IssueResponse] | Response:
+    """Get all issues with optional filtering by status, assignee, project, and workspace.
+
+    With ``cursor``, ``fields`` or ``order`` (and no ``offset``) results are
+    keyset paginated, ``limit`` at a time: filters combine, and the cursor
+    for the next page is returned in the ``X-Next-Cursor`` header.
+    ``order=created_at`` pages newest first and ``order=work_rank`` pages
+    through ranked issues in queue order. A plain ``limit`` keeps the
+    unpaginated listing.
+    """
+    filters = {
+        "status": status_filter,
+        "assignee": assignee,
+        "project_id": project_id,
+        "workspace": workspace,
+        "work_company": work_company,
+    }
+    selected = parse_fields(fields, IssueResponse, Issue)
+    if stream:
+        reject_stream_paging(limit=limit, offset=offset, cursor=cursor)
+        return stream_listing(
+            IssueRepository, filters, IssueResponse, order or "created_at", selected
+        )
+    if offset is None and (cursor or selected or order):
+        try:
+            page = await issue_service.get_issues_page(
+                limit=limit or DEFAULT_PAGE_SIZE,
+                cursor=cursor,
+                order=order or "created_at",
+                fields=selected,
+                **filters,
+            )
+        except TurboValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+            ) from e
+        return page_response(page)
+
     # Workspace filtering takes precedence
     if workspace and workspace != "all":
         return await issue_service.get_issues_by_workspace(
@@ -213,15 +272,6 @@ async def reopen_issue(
         )
 
 
-@router.get("/search", response_model=list[IssueResponse])
-async def search_issues(
-    query: str = Query(..., min_length=1),
-    issue_service: IssueService = Depends(get_issue_service),
-) -> list[IssueResponse]:
-    """Search issues by title."""
-    return await issue_service.search_issues_by_title(query)
-
-
 @router.post("/{issue_id}/tags/{tag_id}", response_model=IssueResponse)
 async def add_tag_to_issue(
     issue_id: UUID,
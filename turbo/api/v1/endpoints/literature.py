@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from turbo.core.database.connection import get_db_session
+from turbo.core.repositories.feed_sync import FeedSyncStateRepository
 from turbo.core.repositories.literature import LiteratureRepository
 from turbo.core.schemas.literature import (
     FeedURL,
@@ -16,6 +17,7 @@ from turbo.core.schemas.literature import (
     LiteratureType,
     LiteratureUpdate,
 )
+from turbo.core.services.feed_sync import FeedSyncService
 from turbo.core.services.literature import LiteratureService
 
 router = APIRouter(prefix="/literature", tags=["literature"])
@@ -26,7 +28,8 @@ def get_literature_service(
 ) -> LiteratureService:
     """Get literature service."""
     repository = LiteratureRepository(session)
-    return LiteratureService(repository)
+    feed_sync = FeedSyncService(FeedSyncStateRepository(session))
+    return LiteratureService(repository, feed_sync)
 
 
 @router.post("/", response_model=LiteratureResponse, status_code=status.HTTP_201_CREATED)
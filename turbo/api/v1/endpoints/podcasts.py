@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from turbo.core.database.connection import get_db_session
+from turbo.core.repositories.feed_sync import FeedSyncStateRepository
 from turbo.core.repositories.podcast import PodcastShowRepository, PodcastEpisodeRepository
 from turbo.core.schemas.podcast import (
     PodcastShowCreate,
@@ -17,8 +18,10 @@ from turbo.core.schemas.podcast import (
     PodcastEpisodeResponse,
     PodcastEpisodeUpdate,
     PodcastFeedURL,
+    PodcastFeedRefreshResult,
     PlayProgress,
 )
+from turbo.core.services.feed_sync import FeedSyncService
 from turbo.core.services.podcast import PodcastService
 
 router = APIRouter(prefix="/podcasts", tags=["podcasts"])
@@ -39,7 +42,8 @@ def get_podcast_service(
     """Get podcast service."""
     show_repository = PodcastShowRepository(session)
     episode_repository = PodcastEpisodeRepository(session)
-    return PodcastService(show_repository, episode_repository)
+    feed_sync = FeedSyncService(FeedSyncStateRepository(session))
+    return PodcastService(show_repository, episode_repository, feed_sync)
 
 
 def get_transcription_service(
@@ -218,6 +222,15 @@ async def subscribe_to_feed(
         )
 
 
+@router.post("/shows/refresh", response_model=list[PodcastFeedRefreshResult])
+async def refresh_subscribed_shows(
+    max_concurrency: Optional[int] = Query(None, ge=1, le=32),
+    service: PodcastService = Depends(get_podcast_service),
+) -> list[PodcastFeedRefreshResult]:
+    """Fetch new episodes for every subscribed show concurrently."""
+    return await service.refresh_subscribed_shows(max_concurrency)
+
+
 @router.post("/shows/{show_id}/fetch-episodes", response_model=list[PodcastEpisodeResponse])
 async def fetch_episodes(
     show_id: UUID,
@@ -462,6 +475,38 @@ async def transcribe_multiple_episodes(
     }
 
 
+@router.get("/transcription/jobs")
+async def get_transcription_jobs(
+    transcription_service = Depends(get_transcription_service),
+) -> dict[str, int]:
+    """Get transcription job queue progress by status."""
+    return await transcription_service.get_job_progress()
+
+
+@router.post("/transcription/jobs/resume")
+async def resume_transcription_jobs(
+    transcription_service = Depends(get_transcription_service),
+) -> dict[str, Any]:
+    """Run pending and interrupted transcription jobs."""
+    results = await transcription_service.resume_jobs()
+    successful = sum(1 for r in results.values() if r["success"])
+    return {
+        "summary": {
+            "total": len(results),
+            "successful": successful,
+            "failed": len(results) - successful,
+        },
+        "results": {
+            str(episode_id): {
+                "success": result["success"],
+                "episode_id": str(episode_id),
+                "error": result["error"],
+            }
+            for episode_id, result in results.items()
+        },
+    }
+
+
 @router.get("/transcription/stats")
 async def get_transcription_stats(
     transcription_service = Depends(get_transcription_service),
@@ -11,6 +11,7 @@ from turbo.core.schemas import (
     ProjectCreate,
     ProjectResponse,
     ProjectUpdate,
+    ProjectWithStats,
 )
 from turbo.core.services import ProjectService
 from turbo.utils.exceptions import (
@@ -54,31 +55,47 @@ async def get_project(
         )
 
 
-@router.get("/", response_model=list[ProjectResponse])
+@router.get(
+    "/",
+    response_model=None,
+    responses={
+        200: {
+            "model": list[ProjectWithStats],
+            "description": "Projects; issue statistics are included when "
+            "include_stats is true",
+        }
+    },
+)
 async def get_projects(
     status_filter: str | None = Query(None, alias="status"),
     priority: str | None = Query(None),
     workspace: str | None = Query(None, pattern="^(all|personal|freelance|work)$"),
     work_company: str | None = Query(None),
+    include_stats: bool = Query(False, description="Include issue statistics"),
     limit: int | None = Query(None, ge=1, le=100),
     offset: int | None = Query(None, ge=0),
     project_service: ProjectService = Depends(get_project_service),
-) -> list[ProjectResponse]:
+) -> list[ProjectResponse] | list[ProjectWithStats]:
     """Get all projects with optional filtering by status, priority, and workspace."""
     # Workspace filtering takes precedence
     if workspace and workspace != "all":
-        return await project_service.get_projects_by_workspace(
+        projects = await project_service.get_projects_by_workspace(
             workspace=workspace,
             work_company=work_company,
             limit=limit,
             offset=offset,
         )
     elif status_filter:
-        return await project_service.get_projects_by_status(status_filter)
+        projects = await project_service.get_projects_by_status(status_filter)
     elif priority:
-        return await project_service.get_projects_by_priority(priority)
+        projects = await project_service.get_projects_by_priority(priority)
     else:
-        return await project_service.get_all_projects(limit=limit, offset=offset)
+        projects = await project_service.get_all_projects(limit=limit, offset=offset)
+
+    if include_stats:
+        # One GROUP BY query for the whole page rather than one per project
+        return await project_service.attach_statistics(projects)
+    return projects
 
 
 @router.put("/{project_id}", response_model=ProjectResponse)
@@ -0,0 +1,53 @@
+"""Search API endpoints."""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from turbo.api.dependencies import get_search_service
+from turbo.core.database import get_db_session
+from turbo.core.schemas import HybridSearchResponse, SearchResponse
+from turbo.core.schemas.search import SearchEntityType
+from turbo.core.services.graph import GraphService
+from turbo.core.services.hybrid_search import HybridSearchService
+from turbo.core.services.search import SearchService
+from turbo.utils.config import get_settings
+
+router = APIRouter()
+
+
+@router.get("/search", response_model=SearchResponse)
+async def search(
+    query: str = Query(..., min_length=1),
+    entity_types: list[SearchEntityType] | None = Query(None, alias="type"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    search_service: SearchService = Depends(get_search_service),
+) -> SearchResponse:
+    """Ranked search across documents, issues and projects, with snippets."""
+    return await search_service.search(
+        query, entity_types=entity_types, limit=limit, offset=offset
+    )
+
+
+@router.get("/search/hybrid", response_model=HybridSearchResponse)
+async def hybrid_search(
+    query: str = Query(..., min_length=1),
+    entity_types: list[SearchEntityType] | None = Query(None, alias="type"),
+    limit: int = Query(20, ge=1, le=100),
+    session: AsyncSession = Depends(get_db_session),
+) -> HybridSearchResponse:
+    """
+    Full-text and semantic search in one query.
+
+    Both rankings are computed concurrently and fused with reciprocal rank
+    fusion. Falls back to full-text results alone when the knowledge graph
+    is disabled or unavailable.
+    """
+    graph_service = GraphService() if get_settings().graph.enabled else None
+    try:
+        return await HybridSearchService(session, graph_service).search(
+            query, entity_types=entity_types, limit=limit
+        )
+    finally:
+        if graph_service is not None:
+            await graph_service.close()
@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+import logging
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
@@ -15,6 +16,8 @@ from turbo.core.schemas.terminal import (
 )
 from turbo.core.services.terminal import TerminalService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/terminal", tags=["terminal"])
 
 # Global service instance for WebSocket connections
@@ -94,12 +97,18 @@ async def terminal_websocket(
     websocket: WebSocket,
     session_id: str,
 ) -> None:
-    """WebSocket endpoint for terminal I/O."""
+    """WebSocket endpoint for terminal I/O.
+
+    Output is sent as binary frames of raw PTY bytes, starting with a replay
+    of the session's recent scrollback. Input arrives as binary frames of raw
+    bytes, or as JSON text messages: ``{"type": "input", "data": ...}`` and
+    ``{"type": "resize", "rows": ..., "cols": ...}``.
+    """
     await websocket.accept()
 
     # Create a service instance (without async for - we don't need the session after verification)
     service = None
-    pty = None
+    bridge = None
 
     # Get database session just to verify the terminal session exists
     async for db_session in get_db_session():
@@ -111,106 +120,76 @@ async def terminal_websocket(
             await websocket.close(code=1008, reason="Session not found")
             return
 
-        # Get PTY process
-        pty = service.get_pty(session_id)
-        if not pty or not pty.isalive():
+        # Attach to the PTY's output bridge
+        bridge = service.get_bridge(session_id)
+        if not bridge:
             await websocket.close(code=1008, reason="Session inactive")
             return
 
         # Break after first iteration - we have what we need
         break
 
-    if not pty:
+    if not bridge:
         await websocket.close(code=1008, reason="PTY not found")
         return
 
     _terminal_services[session_id] = service
+    scrollback, subscription = bridge.subscribe()
 
-    # Create tasks for bidirectional communication
-    async def read_from_pty() -> None:
-        """Read from PTY and send to WebSocket."""
-        try:
-            print(f"Starting read_from_pty loop, pty.isalive(): {pty.isalive()}", flush=True)
-            while pty.isalive():
-                data = await service.read_from_session(session_id, timeout=0.1)
-                if data:
-                    await websocket.send_json({"type": "output", "data": data})
-                else:
-                    # Only sleep if no data was read to avoid lag
-                    await asyncio.sleep(0.01)
-            print(f"PTY died, exiting read loop. isalive: {pty.isalive()}", flush=True)
-        except WebSocketDisconnect:
-            print("WebSocket disconnected in read_from_pty", flush=True)
-        except Exception as e:
-            print(f"Error reading from PTY: {e}", flush=True)
-            import traceback
-            traceback.print_exc()
-
-    async def write_to_pty() -> None:
+    async def send_output() -> None:
+        """Forward PTY output frames to the WebSocket."""
+        if scrollback:
+            await websocket.send_bytes(scrollback)
+        while (frame := await subscription.get()) is not None:
+            await websocket.send_bytes(frame)
+
+    async def receive_input() -> None:
         """Receive from WebSocket and write to PTY."""
-        try:
-            print("Starting write_to_pty loop", flush=True)
-            while True:
-                message = await websocket.receive_text()
-                print(f"Received WebSocket message: {message[:100]}", flush=True)
-                try:
-                    data = json.loads(message)
-                    msg_type = data.get("type")
-
-                    if msg_type == "input":
-                        input_data = data.get("data", "")
-                        print(f"Writing to PTY: {repr(input_data)}", flush=True)
-                        result = await service.write_to_session(session_id, input_data)
-                        print(f"Write result: {result}", flush=True)
-
-                    elif msg_type == "resize":
-                        rows = data.get("rows", 24)
-                        cols = data.get("cols", 80)
-                        print(f"Resizing terminal: {rows}x{cols}", flush=True)
-                        await service.resize_session(session_id, rows, cols)
-
-                except json.JSONDecodeError:
-                    # Treat as raw input
-                    print(f"JSONDecodeError, treating as raw input: {message}", flush=True)
-                    await service.write_to_session(session_id, message)
-
-        except WebSocketDisconnect:
-            print("WebSocket disconnected in write_to_pty", flush=True)
-        except Exception as e:
-            print(f"Error writing to PTY: {e}", flush=True)
-            import traceback
-            traceback.print_exc()
-
-    # Run both tasks concurrently
-    try:
-        print(f"Creating tasks for session {session_id}", flush=True)
-        reader_task = asyncio.create_task(read_from_pty())
-        print("Reader task created", flush=True)
-        writer_task = asyncio.create_task(write_to_pty())
-        print("Writer task created", flush=True)
-
-        # Wait for either task to complete (usually means disconnection)
-        done, pending = await asyncio.wait(
-            [reader_task, writer_task], return_when=asyncio.FIRST_COMPLETED
-        )
-        print(f"Task completed. Done: {len(done)}, Pending: {len(pending)}", flush=True)
-
-        # Cancel remaining tasks
-        for task in pending:
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
 
-    except Exception as e:
-        print(f"WebSocket error: {e}")
-        import traceback
-        traceback.print_exc()
+            if message.get("bytes") is not None:
+                await service.write_to_session(session_id, message["bytes"])
+                continue
+
+            text = message.get("text") or ""
+            try:
+                data = json.loads(text)
+            except json.JSONDecodeError:
+                # Treat as raw input
+                await service.write_to_session(session_id, text)
+                continue
+
+            msg_type = data.get("type") if isinstance(data, dict) else None
+            if msg_type == "input":
+                await service.write_to_session(session_id, data.get("data", ""))
+            elif msg_type == "resize":
+                await service.resize_session(
+                    session_id, data.get("rows", 24), data.get("cols", 80)
+                )
+
+    # Run both directions until either side finishes
+    tasks = [
+        asyncio.create_task(send_output()),
+        asyncio.create_task(receive_input()),
+    ]
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if not task.cancelled() and task.exception() and not isinstance(
+                task.exception(), WebSocketDisconnect
+            ):
+                logger.error(f"Terminal WebSocket error: {task.exception()}")
     finally:
-        # Clean up
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        bridge.unsubscribe(subscription)
         _terminal_services.pop(session_id, None)
         try:
-            await websocket.close()
-        except:
+            # 1013: dropped for falling behind; reconnecting replays scrollback
+            await websocket.close(code=1013 if subscription.overflowed else 1000)
+        except Exception:
             pass  # Already closed
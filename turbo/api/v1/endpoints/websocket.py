@@ -39,7 +39,7 @@ async def websocket_endpoint(
 
             # Echo back ping messages for keepalive
             if data == "ping":
-                await websocket.send_text("pong")
+                await manager.send_personal(websocket, "pong")
 
     except WebSocketDisconnect:
         manager.disconnect(websocket, entity_type, entity_id)
@@ -70,7 +70,7 @@ async def agent_activity_websocket(websocket: WebSocket):
         recent_sessions = [s.to_dict() for s in tracker.get_recent(limit=20)]
         stats = tracker.get_stats()
 
-        await websocket.send_json({
+        await manager.send_personal(websocket, {
             "type": "initial_state",
             "data": {
                 "active_sessions": active_sessions,
@@ -85,13 +85,13 @@ async def agent_activity_websocket(websocket: WebSocket):
 
             # Echo back ping messages for keepalive
             if data == "ping":
-                await websocket.send_text("pong")
+                await manager.send_personal(websocket, "pong")
 
             # Handle refresh request
             elif data == "refresh":
                 active_sessions = [s.to_dict() for s in tracker.get_all_active()]
                 stats = tracker.get_stats()
-                await websocket.send_json({
+                await manager.send_personal(websocket, {
                     "type": "refresh",
                     "data": {
                         "active_sessions": active_sessions,
@@ -105,3 +105,13 @@ async def agent_activity_websocket(websocket: WebSocket):
     except Exception as e:
         logger.error(f"Agent activity WebSocket error: {e}")
         manager.disconnect_agent_activity(websocket)
+
+
+@router.get("/ws/metrics")
+async def websocket_metrics():
+    """Delivery metrics for each room and its connections.
+
+    Per-connection counters include messages sent, dropped because the client
+    fell behind, and coalesced into a newer update, plus send queue depth.
+    """
+    return manager.get_metrics()
@@ -9,6 +9,7 @@ from pydantic import BaseModel, Field
 from turbo.api.dependencies import get_issue_service
 from turbo.core.schemas.issue import IssueResponse
 from turbo.core.services.issue import IssueService
+from turbo.utils.exceptions import IssueNotFoundError
 
 router = APIRouter()
 
@@ -16,19 +17,39 @@ router = APIRouter()
 class SetRankRequest(BaseModel):
     """Request to set issue work rank."""
 
-    work_rank: int = Field(..., ge=1, description="New rank position (1=highest priority)")
+    work_rank: int = Field(
+        ..., ge=1, description="New queue position (1=highest priority)"
+    )
 
 
 class BulkRerankRequest(BaseModel):
     """Request to bulk update issue ranks."""
 
-    issue_ranks: list[dict[str, int]] = Field(
+    issue_ranks: list[dict[str, UUID | int]] = Field(
         ...,
         description="List of {issue_id: rank} mappings",
         example=[{"issue_id": "uuid1", "rank": 1}, {"issue_id": "uuid2", "rank": 2}],
     )
 
 
+class BulkRerankResponse(BaseModel):
+    """Result of a bulk rerank."""
+
+    updated_count: int
+    message: str
+    issues: list[IssueResponse] = Field(
+        default_factory=list, description="Updated issues"
+    )
+
+
+class MoveIssueRequest(BaseModel):
+    """Request to move an issue within the work queue."""
+
+    after_issue_id: UUID | None = Field(
+        None, description="Issue to place it directly after (null = top of queue)"
+    )
+
+
 @router.get("/", response_model=list[IssueResponse])
 async def get_work_queue(
     status_filter: str | None = Query(None, pattern="^(open|ready|in_progress|review|testing|closed)$"),
@@ -67,7 +88,7 @@ async def get_next_issue(
     """
     Get THE next issue to work on.
 
-    Returns the highest-ranked open/in_progress issue (work_rank=1).
+    Returns the first open/in_progress issue in the queue (lowest work_rank).
     Returns None if no ranked issues exist.
     """
     try:
@@ -87,9 +108,10 @@ async def set_issue_rank(
     issue_service: IssueService = Depends(get_issue_service),
 ) -> IssueResponse:
     """
-    Set work rank for a specific issue.
+    Move an issue to a position in the work queue.
 
-    Updates the issue's work_rank and last_ranked_at timestamp.
+    The position is translated into a sparse work_rank key between its new
+    neighbours, and last_ranked_at is updated.
     """
     try:
         updated_issue = await issue_service.set_work_rank(
@@ -131,22 +153,24 @@ async def remove_issue_rank(
         )
 
 
-@router.post("/bulk-rerank", response_model=dict)
+@router.post("/bulk-rerank", response_model=BulkRerankResponse)
 async def bulk_rerank_issues(
     rerank_request: BulkRerankRequest,
     issue_service: IssueService = Depends(get_issue_service),
-) -> dict:
+) -> BulkRerankResponse:
     """
     Bulk update work ranks for multiple issues.
 
-    Useful for drag-and-drop reordering in the UI.
+    Useful for drag-and-drop reordering in the UI. All ranks are written
+    with a single UPDATE and the updated issues are returned.
     """
     try:
-        updated_count = await issue_service.bulk_rerank(rerank_request.issue_ranks)
-        return {
-            "updated_count": updated_count,
-            "message": f"Successfully updated {updated_count} issue ranks",
-        }
+        issues = await issue_service.bulk_rerank(rerank_request.issue_ranks)
+        return BulkRerankResponse(
+            updated_count=len(issues),
+            message=f"Successfully updated {len(issues)} issue ranks",
+            issues=issues,
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -154,8 +178,46 @@ async def bulk_rerank_issues(
         )
 
 
+@router.post("/{issue_id}/move", response_model=list[IssueResponse])
+async def move_issue(
+    issue_id: UUID,
+    move_request: MoveIssueRequest,
+    issue_service: IssueService = Depends(get_issue_service),
+) -> list[IssueResponse]:
+    """
+    Move an issue to directly after another one in the work queue.
+
+    Usually only the moved issue is rewritten; returns every issue whose
+    rank changed.
+    """
+    try:
+        return await issue_service.move_in_queue(
+            issue_id=issue_id, after_issue_id=move_request.after_issue_id
+        )
+    except IssueNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to move issue: {str(e)}",
+        )
+
+
 @router.post("/auto-rank", response_model=dict)
 async def auto_rank_issues(
+    transitive_weight: float = Query(
+        0.0,
+        ge=0.0,
+        description="Extra points per issue blocked indirectly (0 disables)",
+    ),
     issue_service: IssueService = Depends(get_issue_service),
 ) -> dict:
     """
@@ -169,7 +231,9 @@ async def auto_rank_issues(
     - Dependencies (issues that block others ranked higher)
     """
     try:
-        ranked_count = await issue_service.auto_rank_issues()
+        ranked_count = await issue_service.auto_rank_issues(
+            transitive_weight=transitive_weight
+        )
         return {
             "ranked_count": ranked_count,
             "message": f"Successfully auto-ranked {ranked_count} issues",
@@ -342,13 +342,13 @@ def delete(issue_id, confirm):
 )
 @handle_exceptions
 def search(query, format):
-    """Search issues by title."""
+    """Search issues by title and description."""
 
     async def _search():
         async for session in get_db_session():
             service = create_issue_service(session)
 
-            issues = await service.search_issues_by_title(query)
+            issues = await service.search_issues(query)
 
             if not issues:
                 console.print(f"[yellow]No issues found matching '{query}'[/yellow]")
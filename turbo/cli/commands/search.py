@@ -5,19 +5,18 @@ from typing import Any
 import click
 from rich import box
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 
-from turbo.api.dependencies import (
-    get_document_service,
-    get_issue_service,
-    get_project_service,
-    get_tag_service,
-)
+from turbo.api.dependencies import get_tag_service
 from turbo.cli.utils import handle_exceptions, run_async
 from turbo.core.database import get_db_session
 from turbo.core.schemas.graph import GraphSearchQuery
+from turbo.core.schemas.search import HybridSearchResponse, SearchResponse
 from turbo.core.services.graph import GraphService
+from turbo.core.services.hybrid_search import HybridSearchService
+from turbo.core.services.search import HIGHLIGHT_END, HIGHLIGHT_START, SearchService
 from turbo.utils.config import get_settings
 
 console = Console()
@@ -26,6 +25,9 @@ console = Console()
 TYPE_CHOICES = ["all", "projects", "issues", "documents", "tags"]
 FORMAT_CHOICES = ["table", "json"]
 
+# CLI type -> full-text index entity type
+KEYWORD_TYPE_MAP = {"projects": "project", "issues": "issue", "documents": "document"}
+
 
 @click.command()
 @click.argument("query")
@@ -44,6 +46,11 @@ FORMAT_CHOICES = ["table", "json"]
     is_flag=True,
     help="Use semantic search (knowledge graph) - understands meaning, not just keywords",
 )
+@click.option(
+    "--hybrid",
+    is_flag=True,
+    help="Combine keyword and semantic rankings into one result list",
+)
 @click.option(
     "--min-relevance",
     type=float,
@@ -51,29 +58,39 @@ FORMAT_CHOICES = ["table", "json"]
     help="Minimum relevance score for semantic search (0.0-1.0)",
 )
 @handle_exceptions
-def search_command(query, type, format, limit, semantic, min_relevance):
+def search_command(query, type, format, limit, semantic, hybrid, min_relevance):
     """
     Search across all entities in the workspace.
 
-    Two search modes:
+    Three search modes:
 
     \b
-    1. Keyword search (default): Fast exact/partial text matching
+    1. Keyword search (default): Ranked full-text matching with snippets
        Example: turbo search "authentication"
 
     \b
     2. Semantic search (--semantic): AI-powered meaning-based search
        Example: turbo search "user login problems" --semantic
 
+    \b
+    3. Hybrid search (--hybrid): Keyword and semantic results fused into one
+       ranking, falling back to keyword results when the graph is offline
+       Example: turbo search "login timeout" --hybrid
+
     \b
     Semantic search understands concepts and finds related items even if
     they use different words. It's powered by local embeddings - no API
     keys needed, completely private, and free forever.
     """
 
+    if semantic and hybrid:
+        raise click.UsageError("--semantic and --hybrid cannot be combined")
+
     async def _search():
         # Check if semantic search is requested
-        if semantic:
+        if hybrid and type != "tags":
+            await _hybrid_search(query, type, format, limit)
+        elif semantic:
             await _semantic_search(query, type, format, limit, min_relevance)
         else:
             await _keyword_search(query, type, format, limit)
@@ -143,134 +160,134 @@ async def _semantic_search(query: str, entity_type: str, output_format: str, lim
 
 
 async def _keyword_search(query: str, entity_type: str, output_format: str, limit: int):
-    """Perform traditional keyword search."""
+    """Perform ranked full-text search."""
     async for session in get_db_session():
-        project_service = get_project_service(session)
-        issue_service = get_issue_service(session)
-        document_service = get_document_service(session)
+        search_service = SearchService(session)
         tag_service = get_tag_service(session)
 
-        results = {}
-
         try:
-            if entity_type in ["all", "projects"]:
-                results["projects"] = await project_service.search_projects_by_name(
-                    query
-                )
-
-            if entity_type in ["all", "issues"]:
-                results["issues"] = await issue_service.search_issues_by_title(
-                    query
-                )
-
-            if entity_type in ["all", "documents"]:
-                results["documents"] = await document_service.search_documents(
-                    query
+            response = None
+            if entity_type != "tags":
+                entity_types = None if entity_type == "all" else [KEYWORD_TYPE_MAP[entity_type]]
+                response = await search_service.search(
+                    query, entity_types=entity_types, limit=limit
                 )
 
+            tags = []
             if entity_type in ["all", "tags"]:
-                results["tags"] = await tag_service.search_tags_by_name(query)
+                tags = (await tag_service.search_tags_by_name(query))[:limit]
 
             # Display results
             if output_format == "table":
-                _display_search_results_table(results, query, limit)
+                _display_search_results_table(response, tags, query)
             else:
-                _display_search_results_json(results, query, limit)
+                _display_search_results_json(response, tags, query)
 
         except Exception as e:
             console.print(f"[red]Search failed: {e}[/red]")
 
 
-def _display_search_results_table(
-    results: dict[str, list[Any]], query: str, limit: int
-):
-    """Display search results in table format."""
-    total_results = sum(len(items) for items in results.values())
+async def _hybrid_search(query: str, entity_type: str, output_format: str, limit: int):
+    """Perform full-text and semantic search fused into one ranking."""
+    graph_service = GraphService() if get_settings().graph.enabled else None
 
-    if total_results == 0:
-        console.print(f"[yellow]No results found for '{query}'[/yellow]")
+    async for session in get_db_session():
+        try:
+            entity_types = None if entity_type == "all" else [KEYWORD_TYPE_MAP[entity_type]]
+            response = await HybridSearchService(session, graph_service).search(
+                query, entity_types=entity_types, limit=limit
+            )
+
+            if output_format == "table":
+                _display_hybrid_results_table(response)
+            else:
+                console.print(response.model_dump_json(indent=2))
+
+        except Exception as e:
+            console.print(f"[red]Search failed: {e}[/red]")
+        finally:
+            if graph_service is not None:
+                await graph_service.close()
+
+
+def _display_hybrid_results_table(response: HybridSearchResponse):
+    """Display hybrid search results in table format."""
+    if not response.results:
+        console.print(f"[yellow]No results found for '{response.query}'[/yellow]")
         return
 
-    console.print(f"[blue]Found {total_results} result(s) for '{query}':[/blue]\n")
+    if "semantic" not in response.sources:
+        console.print("[dim]Knowledge graph unavailable - showing keyword matches only[/dim]")
 
-    shown_count = 0
+    table = Table(
+        title=f"{len(response.results)} result(s) in {response.execution_time_ms:.0f}ms"
+        + (" (cached)" if response.cached else ""),
+        box=box.ROUNDED,
+    )
+    table.add_column("Score", style="cyan", justify="right")
+    table.add_column("Type", style="magenta")
+    table.add_column("Title", style="green")
+    table.add_column("Match")
+    table.add_column("ID", style="dim")
 
-    # Display projects
-    if results.get("projects"):
-        console.print("[bold cyan]Projects:[/bold cyan]")
-        table = Table(box=box.SIMPLE)
-        table.add_column("ID", style="dim")
-        table.add_column("Name", style="bold")
-        table.add_column("Status", style="cyan")
-        table.add_column("Priority", style="yellow")
+    for result in response.results:
+        title = result.title[:57] + "..." if len(result.title) > 60 else result.title
+        table.add_row(
+            f"{result.score:.4f}",
+            result.entity_type,
+            escape(title),
+            _highlight(result.snippet),
+            str(result.entity_id)[:8] + "...",
+        )
 
-        for project in results["projects"][: limit - shown_count]:
-            table.add_row(
-                str(project.id)[:8] + "...",
-                project.name,
-                project.status,
-                project.priority,
-            )
-            shown_count += 1
+    console.print(table)
 
-        console.print(table)
-        console.print()
 
-    # Display issues
-    if "issues" in results and results["issues"] and shown_count < limit:
-        console.print("[bold cyan]Issues:[/bold cyan]")
-        table = Table(box=box.SIMPLE)
-        table.add_column("ID", style="dim")
-        table.add_column("Title", style="bold")
-        table.add_column("Status", style="cyan")
-        table.add_column("Priority", style="yellow")
+def _highlight(snippet: str) -> str:
+    """Render search highlights as rich markup."""
+    return (
+        escape(snippet)
+        .replace(HIGHLIGHT_START, "[bold yellow]")
+        .replace(HIGHLIGHT_END, "[/bold yellow]")
+    )
 
-        for issue in results["issues"][: limit - shown_count]:
-            table.add_row(
-                str(issue.id)[:8] + "...",
-                issue.title[:50] + "..." if len(issue.title) > 50 else issue.title,
-                issue.status,
-                issue.priority,
-            )
-            shown_count += 1
 
-        console.print(table)
-        console.print()
+def _display_search_results_table(
+    response: SearchResponse | None, tags: list[Any], query: str
+):
+    """Display search results in table format."""
+    matches = response.results if response else []
+    total_matches = response.total if response else 0
 
-    # Display documents
-    if "documents" in results and results["documents"] and shown_count < limit:
-        console.print("[bold cyan]Documents:[/bold cyan]")
+    if not matches and not tags:
+        console.print(f"[yellow]No results found for '{query}'[/yellow]")
+        return
+
+    console.print(
+        f"[blue]Found {total_matches + len(tags)} result(s) for '{query}':[/blue]\n"
+    )
+
+    if matches:
         table = Table(box=box.SIMPLE)
+        table.add_column("Type", style="magenta")
         table.add_column("ID", style="dim")
         table.add_column("Title", style="bold")
-        table.add_column("Type", style="cyan")
-        table.add_column("Size", style="green")
-
-        for document in results["documents"][: limit - shown_count]:
-            content_size = len(document.content or "")
-            size_str = (
-                f"{content_size} chars"
-                if content_size < 1000
-                else f"{content_size/1000:.1f}K"
-            )
+        table.add_column("Match")
 
+        for result in matches:
+            title = result.title[:50] + "..." if len(result.title) > 50 else result.title
             table.add_row(
-                str(document.id)[:8] + "...",
-                (
-                    document.title[:50] + "..."
-                    if len(document.title) > 50
-                    else document.title
-                ),
-                document.document_type,
-                size_str,
+                result.entity_type,
+                str(result.entity_id)[:8] + "...",
+                escape(title),
+                _highlight(result.snippet),
             )
-            shown_count += 1
 
         console.print(table)
         console.print()
 
     # Display tags
-    if "tags" in results and results["tags"] and shown_count < limit:
+    if tags:
         console.print("[bold cyan]Tags:[/bold cyan]")
         table = Table(box=box.SIMPLE)
         table.add_column("ID", style="dim")
@@ -278,7 +295,7 @@ def _display_search_results_table(
         table.add_column("Color", style="cyan")
         table.add_column("Description", style="white")
 
-        for tag in results["tags"][: limit - shown_count]:
+        for tag in tags:
             colored_name = f"[{tag.color}]{tag.name}[/{tag.color}]"
             description = (
                 tag.description[:40] + "..."
@@ -287,32 +304,28 @@ def _display_search_results_table(
             )
 
             table.add_row(str(tag.id)[:8] + "...", colored_name, tag.color, description)
-            shown_count += 1
 
         console.print(table)
 
-    if shown_count >= limit and total_results > limit:
+    if total_matches > len(matches):
         console.print(
-            f"[dim]... and {total_results - limit} more results (use --limit to see more)[/dim]"
+            f"[dim]... and {total_matches - len(matches)} more results (use --limit to see more)[/dim]"
         )
 
 
-def _display_search_results_json(results: dict[str, list[Any]], query: str, limit: int):
+def _display_search_results_json(
+    response: SearchResponse | None, tags: list[Any], query: str
+):
     """Display search results in JSON format."""
     import json
 
     output = {
         "query": query,
-        "total_results": sum(len(items) for items in results.values()),
-        "results": {},
+        "total_results": (response.total if response else 0) + len(tags),
+        "results": [result.model_dump() for result in response.results] if response else [],
+        "tags": [tag.model_dump() for tag in tags],
     }
 
-    for entity_type, items in results.items():
-        if items:
-            output["results"][entity_type] = [
-                item.model_dump() for item in items[:limit]
-            ]
-
     console.print(json.dumps(output, indent=2, default=str))
 
 
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.pool import StaticPool
 
 from turbo.core.database.base import Base
+from turbo.core.database.search_index import install_search_index
 from turbo.utils.config import get_settings
 
 # Global engine instance
@@ -112,6 +113,9 @@ async def init_database() -> None:
         # Create all tables
         await conn.run_sync(Base.metadata.create_all)
 
+        # Full-text search index over documents, issues and projects
+        await conn.run_sync(install_search_index)
+
 
 async def close_database() -> None:
     """Close database connections."""
@@ -0,0 +1,118 @@
+"""Full-text search index DDL for documents, issues and projects.
+
+PostgreSQL keeps a generated, weighted ``search_vector`` tsvector column
+with a GIN index on each indexed table (see migration 031). SQLite keeps
+one FTS5 table, ``search_index``, maintained by triggers on the source
+tables; ``search_index_rows`` maps each FTS row to its entity so updates
+and deletes touch a single row instead of scanning the index.
+"""
+
+from sqlalchemy import Connection, text
+
+# entity type -> (table, title column, body column)
+INDEXED_ENTITIES: dict[str, tuple[str, str, str]] = {
+    "document": ("documents", "title", "content"),
+    "issue": ("issues", "title", "description"),
+    "project": ("projects", "name", "description"),
+}
+
+TEXT_SEARCH_CONFIG = "english"
+
+
+def _postgres_statements() -> list[str]:
+    statements = []
+    for table, title, body in INDEXED_ENTITIES.values():
+        statements += [
+            f"""
+            ALTER TABLE {table}
+            ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce({title}, '')), 'A') ||
+                setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce({body}, '')), 'B')
+            ) STORED
+            """,
+            f"""
+            CREATE INDEX IF NOT EXISTS idx_{table}_search_vector
+            ON {table} USING GIN (search_vector)
+            """,
+        ]
+    return statements
+
+
+def _sqlite_statements() -> list[str]:
+    statements = [
+        """
+        CREATE TABLE IF NOT EXISTS search_index_rows (
+            id INTEGER PRIMARY KEY,
+            entity_type TEXT NOT NULL,
+            entity_id TEXT NOT NULL,
+            UNIQUE (entity_type, entity_id)
+        )
+        """,
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS search_index
+        USING fts5(title, body, tokenize = 'porter unicode61')
+        """,
+    ]
+    for entity_type, (table, title, body) in INDEXED_ENTITIES.items():
+        row_of = (
+            "(SELECT id FROM search_index_rows "
+            f"WHERE entity_type = '{entity_type}' AND entity_id = {{ref}}.id)"
+        )
+        statements += [
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_search_insert
+            AFTER INSERT ON {table} BEGIN
+                INSERT INTO search_index_rows (entity_type, entity_id)
+                VALUES ('{entity_type}', new.id);
+                INSERT INTO search_index (rowid, title, body)
+                VALUES (last_insert_rowid(), new.{title}, new.{body});
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_search_update
+            AFTER UPDATE OF {title}, {body} ON {table} BEGIN
+                UPDATE search_index SET title = new.{title}, body = new.{body}
+                WHERE rowid = {row_of.format(ref="new")};
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_search_delete
+            AFTER DELETE ON {table} BEGIN
+                DELETE FROM search_index WHERE rowid = {row_of.format(ref="old")};
+                DELETE FROM search_index_rows
+                WHERE entity_type = '{entity_type}' AND entity_id = old.id;
+            END
+            """,
+            # Backfill rows written before the index existed
+            f"""
+            INSERT INTO search_index_rows (entity_type, entity_id)
+            SELECT '{entity_type}', id FROM {table}
+            WHERE id NOT IN (
+                SELECT entity_id FROM search_index_rows
+                WHERE entity_type = '{entity_type}'
+            )
+            """,
+            f"""
+            INSERT INTO search_index (rowid, title, body)
+            SELECT r.id, t.{title}, t.{body}
+            FROM search_index_rows r JOIN {table} t ON t.id = r.entity_id
+            WHERE r.entity_type = '{entity_type}'
+              AND r.id NOT IN (SELECT rowid FROM search_index)
+            """,
+        ]
+    return statements
+
+
+def install_search_index(connection: Connection) -> None:
+    """Create the full-text index for the connection's dialect (idempotent)."""
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        statements = _postgres_statements()
+    elif dialect == "sqlite":
+        statements = _sqlite_statements()
+    else:
+        return
+
+    for statement in statements:
+        connection.execute(text(statement))
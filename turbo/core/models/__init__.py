@@ -5,12 +5,13 @@ from turbo.core.models.agent import Agent
 from turbo.core.models.agent_session import AgentSession
 from turbo.core.models.calendar_event import CalendarEvent
 from turbo.core.models.company import Company
+from turbo.core.models.feed_sync import FeedSyncState
 from turbo.core.models.form import Form, FormResponse, FormResponseAudit
 from turbo.core.models.job_application import JobApplication
 from turbo.core.models.job_posting import JobPosting, SearchCriteria, JobSearchHistory, JobPostingMatch
 from turbo.core.models.literature import Literature
 from turbo.core.models.network_contact import NetworkContact
-from turbo.core.models.podcast import PodcastShow, PodcastEpisode
+from turbo.core.models.podcast import PodcastShow, PodcastEpisode, TranscriptionJob
 from turbo.core.models.resume import Resume, ResumeSection
 from turbo.core.models.associations import (
     achievement_fact_tags,
@@ -71,6 +72,7 @@ __all__ = [
     "ConversationSummary",
     "Document",
     "Favorite",
+    "FeedSyncState",
     "Form",
     "FormResponse",
     "FormResponseAudit",
@@ -86,6 +88,7 @@ __all__ = [
     "Note",
     "PodcastShow",
     "PodcastEpisode",
+    "TranscriptionJob",
     "Project",
     "Resume",
     "ResumeSection",
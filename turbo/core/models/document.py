@@ -3,7 +3,7 @@
 
 from typing import Optional
 
-from sqlalchemy import Column, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -15,6 +15,10 @@ class Document(Base):
     """Document model representing project documentation."""
 
     __tablename__ = "documents"
+    __table_args__ = (
+        # Keyset pagination order (BaseRepository.get_page)
+        Index("idx_documents_created_at_id", "created_at", "id"),
+    )
 
     # Required fields
     title = Column(String(200), nullable=False, index=True)
@@ -0,0 +1,24 @@
+"""Feed sync state model for conditional RSS fetches."""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from turbo.core.models.base import Base
+
+
+class FeedSyncState(Base):
+    """HTTP cache validators from the last successful fetch of a feed."""
+
+    __tablename__ = "feed_sync_states"
+
+    feed_url: Mapped[str] = mapped_column(String(2048), nullable=False, unique=True, index=True)
+    etag: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
+    last_modified: Mapped[Optional[str]] = mapped_column(String(128), nullable=True)
+    last_checked_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<FeedSyncState: {self.feed_url}>"
@@ -3,7 +3,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from typing import Optional
@@ -16,6 +16,13 @@ class Issue(Base):
     """Issue model representing a task, bug, or feature request."""
 
     __tablename__ = "issues"
+    __table_args__ = (
+        # Covers per-project status counts (IssueRepository.get_status_counts)
+        Index("idx_issues_project_status", "project_id", "status"),
+        # Keyset pagination orders (BaseRepository.get_page)
+        Index("idx_issues_created_at_id", "created_at", "id"),
+        Index("idx_issues_work_rank_id", "work_rank", "id"),
+    )
 
     # Required fields
     title = Column(String(200), nullable=False, index=True)
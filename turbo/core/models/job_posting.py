@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import ARRAY, TIMESTAMP, Boolean, Float, Integer, String, Text, text, ForeignKey
+from sqlalchemy import ARRAY, TIMESTAMP, Boolean, Float, Index, Integer, String, Text, text, ForeignKey
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -15,6 +15,10 @@ class JobPosting(Base):
     """Model for job postings discovered through automated searches."""
 
     __tablename__ = "job_postings"
+    __table_args__ = (
+        Index("idx_job_postings_fingerprint", "fingerprint"),
+        Index("idx_job_postings_company_key", "company_key", "created_at"),
+    )
 
     # Primary Key
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
@@ -66,6 +70,10 @@ class JobPosting(Base):
     # Raw Data
     raw_data: Mapped[Optional[dict]] = mapped_column(JSONB)
 
+    # Deduplication (see JobDeduplicationService)
+    fingerprint: Mapped[Optional[str]] = mapped_column(String(64))  # sha256 of company|title|location
+    company_key: Mapped[Optional[str]] = mapped_column(String(255))  # Normalized company (blocking key)
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP, server_default=text("CURRENT_TIMESTAMP")
@@ -115,4 +115,34 @@ class PodcastEpisode(Base):
     def __repr__(self) -> str:
         """String representation."""
         episode_info = f"S{self.season_number}E{self.episode_number}" if self.season_number and self.episode_number else f"#{self.episode_number}" if self.episode_number else ""
-        return f"<PodcastEpisode {episode_info}: {self.title[:50]}>"
\ No newline at end of file
+        return f"<PodcastEpisode {episode_info}: {self.title[:50]}>"
+
+
+class TranscriptionJob(Base):
+    """Queued transcription of one podcast episode.
+
+    Jobs survive restarts: anything left ``downloading`` or ``transcribing``
+    by a crashed run is put back to ``pending`` and picked up again.
+    """
+
+    __tablename__ = "transcription_jobs"
+
+    episode_id: Mapped[UUID] = mapped_column(ForeignKey("podcast_episodes.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    # pending, downloading, transcribing, completed, failed
+    status: Mapped[str] = mapped_column(String(20), default="pending", nullable=False, index=True)
+
+    # Transcription options
+    model_size: Mapped[str] = mapped_column(String(20), default="base", nullable=False)
+    language: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    beam_size: Mapped[int] = mapped_column(Integer, default=5, nullable=False)
+
+    # Progress
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<TranscriptionJob {self.episode_id}: {self.status}>"
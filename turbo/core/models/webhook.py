@@ -31,6 +31,9 @@ class Webhook(Base):
     max_retries: Mapped[int] = mapped_column(Integer, default=3, nullable=False)
     timeout_seconds: Mapped[int] = mapped_column(Integer, default=30, nullable=False)
 
+    # Receiver accepts several events per request ({"events": [...]})
+    batch_events: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+
     # Headers to send with webhook (e.g., authorization)
     headers: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True, default=dict)
 
@@ -44,7 +47,12 @@ class Webhook(Base):
 
 
 class WebhookDelivery(Base):
-    """Audit log for webhook delivery attempts."""
+    """Outbox and audit log for webhook delivery attempts.
+
+    Rows are written as "pending" with ``next_retry_at`` set to when the
+    dispatcher should (re)try them; claimed rows have it pushed out by the
+    lease so a crashed worker's deliveries become due again.
+    """
 
     __tablename__ = "webhook_deliveries"
 
@@ -1,14 +1,33 @@
 """Base repository with common CRUD operations."""
 
 from abc import ABC
-from typing import Generic, TypeVar
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, ClassVar, Generic, TypeVar
 from uuid import UUID
 
 from pydantic import BaseModel
-from sqlalchemy import delete, select
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    delete,
+    func,
+    insert,
+    inspect,
+    literal,
+    select,
+    tuple_,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, load_only
 
 from turbo.core.database.base import Base
+from turbo.core.repositories.pagination import (
+    KeysetOrder,
+    Page,
+    decode_cursor,
+    encode_cursor,
+)
+from turbo.utils.exceptions import ValidationError
 
 # Type variables for generic repository
 ModelType = TypeVar("ModelType", bound=Base)
@@ -19,25 +38,64 @@ UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 class BaseRepository(ABC, Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """Base repository with common CRUD operations."""
 
+    # Orderings get_page can use, newest first unless a subclass adds more
+    keyset_orders: ClassVar[dict[str, KeysetOrder]] = {
+        "created_at": KeysetOrder(("created_at", "id"), descending=True),
+    }
+
     def __init__(self, session: AsyncSession, model: type[ModelType]) -> None:
         self._session = session
         self._model = model
 
-    async def create(self, obj_in: CreateSchemaType) -> ModelType:
-        """Create a new record."""
+    async def create(self, obj_in: CreateSchemaType, commit: bool = True) -> ModelType:
+        """Create a new record.
+
+        With ``commit=False`` the record is only flushed, so it commits (or
+        rolls back) together with the caller's other changes.
+        """
         obj_data = obj_in.model_dump(exclude_unset=True)
         db_obj = self._model(**obj_data)
         self._session.add(db_obj)
-        await self._session.commit()
+        await self._flush_or_commit(commit)
         await self._session.refresh(db_obj)
         return db_obj
 
+    async def create_many(
+        self, objs_in: Sequence[CreateSchemaType], commit: bool = True
+    ) -> list[ModelType]:
+        """Create many records with one bulk INSERT ... RETURNING.
+
+        Returned objects are fully loaded, including server-generated
+        columns, and come back in input order.
+        """
+        if not objs_in:
+            return []
+        stmt = insert(self._model).returning(
+            self._model, sort_by_parameter_order=True
+        )
+        result = await self._session.scalars(
+            stmt, [obj_in.model_dump(exclude_unset=True) for obj_in in objs_in]
+        )
+        db_objs = list(result.all())
+        if commit:
+            await self._session.commit()
+        return db_objs
+
     async def get_by_id(self, id: UUID) -> ModelType | None:
         """Get record by ID."""
         stmt = select(self._model).where(self._model.id == id)
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_by_ids(self, ids: Sequence[UUID]) -> list[ModelType]:
+        """Get records by ID, in the order the IDs were given."""
+        if not ids:
+            return []
+        stmt = select(self._model).where(self._model.id.in_(ids))
+        result = await self._session.execute(stmt)
+        by_id = {obj.id: obj for obj in result.scalars().all()}
+        return [by_id[id] for id in ids if id in by_id]
+
     async def get_all(
         self, limit: int | None = None, offset: int | None = None
     ) -> list[ModelType]:
@@ -51,8 +109,10 @@ class BaseRepository(ABC, Generic[ModelType, CreateSchemaType, UpdateSchemaType]
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
-    async def update(self, id: UUID, obj_in: UpdateSchemaType) -> ModelType | None:
-        """Update a record by ID."""
+    async def update(
+        self, id: UUID, obj_in: UpdateSchemaType, commit: bool = True
+    ) -> ModelType | None:
+        """Update a record by ID; ``commit=False`` only flushes, as for create."""
         # Get the existing record
         db_obj = await self.get_by_id(id)
         if not db_obj:
@@ -64,25 +124,144 @@ class BaseRepository(ABC, Generic[ModelType, CreateSchemaType, UpdateSchemaType]
             if hasattr(db_obj, field):
                 setattr(db_obj, field, value)
 
-        await self._session.commit()
+        await self._flush_or_commit(commit)
         await self._session.refresh(db_obj)
         return db_obj
 
-    async def delete(self, id: UUID) -> bool:
-        """Delete a record by ID."""
+    async def delete(self, id: UUID, commit: bool = True) -> bool:
+        """Delete a record by ID; ``commit=False`` leaves the commit to the caller."""
         stmt = delete(self._model).where(self._model.id == id)
         result = await self._session.execute(stmt)
-        await self._session.commit()
+        if commit:
+            await self._session.commit()
         return result.rowcount > 0
 
+    async def _flush_or_commit(self, commit: bool) -> None:
+        if commit:
+            await self._session.commit()
+        else:
+            await self._session.flush()
+
     async def exists(self, id: UUID) -> bool:
         """Check if record exists."""
         stmt = select(self._model.id).where(self._model.id == id)
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none() is not None
 
-    async def count(self) -> int:
-        """Count total records."""
-        stmt = select(self._model.id)
+    async def count(self, *criteria: ColumnElement[bool], **filters: Any) -> int:
+        """Count records with ``SELECT count(*)``.
+
+        Args:
+            *criteria: SQL expressions every counted record must satisfy
+            **filters: Column values every counted record must equal,
+                e.g. ``count(status="open")``
+        """
+        stmt = select(func.count()).select_from(self._model)
+        for column_name, value in filters.items():
+            stmt = stmt.where(getattr(self._model, column_name) == value)
+        if criteria:
+            stmt = stmt.where(*criteria)
         result = await self._session.execute(stmt)
-        return len(list(result.scalars().all()))
+        return result.scalar_one()
+
+    async def get_page(
+        self,
+        *criteria: ColumnElement[bool],
+        limit: int = 50,
+        cursor: str | None = None,
+        order: str = "created_at",
+        fields: Sequence[str] | None = None,
+    ) -> Page[ModelType]:
+        """Get one page of records using keyset pagination.
+
+        Args:
+            *criteria: SQL expressions every record must satisfy
+            limit: Maximum number of records in the page
+            cursor: ``next_cursor`` of the previous page; None for the first
+            order: Name of one of ``keyset_orders``
+            fields: Columns to load; others are left unloaded and must not be
+                accessed. The id and sort columns are always loaded.
+
+        Raises:
+            ValidationError: For an unknown order or field, or a bad cursor
+        """
+        sort = self._keyset_attributes(order)
+        stmt = self._page_statement(criteria, sort, cursor, order, fields)
+        result = await self._session.execute(stmt.limit(limit + 1))
+        items = list(result.scalars().all())
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            next_cursor = encode_cursor(
+                order, [getattr(last, attribute.key) for attribute in sort]
+            )
+        return Page(items=items, next_cursor=next_cursor)
+
+    async def iter_pages(
+        self,
+        *criteria: ColumnElement[bool],
+        page_size: int = 500,
+        order: str = "created_at",
+        fields: Sequence[str] | None = None,
+    ) -> AsyncIterator[list[ModelType]]:
+        """Yield every matching record, one keyset page at a time."""
+        cursor = None
+        while True:
+            page = await self.get_page(
+                *criteria, limit=page_size, cursor=cursor, order=order, fields=fields
+            )
+            if page.items:
+                yield page.items
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    def _keyset_attributes(self, order: str) -> list[InstrumentedAttribute]:
+        if order not in self.keyset_orders:
+            raise ValidationError(
+                f"Unknown order '{order}', expected one of: "
+                f"{', '.join(self.keyset_orders)}",
+                field="order",
+            )
+        return [getattr(self._model, name) for name in self.keyset_orders[order].columns]
+
+    def _page_statement(
+        self,
+        criteria: Sequence[ColumnElement[bool]],
+        sort: list[InstrumentedAttribute],
+        cursor: str | None,
+        order: str,
+        fields: Sequence[str] | None,
+    ) -> Select:
+        descending = self.keyset_orders[order].descending
+        stmt = select(self._model).where(*criteria)
+        # Rows with a NULL sort key have no place in the keyset sequence
+        stmt = stmt.where(
+            *(a.isnot(None) for a in sort if a.property.columns[0].nullable)
+        )
+
+        if cursor:
+            values = decode_cursor(cursor, order, sort)
+            key = tuple_(*sort)
+            bound = tuple_(*(literal(v, a.type) for v, a in zip(values, sort)))
+            stmt = stmt.where(key < bound if descending else key > bound)
+
+        stmt = stmt.order_by(*(a.desc() if descending else a.asc() for a in sort))
+
+        if fields:
+            stmt = stmt.options(load_only(*self._field_attributes(fields, sort)))
+        return stmt
+
+    def _field_attributes(
+        self, fields: Sequence[str], sort: list[InstrumentedAttribute]
+    ) -> list[InstrumentedAttribute]:
+        columns = inspect(self._model).column_attrs.keys()
+        unknown = [name for name in fields if name not in columns]
+        if unknown:
+            raise ValidationError(
+                f"Unknown field(s): {', '.join(unknown)}", field="fields"
+            )
+        names = dict.fromkeys(["id", *(a.key for a in sort), *fields])
+        return [getattr(self._model, name) for name in names]
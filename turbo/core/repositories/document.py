@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -18,6 +18,29 @@ class DocumentRepository(BaseRepository[Document, DocumentCreate, DocumentUpdate
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session, Document)
 
+    def list_criteria(
+        self,
+        document_type: str | None = None,
+        document_format: str | None = None,
+        project_id: UUID | None = None,
+        workspace: str | None = None,
+        work_company: str | None = None,
+    ) -> list[ColumnElement[bool]]:
+        """Filters for get_page/iter_pages; every given filter must match."""
+        criteria: list[ColumnElement[bool]] = []
+        if document_type:
+            criteria.append(self._model.type == document_type)
+        if document_format:
+            criteria.append(self._model.format == document_format)
+        if project_id:
+            criteria.append(self._model.project_id == project_id)
+        if workspace and workspace != "all":
+            projects = select(Project.id).where(Project.workspace == workspace)
+            if workspace == "work" and work_company:
+                projects = projects.where(Project.work_company == work_company)
+            criteria.append(self._model.project_id.in_(projects))
+        return criteria
+
     async def get_by_project(self, project_id: UUID) -> list[Document]:
         """Get documents by project ID."""
         stmt = select(self._model).where(self._model.project_id == project_id)
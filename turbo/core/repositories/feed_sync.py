@@ -0,0 +1,50 @@
+"""Repository for feed sync state."""
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from turbo.core.models.feed_sync import FeedSyncState
+from turbo.core.repositories.base import BaseRepository
+
+
+class FeedSyncStateRepository(BaseRepository[FeedSyncState, dict, dict]):
+    """Repository for FeedSyncState operations."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository."""
+        super().__init__(session, FeedSyncState)
+
+    async def get_by_feed_urls(self, feed_urls: list[str]) -> dict[str, FeedSyncState]:
+        """Get the stored state of many feeds in one query, keyed by URL."""
+        if not feed_urls:
+            return {}
+        result = await self._session.execute(
+            select(FeedSyncState).where(FeedSyncState.feed_url.in_(set(feed_urls)))
+        )
+        return {state.feed_url: state for state in result.scalars().all()}
+
+    async def record(
+        self,
+        feed_url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        state: Optional[FeedSyncState] = None,
+    ) -> FeedSyncState:
+        """Stage new validators for a feed without committing.
+
+        The caller commits them together with the items ingested from the
+        same response, so a failed ingest is retried in full next time.
+        """
+        if state is None:
+            state = (await self.get_by_feed_urls([feed_url])).get(feed_url)
+        if state is None:
+            state = FeedSyncState(feed_url=feed_url)
+            self._session.add(state)
+        state.etag = etag
+        state.last_modified = last_modified
+        state.last_checked_at = datetime.now(timezone.utc)
+        await self._session.flush()
+        return state
@@ -1,32 +1,78 @@
 """Issue repository implementation."""
 
+from collections.abc import Sequence
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Row,
+    Update,
+    case,
+    column,
+    func,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from turbo.core.models.issue import Issue
 from turbo.core.models.project import Project
 from turbo.core.repositories.base import BaseRepository
+from turbo.core.repositories.pagination import KeysetOrder
 from turbo.core.schemas.issue import IssueCreate, IssueUpdate
 
 
 class IssueRepository(BaseRepository[Issue, IssueCreate, IssueUpdate]):
     """Repository for issue data access."""
 
+    keyset_orders = {
+        **BaseRepository.keyset_orders,
+        # Work queue order; unranked issues are left out
+        "work_rank": KeysetOrder(("work_rank", "id")),
+    }
+
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session, Issue)
 
+    def list_criteria(
+        self,
+        status: str | None = None,
+        assignee: str | None = None,
+        project_id: UUID | None = None,
+        workspace: str | None = None,
+        work_company: str | None = None,
+    ) -> list[ColumnElement[bool]]:
+        """Filters for get_page/iter_pages; every given filter must match."""
+        criteria: list[ColumnElement[bool]] = []
+        if status:
+            criteria.append(self._model.status == status)
+        if assignee:
+            criteria.append(self._model.assignee == assignee)
+        if project_id:
+            criteria.append(self._model.project_id == project_id)
+        if workspace and workspace != "all":
+            projects = select(Project.id).where(Project.workspace == workspace)
+            if workspace == "work" and work_company:
+                projects = projects.where(Project.work_company == work_company)
+            criteria.append(self._model.project_id.in_(projects))
+        return criteria
+
     async def get_by_project(self, project_id: UUID) -> list[Issue]:
         """Get issues by project ID."""
         stmt = select(self._model).where(self._model.project_id == project_id)
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
-    async def get_by_status(self, status: str) -> list[Issue]:
-        """Get issues by status."""
+    async def get_by_status(self, status: str, limit: int | None = None) -> list[Issue]:
+        """Get issues by status, optionally only the first ``limit``."""
         stmt = select(self._model).where(self._model.status == status)
+        if limit:
+            stmt = stmt.limit(limit)
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
@@ -207,7 +253,7 @@ class IssueRepository(BaseRepository[Issue, IssueCreate, IssueUpdate]):
         return list(result.scalars().all())
 
     async def get_next_issue(self) -> Issue | None:
-        """Get the highest-ranked issue (work_rank=1) that is open or in_progress."""
+        """Get the open or in_progress issue with the lowest work_rank."""
         stmt = (
             select(self._model)
             .where(
@@ -221,6 +267,162 @@ class IssueRepository(BaseRepository[Issue, IssueCreate, IssueUpdate]):
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_rank_candidates(self, statuses: Sequence[str]) -> list[Row]:
+        """Get id, priority and created_at of issues in the given statuses."""
+        stmt = (
+            select(self._model.id, self._model.priority, self._model.created_at)
+            .where(self._model.status.in_(statuses))
+            .order_by(self._model.created_at.asc(), self._model.id.asc())
+        )
+        result = await self._session.execute(stmt)
+        return list(result.all())
+
+    async def get_existing_ids(self, ids: Sequence[UUID]) -> set[UUID]:
+        """Return which of the given issue IDs exist, using one IN query."""
+        if not ids:
+            return set()
+        stmt = select(self._model.id).where(self._model.id.in_(set(ids)))
+        result = await self._session.execute(stmt)
+        return set(result.scalars().all())
+
+    async def get_status_counts(
+        self, project_ids: Sequence[UUID]
+    ) -> dict[UUID, dict[str, int]]:
+        """Count issues per status for each project in one GROUP BY query.
+
+        Projects without issues are omitted from the result.
+        """
+        if not project_ids:
+            return {}
+        stmt = (
+            select(self._model.project_id, self._model.status, func.count())
+            .where(self._model.project_id.in_(set(project_ids)))
+            .group_by(self._model.project_id, self._model.status)
+        )
+        result = await self._session.execute(stmt)
+        counts: dict[UUID, dict[str, int]] = {}
+        for project_id, status, count in result.all():
+            counts.setdefault(project_id, {})[status] = count
+        return counts
+
+    async def get_ranked_ids(self) -> list[UUID]:
+        """Get IDs of every ranked issue in queue order."""
+        stmt = (
+            select(self._model.id)
+            .where(self._model.work_rank.isnot(None))
+            .order_by(self._model.work_rank.asc(), self._model.id.asc())
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_next_rank(
+        self, after_rank: int | None, exclude_id: UUID
+    ) -> int | None:
+        """
+        Get the smallest work_rank greater than ``after_rank``.
+
+        Args:
+            after_rank: Rank to look past (None returns the smallest rank)
+            exclude_id: Issue to ignore (the one being moved)
+
+        Returns:
+            The next rank in the queue, or None if there is none
+        """
+        stmt = select(func.min(self._model.work_rank)).where(
+            self._model.work_rank.isnot(None), self._model.id != exclude_id
+        )
+        if after_rank is not None:
+            stmt = stmt.where(self._model.work_rank > after_rank)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def bulk_update_ranks(
+        self, ranks: dict[UUID, int | None], ranked_at: datetime | None
+    ) -> int:
+        """
+        Set work_rank for many issues in a single UPDATE and commit once.
+
+        PostgreSQL joins against a VALUES list; other dialects use a CASE
+        expression keyed on the issue ID.
+
+        Args:
+            ranks: Mapping of issue ID to new rank (None removes it from the queue)
+            ranked_at: Value for last_ranked_at on every updated issue
+
+        Returns:
+            Number of rows updated
+        """
+        updated = 0
+        for stmt in self._rank_update_statements(ranks, ranked_at):
+            result = await self._session.execute(stmt)
+            updated += result.rowcount
+
+        await self._session.commit()
+        return updated
+
+    async def update_ranks(
+        self, ranks: dict[UUID, int | None], ranked_at: datetime | None
+    ) -> list[Issue]:
+        """
+        Like bulk_update_ranks, but return the updated issues.
+
+        Rows come back through UPDATE ... RETURNING, so no per-row refresh
+        is needed after the commit.
+
+        Args:
+            ranks: Mapping of issue ID to new rank (None removes it from the queue)
+            ranked_at: Value for last_ranked_at on every updated issue
+
+        Returns:
+            Updated issues (unknown IDs are skipped)
+        """
+        issues: list[Issue] = []
+        for stmt in self._rank_update_statements(ranks, ranked_at):
+            result = await self._session.execute(
+                stmt.returning(self._model),
+                execution_options={"populate_existing": True},
+            )
+            issues.extend(result.scalars().all())
+
+        await self._session.commit()
+        return issues
+
+    def _rank_update_statements(
+        self, ranks: dict[UUID, int | None], ranked_at: datetime | None
+    ) -> list[Update]:
+        """Build the UPDATE statement(s) that write a batch of ranks."""
+        if not ranks:
+            return []
+
+        if self._session.get_bind().dialect.name == "postgresql":
+            new_ranks = values(
+                column("id", PGUUID(as_uuid=True)),
+                column("rank", Integer),
+                name="new_ranks",
+            ).data(list(ranks.items()))
+            return [
+                update(self._model)
+                .where(self._model.id == new_ranks.c.id)
+                .values(work_rank=new_ranks.c.rank, last_ranked_at=ranked_at)
+                .execution_options(synchronize_session=False)
+            ]
+
+        statements = []
+        items = list(ranks.items())
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(items), 1000):
+            chunk = dict(items[start : start + 1000])
+            statements.append(
+                update(self._model)
+                .where(self._model.id.in_(chunk))
+                .values(
+                    work_rank=case(chunk, value=self._model.id),
+                    last_ranked_at=ranked_at,
+                )
+                .execution_options(synchronize_session=False)
+            )
+        return statements
+
     async def get_by_key(self, issue_key: str) -> Issue | None:
         """Get issue by its human-readable key (e.g., 'CNTXT-1')."""
         stmt = select(self._model).where(self._model.issue_key == issue_key)
@@ -1,21 +1,73 @@
 """Repository for managing issue dependencies."""
 
 from datetime import datetime, timezone
-from typing import Dict, List
+from typing import Any, Dict, List
 from uuid import UUID
 
-from sqlalchemy import delete, insert, select
+from sqlalchemy import delete, func, insert, literal, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from turbo.core.models.associations import issue_dependencies
+from turbo.core.utils.dependency_graph import DependencyGraph
+from turbo.utils.config import get_settings
+
+
+class DependencyGraphCache:
+    """Process-level adjacency map of the issue_dependencies table.
+
+    Each read checks a version stamp (edge count and newest created_at) with
+    one aggregate query and reloads the edge list only when it has changed,
+    so writes from other sessions or workers are always picked up.
+    """
+
+    def __init__(self) -> None:
+        self._graph: DependencyGraph | None = None
+        self._version: tuple[Any, ...] | None = None
+
+    def invalidate(self) -> None:
+        """Force a reload on the next read."""
+        self._graph = None
+        self._version = None
+
+    async def get(self, session: AsyncSession) -> DependencyGraph:
+        """Get the current dependency graph, reloading it if the table changed."""
+        result = await session.execute(
+            select(
+                func.count(), func.max(issue_dependencies.c.created_at)
+            ).select_from(issue_dependencies)
+        )
+        version = tuple(result.one())
+
+        if self._graph is None or version != self._version:
+            edges = await session.execute(
+                select(
+                    issue_dependencies.c.blocking_issue_id,
+                    issue_dependencies.c.blocked_issue_id,
+                )
+            )
+            self._graph = DependencyGraph((row[0], row[1]) for row in edges.all())
+            self._version = version
+        return self._graph
+
+
+dependency_graph_cache = DependencyGraphCache()
 
 
 class IssueDependencyRepository:
     """Repository for issue dependency operations."""
 
-    def __init__(self, session: AsyncSession):
-        """Initialize repository with database session."""
+    def __init__(self, session: AsyncSession, use_graph_cache: bool | None = None):
+        """Initialize repository with database session.
+
+        Args:
+            session: Database session
+            use_graph_cache: Serve traversals from the process-level adjacency
+                cache instead of recursive CTE queries (defaults to settings)
+        """
         self.session = session
+        if use_graph_cache is None:
+            use_graph_cache = get_settings().database.dependency_graph_cache
+        self.use_graph_cache = use_graph_cache
 
     async def create_dependency(
         self,
@@ -51,6 +103,7 @@ class IssueDependencyRepository:
         )
         await self.session.execute(stmt)
         await self.session.flush()
+        dependency_graph_cache.invalidate()
 
         return {
             "blocking_issue_id": blocking_issue_id,
@@ -76,6 +129,7 @@ class IssueDependencyRepository:
             issue_dependencies.c.blocked_issue_id == blocked_issue_id,
         )
         result = await self.session.execute(stmt)
+        dependency_graph_cache.invalidate()
         return result.rowcount > 0
 
     async def get_blocking_issues(self, issue_id: UUID) -> List[UUID]:
@@ -108,6 +162,19 @@ class IssueDependencyRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_all_edges(self) -> List[tuple[UUID, UUID]]:
+        """Get every (blocking_issue_id, blocked_issue_id) pair in one query.
+
+        Returns:
+            List of dependency edges
+        """
+        stmt = select(
+            issue_dependencies.c.blocking_issue_id,
+            issue_dependencies.c.blocked_issue_id,
+        )
+        result = await self.session.execute(stmt)
+        return [(row[0], row[1]) for row in result.all()]
+
     async def get_all_dependencies(self, issue_id: UUID) -> dict:
         """Get all dependencies for an issue (both blocking and blocked by).
 
@@ -117,8 +184,24 @@ class IssueDependencyRepository:
         Returns:
             Dictionary with 'blocking' and 'blocked_by' lists
         """
-        blocking = await self.get_blocking_issues(issue_id)
-        blocked_by = await self.get_blocked_issues(issue_id)
+        stmt = select(
+            issue_dependencies.c.blocking_issue_id,
+            issue_dependencies.c.blocked_issue_id,
+        ).where(
+            or_(
+                issue_dependencies.c.blocking_issue_id == issue_id,
+                issue_dependencies.c.blocked_issue_id == issue_id,
+            )
+        )
+        result = await self.session.execute(stmt)
+
+        blocking: List[UUID] = []
+        blocked_by: List[UUID] = []
+        for blocking_id, blocked_id in result.all():
+            if blocked_id == issue_id:
+                blocking.append(blocking_id)
+            else:
+                blocked_by.append(blocked_id)
 
         return {
             "blocking": blocking,  # Already UUIDs
@@ -130,7 +213,9 @@ class IssueDependencyRepository:
     ) -> bool:
         """Check if adding this dependency would create a circular dependency.
 
-        Uses depth-first search to detect cycles.
+        The check is a single reachability query: a recursive CTE over the
+        issues downstream of ``blocked_issue_id``, or a lookup in the cached
+        adjacency map.
 
         Args:
             blocking_issue_id: ID of the blocking issue
@@ -141,45 +226,70 @@ class IssueDependencyRepository:
         """
         # If blocked_issue already blocks blocking_issue (directly or indirectly),
         # then adding this dependency would create a cycle
-        visited = set()
-        return await self._has_path(blocked_issue_id, blocking_issue_id, visited)
+        if blocking_issue_id == blocked_issue_id:
+            return True
 
-    async def _has_path(
-        self, from_issue: UUID, to_issue: UUID, visited: set
-    ) -> bool:
-        """Check if there's a dependency path from from_issue to to_issue.
+        if self.use_graph_cache:
+            graph = await dependency_graph_cache.get(self.session)
+            return graph.has_path(blocked_issue_id, blocking_issue_id)
+
+        downstream = self._closure_edges_cte(blocked_issue_id, upstream=False)
+        stmt = (
+            select(literal(1))
+            .select_from(downstream)
+            .where(downstream.c.blocked_issue_id == blocking_issue_id)
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    async def get_upstream(self, issue_id: UUID) -> List[UUID]:
+        """Get every issue that transitively blocks the given issue.
 
         Args:
-            from_issue: Starting issue ID
-            to_issue: Target issue ID
-            visited: Set of visited issue IDs (to prevent infinite loops)
+            issue_id: ID of the issue
 
         Returns:
-            True if there's a path, False otherwise
+            Issue IDs in topological order (blockers first)
         """
-        if from_issue == to_issue:
-            return True
+        closure = await self.get_dependency_closure(issue_id)
+        return closure["upstream"]
 
-        if from_issue in visited:
-            return False
+    async def get_downstream(self, issue_id: UUID) -> List[UUID]:
+        """Get every issue the given issue transitively blocks.
 
-        visited.add(from_issue)
+        Args:
+            issue_id: ID of the issue
 
-        # Get all issues blocked by from_issue
-        blocked_by_from = await self.get_blocked_issues(from_issue)
+        Returns:
+            Issue IDs in topological order (nearest first)
+        """
+        closure = await self.get_dependency_closure(issue_id)
+        return closure["downstream"]
+
+    async def get_dependency_closure(self, issue_id: UUID) -> Dict[str, List[UUID]]:
+        """Get the full upstream and downstream closure of an issue in one query.
 
-        # Recursively check if any of them lead to to_issue
-        for blocked_issue_id in blocked_by_from:
-            if await self._has_path(blocked_issue_id, to_issue, visited):
-                return True
+        Args:
+            issue_id: ID of the issue
 
-        return False
+        Returns:
+            Dictionary with 'upstream' (issues that must finish first) and
+            'downstream' (issues waiting on this one), each in topological order
+        """
+        graph = await self._load_subgraph(issue_id, upstream=True, downstream=True)
+        upstream = graph.ancestors(issue_id)
+        downstream = graph.descendants(issue_id)
+        return {
+            "upstream": graph.topological_order(upstream),
+            "downstream": graph.topological_order(downstream),
+        }
 
     async def get_dependency_chain(self, issue_id: UUID) -> List[UUID]:
         """Get the full dependency chain for an issue.
 
         Returns all issues that must be completed before this issue can start,
-        in topological order.
+        in topological order, followed by the issue itself.
 
         Args:
             issue_id: ID of the issue
@@ -187,33 +297,54 @@ class IssueDependencyRepository:
         Returns:
             List of issue IDs in dependency order
         """
-        chain = []
-        visited = set()
-        await self._build_chain(issue_id, chain, visited)
-        return chain
+        graph = await self._load_subgraph(issue_id, upstream=True, downstream=False)
+        upstream = graph.ancestors(issue_id)
+        return [*graph.topological_order(upstream), issue_id]
 
-    async def _build_chain(
-        self, issue_id: UUID, chain: List[UUID], visited: set
-    ) -> None:
-        """Recursively build the dependency chain.
+    async def _load_subgraph(
+        self, issue_id: UUID, upstream: bool, downstream: bool
+    ) -> DependencyGraph:
+        """Load the edges around an issue as an in-memory graph.
 
-        Args:
-            issue_id: Current issue ID
-            chain: List to append dependencies to
-            visited: Set of visited issue IDs
+        Uses the cached adjacency map when enabled, otherwise one statement
+        combining recursive CTEs over the requested directions.
         """
-        if issue_id in visited:
-            return
+        if self.use_graph_cache:
+            return await dependency_graph_cache.get(self.session)
 
-        visited.add(issue_id)
+        parts = []
+        for enabled, is_upstream in ((upstream, True), (downstream, False)):
+            if enabled:
+                cte = self._closure_edges_cte(issue_id, upstream=is_upstream)
+                parts.append(select(cte.c.blocking_issue_id, cte.c.blocked_issue_id))
 
-        # Get all blocking issues
-        blocking = await self.get_blocking_issues(issue_id)
+        stmt = parts[0] if len(parts) == 1 else parts[0].union_all(*parts[1:])
+        result = await self.session.execute(stmt)
+        return DependencyGraph((row[0], row[1]) for row in result.all())
+
+    def _closure_edges_cte(self, issue_id: UUID, upstream: bool):
+        """Recursive CTE of every dependency edge reachable from an issue.
 
-        # Recursively add their dependencies first
-        for blocking_issue_id in blocking:
-            await self._build_chain(blocking_issue_id, chain, visited)
+        Works on both PostgreSQL and SQLite. UNION (not UNION ALL) drops
+        repeated edges, so the recursion terminates even on cyclic data.
 
-        # Then add this issue
-        if issue_id not in chain:
-            chain.append(issue_id)
\ No newline at end of file
+        Args:
+            issue_id: Issue to start from
+            upstream: Follow edges towards blockers (True) or dependents (False)
+
+        Returns:
+            CTE with blocking_issue_id and blocked_issue_id columns
+        """
+        deps = issue_dependencies
+        near = deps.c.blocked_issue_id if upstream else deps.c.blocking_issue_id
+        name = "upstream_edges" if upstream else "downstream_edges"
+
+        seed = select(deps.c.blocking_issue_id, deps.c.blocked_issue_id).where(
+            near == issue_id
+        )
+        edges = seed.cte(name, recursive=True)
+        frontier = edges.c.blocking_issue_id if upstream else edges.c.blocked_issue_id
+        step = select(deps.c.blocking_issue_id, deps.c.blocked_issue_id).join(
+            edges, near == frontier
+        )
+        return edges.union(step)
@@ -1,9 +1,11 @@
 """Repository for job posting data access."""
 
+from collections.abc import Sequence
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from turbo.core.models.job_posting import JobPosting, SearchCriteria, JobSearchHistory
@@ -69,6 +71,56 @@ class JobPostingRepository(BaseRepository[JobPosting, JobPostingCreate, JobPosti
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_by_external_ids(
+        self, keys: Sequence[tuple[str, str]]
+    ) -> list[JobPosting]:
+        """Get job postings matching any of the given (source, external_id) pairs."""
+        if not keys:
+            return []
+        stmt = select(JobPosting).where(
+            tuple_(JobPosting.source, JobPosting.external_id).in_(set(keys))
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_by_fingerprints(self, fingerprints: Sequence[str]) -> list[JobPosting]:
+        """Get job postings with any of the given dedup fingerprints, oldest first."""
+        if not fingerprints:
+            return []
+        stmt = (
+            select(JobPosting)
+            .where(JobPosting.fingerprint.in_(set(fingerprints)))
+            .order_by(JobPosting.created_at.asc())
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_dedup_candidates(
+        self, company_keys: Sequence[str], since: datetime
+    ) -> list[JobPosting]:
+        """Get recent job postings whose normalized company is in ``company_keys``.
+
+        Rows that predate the fingerprint columns (no company_key yet) are
+        included too, so matching stays correct until the backfill has run.
+        """
+        if not company_keys:
+            return []
+        stmt = select(JobPosting).where(
+            JobPosting.created_at >= since,
+            or_(
+                JobPosting.company_key.in_(set(company_keys)),
+                JobPosting.company_key.is_(None),
+            ),
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_without_fingerprint(self, limit: int = 500) -> list[JobPosting]:
+        """Get job postings that have not been fingerprinted yet."""
+        stmt = select(JobPosting).where(JobPosting.fingerprint.is_(None)).limit(limit)
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_new_jobs(self, limit: int = 100) -> list[JobPosting]:
         """Get all new (unreviewed) job postings."""
         return await self.get_by_status("new", limit=limit)
@@ -25,6 +25,15 @@ class LiteratureRepository(BaseRepository[Literature, LiteratureCreate, Literatu
         )
         return result.scalars().first()
 
+    async def get_existing_urls(self, urls: list[str]) -> set[str]:
+        """Get which of the given URLs are already stored, in one query."""
+        if not urls:
+            return set()
+        result = await self._session.execute(
+            select(Literature.url).where(Literature.url.in_(set(urls)))
+        )
+        return set(result.scalars().all())
+
     async def get_by_type(
         self,
         literature_type: str,
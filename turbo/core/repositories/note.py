@@ -17,12 +17,12 @@ class NoteRepository(BaseRepository[Note, NoteCreate, NoteUpdate]):
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session, Note)
 
-    async def create(self, obj_in: NoteCreate) -> Note:
+    async def create(self, obj_in: NoteCreate, commit: bool = True) -> Note:
         """Create a new note, excluding tag_ids from model creation."""
         obj_data = obj_in.model_dump(exclude_unset=True, exclude={"tag_ids"})
         db_obj = self._model(**obj_data)
         self._session.add(db_obj)
-        await self._session.commit()
+        await self._flush_or_commit(commit)
         await self._session.refresh(db_obj, ["tags"])
         return db_obj
 
@@ -38,7 +38,9 @@ class NoteRepository(BaseRepository[Note, NoteCreate, NoteUpdate]):
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def update(self, id: UUID, obj_in: NoteUpdate | dict) -> Note:
+    async def update(
+        self, id: UUID, obj_in: NoteUpdate | dict, commit: bool = True
+    ) -> Note:
         """Update a note, excluding tag_ids from model update."""
         db_obj = await self.get_by_id(id)
         if not db_obj:
@@ -53,7 +55,7 @@ class NoteRepository(BaseRepository[Note, NoteCreate, NoteUpdate]):
         for field, value in update_data.items():
             setattr(db_obj, field, value)
 
-        await self._session.commit()
+        await self._flush_or_commit(commit)
         await self._session.refresh(db_obj, ["tags"])
         return db_obj
 
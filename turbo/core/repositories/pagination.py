@@ -0,0 +1,75 @@
+"""Keyset pagination primitives shared by repositories.
+
+A cursor records the sort key of the last row of a page, so the next page
+is a ``WHERE (sort key) > (cursor)`` range scan on an index rather than an
+``OFFSET`` that reads and discards every earlier row.
+"""
+
+import base64
+from dataclasses import dataclass, field
+from datetime import datetime
+import json
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy.orm import InstrumentedAttribute
+
+from turbo.utils.exceptions import ValidationError
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class KeysetOrder:
+    """Columns a listing is sorted by; the last must be unique (the id)."""
+
+    columns: tuple[str, ...]
+    descending: bool = False
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of a listing and the cursor for the next, if there is one."""
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+def select_fields(obj: Any, fields: list[str]) -> dict[str, Any]:
+    """The requested attributes of a record loaded with only those fields."""
+    return {name: getattr(obj, name) for name in fields}
+
+
+def encode_cursor(order: str, values: list[Any]) -> str:
+    """Opaque, URL-safe cursor for the row with the given sort key."""
+    payload = json.dumps([order, *values], default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str, order: str, attributes: list[InstrumentedAttribute]
+) -> list[Any]:
+    """Sort key values from a cursor, converted back to column types.
+
+    Raises:
+        ValidationError: If the cursor is malformed or was issued for a
+            different ordering
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_order, *values = json.loads(base64.urlsafe_b64decode(padded))
+        if cursor_order != order or len(values) != len(attributes):
+            raise ValueError("cursor does not match ordering")
+        return [
+            _coerce(value, attribute.type.python_type)
+            for value, attribute in zip(values, attributes)
+        ]
+    except (ValueError, TypeError) as e:
+        raise ValidationError(f"Invalid cursor: {e}", field="cursor") from e
+
+
+def _coerce(value: Any, python_type: type) -> Any:
+    if value is None or isinstance(value, python_type):
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    return python_type(value)
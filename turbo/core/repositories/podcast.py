@@ -1,12 +1,13 @@
 """Repository for Podcast database operations."""
 
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from turbo.core.models.podcast import PodcastShow, PodcastEpisode
+from turbo.core.models.podcast import PodcastShow, PodcastEpisode, TranscriptionJob
 from turbo.core.repositories.base import BaseRepository
 from turbo.core.schemas.podcast import (
     PodcastShowCreate,
@@ -32,7 +33,7 @@ class PodcastShowRepository(BaseRepository[PodcastShow, PodcastShowCreate, Podca
 
     async def get_subscribed(
         self,
-        limit: int = 100,
+        limit: Optional[int] = 100,
         offset: int = 0,
     ) -> list[PodcastShow]:
         """Get subscribed podcast shows."""
@@ -95,6 +96,14 @@ class PodcastShowRepository(BaseRepository[PodcastShow, PodcastShowCreate, Podca
             await self._session.refresh(show)
         return show
 
+    async def mark_fetched(self, show_id: UUID, fetched_at: datetime) -> None:
+        """Set last_fetched_at without loading the show or committing."""
+        await self._session.execute(
+            update(PodcastShow)
+            .where(PodcastShow.id == show_id)
+            .values(last_fetched_at=fetched_at)
+        )
+
     async def update_episode_stats(self, show_id: UUID) -> Optional[PodcastShow]:
         """Update episode statistics for a show."""
         show = await self.get_by_id(show_id)
@@ -153,6 +162,24 @@ class PodcastEpisodeRepository(BaseRepository[PodcastEpisode, PodcastEpisodeCrea
         )
         return result.scalars().first()
 
+    async def get_by_ids(self, episode_ids: list[UUID]) -> dict[UUID, PodcastEpisode]:
+        """Get many episodes in one query, keyed by ID."""
+        if not episode_ids:
+            return {}
+        result = await self._session.execute(
+            select(PodcastEpisode).where(PodcastEpisode.id.in_(set(episode_ids)))
+        )
+        return {episode.id: episode for episode in result.scalars().all()}
+
+    async def get_existing_guids(self, guids: list[str]) -> set[str]:
+        """Get which of the given GUIDs are already stored, in one query."""
+        if not guids:
+            return set()
+        result = await self._session.execute(
+            select(PodcastEpisode.guid).where(PodcastEpisode.guid.in_(set(guids)))
+        )
+        return set(result.scalars().all())
+
     async def get_by_season(
         self,
         show_id: UUID,
@@ -294,4 +321,58 @@ class PodcastEpisodeRepository(BaseRepository[PodcastEpisode, PodcastEpisodeCrea
     async def list_all(self) -> list[PodcastEpisode]:
         """Get all episodes (for stats)."""
         result = await self._session.execute(select(PodcastEpisode))
-        return list(result.scalars().all())
\ No newline at end of file
+        return list(result.scalars().all())
+
+
+class TranscriptionJobRepository(BaseRepository[TranscriptionJob, dict, dict]):
+    """Repository for TranscriptionJob operations."""
+
+    ACTIVE_STATUSES = ("pending", "downloading", "transcribing")
+    RUNNING_STATUSES = ("downloading", "transcribing")
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository."""
+        super().__init__(session, TranscriptionJob)
+
+    async def get_active_by_episodes(
+        self, episode_ids: list[UUID]
+    ) -> dict[UUID, TranscriptionJob]:
+        """Get unfinished jobs for the given episodes, keyed by episode ID."""
+        if not episode_ids:
+            return {}
+        result = await self._session.execute(
+            select(TranscriptionJob).where(
+                TranscriptionJob.episode_id.in_(set(episode_ids)),
+                TranscriptionJob.status.in_(self.ACTIVE_STATUSES),
+            )
+        )
+        return {job.episode_id: job for job in result.scalars().all()}
+
+    async def get_pending(self, limit: Optional[int] = None) -> list[TranscriptionJob]:
+        """Get pending jobs, oldest first."""
+        result = await self._session.execute(
+            select(TranscriptionJob)
+            .where(TranscriptionJob.status == "pending")
+            .order_by(TranscriptionJob.created_at)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def reset_interrupted(self) -> int:
+        """Put jobs left running by a previous process back to pending."""
+        result = await self._session.execute(
+            update(TranscriptionJob)
+            .where(TranscriptionJob.status.in_(self.RUNNING_STATUSES))
+            .values(status="pending")
+        )
+        await self._session.commit()
+        return result.rowcount
+
+    async def count_by_status(self) -> dict[str, int]:
+        """Count jobs per status in one query."""
+        result = await self._session.execute(
+            select(TranscriptionJob.status, func.count()).group_by(
+                TranscriptionJob.status
+            )
+        )
+        return {status: count for status, count in result.all()}
@@ -17,9 +17,14 @@ class ReviewRequestRepository(BaseRepository[ReviewRequest, dict, dict]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, ReviewRequest)
 
-    async def get_pending_for_user(self) -> list[ReviewRequest]:
+    async def get_pending_for_user(
+        self, limit: Optional[int] = None
+    ) -> list[ReviewRequest]:
         """
-        Get all pending review requests for the user (My Queue).
+        Get pending review requests for the user (My Queue).
+
+        Args:
+            limit: Maximum number of requests to return
 
         Returns:
             List of pending review requests ordered by creation date (newest first)
@@ -29,6 +34,8 @@ class ReviewRequestRepository(BaseRepository[ReviewRequest, dict, dict]):
             .where(ReviewRequest.status == "pending")
             .order_by(ReviewRequest.created_at.desc())
         )
+        if limit:
+            stmt = stmt.limit(limit)
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
@@ -147,9 +154,7 @@ class ReviewRequestRepository(BaseRepository[ReviewRequest, dict, dict]):
         Returns:
             Number of pending review requests
         """
-        stmt = select(ReviewRequest).where(ReviewRequest.status == "pending")
-        result = await self._session.execute(stmt)
-        return len(list(result.scalars().all()))
+        return await self.count(status="pending")
 
     async def get_pending_by_type_counts(self) -> dict[str, int]:
         """
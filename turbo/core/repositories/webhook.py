@@ -1,9 +1,10 @@
 """Webhook repository for database operations."""
 
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from typing import Any
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -66,6 +67,75 @@ class WebhookRepository(BaseRepository[Webhook, WebhookCreate, WebhookUpdate]):
         await self._session.refresh(delivery)
         return delivery
 
+    async def enqueue_deliveries(
+        self,
+        webhooks: list[Webhook],
+        event_type: str,
+        payload: dict,
+        commit: bool = True,
+    ) -> list[WebhookDelivery]:
+        """Queue one pending delivery per webhook, due immediately.
+
+        With ``commit=False`` the rows are only flushed, so they commit (or
+        roll back) together with the caller's own changes.
+        """
+        now = datetime.now(timezone.utc)
+        deliveries = [
+            WebhookDelivery(
+                webhook_id=webhook.id,
+                event_type=event_type,
+                payload=payload,
+                status="pending",
+                next_retry_at=now,
+            )
+            for webhook in webhooks
+        ]
+        self._session.add_all(deliveries)
+        if commit:
+            await self._session.commit()
+        else:
+            await self._session.flush()
+        return deliveries
+
+    async def claim_due_deliveries(
+        self, limit: int, lease_seconds: int
+    ) -> list[WebhookDelivery]:
+        """Lease up to ``limit`` due deliveries of active webhooks.
+
+        Claimed rows get ``next_retry_at`` pushed out by the lease, so other
+        dispatchers skip them and a crashed one's work is picked up later.
+        Rows locked by a concurrent claim are skipped on PostgreSQL.
+        """
+        now = datetime.now(timezone.utc)
+        stmt = (
+            select(WebhookDelivery)
+            .join(Webhook, Webhook.id == WebhookDelivery.webhook_id)
+            .where(
+                WebhookDelivery.status.in_(["pending", "retrying"]),
+                WebhookDelivery.next_retry_at <= now,
+                Webhook.is_active == True,
+            )
+            .order_by(WebhookDelivery.next_retry_at)
+            .limit(limit)
+            .options(selectinload(WebhookDelivery.webhook))
+            .with_for_update(skip_locked=True, of=WebhookDelivery)
+        )
+        result = await self._session.execute(stmt)
+        deliveries = list(result.scalars().all())
+
+        lease_until = now + timedelta(seconds=lease_seconds)
+        for delivery in deliveries:
+            delivery.next_retry_at = lease_until
+        await self._session.commit()
+        return deliveries
+
+    async def save_delivery_results(self, results: list[dict[str, Any]]) -> None:
+        """Write per-delivery attempt outcomes (each dict keyed by ``id``) in one transaction."""
+        if not results:
+            return
+        await self._session.execute(update(WebhookDelivery), results)
+        await self._session.commit()
+
     async def update_delivery_status(
         self,
         delivery_id: UUID,
@@ -1,5 +1,11 @@
 """Pydantic schemas for API request/response validation."""
 
+from turbo.core.schemas.batch import (
+    BatchOperation,
+    BatchRequest,
+    BatchResponse,
+    BatchResult,
+)
 from turbo.core.schemas.calendar_event import (
     CalendarEventCreate,
     CalendarEventResponse,
@@ -66,6 +72,12 @@ from turbo.core.schemas.saved_filter import (
     SavedFilterResponse,
     SavedFilterUpdate,
 )
+from turbo.core.schemas.search import (
+    HybridSearchResponse,
+    HybridSearchResult,
+    SearchResponse,
+    SearchResult,
+)
 from turbo.core.schemas.skill import (
     SkillCreate,
     SkillResponse,
@@ -79,6 +91,10 @@ from turbo.core.schemas.tag import (
 )
 
 __all__ = [
+    "BatchOperation",
+    "BatchRequest",
+    "BatchResponse",
+    "BatchResult",
     "CalendarEventCreate",
     "CalendarEventResponse",
     "CalendarEventSummary",
@@ -94,6 +110,8 @@ __all__ = [
     "GraphSearchResponse",
     "GraphSearchResult",
     "GraphStats",
+    "HybridSearchResponse",
+    "HybridSearchResult",
     "InitiativeCreate",
     "InitiativeResponse",
     "InitiativeUpdate",
@@ -124,6 +142,8 @@ __all__ = [
     "SavedFilterCreate",
     "SavedFilterResponse",
     "SavedFilterUpdate",
+    "SearchResponse",
+    "SearchResult",
     "SkillCreate",
     "SkillResponse",
     "SkillSummary",
@@ -0,0 +1,35 @@
+"""Batch request Pydantic schemas."""
+
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+
+class BatchOperation(BaseModel):
+    """One API call inside a batch."""
+
+    id: str | None = Field(None, max_length=100, description="Caller reference echoed in the result")
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = "GET"
+    path: str = Field(..., pattern="^/", max_length=2048, description="Path relative to /api/v1")
+    params: dict[str, Any] = Field(default_factory=dict)
+    body: Any = None
+
+
+class BatchRequest(BaseModel):
+    """Schema for batch API requests."""
+
+    operations: list[BatchOperation] = Field(..., min_length=1, max_length=50)
+
+
+class BatchResult(BaseModel):
+    """Outcome of one batched operation."""
+
+    id: str | None = None
+    status_code: int
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    """Schema for batch API responses, in operation order."""
+
+    results: list[BatchResult]
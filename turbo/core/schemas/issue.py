@@ -24,7 +24,7 @@ class IssueBase(BaseModel):
     assignee: EmailStr | None = None
     due_date: datetime | None = None
     created_by: str | None = None  # User email or "AI: model_name"
-    work_rank: int | None = Field(None, ge=1, description="Work queue rank (1=highest priority)")
+    work_rank: int | None = Field(None, ge=1, description="Work queue sort key (lower = higher priority)")
     last_ranked_at: datetime | None = None
 
     @field_validator("title")
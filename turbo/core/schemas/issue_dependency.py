@@ -45,4 +45,18 @@ class DependencyChain(BaseModel):
     chain: list[UUID] = Field(
         default_factory=list,
         description="All issues that must be completed first, in order",
-    )
\ No newline at end of file
+    )
+
+
+class DependencyClosure(BaseModel):
+    """Schema for the transitive dependencies of an issue."""
+
+    issue_id: UUID
+    upstream: list[UUID] = Field(
+        default_factory=list,
+        description="All issues that transitively block this issue, in order",
+    )
+    downstream: list[UUID] = Field(
+        default_factory=list,
+        description="All issues this issue transitively blocks, in order",
+    )
@@ -51,7 +51,9 @@ class JobPostingBase(BaseModel):
 
 class JobPostingCreate(JobPostingBase):
     """Schema for creating a job posting."""
-    pass
+
+    fingerprint: Optional[str] = Field(None, max_length=64, description="Dedup fingerprint (computed if omitted)")
+    company_key: Optional[str] = Field(None, max_length=255, description="Normalized company name (computed if omitted)")
 
 
 class JobPostingUpdate(BaseModel):
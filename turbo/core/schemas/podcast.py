@@ -172,6 +172,15 @@ class PodcastFeedFetch(BaseModel):
     limit: Optional[int] = Field(None, ge=1, le=100)
 
 
+class PodcastFeedRefreshResult(BaseModel):
+    """Outcome of refreshing one show's feed."""
+
+    show_id: UUID
+    status: str = Field(..., pattern="^(updated|not_modified|failed)$")
+    new_episodes: int = 0
+    error: Optional[str] = None
+
+
 # Filter Schemas
 class PodcastShowFilter(BaseModel):
     """Schema for filtering podcast shows."""
@@ -123,6 +123,7 @@ class ProjectWithStats(ProjectResponse):
     total_issues: int = 0
     open_issues: int = 0
     closed_issues: int = 0
+    in_progress_issues: int = 0
     completion_rate: float = 0.0
 
 
@@ -0,0 +1,52 @@
+"""Full-text search Pydantic schemas."""
+
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+SearchEntityType = Literal["document", "issue", "project"]
+
+
+class SearchResult(BaseModel):
+    """One ranked full-text match."""
+
+    entity_type: SearchEntityType
+    entity_id: UUID
+    title: str
+    snippet: str = Field(..., description="Body excerpt with matches wrapped in <mark> tags")
+    rank: float = Field(..., description="Relevance score; higher is better")
+
+
+class SearchResponse(BaseModel):
+    """Schema for a page of full-text search results, best match first."""
+
+    query: str
+    results: list[SearchResult]
+    total: int = Field(..., description="Matches across all pages")
+    limit: int
+    offset: int
+
+
+class HybridSearchResult(BaseModel):
+    """One entity ranked by fused full-text and semantic ranks."""
+
+    entity_type: str
+    entity_id: UUID
+    title: str
+    snippet: str
+    score: float = Field(..., description="Reciprocal rank fusion score; higher is better")
+    lexical_rank: int | None = Field(None, description="1-based full-text rank, if matched")
+    semantic_rank: int | None = Field(None, description="1-based semantic rank, if matched")
+
+
+class HybridSearchResponse(BaseModel):
+    """Schema for hybrid search results, best match first."""
+
+    query: str
+    results: list[HybridSearchResult]
+    sources: list[Literal["lexical", "semantic"]] = Field(
+        ..., description="Rankers that contributed to the results"
+    )
+    cached: bool = False
+    execution_time_ms: float
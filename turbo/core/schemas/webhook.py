@@ -17,6 +17,7 @@ class WebhookBase(BaseModel):
     is_active: bool = Field(default=True)
     max_retries: int = Field(default=3, ge=0, le=10)
     timeout_seconds: int = Field(default=30, ge=1, le=300)
+    batch_events: bool = Field(default=False, description="Deliver queued events in batches as {\"events\": [...]}")
     headers: dict[str, str] | None = Field(default_factory=dict, description="Custom headers to send with webhook")
 
     @field_validator("name")
@@ -84,6 +85,7 @@ class WebhookUpdate(BaseModel):
     is_active: bool | None = Field(default=None)
     max_retries: int | None = Field(default=None, ge=0, le=10)
     timeout_seconds: int | None = Field(default=None, ge=1, le=300)
+    batch_events: bool | None = Field(default=None)
     headers: dict[str, str] | None = Field(default=None)
 
 
@@ -118,6 +120,7 @@ class WebhookDeliveryCreate(BaseModel):
     event_type: str = Field(..., min_length=1, max_length=100)
     payload: dict
     status: str = Field(default="pending", pattern="^(success|failed|pending|retrying)$")
+    next_retry_at: datetime | None = Field(default=None)
 
 
 class WebhookDeliveryResponse(WebhookDeliveryBase):
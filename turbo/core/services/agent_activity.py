@@ -11,9 +11,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 
 from turbo.core.models.agent_session import AgentSession as DBAgentSession, AgentSessionStatus
+from turbo.core.services.broadcast_backend import BroadcastBackend
 
 logger = logging.getLogger(__name__)
 
+# Backend channel carrying session changes between API workers
+TRACKER_CHANNEL = "agents:tracker"
+
 
 class AgentStatus(str, Enum):
     """Agent status types."""
@@ -56,6 +60,16 @@ class AgentSession:
             data["completed_at"] = self.completed_at.isoformat()
         return data
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "AgentSession":
+        """Rebuild a session from ``to_dict`` output."""
+        data = dict(data)
+        data["status"] = AgentStatus(data["status"])
+        for field_name in ("started_at", "updated_at", "completed_at"):
+            if data.get(field_name):
+                data[field_name] = datetime.fromisoformat(data[field_name])
+        return cls(**data)
+
 
 class AgentActivityTracker:
     """Tracks all AI agent activity in real-time."""
@@ -65,6 +79,34 @@ class AgentActivityTracker:
         self.recent_sessions: List[AgentSession] = []
         self.max_recent = 100  # Keep last 100 completed sessions
         self._cleanup_task = None
+        self._backend: Optional[BroadcastBackend] = None
+
+    def bind_backend(self, backend: BroadcastBackend):
+        """Share session changes with the tracker in peer API workers."""
+        self._backend = backend
+        backend.subscribe(TRACKER_CHANNEL, self._on_peer_update)
+
+    def _replicate(self, session: AgentSession, finished: bool = False):
+        """Publish a session's current state to peer workers."""
+        if self._backend is not None:
+            self._backend.publish(
+                TRACKER_CHANNEL, {"session": session.to_dict(), "finished": finished}
+            )
+
+    def _on_peer_update(self, _channel: str, data: dict):
+        """Apply a session change made in another worker."""
+        session = AgentSession.from_dict(data["session"])
+        if data.get("finished"):
+            self.active_sessions.pop(session.session_id, None)
+            self._add_recent(session)
+        else:
+            self.active_sessions[session.session_id] = session
+
+    def _add_recent(self, session: AgentSession):
+        """Move a finished session to the front of the recent list."""
+        self.recent_sessions.insert(0, session)
+        if len(self.recent_sessions) > self.max_recent:
+            self.recent_sessions = self.recent_sessions[:self.max_recent]
 
     async def start(self):
         """Start background cleanup task."""
@@ -119,6 +161,7 @@ class AgentActivityTracker:
         )
 
         self.active_sessions[session_id] = session
+        self._replicate(session)
         return session_id
 
     def update_status(
@@ -144,6 +187,8 @@ class AgentActivityTracker:
                 session.completed_at - session.started_at
             ).total_seconds()
 
+        self._replicate(session)
+
     def update_metrics(
         self,
         session_id: str,
@@ -160,6 +205,7 @@ class AgentActivityTracker:
         session.output_tokens = output_tokens
         session.cost_usd = cost_usd
         session.updated_at = datetime.utcnow()
+        self._replicate(session)
 
     def complete_session(
         self,
@@ -184,12 +230,11 @@ class AgentActivityTracker:
         session.updated_at = datetime.utcnow()
 
         # Move to recent sessions
-        self.recent_sessions.insert(0, session)
-        if len(self.recent_sessions) > self.max_recent:
-            self.recent_sessions = self.recent_sessions[:self.max_recent]
+        self._add_recent(session)
 
         # Remove from active
         del self.active_sessions[session_id]
+        self._replicate(session, finished=True)
 
     async def persist_session(self, session_id: str, db: AsyncSession):
         """Persist session to database."""
@@ -243,12 +288,11 @@ class AgentActivityTracker:
         session.updated_at = datetime.utcnow()
 
         # Move to recent sessions
-        self.recent_sessions.insert(0, session)
-        if len(self.recent_sessions) > self.max_recent:
-            self.recent_sessions = self.recent_sessions[:self.max_recent]
+        self._add_recent(session)
 
         # Remove from active
         del self.active_sessions[session_id]
+        self._replicate(session, finished=True)
 
     async def get_recent_from_db(self, db: AsyncSession, limit: int = 50) -> List[dict]:
         """Get recent sessions from database."""
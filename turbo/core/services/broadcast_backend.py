@@ -0,0 +1,391 @@
+"""Cross-process pub/sub for websocket broadcasts and agent activity.
+
+Each API worker delivers to its own sockets directly and publishes the same
+message through a backend so peer workers can deliver it to theirs:
+
+- ``memory``: single process, nothing to publish (the default)
+- ``postgres``: PostgreSQL ``LISTEN/NOTIFY`` on the application database
+- ``unix``: a small relay on a Unix socket for several workers on one host;
+  the first worker to start hosts it and the others connect
+
+Publishing never waits on the transport. Messages go onto a bounded outbox
+that a sender task drains in order.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+import contextlib
+import fcntl
+import json
+import logging
+import os
+from typing import Any, Dict, Optional, Tuple
+from uuid import uuid4
+
+from turbo.utils.config import WebSocketSettings, get_settings
+
+logger = logging.getLogger(__name__)
+
+# Handler receives the channel with its subscription prefix removed
+Handler = Callable[[str, dict], None]
+
+
+class BroadcastBackend(ABC):
+    """Base backend: publish to peer processes, dispatch their messages."""
+
+    def __init__(self, queue_size: int = 10000):
+        self.origin = uuid4().hex
+        self._handlers: Dict[str, Handler] = {}
+        self._queue_size = queue_size
+        self._outbox: Optional[asyncio.Queue] = None
+        self._sender: Optional[asyncio.Task] = None
+        # Reconnects are serialized; the generation counts successful ones
+        self._reconnect_lock = asyncio.Lock()
+        self._generation = 0
+
+    def subscribe(self, prefix: str, handler: Handler) -> None:
+        """Call ``handler`` for peer messages on channels starting with ``prefix``."""
+        self._handlers[prefix] = handler
+
+    def publish(self, channel: str, data: dict) -> None:
+        """Queue a message for peer processes without waiting."""
+        if self._outbox is None:
+            return
+        try:
+            self._outbox.put_nowait((channel, data))
+        except asyncio.QueueFull:
+            logger.warning(f"Broadcast outbox full, dropping message on {channel}")
+
+    async def start(self) -> None:
+        """Connect to the transport and start sending."""
+        if self._sender is not None:
+            return
+        await self._connect()
+        self._outbox = asyncio.Queue(maxsize=self._queue_size)
+        self._sender = asyncio.create_task(self._send_loop())
+
+    async def stop(self) -> None:
+        """Stop sending and disconnect; queued messages are discarded."""
+        if self._sender is not None:
+            self._sender.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sender
+            self._sender = None
+        self._outbox = None
+        await self._disconnect()
+
+    async def _send_loop(self) -> None:
+        while True:
+            channel, data = await self._outbox.get()
+            message = json.dumps({"o": self.origin, "c": channel, "d": data}, default=str)
+            try:
+                await self._send(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Broadcast publish on {channel} failed: {e}")
+                await self._reconnect()
+
+    def _receive(self, message: str) -> None:
+        """Dispatch a message from the transport, ignoring our own echoes."""
+        try:
+            envelope = json.loads(message)
+        except ValueError:
+            logger.warning("Ignoring malformed broadcast message")
+            return
+        if envelope.get("o") == self.origin:
+            return
+        channel = envelope.get("c", "")
+        for prefix, handler in self._handlers.items():
+            if channel.startswith(prefix):
+                try:
+                    handler(channel[len(prefix):], envelope.get("d") or {})
+                except Exception as e:
+                    logger.error(f"Broadcast handler for {channel} failed: {e}")
+
+    async def _reconnect(self) -> bool:
+        """Reconnect the transport; waits a second before returning on failure.
+
+        Callers that were waiting while another reconnect succeeded use that
+        connection instead of replacing it.
+        """
+        generation = self._generation
+        async with self._reconnect_lock:
+            if self._generation != generation:
+                return True
+            await self._disconnect()
+            try:
+                await self._connect()
+            except Exception as e:
+                logger.error(f"Broadcast backend reconnect failed: {e}")
+                await asyncio.sleep(1.0)
+                return False
+            self._generation += 1
+            return True
+
+    @property
+    def running(self) -> bool:
+        """Whether the backend has been started and not stopped."""
+        return self._sender is not None
+
+    # Transport hooks
+
+    async def _connect(self) -> None:
+        pass
+
+    async def _disconnect(self) -> None:
+        pass
+
+    @abstractmethod
+    async def _send(self, message: str) -> None:
+        """Deliver one encoded message to peer processes."""
+        pass
+
+
+class MemoryBroadcastBackend(BroadcastBackend):
+    """Single-process backend; local delivery is all there is."""
+
+    async def start(self) -> None:
+        pass
+
+    def publish(self, channel: str, data: dict) -> None:
+        pass
+
+    async def _send(self, message: str) -> None:
+        pass
+
+
+class PostgresBroadcastBackend(BroadcastBackend):
+    """Relay messages between workers with PostgreSQL LISTEN/NOTIFY.
+
+    NOTIFY payloads are limited to 8000 bytes, so longer messages are sent
+    as numbered chunks and reassembled by listeners.
+    """
+
+    MAX_PAYLOAD_BYTES = 7000
+
+    def __init__(self, dsn: str, channel: str, queue_size: int = 10000):
+        super().__init__(queue_size)
+        self._dsn = dsn.replace("postgresql+asyncpg://", "postgresql://")
+        self._channel = channel
+        self._connection: Any = None
+        self._chunks: Dict[Tuple[str, str], list] = {}
+        self._reconnect_task: Optional[asyncio.Task] = None
+
+    async def _connect(self) -> None:
+        import asyncpg
+
+        self._connection = await asyncpg.connect(self._dsn)
+        await self._connection.add_listener(self._channel, self._on_notify)
+        self._connection.add_termination_listener(self._on_terminated)
+
+    def _on_terminated(self, connection: Any) -> None:
+        # Keep listening after a dropped connection, not just on the next send
+        if self.running and connection is self._connection:
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _disconnect(self) -> None:
+        task = self._reconnect_task
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        self._reconnect_task = None
+        if self._connection is not None:
+            with contextlib.suppress(Exception):
+                await self._connection.close()
+            self._connection = None
+        self._chunks.clear()
+
+    async def _send(self, message: str) -> None:
+        if self._connection is None or self._connection.is_closed():
+            if not await self._reconnect():
+                return
+        for notification in self._split(message):
+            await self._connection.execute(
+                "SELECT pg_notify($1, $2)", self._channel, notification
+            )
+
+    def _split(self, message: str) -> list[str]:
+        """Wrap a message too long for NOTIFY into chunks."""
+        if len(message.encode()) <= self.MAX_PAYLOAD_BYTES:
+            return [message]
+        # Messages are ASCII JSON, and escaping quotes again at most doubles them
+        size = self.MAX_PAYLOAD_BYTES // 2
+        parts = [message[i:i + size] for i in range(0, len(message), size)]
+        message_id = uuid4().hex
+        return [
+            json.dumps({"o": self.origin, "chunk": [message_id, index, len(parts), part]})
+            for index, part in enumerate(parts)
+        ]
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            envelope = json.loads(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed broadcast notification")
+            return
+        if "chunk" not in envelope:
+            self._receive(payload)
+            return
+        if envelope["o"] == self.origin:
+            return
+        message_id, index, total, part = envelope["chunk"]
+        parts = self._chunks.setdefault((envelope["o"], message_id), [None] * total)
+        parts[index] = part
+        if all(p is not None for p in parts):
+            del self._chunks[(envelope["o"], message_id)]
+            self._receive("".join(parts))
+
+
+class _UnixRelay:
+    """Relay hosted by one worker: forwards each line to every other client."""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._clients: set[asyncio.StreamWriter] = set()
+        self._handlers: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_unix_server(
+            self._handle, path=self._path, limit=UnixBroadcastBackend.LINE_LIMIT
+        )
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for task in self._handlers:
+                task.cancel()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self._path)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        self._clients.add(writer)
+        try:
+            while line := await reader.readline():
+                for client in list(self._clients):
+                    if client is not writer:
+                        try:
+                            client.write(line)
+                        except Exception:
+                            self._clients.discard(client)
+        except Exception as e:
+            logger.debug(f"Broadcast relay client error: {e}")
+        finally:
+            self._handlers.discard(task)
+            self._clients.discard(writer)
+            writer.close()
+
+
+class UnixBroadcastBackend(BroadcastBackend):
+    """Relay messages between workers on one host over a Unix socket.
+
+    Workers connect to the relay at ``path``. If none is listening, the
+    first worker to take the lock file starts one in-process. When the
+    hosting worker exits, the others reconnect and one of them takes over.
+    """
+
+    LINE_LIMIT = 16 * 1024 * 1024
+
+    def __init__(self, path: str, queue_size: int = 10000):
+        super().__init__(queue_size)
+        self._path = path
+        self._relay: Optional[_UnixRelay] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+
+    async def _connect(self) -> None:
+        try:
+            reader, self._writer = await self._open()
+        except (FileNotFoundError, ConnectionRefusedError):
+            await self._host_relay()
+            reader, self._writer = await self._open()
+        self._reader_task = asyncio.create_task(self._read_loop(reader))
+
+    async def _open(self):
+        return await asyncio.open_unix_connection(self._path, limit=self.LINE_LIMIT)
+
+    async def _host_relay(self) -> None:
+        """Start the relay unless another worker beat us to it."""
+        with open(f"{self._path}.lock", "w") as lock:
+            # flock blocks while another worker holds it; keep the loop free
+            await asyncio.to_thread(fcntl.flock, lock, fcntl.LOCK_EX)
+            try:
+                _, writer = await self._open()
+                writer.close()
+                return
+            except (FileNotFoundError, ConnectionRefusedError):
+                pass
+            # Nobody is listening, so any socket file left behind is stale
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self._path)
+            self._relay = _UnixRelay(self._path)
+            await self._relay.start()
+            logger.info(f"Hosting broadcast relay on {self._path}")
+
+    async def _disconnect(self) -> None:
+        if self._reader_task is not None:
+            if self._reader_task is not asyncio.current_task():
+                self._reader_task.cancel()
+            self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._relay is not None:
+            await self._relay.stop()
+            self._relay = None
+
+    async def _send(self, message: str) -> None:
+        if self._writer is None and not await self._reconnect():
+            return
+        self._writer.write(message.encode() + b"\n")
+        await self._writer.drain()
+
+    async def _read_loop(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while line := await reader.readline():
+                self._receive(line.decode())
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            logger.error(f"Broadcast relay read failed: {e}")
+        # The relay went away; reconnect, possibly hosting it ourselves
+        logger.warning("Broadcast relay connection lost, reconnecting")
+        while self.running and not await self._reconnect():
+            pass
+
+
+def create_broadcast_backend(
+    settings: Optional[WebSocketSettings] = None,
+) -> BroadcastBackend:
+    """Build the backend selected by ``WEBSOCKET_BROADCAST_BACKEND``."""
+    settings = settings or get_settings().websocket
+    if settings.broadcast_backend == "postgres":
+        return PostgresBroadcastBackend(
+            get_settings().database.url,
+            settings.broadcast_channel,
+            settings.broadcast_queue_size,
+        )
+    if settings.broadcast_backend == "unix":
+        return UnixBroadcastBackend(
+            settings.broadcast_socket_path, settings.broadcast_queue_size
+        )
+    return MemoryBroadcastBackend(settings.broadcast_queue_size)
+
+
+_backend: Optional[BroadcastBackend] = None
+
+
+def get_broadcast_backend() -> BroadcastBackend:
+    """Get the process-wide broadcast backend."""
+    global _backend
+    if _backend is None:
+        _backend = create_broadcast_backend()
+    return _backend
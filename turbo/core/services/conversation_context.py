@@ -1,12 +1,17 @@
 """Context manager for intelligent conversation window management."""
 
+import asyncio
+import json
 import logging
 import re
+import time
+from itertools import chain
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select, desc
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import event, select, desc
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
 
 from turbo.core.models.conversation_memory import ConversationMemory, ConversationSummary
 from turbo.core.models.staff_conversation import StaffConversation
@@ -25,6 +30,114 @@ from turbo.core.services.graph import GraphService
 logger = logging.getLogger(__name__)
 
 
+def estimate_tokens(value: Any) -> int:
+    """Rough token count of a context section (about 4 characters per token)."""
+    return len(json.dumps(value, default=str)) // 4 + 1
+
+
+class ContextBudget:
+    """Token budget that context sections claim in priority order."""
+
+    def __init__(self, max_tokens: int):
+        self.max_tokens = max_tokens
+        self.used = 0
+        self._overflowed = False
+
+    @property
+    def exhausted(self) -> bool:
+        """True once the budget is spent or a section had to be cut."""
+        return self._overflowed or self.used >= self.max_tokens
+
+    def take(self, value: Any) -> bool:
+        """Claim tokens for a section if it fits; nothing fits after a cut."""
+        cost = estimate_tokens(value)
+        if self._overflowed or self.used + cost > self.max_tokens:
+            self._overflowed = True
+            return False
+        self.used += cost
+        return True
+
+    def take_items(self, items: list, keep_last: bool = False) -> list:
+        """Keep leading items (or trailing ones) until the next would not fit."""
+        ordered = reversed(items) if keep_last else items
+        kept = []
+        for item in ordered:
+            if not self.take(item):
+                break
+            kept.append(item)
+        return kept[::-1] if keep_last else kept
+
+
+class UserContextCache:
+    """
+    Per-staff cache of assembled user context.
+
+    Entries are dropped when a session commits changes to any model the
+    context is built from (see the session listeners below), and expire
+    after ``ttl_seconds`` to pick up bulk updates and other processes.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0, max_entries: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.generation = 0
+        self._entries: dict[UUID, tuple[float, dict[str, Any]]] = {}
+
+    def get(self, staff_id: UUID) -> dict[str, Any] | None:
+        entry = self._entries.get(staff_id)
+        if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+            return None
+        return entry[1]
+
+    def set(self, staff_id: UUID, context: dict[str, Any], generation: int) -> None:
+        """Store a context loaded at ``generation``, unless invalidated since."""
+        if generation != self.generation:
+            return
+        if staff_id not in self._entries and len(self._entries) >= self.max_entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[staff_id] = (time.monotonic(), context)
+
+    def invalidate(self, staff_id: UUID | None = None) -> None:
+        """Drop one staff member's context, or every context when none is given."""
+        self.generation += 1
+        if staff_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(staff_id, None)
+
+
+user_context_cache = UserContextCache()
+
+# Changes to these invalidate every staff member's context
+_USER_CONTEXT_MODELS = (Project, Issue, JobApplication, Resume, Company, NetworkContact)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_user_context_changes(session: Session, flush_context: Any) -> None:
+    changes = session.info.setdefault("user_context_changes", set())
+    for instance in chain(session.new, session.dirty, session.deleted):
+        if isinstance(instance, Staff):
+            changes.add(instance.id)
+        elif isinstance(instance, _USER_CONTEXT_MODELS):
+            changes.add(None)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_user_context(session: Session) -> None:
+    changes = session.info.pop("user_context_changes", None)
+    if not changes:
+        return
+    if None in changes:
+        user_context_cache.invalidate()
+    else:
+        for staff_id in changes:
+            user_context_cache.invalidate(staff_id)
+
+
+async def _none() -> None:
+    return None
+
+
 class ConversationContextManager:
     """
     Manages conversation context with intelligent windowing.
@@ -41,7 +154,8 @@ class ConversationContextManager:
         self,
         db: AsyncSession,
         memory_service: ConversationMemoryService,
-        graph_service: GraphService | None = None
+        graph_service: GraphService | None = None,
+        session_factory: async_sessionmaker[AsyncSession] | None = None
     ):
         """Initialize context manager.
 
@@ -49,10 +163,13 @@ class ConversationContextManager:
             db: Database session
             memory_service: Service for long-term memory management
             graph_service: Service for knowledge graph operations (optional)
+            session_factory: Factory for the extra sessions used by concurrent
+                stages (defaults to the application's)
         """
         self.db = db
         self.memory_service = memory_service
         self.graph_service = graph_service
+        self.session_factory = session_factory
 
     async def build_context(
         self,
@@ -65,6 +182,12 @@ class ConversationContextManager:
         """
         Build optimized conversation context.
 
+        Independent stages run concurrently on separate sessions: messages,
+        relevant memories (one search, shared with key facts) and cached
+        user context first; then, only while the token budget has room, the
+        mid-range summary and knowledge graph search.
+        Sections are added in priority order and trimmed to ``max_tokens``.
+
         Args:
             entity_type: "staff" (mentor is deprecated)
             entity_id: UUID of the staff member
@@ -84,103 +207,152 @@ class ConversationContextManager:
         """
         logger.info(f"Building context for {entity_type} {entity_id}")
 
-        # 1. Get all messages
-        messages = await self._get_messages(entity_type, entity_id, limit=max_messages)
+        # 1. Messages, memories and user context are independent
+        messages, memories, user_context = await asyncio.gather(
+            self._get_messages(entity_type, entity_id, limit=max_messages),
+            self._get_memories(entity_type, entity_id, current_message),
+            self._get_user_context(entity_type, entity_id),
+        )
         total_count = len(messages)
 
         if total_count == 0:
             return self._empty_context()
 
-        # 2. Recent messages (last 5) - full detail
-        recent_messages = messages[-5:] if total_count >= 5 else messages
-        logger.info(f"Using {len(recent_messages)} recent messages")
-
-        # 3. Mid-range summary (messages 6-20)
-        conversation_summary = None
-        if total_count > 20:
-            midrange_start = total_count - 20
-            midrange_end = total_count - 5
-            midrange = messages[midrange_start:midrange_end]
+        budget = ContextBudget(max_tokens)
 
-            # Get or create summary
-            conversation_summary = await self.memory_service.get_or_create_summary(
-                entity_type=entity_type,
-                entity_id=entity_id,
-                message_range_start=midrange_start,
-                message_range_end=midrange_end,
-                messages=[self._message_to_dict(m) for m in midrange]
-            )
-            logger.info(f"Using conversation summary for messages {midrange_start}-{midrange_end}")
+        # 2. Recent messages (last 5) - full detail, first claim on the budget
+        recent_messages = budget.take_items(
+            [self._message_to_dict(m) for m in messages[-5:]], keep_last=True
+        )
+        logger.info(f"Using {len(recent_messages)} recent messages")
 
-        # 4. Key facts from old messages (21+)
+        # 3. Key facts from old messages (21+) come from the same memory search
+        memory_dicts = budget.take_items([self._memory_to_dict(m) for m in memories])
         key_facts = []
         if total_count > 20:
-            # Get memories for old portion
-            old_memories = await self.memory_service.get_relevant_memories(
-                entity_type=entity_type,
-                entity_id=entity_id,
-                query_text=current_message,
-                limit=5
-            )
-            key_facts = [
+            key_facts = budget.take_items([
                 {
                     "type": m.memory_type,
                     "content": m.content,
                     "importance": m.importance
                 }
-                for m in old_memories
+                for m in memories
                 if m.memory_type in ["fact", "decision", "preference"]
-            ]
+            ])
             logger.info(f"Retrieved {len(key_facts)} key facts from old messages")
+        logger.info(f"Retrieved {len(memories)} relevant memories")
 
-        # 5. Search knowledge graph for related entities
-        related_entities = {}
-        if self.graph_service:
-            try:
-                related_entities = await self._search_graph_for_related(
-                    messages=messages,
-                    current_message=current_message
-                )
-                logger.info(f"Found related entities from knowledge graph")
-            except Exception as e:
-                logger.warning(f"Knowledge graph search failed: {e}")
-                related_entities = {}
-
-        # 6. Get relevant long-term memories
-        memories = await self.memory_service.get_relevant_memories(
-            entity_type=entity_type,
-            entity_id=entity_id,
-            query_text=current_message,
-            limit=5,
-            min_relevance=0.6
+        # 4. Summary and graph search only run while the budget has room
+        summary_task = graph_task = None
+        if total_count > 20 and not budget.exhausted:
+            summary_task = self._get_summary(entity_type, entity_id, messages)
+        if self.graph_service and not budget.exhausted:
+            graph_task = self._get_related_entities(messages, current_message)
+        conversation_summary, related_entities = await asyncio.gather(
+            summary_task or _none(), graph_task or _none()
         )
-        logger.info(f"Retrieved {len(memories)} relevant memories")
 
-        # 7. User context (active work and career data for mentors)
-        user_context = await self._get_user_context(entity_type, entity_id)
+        summary_dict = self._summary_to_dict(conversation_summary) if conversation_summary else None
+        if summary_dict and not budget.take(summary_dict):
+            summary_dict = None
+
+        # 5. Lower-priority sections are trimmed to what is left
+        user_context = {key: budget.take_items(value) for key, value in user_context.items()}
+        related_entities = {
+            key: budget.take_items(value) for key, value in (related_entities or {}).items()
+        }
 
-        # 8. Extract entities mentioned in conversation
+        # 6. Extract entities mentioned in conversation
         entities_discussed = self._extract_all_entities(messages + [
             type('Message', (), {'content': current_message})()
         ])
 
         return {
-            "recent_messages": [self._message_to_dict(m) for m in recent_messages],
-            "conversation_summary": self._summary_to_dict(conversation_summary) if conversation_summary else None,
+            "recent_messages": recent_messages,
+            "conversation_summary": summary_dict,
             "key_facts": key_facts,
             "related_entities": related_entities,
-            "memories": [self._memory_to_dict(m) for m in memories],
+            "memories": memory_dicts,
             "user_context": user_context,
             "entities_discussed": entities_discussed,
             "total_message_count": total_count,
             "metadata": {
-                "has_summary": conversation_summary is not None,
+                "has_summary": summary_dict is not None,
                 "has_old_messages": total_count > 20,
-                "memory_count": len(memories),
-                "related_count": sum(len(v) for v in related_entities.values())
+                "memory_count": len(memory_dicts),
+                "related_count": sum(len(v) for v in related_entities.values()),
+                "estimated_tokens": budget.used,
             }
         }
 
+    def _new_session(self) -> AsyncSession:
+        """Open a session for a stage that runs alongside others."""
+        if self.session_factory is None:
+            from turbo.core.database.connection import get_session_factory
+
+            self.session_factory = get_session_factory()
+        return self.session_factory()
+
+    async def _get_memories(
+        self,
+        entity_type: str,
+        entity_id: UUID,
+        current_message: str
+    ) -> list[ConversationMemory]:
+        """Relevant long-term memories, searched on a separate session."""
+        async with self._new_session() as session:
+            memory_service = ConversationMemoryService(
+                session, self.memory_service.anthropic_api_key
+            )
+            return await memory_service.get_relevant_memories(
+                entity_type=entity_type,
+                entity_id=entity_id,
+                query_text=current_message,
+                limit=5,
+                min_relevance=0.6
+            )
+
+    async def _get_summary(
+        self,
+        entity_type: str,
+        entity_id: UUID,
+        messages: list[StaffConversation]
+    ) -> ConversationSummary | None:
+        """Get or create the summary of the mid-range messages (6-20)."""
+        total_count = len(messages)
+        midrange_start = total_count - 20
+        midrange_end = total_count - 5
+        midrange = messages[midrange_start:midrange_end]
+
+        summary = await self.memory_service.get_or_create_summary(
+            entity_type=entity_type,
+            entity_id=entity_id,
+            message_range_start=midrange_start,
+            message_range_end=midrange_end,
+            messages=[self._message_to_dict(m) for m in midrange]
+        )
+        logger.info(f"Using conversation summary for messages {midrange_start}-{midrange_end}")
+        return summary
+
+    async def _get_related_entities(
+        self,
+        messages: list[StaffConversation],
+        current_message: str
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Knowledge graph search on a separate session; failures yield nothing."""
+        try:
+            async with self._new_session() as session:
+                related_entities = await self._search_graph_for_related(
+                    messages=messages,
+                    current_message=current_message,
+                    db=session
+                )
+            logger.info(f"Found related entities from knowledge graph")
+            return related_entities
+        except Exception as e:
+            logger.warning(f"Knowledge graph search failed: {e}")
+            return {}
+
     async def _get_messages(
         self,
         entity_type: str,
@@ -208,7 +380,8 @@ class ConversationContextManager:
     async def _search_graph_for_related(
         self,
         messages: list,
-        current_message: str
+        current_message: str,
+        db: AsyncSession | None = None
     ) -> dict[str, list[dict[str, Any]]]:
         """
         Extract entities from messages and find related content from graph.
@@ -216,6 +389,7 @@ class ConversationContextManager:
         Args:
             messages: List of conversation messages
             current_message: Current message text
+            db: Session for entity lookups (defaults to the manager's session)
 
         Returns:
             Dict with related entities by type
@@ -233,45 +407,56 @@ class ConversationContextManager:
             "milestones": []
         }
 
-        # For each mentioned entity, get related entities from graph
-        for entity_type, ids in entity_ids.items():
-            for entity_id in ids[:3]:  # Limit to 3 per type
-                try:
-                    # Search knowledge graph
-                    related_results = await self.graph_service.get_related_entities(
-                        entity_id=UUID(entity_id),
-                        entity_type=entity_type,
-                        limit=2
-                    )
-
-                    # Fetch full entity details
-                    for result in related_results:
-                        entity_data = await self._fetch_entity_details(
-                            result.entity_type,
-                            result.entity_id
-                        )
-                        if entity_data:
-                            related[f"{result.entity_type}s"].append({
-                                "id": str(result.entity_id),
-                                "relevance": result.relevance_score,
-                                **entity_data
-                            })
-
-                except Exception as e:
-                    logger.debug(f"Failed to get related entities for {entity_type} {entity_id}: {e}")
+        # Graph lookups for every mentioned entity run concurrently
+        lookups = [
+            (entity_type, entity_id)
+            for entity_type, ids in entity_ids.items()
+            for entity_id in ids[:3]  # Limit to 3 per type
+        ]
+        results = await asyncio.gather(
+            *(
+                self.graph_service.get_related_entities(
+                    entity_id=UUID(entity_id),
+                    entity_type=entity_type,
+                    limit=2
+                )
+                for entity_type, entity_id in lookups
+            ),
+            return_exceptions=True
+        )
+
+        # Fetch full entity details
+        for (entity_type, entity_id), related_results in zip(lookups, results):
+            if isinstance(related_results, Exception):
+                logger.debug(f"Failed to get related entities for {entity_type} {entity_id}: {related_results}")
+                continue
+            for result in related_results:
+                entity_data = await self._fetch_entity_details(
+                    result.entity_type,
+                    result.entity_id,
+                    db=db
+                )
+                if entity_data:
+                    related[f"{result.entity_type}s"].append({
+                        "id": str(result.entity_id),
+                        "relevance": result.relevance_score,
+                        **entity_data
+                    })
 
         return related
 
     async def _fetch_entity_details(
         self,
         entity_type: str,
-        entity_id: UUID
+        entity_id: UUID,
+        db: AsyncSession | None = None
     ) -> dict[str, Any] | None:
         """Fetch full details for an entity from database.
 
         Args:
             entity_type: Type of entity (issue, project, document, milestone)
             entity_id: UUID of the entity
+            db: Session to query (defaults to the manager's session)
 
         Returns:
             Dict with entity details or None if not found
@@ -288,7 +473,7 @@ class ConversationContextManager:
             return None
 
         try:
-            result = await self.db.execute(
+            result = await (db or self.db).execute(
                 select(model).where(model.id == entity_id)
             )
             entity = result.scalar_one_or_none()
@@ -414,6 +599,9 @@ class ConversationContextManager:
         Get user's current work context (active projects, issues).
         For staff with career capabilities, also includes career data.
 
+        Served from ``user_context_cache`` when possible; otherwise loaded on
+        a separate session and cached until a relevant commit invalidates it.
+
         Args:
             entity_type: "staff" (mentor is deprecated)
             entity_id: UUID of the staff member
@@ -421,146 +609,162 @@ class ConversationContextManager:
         Returns:
             Dict with user context information
         """
+        cached = user_context_cache.get(entity_id)
+        if cached is not None:
+            return cached
+
+        generation = user_context_cache.generation
         try:
-            context = {}
-
-            # Get active projects
-            project_result = await self.db.execute(
-                select(Project)
-                .where(Project.status == "active")
-                .order_by(desc(Project.updated_at))
-                .limit(5)
-            )
-            active_projects = project_result.scalars().all()
-
-            # Get open issues
-            issue_result = await self.db.execute(
-                select(Issue)
-                .where(Issue.status.in_(["open", "in_progress"]))
-                .order_by(desc(Issue.updated_at))
-                .limit(5)
-            )
-            active_issues = issue_result.scalars().all()
+            async with self._new_session() as db:
+                context = await self._load_user_context(db, entity_id)
+        except Exception as e:
+            logger.warning(f"Failed to get user context: {e}", exc_info=True)
+            return {"active_projects": [], "active_issues": []}
 
-            context["active_projects"] = [
-                {
-                    "id": str(p.id),
-                    "name": p.name,
-                    "status": p.status,
-                    "completion": p.completion_percentage
-                }
-                for p in active_projects
-            ]
+        user_context_cache.set(entity_id, context, generation)
+        return context
 
-            context["active_issues"] = [
-                {
-                    "id": str(i.id),
-                    "title": i.title,
-                    "status": i.status,
-                    "priority": i.priority
-                }
-                for i in active_issues
-            ]
+    async def _load_user_context(
+        self,
+        db: AsyncSession,
+        entity_id: UUID
+    ) -> dict[str, Any]:
+        """Query active work and, for career staff, career data."""
+        context = {}
+
+        # Get active projects
+        project_result = await db.execute(
+            select(Project)
+            .where(Project.status == "active")
+            .order_by(desc(Project.updated_at))
+            .limit(5)
+        )
+        active_projects = project_result.scalars().all()
+
+        # Get open issues
+        issue_result = await db.execute(
+            select(Issue)
+            .where(Issue.status.in_(["open", "in_progress"]))
+            .order_by(desc(Issue.updated_at))
+            .limit(5)
+        )
+        active_issues = issue_result.scalars().all()
+
+        context["active_projects"] = [
+            {
+                "id": str(p.id),
+                "name": p.name,
+                "status": p.status,
+                "completion": p.completion_percentage
+            }
+            for p in active_projects
+        ]
+
+        context["active_issues"] = [
+            {
+                "id": str(i.id),
+                "title": i.title,
+                "status": i.status,
+                "priority": i.priority
+            }
+            for i in active_issues
+        ]
+
+        # For staff with career capabilities, include career data
+        staff_result = await db.execute(
+            select(Staff).where(Staff.id == entity_id)
+        )
+        staff = staff_result.scalar_one_or_none()
 
-            # For staff with career capabilities, include career data
-            staff_result = await self.db.execute(
-                select(Staff).where(Staff.id == entity_id)
+        if staff and staff.capabilities:
+            # Check if staff has career-related capabilities
+            career_capabilities = [
+                "career_guidance", "resume_review", "interview_prep",
+                "salary_negotiation", "job_search_strategy"
+            ]
+            has_career_capability = any(
+                cap in staff.capabilities for cap in career_capabilities
             )
-            staff = staff_result.scalar_one_or_none()
 
-            if staff and staff.capabilities:
-                # Check if staff has career-related capabilities
-                career_capabilities = [
-                    "career_guidance", "resume_review", "interview_prep",
-                    "salary_negotiation", "job_search_strategy"
+            if has_career_capability:
+                max_items = 20
+
+                # Include job applications
+                app_result = await db.execute(
+                    select(JobApplication)
+                    .order_by(desc(JobApplication.updated_at))
+                    .limit(max_items)
+                )
+                applications = app_result.scalars().all()
+                context["job_applications"] = [
+                    {
+                        "id": str(a.id),
+                        "position_title": a.position_title,
+                        "company_name": a.company_name,
+                        "status": a.status,
+                        "application_date": a.application_date.isoformat() if a.application_date else None
+                    }
+                    for a in applications
+                ]
+
+                # Include resumes
+                resume_result = await db.execute(
+                    select(Resume)
+                    .order_by(desc(Resume.updated_at))
+                    .limit(max_items)
+                )
+                resumes = resume_result.scalars().all()
+                context["resumes"] = [
+                    {
+                        "id": str(r.id),
+                        "title": r.title,
+                        "is_primary": r.is_primary,
+                        "target_role": r.target_role,
+                        "target_company": r.target_company
+                    }
+                    for r in resumes
                 ]
-                has_career_capability = any(
-                    cap in staff.capabilities for cap in career_capabilities
+
+                # Include companies
+                company_result = await db.execute(
+                    select(Company)
+                    .order_by(desc(Company.updated_at))
+                    .limit(max_items)
                 )
+                companies = company_result.scalars().all()
+                context["companies"] = [
+                    {
+                        "id": str(c.id),
+                        "name": c.name,
+                        "target_status": c.target_status,
+                        "industry": c.industry,
+                        "application_count": c.application_count
+                    }
+                    for c in companies
+                ]
 
-                if has_career_capability:
-                    max_items = 20
-
-                    # Include job applications
-                    app_result = await self.db.execute(
-                        select(JobApplication)
-                        .order_by(desc(JobApplication.updated_at))
-                        .limit(max_items)
-                    )
-                    applications = app_result.scalars().all()
-                    context["job_applications"] = [
-                        {
-                            "id": str(a.id),
-                            "position_title": a.position_title,
-                            "company_name": a.company_name,
-                            "status": a.status,
-                            "application_date": a.application_date.isoformat() if a.application_date else None
-                        }
-                        for a in applications
-                    ]
-
-                    # Include resumes
-                    resume_result = await self.db.execute(
-                        select(Resume)
-                        .order_by(desc(Resume.updated_at))
-                        .limit(max_items)
-                    )
-                    resumes = resume_result.scalars().all()
-                    context["resumes"] = [
-                        {
-                            "id": str(r.id),
-                            "title": r.title,
-                            "is_primary": r.is_primary,
-                            "target_role": r.target_role,
-                            "target_company": r.target_company
-                        }
-                        for r in resumes
-                    ]
-
-                    # Include companies
-                    company_result = await self.db.execute(
-                        select(Company)
-                        .order_by(desc(Company.updated_at))
-                        .limit(max_items)
-                    )
-                    companies = company_result.scalars().all()
-                    context["companies"] = [
-                        {
-                            "id": str(c.id),
-                            "name": c.name,
-                            "target_status": c.target_status,
-                            "industry": c.industry,
-                            "application_count": c.application_count
-                        }
-                        for c in companies
-                    ]
-
-                    # Include contacts
-                    contact_result = await self.db.execute(
-                        select(NetworkContact)
-                        .where(NetworkContact.is_active == True)
-                        .order_by(desc(NetworkContact.updated_at))
-                        .limit(max_items)
-                    )
-                    contacts = contact_result.scalars().all()
-                    context["network_contacts"] = [
-                        {
-                            "id": str(c.id),
-                            "name": f"{c.first_name} {c.last_name}",
-                            "current_title": c.current_title,
-                            "current_company": c.current_company,
-                            "contact_type": c.contact_type,
-                            "relationship_strength": c.relationship_strength,
-                            "referral_status": c.referral_status
-                        }
-                        for c in contacts
-                    ]
-
-            return context
+                # Include contacts
+                contact_result = await db.execute(
+                    select(NetworkContact)
+                    .where(NetworkContact.is_active == True)
+                    .order_by(desc(NetworkContact.updated_at))
+                    .limit(max_items)
+                )
+                contacts = contact_result.scalars().all()
+                context["network_contacts"] = [
+                    {
+                        "id": str(c.id),
+                        "name": f"{c.first_name} {c.last_name}",
+                        "current_title": c.current_title,
+                        "current_company": c.current_company,
+                        "contact_type": c.contact_type,
+                        "relationship_strength": c.relationship_strength,
+                        "referral_status": c.referral_status
+                    }
+                    for c in contacts
+                ]
 
-        except Exception as e:
-            logger.warning(f"Failed to get user context: {e}", exc_info=True)
-            return {"active_projects": [], "active_issues": []}
+        return context
 
     def _message_to_dict(self, message: StaffConversation) -> dict[str, Any]:
         """Convert message object to dict."""
@@ -1,34 +1,31 @@
 """Conversation memory service for long-term AI chat memory management."""
 
+import asyncio
 import json
 import logging
 import re
-from datetime import datetime, timedelta
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from uuid import UUID
 
 import httpx
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from sqlalchemy import select, and_, func
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import bindparam, select, and_, func, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from turbo.core.database.connection import get_session_factory
 from turbo.core.models.conversation_memory import ConversationMemory, ConversationSummary
 from turbo.core.models.staff_conversation import StaffConversation
+from turbo.core.services.embedding import get_embedding_service
 
 logger = logging.getLogger(__name__)
 
-# Lazy load embedding model
-_embedding_model: SentenceTransformer | None = None
 
-
-def get_embedding_model() -> SentenceTransformer:
-    """Get or create sentence transformer model for embeddings."""
-    global _embedding_model
-    if _embedding_model is None:
-        _embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
-        logger.info("Loaded sentence transformer model for memory embeddings")
-    return _embedding_model
+def get_embedding_model() -> Any:
+    """Get the shared sentence transformer model for embeddings."""
+    return get_embedding_service().model
 
 
 def cosine_similarity(a: list[float], b: list[float]) -> float:
@@ -43,6 +40,219 @@ def cosine_similarity(a: list[float], b: list[float]) -> float:
     return float(dot_product / (norm_a * norm_b))
 
 
+def _to_timestamp(value: datetime) -> float:
+    """Convert a datetime to a POSIX timestamp, treating naive values as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+@dataclass
+class MemoryMatrix:
+    """Scoring columns for one staff member's or mentor's memories."""
+
+    memory_ids: list[UUID]
+    embeddings: np.ndarray  # (n, dim) float32, rows L2-normalized
+    importance: np.ndarray  # (n,) float32
+    first_mentioned: np.ndarray  # (n,) POSIX seconds
+    signature: tuple[int, Any]  # (row count, newest created_at) when loaded
+
+
+class MemoryMatrixCache:
+    """
+    Per-entity cache of memory embedding matrices.
+
+    Entries are invalidated explicitly when memories are extracted or decayed
+    in this process, and validated against a cheap count/max(created_at)
+    probe so memories written by other workers are picked up.
+    """
+
+    def __init__(self, max_entities: int = 256):
+        self.max_entities = max_entities
+        self._matrices: dict[tuple[str, UUID], MemoryMatrix] = {}
+
+    def invalidate(self, entity_type: str | None = None, entity_id: UUID | None = None):
+        """Drop one entity's matrix, or every matrix when no entity is given."""
+        if entity_type is None or entity_id is None:
+            self._matrices.clear()
+        else:
+            self._matrices.pop((entity_type, entity_id), None)
+
+    async def get(
+        self, db: AsyncSession, entity_type: str, entity_id: UUID
+    ) -> MemoryMatrix:
+        """Get the memory matrix for an entity, loading it if missing or stale."""
+        key = (entity_type, entity_id)
+        entity_filter = and_(
+            ConversationMemory.entity_type == entity_type,
+            ConversationMemory.entity_id == entity_id,
+        )
+
+        probe = await db.execute(
+            select(
+                func.count(ConversationMemory.id), func.max(ConversationMemory.created_at)
+            ).where(entity_filter)
+        )
+        signature = tuple(probe.one())
+
+        cached = self._matrices.get(key)
+        if cached is not None and cached.signature == signature:
+            return cached
+
+        # Load only the scoring columns, not memory content
+        result = await db.execute(
+            select(
+                ConversationMemory.id,
+                ConversationMemory.embedding,
+                ConversationMemory.importance,
+                ConversationMemory.first_mentioned_at,
+            ).where(entity_filter, ConversationMemory.embedding.is_not(None))
+        )
+        rows = [row for row in result.all() if row.embedding]
+
+        if rows:
+            embeddings = np.asarray([row.embedding for row in rows], dtype=np.float32)
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            embeddings /= norms
+        else:
+            embeddings = np.empty((0, 0), dtype=np.float32)
+
+        matrix = MemoryMatrix(
+            memory_ids=[row.id for row in rows],
+            embeddings=embeddings,
+            importance=np.asarray([row.importance for row in rows], dtype=np.float32),
+            first_mentioned=np.asarray(
+                [_to_timestamp(row.first_mentioned_at) for row in rows], dtype=np.float64
+            ),
+            signature=signature,
+        )
+
+        if key not in self._matrices and len(self._matrices) >= self.max_entities:
+            self._matrices.pop(next(iter(self._matrices)))
+        self._matrices[key] = matrix
+        return matrix
+
+
+class MemoryAccessBuffer:
+    """
+    Collects memory access metadata and writes it in deferred batches.
+
+    Retrieval runs on every chat turn, so access counts are accumulated in
+    memory and flushed with a single executemany UPDATE on a separate
+    session once enough accesses pile up or the flush interval passes.
+    While started, a background task also flushes every ``flush_interval``
+    seconds, and stopping it writes whatever is still pending.
+    """
+
+    def __init__(
+        self,
+        max_pending: int = 100,
+        flush_interval: float = 30.0,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ):
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self._session_factory = session_factory
+        self._pending: dict[UUID, tuple[int, datetime]] = {}
+        self._last_flush = time.monotonic()
+        self._flush_task: asyncio.Task | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of memories with unwritten access updates."""
+        return len(self._pending)
+
+    def record(self, memory_ids: list[UUID]) -> None:
+        """Record an access to each memory and schedule a flush if one is due."""
+        now = datetime.utcnow()
+        for memory_id in memory_ids:
+            count, _ = self._pending.get(memory_id, (0, now))
+            self._pending[memory_id] = (count + 1, now)
+
+        due = (
+            len(self._pending) >= self.max_pending
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        )
+        if due:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._pending and (self._flush_task is None or self._flush_task.done()):
+            self._flush_task = asyncio.create_task(self.flush())
+
+    async def start(self) -> None:
+        """Start flushing pending updates every ``flush_interval`` seconds."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the periodic flush and write every pending update."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._flush_task is not None:
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+        await self.flush()
+
+    async def _run(self) -> None:
+        # Flushes run as their own task so stopping never cuts one short
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            self._schedule_flush()
+
+    async def flush(self) -> int:
+        """
+        Write pending access updates.
+
+        Returns:
+            Number of memories updated
+        """
+        if not self._pending:
+            return 0
+
+        batch, self._pending = self._pending, {}
+        self._last_flush = time.monotonic()
+
+        statement = (
+            update(ConversationMemory.__table__)
+            .where(ConversationMemory.__table__.c.id == bindparam("memory_id"))
+            .values(
+                access_count=ConversationMemory.__table__.c.access_count
+                + bindparam("hits"),
+                last_accessed_at=bindparam("accessed_at"),
+            )
+        )
+        params = [
+            {"memory_id": memory_id, "hits": hits, "accessed_at": accessed_at}
+            for memory_id, (hits, accessed_at) in batch.items()
+        ]
+
+        try:
+            session_factory = self._session_factory or get_session_factory()
+            async with session_factory() as session:
+                await session.execute(statement, params)
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Failed to flush memory access updates: {e}")
+            # Put the batch back so the counts are retried on the next flush
+            for memory_id, (hits, accessed_at) in batch.items():
+                pending_hits, _ = self._pending.get(memory_id, (0, accessed_at))
+                self._pending[memory_id] = (pending_hits + hits, accessed_at)
+            return 0
+
+        return len(batch)
+
+
+memory_matrix_cache = MemoryMatrixCache()
+memory_access_buffer = MemoryAccessBuffer()
+
+
 class ConversationMemoryService:
     """
     Service for managing long-term conversation memory.
@@ -60,12 +270,11 @@ class ConversationMemoryService:
         """
         self.db = db
         self.anthropic_api_key = anthropic_api_key
-        self.model = get_embedding_model()
+        self.embedder = get_embedding_service()
 
     def generate_embedding(self, text: str) -> list[float]:
         """Generate embedding vector from text."""
-        embedding = self.model.encode(text, convert_to_numpy=True)
-        return embedding.tolist()
+        return self.embedder.embed(text)
 
     async def extract_memories_from_conversation(
         self,
@@ -163,12 +372,14 @@ Only extract memories with importance >= {min_importance}. If there are no signi
 
                 memories_data = json.loads(json_str.strip())
 
+                # Generate all embeddings in one batch
+                embeddings = await self.embedder.aembed_many(
+                    [mem_data["content"] for mem_data in memories_data]
+                )
+
                 # Create ConversationMemory objects
                 memories = []
-                for mem_data in memories_data:
-                    # Generate embedding
-                    embedding = self.generate_embedding(mem_data["content"])
-
+                for mem_data, embedding in zip(memories_data, embeddings):
                     memory = ConversationMemory(
                         entity_type=entity_type,
                         entity_id=entity_id,
@@ -189,6 +400,7 @@ Only extract memories with importance >= {min_importance}. If there are no signi
 
                 if memories:
                     await self.db.commit()
+                    memory_matrix_cache.invalidate(entity_type, entity_id)
                     logger.info(f"Extracted {len(memories)} memories from conversation")
 
                 return memories
@@ -221,54 +433,49 @@ Only extract memories with importance >= {min_importance}. If there are no signi
             List of relevant ConversationMemory objects
         """
         # Generate query embedding
-        query_embedding = self.generate_embedding(query_text)
-
-        # Fetch all memories for this entity
-        result = await self.db.execute(
-            select(ConversationMemory)
-            .where(
-                and_(
-                    ConversationMemory.entity_type == entity_type,
-                    ConversationMemory.entity_id == entity_id
-                )
-            )
-        )
-        memories = result.scalars().all()
+        query_embedding = np.asarray(await self.embedder.aembed(query_text), dtype=np.float32)
 
-        if not memories:
+        matrix = await memory_matrix_cache.get(self.db, entity_type, entity_id)
+        total = len(matrix.memory_ids)
+        if total == 0:
             return []
 
-        # Calculate relevance scores with temporal decay
-        scored_memories = []
-        for memory in memories:
-            if not memory.embedding:
-                continue
-
-            # Semantic similarity
-            similarity = cosine_similarity(query_embedding, memory.embedding)
-
-            # Temporal decay (exponential decay over time)
-            days_old = (datetime.utcnow() - memory.first_mentioned_at).days
-            time_factor = np.exp(-days_old / decay_days)
+        # Semantic similarity for every memory in one matrix-vector product
+        query_norm = np.linalg.norm(query_embedding)
+        if query_norm == 0:
+            return []
+        similarity = matrix.embeddings @ (query_embedding / query_norm)
 
-            # Combined score: semantic similarity * importance * temporal decay
-            relevance = similarity * memory.importance * time_factor
+        # Temporal decay (exponential decay over whole days)
+        days_old = np.floor(
+            (datetime.now(timezone.utc).timestamp() - matrix.first_mentioned) / 86400
+        )
+        time_factor = np.exp(-days_old / decay_days)
 
-            if relevance >= min_relevance:
-                scored_memories.append((memory, relevance))
+        # Combined score: semantic similarity * importance * temporal decay
+        relevance = similarity * matrix.importance * time_factor
 
-        # Sort by relevance and limit
-        scored_memories.sort(key=lambda x: x[1], reverse=True)
-        relevant_memories = [mem for mem, _ in scored_memories[:limit]]
+        candidates = np.flatnonzero(relevance >= min_relevance)
+        if candidates.size == 0:
+            logger.info(f"Retrieved 0 relevant memories (from {total} total)")
+            return []
+        if candidates.size > limit:
+            candidates = candidates[
+                np.argpartition(-relevance[candidates], limit - 1)[:limit]
+            ]
+        candidates = candidates[np.argsort(-relevance[candidates], kind="stable")]
+        top_ids = [matrix.memory_ids[i] for i in candidates]
 
-        # Update access metadata
-        for memory in relevant_memories:
-            memory.last_accessed_at = datetime.utcnow()
-            memory.access_count += 1
+        result = await self.db.execute(
+            select(ConversationMemory).where(ConversationMemory.id.in_(top_ids))
+        )
+        by_id = {memory.id: memory for memory in result.scalars().all()}
+        relevant_memories = [by_id[memory_id] for memory_id in top_ids if memory_id in by_id]
 
-        await self.db.commit()
+        # Access metadata is written later in a batch, off the request path
+        memory_access_buffer.record([memory.id for memory in relevant_memories])
 
-        logger.info(f"Retrieved {len(relevant_memories)} relevant memories (from {len(memories)} total)")
+        logger.info(f"Retrieved {len(relevant_memories)} relevant memories (from {total} total)")
         return relevant_memories
 
     async def create_conversation_summary(
@@ -357,7 +564,7 @@ Return JSON:
                 summary_data = json.loads(json_str.strip())
 
                 # Generate embedding for summary
-                embedding = self.generate_embedding(summary_data["summary"])
+                embedding = await self.embedder.aembed(summary_data["summary"])
 
                 # Get time range - parse ISO format strings to datetime
                 time_range_start_str = messages[0].get("created_at")
@@ -456,4 +663,5 @@ Return JSON:
             memory.relevance_score *= decay_factor
 
         await self.db.commit()
+        memory_matrix_cache.invalidate()
         logger.info(f"Applied decay to {len(old_memories)} old memories")
@@ -0,0 +1,268 @@
+"""Streaming export and batched bulk import of workspace data."""
+
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+import json
+from typing import Any
+import uuid
+
+from dateutil.parser import isoparse
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    Integer,
+    Uuid,
+    inspect,
+    insert,
+    or_,
+    select,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import JSON
+
+from turbo.core.models.document import Document
+from turbo.core.models.issue import Issue
+from turbo.core.models.project import Project
+from turbo.core.models.tag import Tag
+
+ENTITY_TYPES = ("projects", "issues", "documents", "tags")
+
+# Insert order that satisfies foreign keys (issues and documents need projects)
+IMPORT_ORDER = ("projects", "tags", "issues", "documents")
+
+ENTITY_MODELS = {
+    "projects": Project,
+    "issues": Issue,
+    "documents": Document,
+    "tags": Tag,
+}
+
+# Unique column used to recognise an already-imported row besides its id
+NATURAL_KEYS = {
+    "projects": "project_key",
+    "issues": "issue_key",
+    "documents": "document_key",
+    "tags": "name",
+}
+
+
+def export_columns(entity_type: str, include_content: bool = True) -> list[Column]:
+    """Columns written for an entity type, in table order."""
+    table = ENTITY_MODELS[entity_type].__table__
+    return [c for c in table.columns if include_content or c.name != "content"]
+
+
+def coerce_value(column: Column, value: Any) -> Any:
+    """Convert an exported value (JSON, CSV text or Parquet) back to a column value.
+
+    CSV has no nulls, so an empty string in a nullable column reads as None.
+    """
+    if value is None or (value == "" and column.nullable):
+        return None
+    column_type = column.type
+    if isinstance(column_type, JSON):
+        return json.loads(value) if isinstance(value, str) else value
+    if isinstance(column_type, Uuid):
+        return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+    if isinstance(column_type, DateTime):
+        return value if isinstance(value, datetime) else isoparse(value)
+    if isinstance(column_type, Boolean):
+        if isinstance(value, str):
+            return value.strip().lower() in ("true", "1", "yes")
+        return bool(value)
+    if isinstance(column_type, Integer):
+        return int(value)
+    if isinstance(column_type, Float):
+        return float(value)
+    return value
+
+
+@dataclass
+class ImportStats:
+    """Per-entity outcome of an import."""
+
+    imported: int = 0
+    skipped: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+class DataExchangeService:
+    """Stream entities out of the database and bulk-load them back in.
+
+    Exports read through a server-side cursor in partitions of
+    ``batch_size`` rows, so memory stays flat regardless of table size.
+    Imports buffer rows per entity type and write each full buffer with one
+    multi-row INSERT. Everything runs in a single transaction that is
+    committed at the end, so a failed import leaves the workspace untouched.
+    """
+
+    DEFAULT_BATCH_SIZE = 500
+
+    def __init__(self, session: AsyncSession, batch_size: int | None = None):
+        """Initialize service.
+
+        Args:
+            session: Database session
+            batch_size: Rows per cursor partition and per INSERT
+        """
+        self._session = session
+        self._batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+
+    async def stream_batches(
+        self, entity_type: str, include_content: bool = True
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield rows of one entity type as lists of column-name dicts.
+
+        Only the selected columns are fetched, so exports without document
+        content never read the content column.
+        """
+        model = ENTITY_MODELS[entity_type]
+        stmt = (
+            select(*export_columns(entity_type, include_content))
+            .order_by(model.id)
+            .execution_options(yield_per=self._batch_size)
+        )
+        result = await self._session.stream(stmt)
+        try:
+            async for partition in result.mappings().partitions():
+                yield [dict(row) for row in partition]
+        finally:
+            await result.close()
+
+    async def import_records(
+        self,
+        records: Iterable[tuple[str, dict[str, Any]]],
+        skip_existing: bool = False,
+    ) -> dict[str, ImportStats]:
+        """Insert ``(entity_type, record)`` pairs in batches, in one transaction.
+
+        Records that fail validation are counted as errors and left out;
+        a database error rolls back the whole import and is re-raised.
+        With ``skip_existing``, each batch is checked against existing ids
+        and natural keys with one query, and rows that match are skipped.
+
+        Returns:
+            Stats keyed by entity type, for the types that appeared
+        """
+        buffers: dict[str, list[dict[str, Any]]] = {t: [] for t in IMPORT_ORDER}
+        stats: dict[str, ImportStats] = {}
+
+        async def flush(entity_type: str) -> None:
+            # Parents must be written before children that reference them
+            for parent in IMPORT_ORDER[: IMPORT_ORDER.index(entity_type)]:
+                if buffers[parent]:
+                    await flush(parent)
+            rows, buffers[entity_type] = buffers[entity_type], []
+            await self._insert_batch(
+                entity_type, rows, skip_existing, stats[entity_type]
+            )
+
+        try:
+            for entity_type, record in records:
+                if entity_type not in ENTITY_MODELS:
+                    continue
+                entity_stats = stats.setdefault(entity_type, ImportStats())
+                try:
+                    row = self._prepare_row(entity_type, record)
+                except (ValueError, TypeError) as e:
+                    label = record.get("name") or record.get("title") or "Unknown"
+                    entity_stats.errors.append(f"{label}: {e}")
+                    continue
+                buffers[entity_type].append(row)
+                if len(buffers[entity_type]) >= self._batch_size:
+                    await flush(entity_type)
+
+            for entity_type in IMPORT_ORDER:
+                if buffers[entity_type]:
+                    await flush(entity_type)
+            await self._session.commit()
+        except Exception:
+            await self._session.rollback()
+            raise
+
+        return stats
+
+    def _prepare_row(self, entity_type: str, record: dict[str, Any]) -> dict[str, Any]:
+        """Map a record onto the model's attributes, coercing each value."""
+        mapper = inspect(ENTITY_MODELS[entity_type])
+        row = {}
+        for attr in mapper.column_attrs:
+            column = attr.columns[0]
+            value = coerce_value(column, record.get(column.name))
+            if value is not None:
+                row[attr.key] = value
+            elif (
+                not column.nullable
+                and column.default is None
+                and column.server_default is None
+            ):
+                raise ValueError(f"missing required field '{column.name}'")
+
+        if (
+            entity_type == "issues"
+            and row.get("type") != "discovery"
+            and not row.get("project_id")
+        ):
+            raise ValueError("no project_id")
+        return row
+
+    async def _insert_batch(
+        self,
+        entity_type: str,
+        rows: list[dict[str, Any]],
+        skip_existing: bool,
+        stats: ImportStats,
+    ) -> None:
+        """Write one batch with a single multi-row INSERT."""
+        if skip_existing:
+            rows = await self._drop_existing(entity_type, rows, stats)
+        if not rows:
+            return
+        await self._session.execute(insert(ENTITY_MODELS[entity_type]), rows)
+        stats.imported += len(rows)
+
+    async def _drop_existing(
+        self, entity_type: str, rows: list[dict[str, Any]], stats: ImportStats
+    ) -> list[dict[str, Any]]:
+        """Remove rows whose id or natural key already exists, with one query.
+
+        Earlier batches of the same import are visible to the lookup, and
+        duplicates within the batch keep only their first occurrence.
+        """
+        model = ENTITY_MODELS[entity_type]
+        key_name = NATURAL_KEYS[entity_type]
+        key_column = getattr(model, key_name)
+
+        ids = [row["id"] for row in rows if row.get("id")]
+        keys = [row[key_name] for row in rows if row.get(key_name)]
+        conditions = []
+        if ids:
+            conditions.append(model.id.in_(ids))
+        if keys:
+            conditions.append(key_column.in_(keys))
+
+        seen_ids: set[Any] = set()
+        seen_keys: set[Any] = set()
+        if conditions:
+            result = await self._session.execute(
+                select(model.id, key_column).where(or_(*conditions))
+            )
+            for existing_id, existing_key in result.all():
+                seen_ids.add(existing_id)
+                seen_keys.add(existing_key)
+
+        fresh = []
+        for row in rows:
+            row_id, row_key = row.get("id"), row.get(key_name)
+            if row_id in seen_ids or row_key in seen_keys:
+                stats.skipped += 1
+                continue
+            if row_id:
+                seen_ids.add(row_id)
+            if row_key:
+                seen_keys.add(row_key)
+            fresh.append(row)
+        return fresh
@@ -4,12 +4,14 @@ from typing import Any
 from uuid import UUID
 
 from turbo.core.repositories.document import DocumentRepository
+from turbo.core.repositories.pagination import Page, select_fields
 from turbo.core.repositories.project import ProjectRepository
 from turbo.core.schemas.document import (
     DocumentCreate,
     DocumentResponse,
     DocumentUpdate,
 )
+from turbo.core.services.search import SearchService
 from turbo.core.utils import strip_emojis
 from turbo.utils.exceptions import DocumentNotFoundError, ProjectNotFoundError
 
@@ -63,6 +65,43 @@ class DocumentService:
         documents = await self._document_repository.get_all(limit=limit, offset=offset)
         return [DocumentResponse.model_validate(document) for document in documents]
 
+    async def get_documents_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        order: str = "created_at",
+        fields: list[str] | None = None,
+        document_type: str | None = None,
+        document_format: str | None = None,
+        project_id: UUID | None = None,
+        workspace: str | None = None,
+        work_company: str | None = None,
+    ) -> Page[DocumentResponse | dict[str, Any]]:
+        """Get one keyset page of documents matching every given filter.
+
+        With ``fields``, only those columns are loaded (so ``content`` can be
+        skipped) and items are dicts of just those fields.
+        """
+        criteria = self._document_repository.list_criteria(
+            document_type=document_type,
+            document_format=document_format,
+            project_id=project_id,
+            workspace=workspace,
+            work_company=work_company,
+        )
+        page = await self._document_repository.get_page(
+            *criteria, limit=limit, cursor=cursor, order=order, fields=fields
+        )
+        return Page(
+            items=[
+                select_fields(document, fields)
+                if fields
+                else DocumentResponse.model_validate(document)
+                for document in page.items
+            ],
+            next_cursor=page.next_cursor,
+        )
+
     async def update_document(
         self, document_id: UUID, update_data: DocumentUpdate
     ) -> DocumentResponse:
@@ -126,21 +165,14 @@ class DocumentService:
         )
         return [DocumentResponse.model_validate(document) for document in documents]
 
-    async def search_documents(self, search_term: str) -> list[DocumentResponse]:
-        """Search documents by title and content."""
-        # Search by title
-        title_results = await self._document_repository.search_by_title(search_term)
-
-        # Search by content
-        content_results = await self._document_repository.search_by_content(search_term)
-
-        # Combine and deduplicate results
-        all_documents = {doc.id: doc for doc in title_results + content_results}
-
-        return [
-            DocumentResponse.model_validate(document)
-            for document in all_documents.values()
-        ]
+    async def search_documents(
+        self, search_term: str, limit: int = 50
+    ) -> list[DocumentResponse]:
+        """Search documents by title and content, best match first."""
+        search_service = SearchService(self._document_repository._session)
+        document_ids = await search_service.search_ids(search_term, "document", limit)
+        documents = await self._document_repository.get_by_ids(document_ids)
+        return [DocumentResponse.model_validate(document) for document in documents]
 
     async def get_project_specifications(
         self, project_id: UUID
@@ -0,0 +1,326 @@
+"""Shared sentence embedding service with micro-batching and a content-hash cache.
+
+Every component that needs embeddings (knowledge graph, conversation memory,
+resume knowledge graph and deduplication) goes through one EmbeddingService
+per model, so the SentenceTransformer weights are loaded once per process.
+
+Vectors are cached by (model, sha256(text)) in an in-memory LRU backed by a
+SQLite file, so re-indexing unchanged issues, documents and memories never
+re-encodes them. Concurrent async requests are coalesced into micro-batches
+and encoded on a worker thread, keeping the event loop free; torch releases
+the GIL while encoding, so a thread pool shares the single model copy.
+"""
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from turbo.utils.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(text: str) -> str:
+    """Stable cache key for a piece of text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingDiskCache:
+    """SQLite-backed persistent store of embeddings keyed by (model, text hash)."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                PRIMARY KEY (model, digest)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get_many(self, model: str, digests: list[str]) -> dict[str, np.ndarray]:
+        """Look up cached vectors for a batch of text hashes."""
+        found: dict[str, np.ndarray] = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(digests), 500):
+                chunk = digests[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT digest, vector FROM embeddings "  # noqa: S608
+                    f"WHERE model = ? AND digest IN ({placeholders})",
+                    [model, *chunk],
+                ).fetchall()
+                for digest, blob in rows:
+                    found[digest] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def put_many(self, model: str, vectors: dict[str, np.ndarray]) -> None:
+        """Store vectors for a batch of text hashes."""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, digest, vector) VALUES (?, ?, ?)",
+                [
+                    (model, digest, np.asarray(vector, dtype=np.float32).tobytes())
+                    for digest, vector in vectors.items()
+                ],
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class EmbeddingService:
+    """Batched, cached text embeddings for a single SentenceTransformer model."""
+
+    def __init__(
+        self,
+        model_name: str,
+        cache_size: int = 10_000,
+        disk_cache: EmbeddingDiskCache | None = None,
+        max_batch_size: int = 64,
+        batch_window_ms: float = 5.0,
+        max_workers: int = 1,
+    ):
+        """Initialize embedding service.
+
+        Args:
+            model_name: SentenceTransformer model name
+            cache_size: Maximum number of vectors held in the in-memory LRU
+            disk_cache: Optional persistent cache shared across restarts
+            max_batch_size: Maximum texts per encode call
+            batch_window_ms: How long async requests wait to be coalesced
+            max_workers: Encoder threads
+        """
+        self.model_name = model_name
+        self.cache_size = cache_size
+        self.disk_cache = disk_cache
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window_ms / 1000
+
+        self._model: Any = None
+        self._model_lock = threading.Lock()
+        self._lru: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lru_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="embedding"
+        )
+
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._pending_loop: asyncio.AbstractEventLoop | None = None
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def model(self) -> Any:
+        """The underlying SentenceTransformer, loaded on first use."""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+
+                    self._model = SentenceTransformer(self.model_name)
+                    logger.info(f"Loaded embedding model {self.model_name}")
+        return self._model
+
+    def encode(self, texts: str | list[str]) -> np.ndarray:
+        """
+        Embed text synchronously, using the cache.
+
+        Mirrors ``SentenceTransformer.encode``: a single string returns a
+        1-D vector, a list returns a 2-D array with one row per text.
+
+        Args:
+            texts: Text or list of texts
+
+        Returns:
+            float32 embedding(s)
+        """
+        if isinstance(texts, str):
+            return self._encode_batch([texts])[0]
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack(self._encode_batch(texts))
+
+    def embed(self, text: str) -> list[float]:
+        """Embed one text synchronously as a list of floats."""
+        return self.encode(text).tolist()
+
+    async def aembed(self, text: str) -> list[float]:
+        """
+        Embed one text without blocking the event loop.
+
+        Requests arriving within the batch window are encoded together.
+        """
+        cached = self._lru_get(content_hash(text))
+        if cached is not None:
+            self.hits += 1
+            return cached.tolist()
+
+        loop = asyncio.get_running_loop()
+        if self._pending_loop is not loop:
+            # A new event loop (e.g. a fresh CLI asyncio.run) starts a new queue
+            self._pending = []
+            self._pending_loop = loop
+            self._flush_handle = None
+
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+
+        vector = await future
+        return vector.tolist()
+
+    async def aembed_many(self, texts: list[str]) -> list[list[float]]:
+        """Embed many texts in one worker-thread call without blocking the loop."""
+        if not texts:
+            return []
+        loop = asyncio.get_running_loop()
+        vectors = await loop.run_in_executor(self._executor, self._encode_batch, texts)
+        return [vector.tolist() for vector in vectors]
+
+    def _flush(self) -> None:
+        """Hand the pending micro-batch to the encoder thread."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(
+            self._executor, self._encode_batch, [text for text, _ in batch]
+        )
+
+        def _resolve(done: asyncio.Future) -> None:
+            error = done.exception()
+            for index, (_, future) in enumerate(batch):
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(done.result()[index])
+
+        task.add_done_callback(_resolve)
+
+    def _encode_batch(self, texts: list[str]) -> list[np.ndarray]:
+        """Embed texts, consulting the LRU and disk caches before the model."""
+        digests = [content_hash(text) for text in texts]
+        vectors: dict[str, np.ndarray] = {}
+
+        for digest in set(digests):
+            cached = self._lru_get(digest)
+            if cached is not None:
+                vectors[digest] = cached
+
+        missing = [d for d in dict.fromkeys(digests) if d not in vectors]
+        if missing and self.disk_cache is not None:
+            from_disk = self.disk_cache.get_many(self.model_name, missing)
+            for digest, vector in from_disk.items():
+                vectors[digest] = vector
+                self._lru_put(digest, vector)
+            missing = [d for d in missing if d not in from_disk]
+
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            text_by_digest = dict(zip(digests, texts))
+            to_encode = [text_by_digest[d] for d in missing]
+            encoded = np.asarray(
+                self.model.encode(
+                    to_encode,
+                    batch_size=self.max_batch_size,
+                    convert_to_numpy=True,
+                    show_progress_bar=False,
+                ),
+                dtype=np.float32,
+            )
+            fresh = dict(zip(missing, encoded))
+            for digest, vector in fresh.items():
+                vectors[digest] = vector
+                self._lru_put(digest, vector)
+            if self.disk_cache is not None:
+                try:
+                    self.disk_cache.put_many(self.model_name, fresh)
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to persist embeddings: {e}")
+
+        return [vectors[digest] for digest in digests]
+
+    def _lru_get(self, digest: str) -> np.ndarray | None:
+        with self._lru_lock:
+            vector = self._lru.get(digest)
+            if vector is not None:
+                self._lru.move_to_end(digest)
+            return vector
+
+    def _lru_put(self, digest: str, vector: np.ndarray) -> None:
+        with self._lru_lock:
+            self._lru[digest] = vector
+            self._lru.move_to_end(digest)
+            while len(self._lru) > self.cache_size:
+                self._lru.popitem(last=False)
+
+
+def get_embedding_service(model_name: str | None = None) -> EmbeddingService:
+    """
+    Get the process-wide embedding service for a model.
+
+    Args:
+        model_name: SentenceTransformer model name (defaults to settings)
+
+    Returns:
+        Shared EmbeddingService instance
+    """
+    return _create_embedding_service(model_name or get_settings().embedding.model)
+
+
+@lru_cache(maxsize=None)
+def _create_embedding_service(model_name: str) -> EmbeddingService:
+    """Create the embedding service for a model (cached)."""
+    settings = get_settings().embedding
+
+    disk_cache = None
+    if settings.disk_cache:
+        try:
+            disk_cache = EmbeddingDiskCache(Path(settings.cache_dir) / "embeddings.sqlite")
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Embedding disk cache unavailable: {e}")
+
+    return EmbeddingService(
+        model_name,
+        cache_size=settings.cache_size,
+        disk_cache=disk_cache,
+        max_batch_size=settings.batch_size,
+        batch_window_ms=settings.batch_window_ms,
+        max_workers=settings.workers,
+    )
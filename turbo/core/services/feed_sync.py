@@ -0,0 +1,131 @@
+"""Service for conditional, concurrent RSS feed fetching."""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import feedparser
+
+from turbo.core.models.feed_sync import FeedSyncState
+from turbo.core.repositories.feed_sync import FeedSyncStateRepository
+from turbo.utils.http_client import get_http_client
+
+
+@dataclass
+class FeedFetch:
+    """Outcome of one feed request."""
+
+    feed_url: str
+    not_modified: bool
+    feed: Any = None  # feedparser.FeedParserDict when the feed was downloaded
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    state: Optional[FeedSyncState] = None
+
+
+class FeedSyncService:
+    """Fetch feeds with conditional GETs over the shared HTTP client.
+
+    ETag and Last-Modified validators from the previous successful fetch are
+    sent as If-None-Match / If-Modified-Since, and a 304 response comes back
+    as a ``FeedFetch`` with ``not_modified`` set and no parsed feed.
+    """
+
+    DEFAULT_CONCURRENCY = 8
+    FEED_TIMEOUT_SECONDS = 60.0
+
+    def __init__(self, state_repository: Optional[FeedSyncStateRepository] = None):
+        """Initialize service.
+
+        Args:
+            state_repository: Where validators are stored. Without one every
+                fetch downloads the full feed.
+        """
+        self.state_repo = state_repository
+
+    async def fetch(self, feed_url: str, conditional: bool = True) -> FeedFetch:
+        """Fetch one feed, skipping the download if it has not changed."""
+        state = None
+        if conditional and self.state_repo:
+            states = await self.state_repo.get_by_feed_urls([feed_url])
+            state = states.get(feed_url)
+        return await self._fetch(feed_url, state)
+
+    async def fetch_many(
+        self,
+        feed_urls: Iterable[str],
+        max_concurrency: Optional[int] = None,
+        conditional: bool = True,
+    ) -> AsyncIterator[tuple[str, FeedFetch | Exception]]:
+        """Fetch many feeds concurrently, yielding each as it completes.
+
+        Stored validators for every feed are loaded up front in one query.
+        At most ``max_concurrency`` requests are in flight at once. Failures
+        are yielded as the exception instead of aborting the batch.
+
+        Yields:
+            Tuples of (feed_url, FeedFetch or exception)
+        """
+        urls = list(dict.fromkeys(feed_urls))
+        states: dict[str, FeedSyncState] = {}
+        if conditional and self.state_repo:
+            states = await self.state_repo.get_by_feed_urls(urls)
+        semaphore = asyncio.Semaphore(max_concurrency or self.DEFAULT_CONCURRENCY)
+
+        async def fetch_one(url: str) -> tuple[str, FeedFetch | Exception]:
+            async with semaphore:
+                try:
+                    return url, await self._fetch(url, states.get(url))
+                except Exception as e:
+                    return url, e
+
+        tasks = [asyncio.ensure_future(fetch_one(url)) for url in urls]
+        try:
+            for next_fetch in asyncio.as_completed(tasks):
+                yield await next_fetch
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def record(self, fetch: FeedFetch) -> None:
+        """Stage the validators from a fetch; the caller commits."""
+        if self.state_repo is None:
+            return
+        fetch.state = await self.state_repo.record(
+            fetch.feed_url, fetch.etag, fetch.last_modified, state=fetch.state
+        )
+
+    async def _fetch(self, feed_url: str, state: Optional[FeedSyncState]) -> FeedFetch:
+        """Issue the (conditional) request and parse the feed off the event loop."""
+        headers = {}
+        if state is not None:
+            if state.etag:
+                headers["If-None-Match"] = state.etag
+            if state.last_modified:
+                headers["If-Modified-Since"] = state.last_modified
+
+        response = await get_http_client().get(
+            feed_url, headers=headers, timeout=self.FEED_TIMEOUT_SECONDS
+        )
+        if response.status_code == 304 and state is not None:
+            return FeedFetch(
+                feed_url=feed_url,
+                not_modified=True,
+                etag=response.headers.get("ETag", state.etag),
+                last_modified=response.headers.get(
+                    "Last-Modified", state.last_modified
+                ),
+                state=state,
+            )
+        response.raise_for_status()
+
+        feed = await asyncio.to_thread(feedparser.parse, response.content)
+        return FeedFetch(
+            feed_url=feed_url,
+            not_modified=False,
+            feed=feed,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            state=state,
+        )
@@ -1,14 +1,14 @@
 """Knowledge Graph service with local embeddings for semantic search."""
 
+import logging
 import time
 from datetime import datetime, timezone
-from functools import lru_cache
-from typing import Any
+from typing import Any, ClassVar
 from uuid import UUID
 
 import numpy as np
 from neo4j import AsyncGraphDatabase
-from sentence_transformers import SentenceTransformer
+from neo4j.exceptions import Neo4jError
 
 from turbo.core.schemas.graph import (
     GraphNodeCreate,
@@ -17,13 +17,19 @@ from turbo.core.schemas.graph import (
     GraphSearchResult,
     GraphStats,
 )
+from turbo.core.services.embedding import EmbeddingService, get_embedding_service
+from turbo.core.services.vector_index import LocalVectorIndex, get_entity_index
 from turbo.utils.config import get_settings
 
+logger = logging.getLogger(__name__)
 
-@lru_cache(maxsize=1)
-def get_embedding_model(model_name: str) -> SentenceTransformer:
+# How often to check whether a populating native vector index is online
+VECTOR_INDEX_RECHECK_SECONDS = 30.0
+
+
+def get_embedding_model(model_name: str) -> Any:
     """
-    Get or create embedding model (cached).
+    Get the shared SentenceTransformer for a model.
 
     First run downloads ~90MB model, then cached in memory.
     Model: all-MiniLM-L6-v2
@@ -31,7 +37,7 @@ def get_embedding_model(model_name: str) -> SentenceTransformer:
     - Speed: ~3000 sentences/sec on CPU
     - Quality: Excellent for semantic search
     """
-    return SentenceTransformer(model_name)
+    return get_embedding_service(model_name).model
 
 
 def cosine_similarity(a: list[float], b: list[float]) -> float:
@@ -47,12 +53,16 @@ def cosine_similarity(a: list[float], b: list[float]) -> float:
 class GraphService:
     """Service for knowledge graph operations with local embeddings."""
 
+    # Per server URI: whether the native Neo4j vector index is usable, and
+    # the monotonic time to check again (inf once the answer is final)
+    _native_index_ready: ClassVar[dict[str, tuple[bool, float]]] = {}
+
     def __init__(self) -> None:
         """Initialize graph service with Neo4j and local embeddings."""
         settings = get_settings()
         self._settings = settings.graph
         self._driver = None
-        self._model = None
+        self._embedder: EmbeddingService | None = None
 
     async def _get_driver(self) -> AsyncGraphDatabase:
         """Get or create Neo4j driver."""
@@ -63,17 +73,15 @@ class GraphService:
             )
         return self._driver
 
-    def _get_model(self) -> SentenceTransformer:
-        """Get or create embedding model."""
-        if self._model is None:
-            self._model = get_embedding_model(self._settings.embedding_model)
-        return self._model
+    def _get_embedder(self) -> EmbeddingService:
+        """Get the shared embedding service for the configured model."""
+        if self._embedder is None:
+            self._embedder = get_embedding_service(self._settings.embedding_model)
+        return self._embedder
 
-    def _generate_embedding(self, text: str) -> list[float]:
+    async def _generate_embedding(self, text: str) -> list[float]:
         """Generate embedding vector from text using local model."""
-        model = self._get_model()
-        embedding = model.encode(text, convert_to_numpy=True)
-        return embedding.tolist()
+        return await self._get_embedder().aembed(text)
 
     async def health_check(self) -> dict[str, Any]:
         """Check Neo4j connection health."""
@@ -106,7 +114,7 @@ class GraphService:
         driver = await self._get_driver()
 
         # Generate embedding locally
-        embedding = self._generate_embedding(node_data.content)
+        embedding = await self._generate_embedding(node_data.content)
 
         async with driver.session() as session:
             # Create or merge node with embedding
@@ -131,6 +139,11 @@ class GraphService:
                 metadata=node_data.metadata,
             )
 
+        # Keep the local ANN fallback current without rescanning the graph
+        get_entity_index().upsert(
+            node_data.entity_type, str(node_data.entity_id), embedding
+        )
+
         return {
             "entity_id": node_data.entity_id,
             "entity_type": node_data.entity_type,
@@ -143,6 +156,9 @@ class GraphService:
         """
         Search the knowledge graph for relevant entities using semantic similarity.
 
+        Uses the Neo4j vector index on ``Entity.embedding`` when the server
+        supports it, otherwise the process-local ANN index.
+
         Args:
             query: Search query with text, limit, filters, and relevance threshold
 
@@ -150,68 +166,16 @@ class GraphService:
             GraphSearchResponse with matching results and metadata
         """
         start_time = time.time()
-        driver = await self._get_driver()
 
         # Generate query embedding locally
-        query_embedding = self._generate_embedding(query.query)
-
-        async with driver.session() as session:
-            # Fetch all entities (we'll do similarity in Python)
-            # For production with many nodes, consider Neo4j vector index
-            cypher_query = """
-            MATCH (e:Entity)
-            """
-
-            # Add type filter if specified
-            if query.entity_types:
-                type_list = ", ".join([f"'{t}'" for t in query.entity_types])
-                cypher_query += f" WHERE e.type IN [{type_list}]"
-
-            cypher_query += """
-            RETURN e.id as id, e.type as type, e.content as content,
-                   e.embedding as embedding, e.created_at as created_at,
-                   properties(e) as metadata
-            """
-
-            result = await session.run(cypher_query)
-            records = [record async for record in result]
+        query_embedding = await self._generate_embedding(query.query)
 
-        # Calculate similarities and sort
-        results = []
-        for record in records:
-            if not record["embedding"]:
-                continue
-
-            # Calculate cosine similarity
-            similarity = cosine_similarity(query_embedding, record["embedding"])
-
-            # Filter by minimum relevance
-            if similarity < query.min_relevance:
-                continue
-
-            # Clean metadata (remove internal fields)
-            metadata = dict(record["metadata"])
-            for key in ["id", "type", "content", "embedding", "created_at", "updated_at"]:
-                metadata.pop(key, None)
-
-            # Convert Neo4j DateTime to Python datetime if needed
-            created_at = record.get("created_at")
-            if created_at and hasattr(created_at, "to_native"):
-                created_at = created_at.to_native()
-
-            graph_result = GraphSearchResult(
-                entity_id=UUID(record["id"]),
-                entity_type=record["type"],
-                content=record["content"],
-                relevance_score=similarity,
-                metadata=metadata,
-                created_at=created_at,
-            )
-            results.append(graph_result)
-
-        # Sort by relevance and limit
-        results.sort(key=lambda x: x.relevance_score, reverse=True)
-        results = results[: query.limit]
+        results = await self._vector_search(
+            query_embedding,
+            limit=query.limit,
+            entity_types=query.entity_types,
+            min_relevance=query.min_relevance,
+        )
 
         execution_time_ms = (time.time() - start_time) * 1000
 
@@ -252,55 +216,211 @@ class GraphService:
             )
             source_record = await source_result.single()
 
-            if not source_record or not source_record["embedding"]:
-                return []
+        if not source_record or not source_record["embedding"]:
+            return []
 
-            source_embedding = source_record["embedding"]
+        return await self._vector_search(
+            source_record["embedding"],
+            limit=limit,
+            exclude=(entity_type, str(entity_id)),
+        )
 
-            # Get all other entities
-            others_query = """
-            MATCH (e:Entity)
-            WHERE e.id <> $entity_id
-            RETURN e.id as id, e.type as type, e.content as content,
-                   e.embedding as embedding, e.created_at as created_at,
-                   properties(e) as metadata
-            """
+    async def _vector_search(
+        self,
+        embedding: list[float],
+        limit: int,
+        entity_types: list[str] | None = None,
+        min_relevance: float = 0.0,
+        exclude: tuple[str, str] | None = None,
+    ) -> list[GraphSearchResult]:
+        """Top-k similarity search, native index first with local ANN fallback."""
+        if self._settings.use_vector_index and await self._ensure_vector_index(
+            len(embedding)
+        ):
+            try:
+                return await self._native_vector_search(
+                    embedding, limit, entity_types, min_relevance, exclude
+                )
+            except Neo4jError as e:
+                logger.warning(f"Neo4j vector index query failed, using local index: {e}")
+                GraphService._native_index_ready[self._settings.uri] = (False, float("inf"))
+
+        return await self._local_vector_search(
+            embedding, limit, entity_types, min_relevance, exclude
+        )
 
-            result = await session.run(others_query, entity_id=str(entity_id))
+    async def _ensure_vector_index(self, dimensions: int) -> bool:
+        """Create the Neo4j vector index if needed; return whether it is usable."""
+        cached = GraphService._native_index_ready.get(self._settings.uri)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
+        driver = await self._get_driver()
+        index_name = self._settings.vector_index_name
+        try:
+            async with driver.session() as session:
+                await session.run(
+                    f"""
+                    CREATE VECTOR INDEX `{index_name}` IF NOT EXISTS
+                    FOR (e:Entity) ON (e.embedding)
+                    OPTIONS {{indexConfig: {{
+                        `vector.dimensions`: $dimensions,
+                        `vector.similarity_function`: 'cosine'
+                    }}}}
+                    """,
+                    dimensions=dimensions,
+                )
+                result = await session.run(
+                    "SHOW INDEXES YIELD name, type, state "
+                    "WHERE name = $name RETURN type, state",
+                    name=index_name,
+                )
+                record = await result.single()
+            ready = bool(record and record["type"] == "VECTOR")
+            recheck_at = float("inf")
+            if ready and record["state"] != "ONLINE":
+                # Still populating; use the local index until it comes online
+                ready = False
+                recheck_at = time.monotonic() + VECTOR_INDEX_RECHECK_SECONDS
+        except Neo4jError as e:
+            logger.info(f"Neo4j vector index unavailable, using local index: {e}")
+            ready, recheck_at = False, float("inf")
+
+        GraphService._native_index_ready[self._settings.uri] = (ready, recheck_at)
+        return ready
+
+    async def _native_vector_search(
+        self,
+        embedding: list[float],
+        limit: int,
+        entity_types: list[str] | None,
+        min_relevance: float,
+        exclude: tuple[str, str] | None,
+    ) -> list[GraphSearchResult]:
+        """Query the Neo4j vector index."""
+        # Filters are applied after the ANN lookup, so over-fetch when filtering
+        candidates = limit + (1 if exclude else 0)
+        if entity_types:
+            candidates *= 5
+
+        driver = await self._get_driver()
+        async with driver.session() as session:
+            result = await session.run(
+                """
+                CALL db.index.vector.queryNodes($index_name, $candidates, $embedding)
+                YIELD node AS e, score
+                WHERE ($entity_types IS NULL OR e.type IN $entity_types)
+                  AND ($exclude_id IS NULL OR e.id <> $exclude_id)
+                RETURN e.id as id, e.type as type, e.content as content,
+                       e.created_at as created_at,
+                       e {.*, embedding: null} as metadata, score
+                ORDER BY score DESC
+                LIMIT $limit
+                """,
+                index_name=self._settings.vector_index_name,
+                candidates=candidates,
+                embedding=embedding,
+                entity_types=entity_types or None,
+                exclude_id=exclude[1] if exclude else None,
+                limit=limit,
+            )
             records = [record async for record in result]
 
-        # Calculate similarities
-        related_entities = []
+        results = []
         for record in records:
-            if not record["embedding"]:
+            # Neo4j reports cosine scores normalized to [0, 1] as (1 + cos) / 2
+            similarity = 2 * record["score"] - 1
+            if similarity < min_relevance:
                 continue
+            results.append(self._to_search_result(record, similarity))
+        return results
+
+    async def _local_vector_search(
+        self,
+        embedding: list[float],
+        limit: int,
+        entity_types: list[str] | None,
+        min_relevance: float,
+        exclude: tuple[str, str] | None,
+    ) -> list[GraphSearchResult]:
+        """Query the in-process ANN index, then fetch only the matching nodes."""
+        index = await self._get_local_index()
+        hits = index.search(
+            embedding,
+            k=limit,
+            entity_types=entity_types,
+            min_score=min_relevance,
+            exclude=exclude,
+        )
+        if not hits:
+            return []
 
-            similarity = cosine_similarity(source_embedding, record["embedding"])
-
-            # Clean metadata
-            metadata = dict(record["metadata"])
-            for key in ["id", "type", "content", "embedding", "created_at", "updated_at"]:
-                metadata.pop(key, None)
-
-            # Convert Neo4j DateTime to Python datetime if needed
-            created_at = record.get("created_at")
-            if created_at and hasattr(created_at, "to_native"):
-                created_at = created_at.to_native()
-
-            related_entities.append(
-                GraphSearchResult(
-                    entity_id=UUID(record["id"]),
-                    entity_type=record["type"],
-                    content=record["content"],
-                    relevance_score=similarity,
-                    metadata=metadata,
-                    created_at=created_at,
-                )
+        driver = await self._get_driver()
+        async with driver.session() as session:
+            result = await session.run(
+                """
+                UNWIND $keys AS key
+                MATCH (e:Entity {type: key[0], id: key[1]})
+                RETURN e.id as id, e.type as type, e.content as content,
+                       e.created_at as created_at,
+                       e {.*, embedding: null} as metadata
+                """,
+                keys=[[entity_type, entity_id] for entity_type, entity_id, _ in hits],
             )
+            records = {(r["type"], r["id"]): r async for r in result}
+
+        results = []
+        for entity_type, entity_id, similarity in hits:
+            record = records.get((entity_type, entity_id))
+            if record is None:
+                # Node was deleted outside this process
+                index.remove(entity_type, entity_id)
+                continue
+            results.append(self._to_search_result(record, similarity))
+        return results
 
-        # Sort by similarity and limit
-        related_entities.sort(key=lambda x: x.relevance_score, reverse=True)
-        return related_entities[:limit]
+    async def _get_local_index(self) -> LocalVectorIndex:
+        """Get the local ANN index, loading embeddings from Neo4j on first use."""
+        index = get_entity_index()
+        if index.loaded:
+            return index
+
+        driver = await self._get_driver()
+        async with driver.session() as session:
+            result = await session.run(
+                """
+                MATCH (e:Entity)
+                WHERE e.embedding IS NOT NULL
+                RETURN e.id as id, e.type as type, e.embedding as embedding
+                """
+            )
+            async for record in result:
+                index.upsert(record["type"], record["id"], record["embedding"])
+
+        index.loaded = True
+        return index
+
+    @staticmethod
+    def _to_search_result(record: Any, similarity: float) -> GraphSearchResult:
+        """Convert a Neo4j record into a search result."""
+        # Clean metadata (remove internal fields)
+        metadata = dict(record["metadata"])
+        for key in ["id", "type", "content", "embedding", "created_at", "updated_at"]:
+            metadata.pop(key, None)
+
+        # Convert Neo4j DateTime to Python datetime if needed
+        created_at = record.get("created_at")
+        if created_at and hasattr(created_at, "to_native"):
+            created_at = created_at.to_native()
+
+        return GraphSearchResult(
+            entity_id=UUID(record["id"]),
+            entity_type=record["type"],
+            content=record["content"],
+            relevance_score=min(max(similarity, 0.0), 1.0),
+            metadata=metadata,
+            created_at=created_at,
+        )
 
     async def get_statistics(self) -> GraphStats:
         """Get knowledge graph statistics."""
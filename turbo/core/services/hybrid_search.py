@@ -0,0 +1,203 @@
+"""Hybrid search: full-text and semantic rankings fused with reciprocal rank fusion."""
+
+import asyncio
+import logging
+import re
+import time
+from collections.abc import Hashable, Sequence
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from turbo.core.schemas.graph import GraphSearchQuery, GraphSearchResult
+from turbo.core.schemas.search import (
+    HybridSearchResponse,
+    HybridSearchResult,
+    SearchResult,
+)
+from turbo.core.services.graph import GraphService
+from turbo.core.services.search import SearchService
+from turbo.utils.config import SearchSettings, get_settings
+
+logger = logging.getLogger(__name__)
+
+ResultKey = tuple[str, UUID]  # (entity_type, entity_id)
+CacheKey = tuple[str, tuple[str, ...] | None, int]
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Hashable]], k: int = 60
+) -> list[tuple[Hashable, float]]:
+    """
+    Fuse ranked lists by summing ``1 / (k + rank)`` per item.
+
+    Only ranks are used, so scores from different rankers (bm25,
+    ts_rank_cd, cosine similarity) never need to be comparable. Ties keep
+    the order in which items were first seen.
+    """
+    scores: dict[Hashable, float] = {}
+    for ranking in rankings:
+        for rank, item in enumerate(ranking, start=1):
+            scores[item] = scores.get(item, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: -item[1])
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a query, used as the cache key."""
+    return re.sub(r"\s+", " ", query).strip().lower()
+
+
+class HybridSearchCache:
+    """Short-lived cache of fused results keyed by normalized query."""
+
+    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[CacheKey, tuple[float, HybridSearchResponse]] = {}
+
+    def get(self, key: CacheKey) -> HybridSearchResponse | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        return entry[1]
+
+    def set(self, key: CacheKey, response: HybridSearchResponse) -> None:
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic(), response)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+hybrid_search_cache = HybridSearchCache(
+    ttl_seconds=get_settings().search.cache_ttl_seconds,
+    max_entries=get_settings().search.cache_size,
+)
+
+
+class HybridSearchService:
+    """
+    One query answered by the full-text index and the vector index together.
+
+    Both rankers run concurrently and take their top ``candidate_pool``
+    hits, which are fused with reciprocal rank fusion. When the knowledge
+    graph is disabled or unreachable, results come from full-text search
+    alone and ``sources`` says so.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        graph_service: GraphService | None = None,
+        settings: SearchSettings | None = None,
+        cache: HybridSearchCache | None = None,
+    ) -> None:
+        self._search_service = SearchService(session)
+        self._graph_service = graph_service
+        self._settings = settings or get_settings().search
+        self._cache = cache if cache is not None else hybrid_search_cache
+
+    async def search(
+        self,
+        query: str,
+        entity_types: list[str] | None = None,
+        limit: int = 20,
+    ) -> HybridSearchResponse:
+        """Search with fused lexical and semantic ranking, best match first."""
+        start_time = time.time()
+        key = (
+            normalize_query(query),
+            tuple(sorted(entity_types)) if entity_types else None,
+            limit,
+        )
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached.model_copy(
+                update={
+                    "cached": True,
+                    "execution_time_ms": (time.time() - start_time) * 1000,
+                }
+            )
+
+        lexical, semantic = await asyncio.gather(
+            self._search_service.search(
+                key[0], entity_types=entity_types, limit=self._settings.candidate_pool
+            ),
+            self._semantic_search(key[0], entity_types),
+        )
+
+        lexical_hits: dict[ResultKey, SearchResult] = {
+            (hit.entity_type, hit.entity_id): hit for hit in lexical.results
+        }
+        semantic_hits: dict[ResultKey, GraphSearchResult] = {
+            (hit.entity_type, hit.entity_id): hit for hit in semantic or []
+        }
+        lexical_ranks = {hit: rank for rank, hit in enumerate(lexical_hits, start=1)}
+        semantic_ranks = {hit: rank for rank, hit in enumerate(semantic_hits, start=1)}
+
+        fused = reciprocal_rank_fusion(
+            [list(lexical_hits), list(semantic_hits)], k=self._settings.rrf_k
+        )
+        results = []
+        for result_key, score in fused[:limit]:
+            title, snippet = self._describe(
+                lexical_hits.get(result_key), semantic_hits.get(result_key)
+            )
+            results.append(
+                HybridSearchResult(
+                    entity_type=result_key[0],
+                    entity_id=result_key[1],
+                    title=title,
+                    snippet=snippet,
+                    score=score,
+                    lexical_rank=lexical_ranks.get(result_key),
+                    semantic_rank=semantic_ranks.get(result_key),
+                )
+            )
+
+        response = HybridSearchResponse(
+            query=query,
+            results=results,
+            sources=["lexical", "semantic"] if semantic is not None else ["lexical"],
+            execution_time_ms=(time.time() - start_time) * 1000,
+        )
+        self._cache.set(key, response)
+        return response
+
+    async def _semantic_search(
+        self, query: str, entity_types: list[str] | None
+    ) -> list[GraphSearchResult] | None:
+        """Vector top-k from the knowledge graph, or None when it is unavailable."""
+        if self._graph_service is None:
+            return None
+        try:
+            response = await self._graph_service.search(
+                GraphSearchQuery(
+                    query=query,
+                    limit=min(self._settings.candidate_pool, 100),
+                    entity_types=entity_types,
+                    min_relevance=self._settings.semantic_min_relevance,
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Semantic search unavailable, using full-text only: {e}")
+            return None
+        return response.results
+
+    @staticmethod
+    def _describe(
+        lexical: SearchResult | None, semantic: GraphSearchResult | None
+    ) -> tuple[str, str]:
+        """Title and snippet, preferring the highlighted full-text match."""
+        if lexical is not None:
+            return lexical.title, lexical.snippet
+        content = semantic.content
+        title = semantic.metadata.get("title") or semantic.metadata.get("name")
+        if not title:
+            title = content.splitlines()[0][:100] if content else ""
+        snippet = content[:200] + "..." if len(content) > 200 else content
+        return title, snippet
@@ -2,10 +2,12 @@
 
 import logging
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from turbo.core.repositories.issue import IssueRepository
 from turbo.core.repositories.issue_dependency import IssueDependencyRepository
+from turbo.core.repositories.pagination import Page, select_fields
 from turbo.core.repositories.milestone import MilestoneRepository
 from turbo.core.repositories.project import ProjectRepository
 from turbo.core.repositories.work_log import WorkLogRepository
@@ -17,7 +19,10 @@ from turbo.core.schemas.issue import (
 from turbo.core.schemas.graph import GraphNodeCreate
 from turbo.core.schemas.work_log import WorkLogCreate, WorkLogResponse
 from turbo.core.services.graph import GraphService
+from turbo.core.services.issue_ranking import RANK_SPACING, rank_between, rank_issues
+from turbo.core.services.search import SearchService
 from turbo.core.utils import strip_emojis
+from turbo.core.utils.dependency_graph import DependencyGraph
 from turbo.utils.config import get_settings
 from turbo.utils.exceptions import IssueNotFoundError, ProjectNotFoundError
 
@@ -202,6 +207,43 @@ class IssueService:
         issues = await self._issue_repository.get_all(limit=limit, offset=offset)
         return [IssueResponse.model_validate(issue) for issue in issues]
 
+    async def get_issues_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        order: str = "created_at",
+        fields: list[str] | None = None,
+        status: str | None = None,
+        assignee: str | None = None,
+        project_id: UUID | None = None,
+        workspace: str | None = None,
+        work_company: str | None = None,
+    ) -> Page[IssueResponse | dict[str, Any]]:
+        """Get one keyset page of issues matching every given filter.
+
+        With ``fields``, only those columns are loaded and items are dicts
+        of just those fields.
+        """
+        criteria = self._issue_repository.list_criteria(
+            status=status,
+            assignee=assignee,
+            project_id=project_id,
+            workspace=workspace,
+            work_company=work_company,
+        )
+        page = await self._issue_repository.get_page(
+            *criteria, limit=limit, cursor=cursor, order=order, fields=fields
+        )
+        return Page(
+            items=[
+                select_fields(issue, fields)
+                if fields
+                else IssueResponse.model_validate(issue)
+                for issue in page.items
+            ],
+            next_cursor=page.next_cursor,
+        )
+
     async def get_issues_by_workspace(
         self,
         workspace: str,
@@ -236,8 +278,9 @@ class IssueService:
         old_status = issue.status
         status_changed_to_ready = update_data.status == "ready" and old_status != "ready"
 
-        # Update basic fields
-        issue = await self._issue_repository.update(issue_id, update_data)
+        # Update basic fields. The commit comes after the webhook events are
+        # queued, so the change and its events are kept or lost together
+        issue = await self._issue_repository.update(issue_id, update_data, commit=False)
         if not issue:
             raise IssueNotFoundError(issue_id)
 
@@ -248,11 +291,6 @@ class IssueService:
                 milestone = await self._milestone_repository.get_by_id(milestone_id)
                 if milestone:
                     issue.milestones.append(milestone)
-            await self._issue_repository._session.commit()
-            await self._issue_repository._session.refresh(issue)
-
-        # Re-index in knowledge graph to update search
-        await self._index_issue_in_graph(issue)
 
         # Emit webhook event if issue was assigned
         if self._webhook_service and update_data.assigned_to_id is not None:
@@ -264,7 +302,7 @@ class IssueService:
                     "assigned_to_id": str(issue.assigned_to_id) if issue.assigned_to_id else None,
                     "project_id": str(issue.project_id) if issue.project_id else None,
                 }
-                await self._webhook_service.emit_event("issue.assigned", payload)
+                await self._webhook_service.emit_event("issue.assigned", payload, commit=False)
                 logger.info(f"Emitted issue.assigned event for issue {issue_id}")
             except Exception as e:
                 # Log webhook errors but don't fail the update
@@ -280,12 +318,18 @@ class IssueService:
                     "new_status": "ready",
                     "project_id": str(issue.project_id) if issue.project_id else None,
                 }
-                await self._webhook_service.emit_event("issue.ready", payload)
+                await self._webhook_service.emit_event("issue.ready", payload, commit=False)
                 logger.info(f"Emitted issue.ready event for issue {issue_id}")
             except Exception as e:
                 # Log webhook errors but don't fail the update
                 logger.error(f"Failed to emit issue.ready webhook for issue {issue_id}: {str(e)}")
 
+        await self._issue_repository._session.commit()
+        await self._issue_repository._session.refresh(issue)
+
+        # Re-index in knowledge graph to update search
+        await self._index_issue_in_graph(issue)
+
         return IssueResponse.model_validate(issue)
 
     async def delete_issue(self, issue_id: UUID) -> bool:
@@ -375,9 +419,13 @@ class IssueService:
         issues = await self._issue_repository.get_high_priority_issues()
         return [IssueResponse.model_validate(issue) for issue in issues]
 
-    async def search_issues(self, title_pattern: str) -> list[IssueResponse]:
-        """Search issues by title pattern."""
-        issues = await self._issue_repository.search_by_title(title_pattern)
+    async def search_issues(
+        self, search_term: str, limit: int = 50
+    ) -> list[IssueResponse]:
+        """Search issues by title and description, best match first."""
+        search_service = SearchService(self._issue_repository._session)
+        issue_ids = await search_service.search_ids(search_term, "issue", limit)
+        issues = await self._issue_repository.get_by_ids(issue_ids)
         return [IssueResponse.model_validate(issue) for issue in issues]
 
     async def get_project_open_issues(self, project_id: UUID) -> list[IssueResponse]:
@@ -451,11 +499,16 @@ class IssueService:
         self, issue_id: UUID, work_rank: int | None
     ) -> IssueResponse:
         """
-        Set or clear work rank for an issue.
+        Move an issue to a position in the work queue, or remove it.
+
+        ``work_rank`` values are sparse sort keys, so the requested position
+        is translated into a move after the issue currently at the position
+        before it. Positions past the end of the queue place it last.
 
         Args:
             issue_id: ID of the issue
-            work_rank: New rank (1=highest priority) or None to remove from queue
+            work_rank: New queue position (1=highest priority) or None to
+                remove from queue
 
         Returns:
             Updated issue
@@ -463,30 +516,38 @@ class IssueService:
         Raises:
             IssueNotFoundError: If issue doesn't exist
         """
-        from datetime import datetime
-
         issue = await self._issue_repository.get_by_id(issue_id)
         if not issue:
             raise IssueNotFoundError(issue_id)
 
-        # Update rank and timestamp
-        issue.work_rank = work_rank
-        issue.last_ranked_at = datetime.utcnow() if work_rank is not None else None
+        if work_rank is None:
+            issue.work_rank = None
+            issue.last_ranked_at = None
+            # Commit the changes (issue is already an ORM object)
+            await self._issue_repository._session.commit()
+            await self._issue_repository._session.refresh(issue)
+            return IssueResponse.model_validate(issue)
 
-        # Commit the changes (issue is already an ORM object)
-        await self._issue_repository._session.commit()
-        await self._issue_repository._session.refresh(issue)
-        return IssueResponse.model_validate(issue)
+        ranked_ids = await self._issue_repository.get_ranked_ids()
+        order = [ranked_id for ranked_id in ranked_ids if ranked_id != issue_id]
+        position = min(work_rank, len(order) + 1)
+        after_issue_id = order[position - 2] if position > 1 else None
+
+        moved = await self.move_in_queue(issue_id, after_issue_id)
+        return next(i for i in moved if i.id == issue_id)
 
-    async def bulk_rerank(self, issue_ranks: list[dict]) -> int:
+    async def bulk_rerank(self, issue_ranks: list[dict]) -> list[IssueResponse]:
         """
         Bulk update work ranks for multiple issues.
 
+        IDs are validated with one query and all ranks are written with one
+        UPDATE and one commit; IDs that don't exist are skipped.
+
         Args:
             issue_ranks: List of dicts with 'issue_id' and 'rank' keys
 
         Returns:
-            Number of issues updated
+            The updated issues
 
         Example:
             await bulk_rerank([
@@ -494,25 +555,75 @@ class IssueService:
                 {"issue_id": "uuid2", "rank": 2},
             ])
         """
-        from datetime import datetime
+        ranks = {UUID(str(item["issue_id"])): item["rank"] for item in issue_ranks}
+        existing = await self._issue_repository.get_existing_ids(list(ranks))
+        if not existing:
+            return []
+
+        ranks = {i: rank for i, rank in ranks.items() if i in existing}
+        issues = await self._issue_repository.update_ranks(
+            ranks, ranked_at=datetime.utcnow()
+        )
+        return [IssueResponse.model_validate(issue) for issue in issues]
+
+    async def move_in_queue(
+        self, issue_id: UUID, after_issue_id: UUID | None = None
+    ) -> list[IssueResponse]:
+        """
+        Move an issue to directly after another one in the work queue.
+
+        The issue takes a free rank between its new neighbours, so a move
+        normally writes a single row. Only when the neighbours are adjacent
+        integers is the queue renumbered with RANK_SPACING gaps, in one UPDATE.
+
+        Args:
+            issue_id: Issue to move
+            after_issue_id: Issue it should follow (None moves it to the top)
+
+        Returns:
+            The issues whose rank changed
+
+        Raises:
+            IssueNotFoundError: If either issue doesn't exist
+            ValueError: If the anchor issue is not in the work queue
+        """
+        if after_issue_id == issue_id:
+            raise ValueError("An issue cannot be moved after itself")
 
-        updated_count = 0
-        now = datetime.utcnow()
+        issue = await self._issue_repository.get_by_id(issue_id)
+        if not issue:
+            raise IssueNotFoundError(issue_id)
 
-        for item in issue_ranks:
-            issue_id = UUID(item["issue_id"])
-            rank = item["rank"]
+        previous = None
+        if after_issue_id is not None:
+            anchor = await self._issue_repository.get_by_id(after_issue_id)
+            if not anchor:
+                raise IssueNotFoundError(after_issue_id)
+            if anchor.work_rank is None:
+                raise ValueError(f"Issue {after_issue_id} is not in the work queue")
+            previous = anchor.work_rank
 
-            issue = await self._issue_repository.get_by_id(issue_id)
-            if issue:
-                issue.work_rank = rank
-                issue.last_ranked_at = now
-                await self._issue_repository.update(issue)
-                updated_count += 1
+        following = await self._issue_repository.get_next_rank(previous, issue_id)
+        new_rank = rank_between(previous, following)
 
-        return updated_count
+        if new_rank is not None:
+            ranks = {issue_id: new_rank}
+        else:
+            ranked_ids = await self._issue_repository.get_ranked_ids()
+            order = [ranked_id for ranked_id in ranked_ids if ranked_id != issue_id]
+            position = order.index(after_issue_id) + 1 if after_issue_id else 0
+            order.insert(position, issue_id)
+            ranks = {
+                ranked_id: index * RANK_SPACING
+                for index, ranked_id in enumerate(order, start=1)
+            }
+
+        issues = await self._issue_repository.update_ranks(
+            ranks, ranked_at=datetime.utcnow()
+        )
+        return [IssueResponse.model_validate(i) for i in issues]
 
-    async def auto_rank_issues(self) -> int:
+    async def auto_rank_issues(self, transitive_weight: float = 0.0) -> int:
         """
         Auto-rank all open/in_progress issues using intelligent scoring.
 
@@ -522,65 +633,36 @@ class IssueService:
         - Blockers (issues not blocked rank higher)
         - Dependencies (issues that block others rank higher)
 
+        Eligible issues and the whole dependency table are loaded with one
+        query each, scored in memory and written back with one UPDATE.
+
+        Args:
+            transitive_weight: Optional points per issue blocked indirectly,
+                computed from the in-memory dependency DAG
+
         Returns:
             Number of issues ranked
         """
-        from datetime import datetime
-
-        # Get all open and in_progress issues
-        issues = await self._issue_repository.get_all()
-        eligible_issues = [
-            i for i in issues if i.status in ["open", "in_progress"]
-        ]
-
-        if not eligible_issues:
+        candidates = await self._issue_repository.get_rank_candidates(
+            ["open", "in_progress"]
+        )
+        if not candidates:
             return 0
 
-        # Calculate scores for each issue
-        scored_issues = []
-        for issue in eligible_issues:
-            score = await self._calculate_auto_rank_score(issue)
-            scored_issues.append((issue, score))
-
-        # Sort by score (descending) and assign ranks
-        scored_issues.sort(key=lambda x: x[1], reverse=True)
-
-        now = datetime.utcnow()
-        for rank, (issue, score) in enumerate(scored_issues, start=1):
-            # Directly update the issue object
-            issue.work_rank = rank
-            issue.last_ranked_at = now
-
-        # Flush and commit all changes at once
-        await self._issue_repository._session.flush()
-        await self._issue_repository._session.commit()
-
-        return len(scored_issues)
-
-    async def _calculate_auto_rank_score(self, issue) -> float:
-        """Calculate auto-ranking score for an issue."""
-        from datetime import datetime
-
-        score = 0.0
-
-        # Priority weight (most important factor)
-        priority_weights = {"critical": 100, "high": 50, "medium": 25, "low": 10}
-        score += priority_weights.get(issue.priority, 25)
-
-        # Age factor (older issues get higher priority)
-        age_days = (datetime.utcnow() - issue.created_at.replace(tzinfo=None)).days
-        score += min(age_days * 0.5, 20)  # Cap at 20 points
-
-        # Blocker penalty (check if issue is blocked)
-        blockers = await self._dependency_repository.get_blocking_issues(issue.id)
-        if blockers:
-            score -= 15  # Reduce priority if blocked
-
-        # Dependency boost (issues that block others are more important)
-        blocked_issues = await self._dependency_repository.get_blocked_issues(issue.id)
-        score += len(blocked_issues) * 5  # +5 points per issue blocked
+        graph = DependencyGraph(await self._dependency_repository.get_all_edges())
+        ranked_ids = rank_issues(
+            [c.id for c in candidates],
+            [c.priority for c in candidates],
+            [c.created_at for c in candidates],
+            graph,
+            transitive_weight=transitive_weight,
+        )
 
-        return score
+        await self._issue_repository.bulk_update_ranks(
+            {issue_id: rank for rank, issue_id in enumerate(ranked_ids, start=1)},
+            ranked_at=datetime.utcnow(),
+        )
+        return len(ranked_ids)
 
     async def start_work(
         self, issue_id: UUID, started_by: str, project_path: str | None = None
@@ -3,13 +3,22 @@ Job deduplication service for detecting duplicate job postings across sources.
 
 This service provides fuzzy matching and fingerprinting to identify duplicate jobs
 that may be posted on multiple platforms with slight variations.
+
+Every posting stores its fingerprint and normalized company name (the
+blocking key). A scrape is deduplicated as a batch: one query each for
+external IDs and fingerprints, one query for recent postings sharing a
+company key, then a single rapidfuzz ``cdist`` pass scores every scraped
+job against those candidates.
 """
 
 import hashlib
 import re
-from difflib import SequenceMatcher
+from datetime import datetime, timedelta
 from typing import Optional
-from uuid import UUID
+
+import numpy as np
+from rapidfuzz import fuzz
+from rapidfuzz.process import cdist
 
 from turbo.core.models.job_posting import JobPosting
 from turbo.core.repositories.job_posting import JobPostingRepository
@@ -24,6 +33,14 @@ class JobDeduplicationService:
     LIKELY_DUPLICATE_THRESHOLD = 0.85  # 85% similar = likely duplicate
     POSSIBLE_DUPLICATE_THRESHOLD = 0.70  # 70% similar = possible duplicate
 
+    # Weights of each field in the overall similarity
+    COMPANY_WEIGHT = 0.4
+    TITLE_WEIGHT = 0.4
+    LOCATION_WEIGHT = 0.2
+
+    # Only postings created this recently are fuzzy-match candidates
+    CANDIDATE_WINDOW_DAYS = 30
+
     def __init__(self, job_posting_repository: JobPostingRepository):
         self._job_posting_repo = job_posting_repository
 
@@ -113,13 +130,27 @@ class JobDeduplicationService:
         # Create SHA256 hash
         return hashlib.sha256(fingerprint_string.encode()).hexdigest()
 
+    @staticmethod
+    def dedup_keys(
+        company_name: str,
+        job_title: str,
+        location: Optional[str] = None
+    ) -> dict[str, str]:
+        """Column values (fingerprint, company_key) that index a posting for dedup."""
+        return {
+            "fingerprint": JobDeduplicationService.create_job_fingerprint(
+                company_name, job_title, location
+            ),
+            "company_key": JobDeduplicationService.normalize_company_name(company_name),
+        }
+
     @staticmethod
     def calculate_similarity(text1: str, text2: str) -> float:
         """Calculate similarity ratio between two text strings (0.0 to 1.0)."""
         if not text1 or not text2:
             return 0.0
 
-        return SequenceMatcher(None, text1, text2).ratio()
+        return fuzz.ratio(text1, text2, processor=None) / 100
 
     @staticmethod
     def calculate_job_similarity(job1_data: dict, job2_data: dict) -> float:
@@ -148,13 +179,83 @@ class JobDeduplicationService:
 
         # Weighted average
         overall_similarity = (
-            company_sim * 0.4 +
-            title_sim * 0.4 +
-            location_sim * 0.2
+            company_sim * JobDeduplicationService.COMPANY_WEIGHT +
+            title_sim * JobDeduplicationService.TITLE_WEIGHT +
+            location_sim * JobDeduplicationService.LOCATION_WEIGHT
         )
 
         return overall_similarity
 
+    @staticmethod
+    def normalize_job_fields(
+        company_name: str, job_title: str, location: Optional[str]
+    ) -> tuple[str, str, str]:
+        """Normalized (company, title, location) used for fuzzy matching."""
+        return (
+            JobDeduplicationService.normalize_company_name(company_name),
+            JobDeduplicationService.normalize_job_title(job_title),
+            JobDeduplicationService.normalize_location(location),
+        )
+
+    @staticmethod
+    def similarity_matrix(
+        queries: list[tuple[str, str, str]],
+        choices: list[tuple[str, str, str]],
+    ) -> np.ndarray:
+        """
+        Weighted job similarity of every query against every choice.
+
+        Each field is scored for the whole batch with one ``cdist`` call, so
+        the result matches ``calculate_job_similarity`` applied pairwise.
+
+        Args:
+            queries: Normalized (company, title, location) tuples
+            choices: Normalized (company, title, location) tuples
+
+        Returns:
+            Array of shape (len(queries), len(choices)) with values in [0, 1]
+        """
+        scores = np.zeros((len(queries), len(choices)), dtype=np.float32)
+        if not queries or not choices:
+            return scores
+
+        weights = (
+            JobDeduplicationService.COMPANY_WEIGHT,
+            JobDeduplicationService.TITLE_WEIGHT,
+            JobDeduplicationService.LOCATION_WEIGHT,
+        )
+        for field, weight in enumerate(weights):
+            query_values = [q[field] for q in queries]
+            choice_values = [c[field] for c in choices]
+            field_scores = cdist(
+                query_values,
+                choice_values,
+                scorer=fuzz.ratio,
+                processor=None,
+                dtype=np.float32,
+                workers=-1,
+            )
+            # Empty strings never match (as in calculate_similarity)
+            field_scores[[not v for v in query_values], :] = 0
+            field_scores[:, [not v for v in choice_values]] = 0
+            scores += field_scores * (weight / 100)
+
+        return scores
+
+    async def _load_candidates(
+        self, company_keys: list[str]
+    ) -> tuple[list[JobPosting], list[tuple[str, str, str]]]:
+        """Recent postings in the given company blocks, with normalized fields."""
+        cutoff = datetime.utcnow() - timedelta(days=self.CANDIDATE_WINDOW_DAYS)
+        candidates = await self._job_posting_repo.get_dedup_candidates(
+            company_keys, since=cutoff
+        )
+        fields = [
+            self.normalize_job_fields(c.company_name, c.job_title, c.location)
+            for c in candidates
+        ]
+        return candidates, fields
+
     async def find_duplicate_by_fingerprint(
         self,
         company_name: str,
@@ -164,14 +265,11 @@ class JobDeduplicationService:
         """
         Find an exact duplicate job by fingerprint hash.
 
-        Returns the existing job posting if found, None otherwise.
+        Returns the oldest existing job posting if found, None otherwise.
         """
         fingerprint = self.create_job_fingerprint(company_name, job_title, location)
-
-        # Query database for jobs with matching fingerprint
-        # This would require adding a fingerprint column to the job_postings table
-        # For now, we'll do fuzzy matching instead
-        return None
+        matches = await self._job_posting_repo.get_by_fingerprints([fingerprint])
+        return matches[0] if matches else None
 
     async def find_similar_jobs(
         self,
@@ -182,47 +280,92 @@ class JobDeduplicationService:
         """
         Find similar jobs in the database using fuzzy matching.
 
+        Only recent postings from the same normalized company are compared.
+
         Returns list of (job, similarity_score) tuples, sorted by similarity.
         """
-        # Get recent jobs from database (last 30 days)
-        # We'll search through these for potential duplicates
-        from datetime import datetime, timedelta
-        recent_cutoff = datetime.utcnow() - timedelta(days=30)
-
-        # Get all jobs (we'll filter by date in memory for now)
-        all_jobs = await self._job_posting_repo.get_all(limit=1000)
-
-        # Filter to recent jobs
-        recent_jobs = [
-            job for job in all_jobs
-            if job.created_at >= recent_cutoff
+        fields = self.normalize_job_fields(
+            scraped_job.company_name, scraped_job.job_title, scraped_job.location
+        )
+        candidates, candidate_fields = await self._load_candidates([fields[0]])
+
+        scores = self.similarity_matrix([fields], candidate_fields)[0]
+        order = np.argsort(-scores, kind="stable")
+        return [
+            (candidates[i], float(scores[i]))
+            for i in order[:limit]
+            if scores[i] >= min_similarity
         ]
 
-        # Calculate similarity for each job
-        job_data = {
-            "company_name": scraped_job.company_name,
-            "job_title": scraped_job.job_title,
-            "location": scraped_job.location,
-        }
+    async def find_duplicates(
+        self,
+        scraped_jobs: list[ScrapedJob],
+        threshold: float = LIKELY_DUPLICATE_THRESHOLD
+    ) -> list[tuple[bool, Optional[JobPosting], float]]:
+        """
+        Check a whole scrape for duplicates of existing jobs in one pass.
 
-        similar_jobs = []
-        for existing_job in recent_jobs:
-            existing_data = {
-                "company_name": existing_job.company_name,
-                "job_title": existing_job.job_title,
-                "location": existing_job.location,
-            }
+        Returns:
+            One (is_duplicate, existing_job, similarity_score) per scraped job
+        """
+        if not scraped_jobs:
+            return []
 
-            similarity = self.calculate_job_similarity(job_data, existing_data)
+        # Exact matches: source + external_id, then fingerprint
+        external_keys = [
+            (job.source, job.external_id) for job in scraped_jobs if job.external_id
+        ]
+        by_external_id = {
+            (posting.source, posting.external_id): posting
+            for posting in await self._job_posting_repo.get_by_external_ids(external_keys)
+        }
 
-            if similarity >= min_similarity:
-                similar_jobs.append((existing_job, similarity))
+        fingerprints = [
+            self.create_job_fingerprint(job.company_name, job.job_title, job.location)
+            for job in scraped_jobs
+        ]
+        by_fingerprint: dict[str, JobPosting] = {}
+        for posting in await self._job_posting_repo.get_by_fingerprints(fingerprints):
+            by_fingerprint.setdefault(posting.fingerprint, posting)
+
+        results: list[tuple[bool, Optional[JobPosting], float]] = []
+        pending: list[int] = []
+        for index, (job, fingerprint) in enumerate(zip(scraped_jobs, fingerprints)):
+            existing = by_external_id.get((job.source, job.external_id)) or (
+                by_fingerprint.get(fingerprint)
+            )
+            if existing:
+                results.append((True, existing, 1.0))
+            else:
+                results.append((False, None, 0.0))
+                pending.append(index)
+
+        if not pending:
+            return results
+
+        # Fuzzy matches against recent postings in the same company blocks
+        pending_fields = [
+            self.normalize_job_fields(
+                scraped_jobs[i].company_name,
+                scraped_jobs[i].job_title,
+                scraped_jobs[i].location,
+            )
+            for i in pending
+        ]
+        candidates, candidate_fields = await self._load_candidates(
+            sorted({fields[0] for fields in pending_fields})
+        )
+        if not candidates:
+            return results
 
-        # Sort by similarity (highest first)
-        similar_jobs.sort(key=lambda x: x[1], reverse=True)
+        scores = self.similarity_matrix(pending_fields, candidate_fields)
+        best = scores.argmax(axis=1)
+        for row, index in enumerate(pending):
+            similarity = float(scores[row, best[row]])
+            if similarity >= threshold:
+                results[index] = (True, candidates[best[row]], similarity)
 
-        # Return top N matches
-        return similar_jobs[:limit]
+        return results
 
     async def is_duplicate(
         self,
@@ -235,27 +378,33 @@ class JobDeduplicationService:
         Returns:
             (is_duplicate, existing_job, similarity_score)
         """
-        # First check by source + external_id (exact match)
-        existing = await self._job_posting_repo.get_by_external_id(
-            scraped_job.source,
-            scraped_job.external_id
-        )
+        results = await self.find_duplicates([scraped_job], threshold=threshold)
+        return results[0]
 
-        if existing:
-            return (True, existing, 1.0)
+    async def backfill_fingerprints(self, batch_size: int = 500) -> int:
+        """
+        Fill in fingerprint and company_key for postings created before they existed.
 
-        # Check for similar jobs using fuzzy matching
-        similar_jobs = await self.find_similar_jobs(
-            scraped_job,
-            limit=1,
-            min_similarity=threshold
-        )
+        Returns:
+            Number of postings updated
+        """
+        updated = 0
+        while True:
+            postings = await self._job_posting_repo.get_without_fingerprint(
+                limit=batch_size
+            )
+            if not postings:
+                return updated
 
-        if similar_jobs:
-            best_match, similarity = similar_jobs[0]
-            return (True, best_match, similarity)
+            for posting in postings:
+                keys = self.dedup_keys(
+                    posting.company_name, posting.job_title, posting.location
+                )
+                posting.fingerprint = keys["fingerprint"]
+                posting.company_key = keys["company_key"]
 
-        return (False, None, 0.0)
+            await self._job_posting_repo._session.commit()
+            updated += len(postings)
 
     async def get_deduplication_stats(
         self,
@@ -276,11 +425,12 @@ class JobDeduplicationService:
             "duplicate_details": []
         }
 
-        for scraped_job in scraped_jobs:
-            is_dup, existing, similarity = await self.is_duplicate(
-                scraped_job,
-                threshold=self.POSSIBLE_DUPLICATE_THRESHOLD
-            )
+        results = await self.find_duplicates(
+            scraped_jobs,
+            threshold=self.POSSIBLE_DUPLICATE_THRESHOLD
+        )
+
+        for scraped_job, (is_dup, existing, similarity) in zip(scraped_jobs, results):
 
             if not is_dup:
                 stats["unique_jobs"] += 1
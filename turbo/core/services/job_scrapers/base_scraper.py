@@ -1,9 +1,11 @@
 """Base scraper interface for job boards."""
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import ClassVar, Optional
 
 
 @dataclass
@@ -34,6 +36,10 @@ class ScrapedJob:
 class BaseScraper(ABC):
     """Abstract base class for job board scrapers."""
 
+    # Earliest time (time.monotonic) the next search may start, per source.
+    # Shared by every scraper instance so concurrent runs respect the limit.
+    _next_request_at: ClassVar[dict[str, float]] = {}
+
     def __init__(self, rate_limit_delay: float = 1.0):
         """
         Initialize the scraper.
@@ -49,6 +55,19 @@ class BaseScraper(ABC):
         """Return the source name (e.g., 'indeed', 'linkedin')."""
         pass
 
+    async def wait_for_rate_limit(self) -> None:
+        """
+        Wait until this source may be queried again.
+
+        Searches against the same source start at least ``rate_limit_delay``
+        seconds apart; different sources never wait on each other.
+        """
+        now = time.monotonic()
+        slot = max(now, self._next_request_at.get(self.source_name, 0.0))
+        self._next_request_at[self.source_name] = slot + self.rate_limit_delay
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
     @abstractmethod
     async def search_jobs(
         self,
@@ -1,6 +1,5 @@
 """Indeed job board scraper."""
 
-import asyncio
 import re
 from datetime import datetime, timedelta
 from typing import Optional
@@ -73,9 +72,6 @@ class IndeedScraper(BaseScraper):
                         if job:
                             jobs.append(job)
 
-                        # Rate limit
-                        await asyncio.sleep(self.rate_limit_delay)
-
         except Exception as e:
             print(f"Error scraping Indeed: {e}")
 
@@ -1,5 +1,7 @@
 """Job search service orchestrating scrapers, scoring, and storage."""
 
+import asyncio
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
@@ -36,9 +38,58 @@ from turbo.core.services.job_deduplication import JobDeduplicationService
 from turbo.utils.exceptions import TurboBaseException
 
 
+@dataclass
+class _SearchRun:
+    """Postings queued by one execute_search run, for cross-source dedup."""
+
+    seen_sources: dict[str, str] = field(default_factory=dict)  # fingerprint -> source
+    postings: list[JobPostingCreate] = field(default_factory=list)
+    _queued: list[ScrapedJob] = field(default_factory=list)
+    _queued_fields: list[tuple[str, str, str]] = field(default_factory=list)
+
+    def queue(self, scraped_job: ScrapedJob, posting: JobPostingCreate) -> None:
+        """Queue a posting for the final bulk insert."""
+        self.postings.append(posting)
+        self._queued.append(scraped_job)
+        self._queued_fields.append(
+            JobDeduplicationService.normalize_job_fields(
+                scraped_job.company_name, scraped_job.job_title, scraped_job.location
+            )
+        )
+
+    def find_match(
+        self, scraped_job: ScrapedJob, fingerprint: str, threshold: float
+    ) -> Optional[tuple[str, float]]:
+        """
+        Match a job against what this run has already seen or queued.
+
+        Returns:
+            (source of the matching job, similarity), or None
+        """
+        if fingerprint in self.seen_sources:
+            return self.seen_sources[fingerprint], 1.0
+        if not self._queued:
+            return None
+
+        fields = JobDeduplicationService.normalize_job_fields(
+            scraped_job.company_name, scraped_job.job_title, scraped_job.location
+        )
+        scores = JobDeduplicationService.similarity_matrix([fields], self._queued_fields)[0]
+        best = int(scores.argmax())
+        if scores[best] >= threshold:
+            return self._queued[best].source, float(scores[best])
+        return None
+
+
 class JobSearchService:
     """Service for job search operations."""
 
+    # Seconds each source may take during execute_search
+    SEARCH_TIMEOUT_SECONDS = 60.0
+
+    # Minimum score for a scraped job to be saved
+    MIN_MATCH_SCORE = 50
+
     def __init__(
         self,
         job_posting_repository: JobPostingRepository,
@@ -69,6 +120,12 @@ class JobSearchService:
 
     async def create_job_posting(self, data: JobPostingCreate) -> JobPostingResponse:
         """Create a new job posting."""
+        if data.fingerprint is None:
+            data = data.model_copy(
+                update=self._dedup_service.dedup_keys(
+                    data.company_name, data.job_title, data.location
+                )
+            )
         posting = await self._job_posting_repo.create(data)
         return JobPostingResponse.model_validate(posting)
 
@@ -167,17 +224,27 @@ class JobSearchService:
     # ========================================================================
 
     async def execute_search(
-        self, criteria_id: UUID, sources: Optional[list[str]] = None
+        self,
+        criteria_id: UUID,
+        sources: Optional[list[str]] = None,
+        timeout: Optional[float] = None,
     ) -> JobSearchHistoryResponse:
         """
         Execute a job search based on search criteria.
 
+        All sources are scraped concurrently. Results are deduplicated and
+        scored in a single stage as each source finishes, and matched postings
+        are inserted together in one transaction at the end. A source that
+        fails or exceeds the timeout is marked failed without affecting the
+        others.
+
         Args:
             criteria_id: ID of search criteria to use
             sources: List of sources to search (default: all enabled in criteria)
+            timeout: Seconds each source may take (default: SEARCH_TIMEOUT_SECONDS)
 
         Returns:
-            Search history record with results
+            Search history record with results (of the last requested source)
         """
         # Get criteria
         criteria = await self._criteria_repo.get_by_id(criteria_id)
@@ -185,18 +252,22 @@ class JobSearchService:
             raise TurboBaseException(f"Search criteria {criteria_id} not found", "CRITERIA_NOT_FOUND")
 
         # Determine which sources to search
-        search_sources = sources or criteria.enabled_sources or ["indeed"]
+        search_sources = [
+            source
+            for source in dict.fromkeys(sources or criteria.enabled_sources or ["indeed"])
+            if source in self._scrapers
+        ]
+        if not search_sources:
+            raise TurboBaseException("No supported job sources selected", "NO_JOB_SOURCES")
 
-        total_found = 0
-        total_matched = 0
-        total_new = 0
+        timeout = timeout or self.SEARCH_TIMEOUT_SECONDS
 
-        for source in search_sources:
-            scraper = self._scrapers.get(source)
-            if not scraper:
-                continue
+        # Index any postings created before fingerprints were stored
+        await self._dedup_service.backfill_fingerprints()
 
-            # Create search history record
+        # Create search history records
+        histories = {}
+        for source in search_sources:
             history_data = JobSearchHistoryCreate(
                 search_criteria_id=criteria_id,
                 source=source,
@@ -207,108 +278,53 @@ class JobSearchService:
                 },
                 status="running",
             )
-            history = await self._history_repo.create(history_data)
-
-            try:
-                start_time = datetime.now()
-
-                # Deduplication tracking
-                duplicate_exact = 0
-                duplicate_fuzzy = 0
-                duplicate_details = []
+            histories[source] = await self._history_repo.create(history_data)
+
+        start_time = datetime.now()
+        run = _SearchRun()
+        scrapes = [
+            asyncio.ensure_future(self._scrape_source(source, criteria, timeout))
+            for source in search_sources
+        ]
+
+        try:
+            # Single dedup/score stage, fed as each scraper finishes
+            for next_scrape in asyncio.as_completed(scrapes):
+                source, scraped_jobs, error = await next_scrape
+                history = histories[source]
+                history.completed_at = datetime.now()
+                history.duration_seconds = (history.completed_at - start_time).seconds
 
-                # Execute search
-                scraped_jobs = await scraper.search_jobs(
-                    keywords=criteria.job_titles,
-                    locations=criteria.locations,
-                    remote_only=criteria.exclude_onsite,
-                    limit=100,
-                )
+                if error is not None:
+                    history.status = "failed"
+                    history.error_message = error
+                    continue
 
-                # Process and score jobs
-                for scraped_job in scraped_jobs:
-                    total_found += 1
-
-                    # Check if job is a duplicate (exact or fuzzy match)
-                    is_duplicate, existing_job, similarity = await self._dedup_service.is_duplicate(
-                        scraped_job,
-                        threshold=self._dedup_service.LIKELY_DUPLICATE_THRESHOLD
-                    )
-
-                    if is_duplicate:
-                        # Track duplicate type
-                        if similarity >= 0.95:
-                            duplicate_exact += 1
-                        else:
-                            duplicate_fuzzy += 1
-
-                        # Record duplicate details
-                        duplicate_details.append({
-                            "job_title": scraped_job.job_title,
-                            "company": scraped_job.company_name,
-                            "similarity": round(similarity, 2),
-                            "existing_source": existing_job.source if existing_job else None,
-                            "existing_id": str(existing_job.id) if existing_job else None,
-                        })
-                        continue
-
-                    total_new += 1
-
-                    # Score the job
-                    score, reasons = self._score_job(scraped_job, criteria)
-
-                    # Only save if score meets threshold (e.g., > 50)
-                    if score >= 50:
-                        total_matched += 1
-
-                        # Create job posting
-                        posting_data = JobPostingCreate(
-                            source=scraped_job.source,
-                            source_url=scraped_job.source_url,
-                            external_id=scraped_job.external_id,
-                            company_name=scraped_job.company_name,
-                            job_title=scraped_job.job_title,
-                            job_description=scraped_job.job_description,
-                            location=scraped_job.location,
-                            remote_policy=scraped_job.remote_policy,
-                            salary_min=scraped_job.salary_min,
-                            salary_max=scraped_job.salary_max,
-                            salary_currency=scraped_job.salary_currency,
-                            required_skills=scraped_job.required_skills,
-                            preferred_skills=scraped_job.preferred_skills,
-                            posted_date=scraped_job.posted_date,
-                            match_score=score,
-                            match_reasons=reasons,
-                            raw_data=scraped_job.raw_data,
-                        )
-                        await self._job_posting_repo.create(posting_data)
-
-                # Update history record with dedup stats
-                duration = (datetime.now() - start_time).seconds
+                stats = await self._dedup_and_score(scraped_jobs, criteria, run)
                 history.status = "completed"
-                history.jobs_found = total_found
-                history.jobs_matched = total_matched
-                history.jobs_new = total_new
-                history.jobs_duplicate_exact = duplicate_exact
-                history.jobs_duplicate_fuzzy = duplicate_fuzzy
-                history.dedup_stats = {
-                    "total_duplicates": duplicate_exact + duplicate_fuzzy,
-                    "exact_matches": duplicate_exact,
-                    "fuzzy_matches": duplicate_fuzzy,
-                    "duplicate_rate": round((duplicate_exact + duplicate_fuzzy) / total_found * 100, 1) if total_found > 0 else 0,
-                    "duplicate_details": duplicate_details[:10],  # Keep top 10 for reference
-                }
-                history.completed_at = datetime.now()
-                history.duration_seconds = duration
-                await self._history_repo._session.commit()
-
-            except Exception as e:
-                # Mark history as failed
+                history.jobs_found = stats["found"]
+                history.jobs_matched = stats["matched"]
+                history.jobs_new = stats["new"]
+                history.jobs_duplicate_exact = stats["duplicate_exact"]
+                history.jobs_duplicate_fuzzy = stats["duplicate_fuzzy"]
+                history.dedup_stats = stats["dedup_stats"]
+
+            # Bulk insert every matched posting in one transaction
+            await self._job_posting_repo.create_many(run.postings, commit=False)
+            await self._history_repo._session.commit()
+
+        except Exception as e:
+            await self._history_repo._session.rollback()
+            # Mark history as failed
+            for history in histories.values():
                 history.status = "failed"
                 history.error_message = str(e)
                 history.completed_at = datetime.now()
-                await self._history_repo._session.commit()
-                raise
+            await self._history_repo._session.commit()
+            raise
+        finally:
+            for scrape in scrapes:
+                scrape.cancel()
 
         # Update criteria last_search_at and next_search_at
         update_data = SearchCriteriaUpdate(
@@ -318,7 +334,148 @@ class JobSearchService:
         await self._criteria_repo.update(criteria_id, update_data)
 
         # Return the history record
-        return JobSearchHistoryResponse.model_validate(history)
+        return JobSearchHistoryResponse.model_validate(histories[search_sources[-1]])
+
+    async def _scrape_source(
+        self, source: str, criteria, timeout: float
+    ) -> tuple[str, list[ScrapedJob], Optional[str]]:
+        """
+        Run one scraper within its rate limit and the timeout budget.
+
+        Never raises, so one source cannot cancel the others.
+
+        Returns:
+            Tuple of (source, scraped_jobs, error_message)
+        """
+        scraper = self._scrapers[source]
+        try:
+            await scraper.wait_for_rate_limit()
+            scraped_jobs = await asyncio.wait_for(
+                scraper.search_jobs(
+                    keywords=criteria.job_titles,
+                    locations=criteria.locations,
+                    remote_only=criteria.exclude_onsite,
+                    limit=100,
+                ),
+                timeout=timeout,
+            )
+            return source, scraped_jobs, None
+        except asyncio.TimeoutError:
+            return source, [], f"Timed out after {timeout:g}s"
+        except Exception as e:
+            return source, [], str(e)
+
+    async def _dedup_and_score(
+        self, scraped_jobs: list[ScrapedJob], criteria, run: "_SearchRun"
+    ) -> dict:
+        """
+        Deduplicate and score one source's results, queueing matches for insert.
+
+        Jobs are checked against the database in one batch, then against the
+        postings already queued by this run (from any source).
+
+        Returns:
+            Per-source counts and dedup stats for the history record
+        """
+        duplicate_exact = 0
+        duplicate_fuzzy = 0
+        duplicate_details = []
+        total_new = 0
+        total_matched = 0
+
+        # Check the whole scrape for duplicates (exact or fuzzy match) at once
+        dedup_results = await self._dedup_service.find_duplicates(
+            scraped_jobs,
+            threshold=self._dedup_service.LIKELY_DUPLICATE_THRESHOLD
+        )
+
+        # Process and score jobs
+        for scraped_job, dedup_result in zip(scraped_jobs, dedup_results):
+            # Unpacked rather than bound by the loop, as a match in this run
+            # can still turn the job into a duplicate
+            is_duplicate, existing_job, similarity = dedup_result
+            dedup_keys = self._dedup_service.dedup_keys(
+                scraped_job.company_name, scraped_job.job_title, scraped_job.location
+            )
+            existing_source = existing_job.source if existing_job else None
+            existing_id = str(existing_job.id) if existing_job else None
+
+            # Repeats of jobs already seen in this run
+            if not is_duplicate:
+                match = run.find_match(
+                    scraped_job, dedup_keys["fingerprint"],
+                    self._dedup_service.LIKELY_DUPLICATE_THRESHOLD,
+                )
+                if match:
+                    is_duplicate = True
+                    existing_source, similarity = match
+            run.seen_sources.setdefault(dedup_keys["fingerprint"], scraped_job.source)
+
+            if is_duplicate:
+                # Track duplicate type
+                if similarity >= 0.95:
+                    duplicate_exact += 1
+                else:
+                    duplicate_fuzzy += 1
+
+                # Record duplicate details
+                duplicate_details.append({
+                    "job_title": scraped_job.job_title,
+                    "company": scraped_job.company_name,
+                    "similarity": round(similarity, 2),
+                    "existing_source": existing_source,
+                    "existing_id": existing_id,
+                })
+                continue
+
+            total_new += 1
+
+            # Score the job
+            score, reasons = self._score_job(scraped_job, criteria)
+
+            # Only save if score meets threshold (e.g., > 50)
+            if score >= self.MIN_MATCH_SCORE:
+                total_matched += 1
+                run.queue(
+                    scraped_job,
+                    JobPostingCreate(
+                        source=scraped_job.source,
+                        source_url=scraped_job.source_url,
+                        external_id=scraped_job.external_id,
+                        company_name=scraped_job.company_name,
+                        job_title=scraped_job.job_title,
+                        job_description=scraped_job.job_description,
+                        location=scraped_job.location,
+                        remote_policy=scraped_job.remote_policy,
+                        salary_min=scraped_job.salary_min,
+                        salary_max=scraped_job.salary_max,
+                        salary_currency=scraped_job.salary_currency,
+                        required_skills=scraped_job.required_skills,
+                        preferred_skills=scraped_job.preferred_skills,
+                        posted_date=scraped_job.posted_date,
+                        match_score=score,
+                        match_reasons=reasons,
+                        raw_data=scraped_job.raw_data,
+                        **dedup_keys,
+                    ),
+                )
+
+        total_found = len(scraped_jobs)
+        total_duplicates = duplicate_exact + duplicate_fuzzy
+        return {
+            "found": total_found,
+            "matched": total_matched,
+            "new": total_new,
+            "duplicate_exact": duplicate_exact,
+            "duplicate_fuzzy": duplicate_fuzzy,
+            "dedup_stats": {
+                "total_duplicates": total_duplicates,
+                "exact_matches": duplicate_exact,
+                "fuzzy_matches": duplicate_fuzzy,
+                "duplicate_rate": round(total_duplicates / total_found * 100, 1) if total_found > 0 else 0,
+                "duplicate_details": duplicate_details[:10],  # Keep top 10 for reference
+            },
+        }
 
     def _score_job(self, job: ScrapedJob, criteria) -> tuple[float, dict]:
         """
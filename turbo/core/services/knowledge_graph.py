@@ -6,6 +6,7 @@ from typing import Any, Optional
 from neo4j import AsyncGraphDatabase, AsyncDriver
 from pydantic import BaseModel
 
+from turbo.core.services.embedding import get_embedding_service
 from turbo.utils.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -131,13 +132,12 @@ class KnowledgeGraphService:
                 logger.warning(f"Failed to create vector index (requires Neo4j 5.11+): {e}")
 
     def _load_embedder(self) -> Any:
-        """Load sentence transformer model for embeddings."""
+        """Get the shared embedding service, or None if embeddings are unavailable."""
         if self._embedder is None:
             try:
-                from sentence_transformers import SentenceTransformer
+                import sentence_transformers  # noqa: F401
 
-                self._embedder = SentenceTransformer("all-MiniLM-L6-v2")
-                logger.info("Loaded sentence transformer model for embeddings")
+                self._embedder = get_embedding_service()
             except Exception as e:
                 logger.warning(f"Failed to load embedder: {e}")
         return self._embedder
@@ -399,7 +399,7 @@ class KnowledgeGraphService:
         embedding = None
         if embedder:
             try:
-                embedding = embedder.encode(canonical_name or name).tolist()
+                embedding = await embedder.aembed(canonical_name or name)
             except Exception as e:
                 logger.warning(f"Failed to generate embedding: {e}")
 
@@ -513,7 +513,7 @@ class KnowledgeGraphService:
             logger.warning("Embedder not available for semantic search")
             return []
 
-        query_embedding = embedder.encode(query).tolist()
+        query_embedding = await embedder.aembed(query)
 
         # Search across entity types
         label = entity_type.capitalize() if entity_type else "Skill"
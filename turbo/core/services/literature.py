@@ -1,21 +1,32 @@
 """Service for Literature business logic."""
 
+import asyncio
 from typing import Optional
 from uuid import UUID
 
+from pydantic import ValidationError
+
 from turbo.core.models.literature import Literature
 from turbo.core.repositories.literature import LiteratureRepository
 from turbo.core.schemas.literature import LiteratureCreate, LiteratureUpdate
+from turbo.core.services.feed_sync import FeedSyncService
 from turbo.core.utils import strip_emojis
-from turbo.utils.content_extractor import extract_article_content, fetch_rss_feed
+from turbo.utils.content_extractor import extract_article_content, parse_feed_articles
 
 
 class LiteratureService:
     """Service for Literature operations."""
 
-    def __init__(self, repository: LiteratureRepository):
+    CONTENT_FETCH_CONCURRENCY = 5
+
+    def __init__(
+        self,
+        repository: LiteratureRepository,
+        feed_sync: Optional[FeedSyncService] = None,
+    ):
         """Initialize service."""
         self.repository = repository
+        self.feed_sync = feed_sync or FeedSyncService()
 
     async def create_literature(self, literature_data: LiteratureCreate) -> Literature:
         """Create new literature."""
@@ -118,38 +129,62 @@ class LiteratureService:
         return await self.repository.create(literature_create)
 
     async def fetch_from_rss_feed(self, feed_url: str) -> list[Literature]:
-        """Fetch articles from RSS feed."""
-        articles_data = await fetch_rss_feed(feed_url)
-        created_articles = []
-
-        for article_data in articles_data:
-            # Check if already exists
+        """Fetch new articles from RSS feed.
+
+        The feed is requested conditionally and a 304 returns no articles.
+        Known URLs are filtered with one query, full content for the rest is
+        extracted concurrently, and the new articles are bulk inserted.
+        """
+        fetch = await self.feed_sync.fetch(feed_url)
+        if fetch.not_modified:
+            await self.feed_sync.record(fetch)
+            await self.repository._session.commit()
+            return []
+
+        articles_data = []
+        seen_urls = set()
+        for article_data in parse_feed_articles(fetch.feed, feed_url):
             url = article_data.get("url")
             if url:
-                existing = await self.repository.get_by_url(url)
-                if existing:
+                if url in seen_urls:
                     continue
+                seen_urls.add(url)
+            articles_data.append(article_data)
 
-            # Fetch full content if we only have summary
-            if article_data.get("url") and not article_data.get("content"):
-                try:
-                    full_content = await extract_article_content(article_data["url"])
-                    article_data["content"] = full_content.get("content", article_data.get("summary", ""))
-                except Exception:
-                    # Fall back to summary if content extraction fails
-                    article_data["content"] = article_data.get("summary", "")
+        existing = await self.repository.get_existing_urls(list(seen_urls))
+        articles_data = [a for a in articles_data if a.get("url") not in existing]
 
-            # Create literature
+        semaphore = asyncio.Semaphore(self.CONTENT_FETCH_CONCURRENCY)
+        await asyncio.gather(
+            *(self._fill_content(article_data, semaphore) for article_data in articles_data)
+        )
+
+        literature_creates = []
+        for article_data in articles_data:
             try:
-                literature_create = LiteratureCreate(
-                    type="article",
-                    content=article_data.get("content") or article_data.get("summary", ""),
-                    **article_data,
-                )
-                literature = await self.repository.create(literature_create)
-                created_articles.append(literature)
-            except Exception:
-                # Skip articles that fail to create
+                literature_creates.append(LiteratureCreate(type="article", **article_data))
+            except ValidationError:
+                # Skip articles that fail validation
                 continue
 
-        return created_articles
\ No newline at end of file
+        created_articles = await self.repository.create_many(
+            literature_creates, commit=False
+        )
+        await self.feed_sync.record(fetch)
+        await self.repository._session.commit()
+        return created_articles
+
+    async def _fill_content(
+        self, article_data: dict, semaphore: asyncio.Semaphore
+    ) -> None:
+        """Extract full article content, falling back to the feed summary."""
+        content = None
+        if article_data.get("url"):
+            async with semaphore:
+                try:
+                    full_content = await extract_article_content(article_data["url"])
+                    content = full_content.get("content")
+                except Exception:
+                    # Fall back to summary if content extraction fails
+                    pass
+        article_data["content"] = content or article_data.get("summary", "")
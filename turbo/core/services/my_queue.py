@@ -0,0 +1,167 @@
+"""My Queue service: pending approvals, assigned work and review requests."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from itertools import chain
+import time
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from turbo.core.models.action_approval import ActionApproval
+from turbo.core.models.issue import Issue
+from turbo.core.models.review_request import ReviewRequest
+from turbo.core.repositories.action_approval_repository import ActionApprovalRepository
+from turbo.core.repositories.issue import IssueRepository
+from turbo.core.repositories.review_request import ReviewRequestRepository
+from turbo.core.schemas.action_approval import ActionApprovalResponse
+from turbo.core.schemas.issue import IssueResponse
+from turbo.core.schemas.review_request import ReviewRequestResponse
+
+T = TypeVar("T")
+SchemaType = TypeVar("SchemaType", bound=BaseModel)
+
+
+class MyQueueCountsCache:
+    """
+    Short-lived cache of the My Queue badge counts.
+
+    Dropped when a session commits changes to issues, action approvals or
+    review requests (see the session listeners below), and expires after
+    ``ttl_seconds`` to pick up bulk updates and other processes.
+    """
+
+    def __init__(self, ttl_seconds: float = 10.0):
+        self.ttl_seconds = ttl_seconds
+        self.generation = 0
+        self._entry: tuple[float, dict[str, int]] | None = None
+
+    def get(self) -> dict[str, int] | None:
+        if self._entry is None or time.monotonic() - self._entry[0] > self.ttl_seconds:
+            return None
+        return self._entry[1]
+
+    def set(self, counts: dict[str, int], generation: int) -> None:
+        """Store counts loaded at ``generation``, unless invalidated since."""
+        if generation != self.generation:
+            return
+        self._entry = (time.monotonic(), counts)
+
+    def invalidate(self) -> None:
+        self.generation += 1
+        self._entry = None
+
+
+my_queue_counts_cache = MyQueueCountsCache()
+
+# Changes to these can move items in or out of the queue
+_QUEUE_MODELS = (Issue, ActionApproval, ReviewRequest)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_queue_changes(session: Session, _flush_context: Any) -> None:
+    for instance in chain(session.new, session.dirty, session.deleted):
+        if isinstance(instance, _QUEUE_MODELS):
+            session.info["my_queue_changed"] = True
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_queue_counts(session: Session) -> None:
+    if session.info.pop("my_queue_changed", False):
+        my_queue_counts_cache.invalidate()
+
+
+class MyQueueService:
+    """
+    Builds the unified work queue.
+
+    Sections are independent, so each is loaded on its own session and
+    they run concurrently. Sections are limited in SQL and counts come from
+    ``count(*)`` queries, so neither grows with the size of the backlog.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        cache: MyQueueCountsCache | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._cache = cache if cache is not None else my_queue_counts_cache
+
+    async def get_counts(self) -> dict[str, int]:
+        """Item counts per section plus ``total``, cached briefly."""
+        cached = self._cache.get()
+        if cached is not None:
+            return dict(cached)
+        generation = self._cache.generation
+
+        action_approvals, review_requests, assigned_issues = await asyncio.gather(
+            self._run(lambda s: ActionApprovalRepository(s).count_pending()),
+            self._run(lambda s: ReviewRequestRepository(s).count_pending()),
+            # TODO: Add proper assignment filtering
+            # For now, count open issues as assigned issues
+            self._run(lambda s: IssueRepository(s).count(status="open")),
+        )
+        counts = {
+            "action_approvals": action_approvals,
+            "assigned_issues": assigned_issues,
+            "assigned_initiatives": 0,  # TODO
+            "assigned_milestones": 0,  # TODO
+            "review_requests": review_requests,
+        }
+        counts["total"] = sum(counts.values())
+
+        self._cache.set(counts, generation)
+        return dict(counts)
+
+    async def get_queue(self, limit: int) -> dict[str, Any]:
+        """Up to ``limit`` items per section, with counts for every section."""
+        action_approvals, review_requests, assigned_issues, counts = (
+            await asyncio.gather(
+                self._load(
+                    lambda s: ActionApprovalRepository(s).get_pending_approvals(
+                        limit=limit
+                    ),
+                    ActionApprovalResponse,
+                ),
+                self._load(
+                    lambda s: ReviewRequestRepository(s).get_pending_for_user(
+                        limit=limit
+                    ),
+                    ReviewRequestResponse,
+                ),
+                # In Phase 1 open issues stand in for issues assigned to the user
+                self._load(
+                    lambda s: IssueRepository(s).get_by_status("open", limit=limit),
+                    IssueResponse,
+                ),
+                self.get_counts(),
+            )
+        )
+        return {
+            "action_approvals": action_approvals,
+            "assigned_issues": assigned_issues,
+            # TODO: Add assignment filtering when implemented
+            "assigned_initiatives": [],
+            "assigned_milestones": [],
+            "review_requests": review_requests,
+            "counts": counts,
+        }
+
+    async def _run(self, query: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        """Run one query on a session of its own."""
+        async with self._session_factory() as session:
+            return await query(session)
+
+    async def _load(
+        self,
+        query: Callable[[AsyncSession], Awaitable[list[Any]]],
+        schema: type[SchemaType],
+    ) -> list[SchemaType]:
+        """Run a list query on its own session and validate rows before closing it."""
+        async with self._session_factory() as session:
+            return [schema.model_validate(row) for row in await query(session)]
@@ -92,8 +92,9 @@ class NoteService:
         # Extract tag IDs if provided
         tag_ids = note_data.tag_ids
 
-        # Create note (pass Pydantic model directly)
-        note = await self._note_repository.create(note_data)
+        # Create note (pass Pydantic model directly). The commit comes after
+        # the webhook event is queued, so both are kept or lost together
+        note = await self._note_repository.create(note_data, commit=False)
 
         # Add tags if provided
         if tag_ids:
@@ -103,25 +104,27 @@ class NoteService:
                 if tag:
                     tags.append(tag)
             note.tags = tags
-            await self._note_repository.update(note.id, {})
-
-        # Index in knowledge graph
-        await self._index_note_in_graph(note)
 
         # Emit webhook event
         if self._webhook_service:
             try:
                 await self._webhook_service.emit_event(
                     event_type="note.created",
-                    data={
+                    payload={
                         "note_id": str(note.id),
                         "title": note.title,
                         "workspace": note.workspace,
                     },
+                    commit=False,
                 )
             except Exception as e:
                 logger.warning(f"Failed to emit webhook event: {e}")
 
+        await self._note_repository._session.commit()
+
+        # Index in knowledge graph
+        await self._index_note_in_graph(note)
+
         return NoteResponse.model_validate(note)
 
     async def get_note(self, note_id: UUID) -> NoteResponse:
@@ -141,8 +144,10 @@ class NoteService:
         tag_ids = note_data.tag_ids
         note_update_dict = note_data.model_dump(exclude_unset=True, exclude={"tag_ids"})
 
-        # Update note
-        updated_note = await self._note_repository.update(note_id, note_update_dict)
+        # Update note; committed together with its webhook event, as in create
+        updated_note = await self._note_repository.update(
+            note_id, note_update_dict, commit=False
+        )
 
         # Update tags if provided
         if tag_ids is not None:
@@ -152,24 +157,26 @@ class NoteService:
                 if tag:
                     tags.append(tag)
             updated_note.tags = tags
-            await self._note_repository.update(note_id, {})
-
-        # Re-index in knowledge graph
-        await self._index_note_in_graph(updated_note)
 
         # Emit webhook event
         if self._webhook_service:
             try:
                 await self._webhook_service.emit_event(
                     event_type="note.updated",
-                    data={
+                    payload={
                         "note_id": str(note_id),
                         "title": updated_note.title,
                     },
+                    commit=False,
                 )
             except Exception as e:
                 logger.warning(f"Failed to emit webhook event: {e}")
 
+        await self._note_repository._session.commit()
+
+        # Re-index in knowledge graph
+        await self._index_note_in_graph(updated_note)
+
         return NoteResponse.model_validate(updated_note)
 
     async def delete_note(self, note_id: UUID) -> None:
@@ -178,21 +185,24 @@ class NoteService:
         if not note:
             raise NoteNotFoundError(f"Note with ID {note_id} not found")
 
-        await self._note_repository.delete(note_id)
+        await self._note_repository.delete(note_id, commit=False)
 
         # Emit webhook event
         if self._webhook_service:
             try:
                 await self._webhook_service.emit_event(
                     event_type="note.deleted",
-                    data={
+                    payload={
                         "note_id": str(note_id),
                         "title": note.title,
                     },
+                    commit=False,
                 )
             except Exception as e:
                 logger.warning(f"Failed to emit webhook event: {e}")
 
+        await self._note_repository._session.commit()
+
     async def list_notes(
         self,
         workspace: str | None = None,
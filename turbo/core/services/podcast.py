@@ -5,8 +5,7 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-import feedparser
-import httpx
+from pydantic import ValidationError
 
 from turbo.core.models.podcast import PodcastShow, PodcastEpisode
 from turbo.core.repositories.podcast import PodcastShowRepository, PodcastEpisodeRepository
@@ -16,7 +15,9 @@ from turbo.core.schemas.podcast import (
     PodcastEpisodeCreate,
     PodcastEpisodeUpdate,
     PlayProgress,
+    PodcastFeedRefreshResult,
 )
+from turbo.core.services.feed_sync import FeedFetch, FeedSyncService
 
 
 class PodcastService:
@@ -26,10 +27,12 @@ class PodcastService:
         self,
         show_repository: PodcastShowRepository,
         episode_repository: PodcastEpisodeRepository,
+        feed_sync: Optional[FeedSyncService] = None,
     ):
         """Initialize service."""
         self.show_repo = show_repository
         self.episode_repo = episode_repository
+        self.feed_sync = feed_sync or FeedSyncService()
 
     # Show operations
     async def create_show(self, show_data: PodcastShowCreate) -> PodcastShow:
@@ -212,53 +215,123 @@ class PodcastService:
         show_id: UUID,
         limit: Optional[int] = None,
     ) -> list[PodcastEpisode]:
-        """Fetch episodes from podcast RSS feed."""
+        """Fetch new episodes from podcast RSS feed.
+
+        Full fetches are conditional on the validators stored by the previous
+        one, so an unchanged feed costs a single 304 round trip. Limited
+        fetches always download the feed and leave the validators alone,
+        otherwise a later full fetch would skip the older entries.
+        """
         show = await self.show_repo.get_by_id(show_id)
         if not show:
             raise ValueError(f"Show {show_id} not found")
 
-        # Fetch and parse feed
-        episodes_data = await self._fetch_feed_episodes(show.feed_url, limit)
+        fetch = await self.feed_sync.fetch(show.feed_url, conditional=limit is None)
+        return await self._ingest_feed(show_id, fetch, limit)
 
-        created_episodes = []
-        for episode_data in episodes_data:
-            # Check if episode already exists by GUID
-            if episode_data.get("guid"):
-                existing = await self.episode_repo.get_by_guid(episode_data["guid"])
-                if existing:
-                    continue
+    async def refresh_subscribed_shows(
+        self,
+        max_concurrency: Optional[int] = None,
+    ) -> list[PodcastFeedRefreshResult]:
+        """Fetch every subscribed show's feed and ingest new episodes.
+
+        Feeds are downloaded concurrently, at most ``max_concurrency`` at a
+        time, and each is written to the database as soon as it arrives.
+        One show failing does not stop the others.
+        """
+        shows = await self.show_repo.get_subscribed(limit=None)
+        # Plain IDs, since a rollback below expires the loaded shows
+        show_ids = {show.feed_url: show.id for show in shows}
+
+        results = []
+        async for feed_url, fetch in self.feed_sync.fetch_many(
+            show_ids, max_concurrency=max_concurrency
+        ):
+            show_id = show_ids[feed_url]
+            if isinstance(fetch, Exception):
+                results.append(
+                    PodcastFeedRefreshResult(
+                        show_id=show_id, status="failed", error=str(fetch)
+                    )
+                )
+                continue
 
-            # Create episode
             try:
-                episode_create = PodcastEpisodeCreate(
+                created = await self._ingest_feed(show_id, fetch)
+            except Exception as e:
+                await self.show_repo._session.rollback()
+                results.append(
+                    PodcastFeedRefreshResult(show_id=show_id, status="failed", error=str(e))
+                )
+                continue
+
+            results.append(
+                PodcastFeedRefreshResult(
                     show_id=show_id,
-                    **episode_data,
+                    status="not_modified" if fetch.not_modified else "updated",
+                    new_episodes=len(created),
+                )
+            )
+
+        return results
+
+    async def _ingest_feed(
+        self,
+        show_id: UUID,
+        fetch: FeedFetch,
+        limit: Optional[int] = None,
+    ) -> list[PodcastEpisode]:
+        """Insert the episodes of a fetched feed that are not stored yet.
+
+        Existing GUIDs are found with one IN query and the new episodes are
+        written with one bulk insert, committed together with the feed's
+        validators and ``last_fetched_at``.
+        """
+        await self.show_repo.mark_fetched(show_id, datetime.now(timezone.utc))
+        if fetch.not_modified:
+            await self.feed_sync.record(fetch)
+            await self.show_repo._session.commit()
+            return []
+
+        entries = fetch.feed.entries if not limit else fetch.feed.entries[:limit]
+        episodes_data = {}
+        for entry in entries:
+            episode_data = self._parse_episode(entry)
+            if episode_data:
+                # First occurrence wins when a feed repeats a GUID
+                episodes_data.setdefault(episode_data["guid"], episode_data)
+
+        existing = await self.episode_repo.get_existing_guids(list(episodes_data))
+        episodes_create = []
+        for guid, episode_data in episodes_data.items():
+            if guid in existing:
+                continue
+            try:
+                episodes_create.append(
+                    PodcastEpisodeCreate(show_id=show_id, **episode_data)
                 )
-                episode = await self.episode_repo.create(episode_create)
-                created_episodes.append(episode)
-            except Exception:
-                # Skip episodes that fail to create
+            except ValidationError:
+                # Skip episodes with invalid data
                 continue
 
-        # Update show stats and last_fetched_at
-        await self.show_repo.update(
-            show_id,
-            PodcastShowUpdate(last_fetched_at=datetime.now(timezone.utc)),
+        created_episodes = await self.episode_repo.create_many(
+            episodes_create, commit=False
         )
-        await self.show_repo.update_episode_stats(show_id)
+        if limit is None:
+            await self.feed_sync.record(fetch)
+        await self.show_repo._session.commit()
+
+        if created_episodes:
+            await self.show_repo.update_episode_stats(show_id)
 
         return created_episodes
 
     async def _fetch_feed_metadata(self, feed_url: str) -> dict:
         """Fetch and parse podcast feed metadata."""
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(feed_url)
-            response.raise_for_status()
-
-        feed = feedparser.parse(response.text)
+        fetch = await self.feed_sync.fetch(feed_url, conditional=False)
 
         # Extract podcast-specific metadata
-        channel = feed.feed
+        channel = fetch.feed.feed
 
         return {
             "title": channel.get("title", "Unknown Podcast"),
@@ -272,28 +345,6 @@ class PodcastService:
             "explicit": channel.get("itunes_explicit") == "yes",
         }
 
-    async def _fetch_feed_episodes(
-        self,
-        feed_url: str,
-        limit: Optional[int] = None,
-    ) -> list[dict]:
-        """Fetch and parse podcast episodes from feed."""
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(feed_url)
-            response.raise_for_status()
-
-        feed = feedparser.parse(response.text)
-        episodes = []
-
-        entries = feed.entries if not limit else feed.entries[:limit]
-
-        for entry in entries:
-            episode = self._parse_episode(entry)
-            if episode:
-                episodes.append(episode)
-
-        return episodes
-
     def _parse_episode(self, entry: dict) -> Optional[dict]:
         """Parse episode data from feed entry."""
         # Get audio enclosure
@@ -341,7 +392,8 @@ class PodcastService:
             "file_size": file_size,
             "mime_type": mime_type,
             "published_at": self._parse_date(entry),
-            "guid": entry.get("id") or entry.get("guid"),
+            # Episodes without a GUID are keyed by their enclosure URL
+            "guid": entry.get("id") or entry.get("guid") or audio_url,
             "image_url": self._extract_episode_image(entry),
         }
 
@@ -107,16 +107,29 @@ class ProjectService:
         if not project:
             raise ProjectNotFoundError(project_id)
 
-        # Get project issues
-        issues = await self._issue_repository.get_by_project(project_id)
-
-        # Calculate statistics
-        total_issues = len(issues)
-        open_issues = len([issue for issue in issues if issue.status == "open"])
-        closed_issues = len([issue for issue in issues if issue.status == "closed"])
-        in_progress_issues = len(
-            [issue for issue in issues if issue.status == "in_progress"]
-        )
+        stats = await self.get_projects_statistics([project_id])
+        return stats[project_id]
+
+    async def get_projects_statistics(
+        self, project_ids: list[UUID]
+    ) -> dict[UUID, dict[str, Any]]:
+        """Get statistics for many projects with one aggregate query.
+
+        Projects that do not exist or have no issues get zero counts.
+        """
+        counts = await self._issue_repository.get_status_counts(project_ids)
+        return {
+            project_id: self._build_statistics(project_id, counts.get(project_id, {}))
+            for project_id in project_ids
+        }
+
+    @staticmethod
+    def _build_statistics(
+        project_id: UUID, status_counts: dict[str, int]
+    ) -> dict[str, Any]:
+        """Derive project statistics from per-status issue counts."""
+        total_issues = sum(status_counts.values())
+        closed_issues = status_counts.get("closed", 0)
 
         completion_rate = 0.0
         if total_issues > 0:
@@ -125,28 +138,34 @@ class ProjectService:
         return {
             "project_id": project_id,
             "total_issues": total_issues,
-            "open_issues": open_issues,
+            "open_issues": status_counts.get("open", 0),
             "closed_issues": closed_issues,
-            "in_progress_issues": in_progress_issues,
+            "in_progress_issues": status_counts.get("in_progress", 0),
             "completion_rate": completion_rate,
         }
 
     async def get_project_with_stats(self, project_id: UUID) -> ProjectWithStats:
         """Get project with statistics included."""
-        # Get basic project info
         project_response = await self.get_project_by_id(project_id)
-
-        # Get statistics
-        stats = await self.get_project_statistics(project_id)
-
-        # Combine into ProjectWithStats
-        return ProjectWithStats(
-            **project_response.model_dump(),
-            total_issues=stats["total_issues"],
-            open_issues=stats["open_issues"],
-            closed_issues=stats["closed_issues"],
-            completion_rate=stats["completion_rate"],
-        )
+        projects = await self.attach_statistics([project_response])
+        return projects[0]
+
+    async def attach_statistics(
+        self, projects: list[ProjectResponse]
+    ) -> list[ProjectWithStats]:
+        """Add issue statistics to already-loaded projects in one query."""
+        stats = await self.get_projects_statistics([p.id for p in projects])
+        return [
+            ProjectWithStats(
+                **project.model_dump(),
+                total_issues=stats[project.id]["total_issues"],
+                open_issues=stats[project.id]["open_issues"],
+                closed_issues=stats[project.id]["closed_issues"],
+                in_progress_issues=stats[project.id]["in_progress_issues"],
+                completion_rate=stats[project.id]["completion_rate"],
+            )
+            for project in projects
+        ]
 
     async def get_projects_by_status(self, status: str) -> list[ProjectResponse]:
         """Get projects by status."""
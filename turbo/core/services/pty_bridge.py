@@ -0,0 +1,162 @@
+"""Event-driven bridge from a PTY file descriptor to websocket clients."""
+
+import asyncio
+import errno
+import logging
+import os
+from typing import Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class PtySubscription:
+    """Output frames for one client; ``None`` marks the end of the stream."""
+
+    def __init__(self, max_frames: int):
+        self._queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(max_frames)
+        self.overflowed = False
+
+    async def get(self) -> Optional[bytes]:
+        """Next output frame, or None once the stream has ended."""
+        return await self._queue.get()
+
+    def _push(self, frame: bytes) -> bool:
+        try:
+            self._queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def _end(self, discard: bool = False) -> None:
+        """Queue the end marker, after any pending frames unless ``discard``."""
+        if discard:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+        elif self._queue.full():
+            # Make room for the end marker
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+
+class PtyBridge:
+    """Read a PTY only when it has output and fan frames out to clients.
+
+    The descriptor is registered with ``loop.add_reader``, so an idle
+    terminal costs nothing. Output is coalesced into frames: a frame is sent
+    ``FRAME_INTERVAL`` seconds after the first unsent byte arrives, or as soon
+    as ``FRAME_MAX_BYTES`` have accumulated. Sent output is also kept in a
+    scrollback ring buffer that is replayed to clients when they (re)connect.
+
+    A client that falls ``MAX_PENDING_FRAMES`` behind is dropped; it can
+    reconnect and catch up from the scrollback.
+    """
+
+    READ_SIZE = 65536
+    FRAME_INTERVAL = 0.005
+    FRAME_MAX_BYTES = 32 * 1024
+    SCROLLBACK_BYTES = 256 * 1024
+    MAX_PENDING_FRAMES = 256
+
+    def __init__(self, fd: int, scrollback_bytes: Optional[int] = None):
+        """Initialize bridge.
+
+        Args:
+            fd: PTY master file descriptor; switched to non-blocking mode
+            scrollback_bytes: Output kept for replay to reconnecting clients
+        """
+        self._fd = fd
+        self._scrollback_limit = scrollback_bytes or self.SCROLLBACK_BYTES
+        self._scrollback = bytearray()
+        self._pending = bytearray()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._subscribers: Set[PtySubscription] = set()
+        self._loop = asyncio.get_running_loop()
+        self._closed = False
+
+        os.set_blocking(fd, False)
+        self._loop.add_reader(fd, self._on_readable)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the PTY has hit EOF or the bridge was closed."""
+        return self._closed
+
+    def subscribe(self) -> tuple[bytes, PtySubscription]:
+        """Register a client.
+
+        Returns:
+            The scrollback to replay first, and the subscription for new
+            output. Nothing is missed or repeated between the two.
+        """
+        subscription = PtySubscription(self.MAX_PENDING_FRAMES)
+        if self._closed:
+            subscription._end()
+        else:
+            self._subscribers.add(subscription)
+        return bytes(self._scrollback), subscription
+
+    def unsubscribe(self, subscription: PtySubscription) -> None:
+        """Stop delivering output to a client."""
+        self._subscribers.discard(subscription)
+
+    def close(self) -> None:
+        """Stop reading, deliver buffered output and end every subscription."""
+        if self._closed:
+            return
+        self._closed = True
+        self._loop.remove_reader(self._fd)
+        self._flush()
+        for subscription in self._subscribers:
+            subscription._end()
+        self._subscribers.clear()
+
+    def _on_readable(self) -> None:
+        """Read one chunk, then schedule a frame.
+
+        Only ``READ_SIZE`` bytes are read per call; the loop calls again
+        while more output is buffered, so a PTY that writes continuously
+        cannot starve other callbacks.
+        """
+        try:
+            data = os.read(self._fd, self.READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            # EIO is how Linux reports that the shell has exited
+            if e.errno != errno.EIO:
+                logger.error(f"Error reading from PTY: {e}")
+            self.close()
+            return
+        if not data:
+            self.close()
+            return
+
+        self._pending += data
+        if len(self._pending) >= self.FRAME_MAX_BYTES:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(
+                self.FRAME_INTERVAL, self._flush
+            )
+
+    def _flush(self) -> None:
+        """Send pending output as one frame and append it to the scrollback."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+
+        frame = bytes(self._pending)
+        self._pending.clear()
+        self._scrollback += frame
+        excess = len(self._scrollback) - self._scrollback_limit
+        if excess > 0:
+            del self._scrollback[:excess]
+
+        for subscription in list(self._subscribers):
+            if not subscription._push(frame):
+                logger.warning("Dropping terminal client that fell behind")
+                subscription.overflowed = True
+                self._subscribers.discard(subscription)
+                subscription._end(discard=True)
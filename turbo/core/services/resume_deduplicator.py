@@ -1,9 +1,21 @@
-"""Smart deduplication service using fuzzy matching and semantic similarity."""
-
+"""Smart deduplication service using fuzzy matching and semantic similarity.
+
+Each section is deduplicated as a batch rather than item by item: string
+similarity for every pair comes from one rapidfuzz ``cdist`` call, project
+descriptions are embedded with one ``encode`` call and compared with one
+matrix product, and the pairs that pass the thresholds are clustered with
+union-find. Each cluster is merged into its first member, so output order
+follows first appearance.
+"""
+
+import asyncio
+from collections.abc import Callable
 import logging
 from typing import Any, Optional
 
-from rapidfuzz import fuzz, process
+import numpy as np
+from rapidfuzz import fuzz
+from rapidfuzz.process import cdist
 
 # Optional knowledge graph import
 try:
@@ -14,6 +26,56 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def _score_matrix(
+    values: list[str], scorer: Callable[..., float] = fuzz.token_sort_ratio
+) -> np.ndarray:
+    """Pairwise string similarity (0-100) of every value against every other.
+
+    As with the scorers themselves, two empty strings score 100.
+    """
+    return cdist(
+        values, values, scorer=scorer, processor=None, dtype=np.float32, workers=-1
+    )
+
+
+def _jaccard_matrix(sets: list[set[str]]) -> np.ndarray:
+    """Pairwise Jaccard similarity of the sets; 0 where either set is empty."""
+    vocabulary = {item: i for i, item in enumerate(set().union(*sets))}
+    membership = np.zeros((len(sets), len(vocabulary)), dtype=np.float32)
+    for row, items in enumerate(sets):
+        membership[row, [vocabulary[item] for item in items]] = 1
+    intersection = membership @ membership.T
+    sizes = membership.sum(axis=1)
+    union = sizes[:, None] + sizes[None, :] - intersection
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(union > 0, intersection / union, 0.0)
+
+
+def _cluster(matches: np.ndarray) -> list[list[int]]:
+    """Group indices connected by ``matches[i, j]`` (i < j) with union-find.
+
+    Clusters are ordered by, and each lists members from, the lowest index.
+    """
+    parent = list(range(len(matches)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in np.argwhere(np.triu(matches, k=1)):
+        root_i, root_j = find(int(i)), find(int(j))
+        if root_i != root_j:
+            # The lower index stays the root, i.e. the cluster's representative
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    clusters: dict[int, list[int]] = {}
+    for i in range(len(parent)):
+        clusters.setdefault(find(i), []).append(i)
+    return list(clusters.values())
+
+
 class ResumeDeduplicatorService:
     """Smart deduplication using fuzzy matching and semantic similarity."""
 
@@ -28,13 +90,14 @@ class ResumeDeduplicatorService:
         self._load_embedder()
 
     def _load_embedder(self) -> None:
-        """Load sentence transformer model for semantic similarity."""
+        """Use the shared embedding service for semantic similarity."""
         try:
-            from sentence_transformers import SentenceTransformer
+            import sentence_transformers  # noqa: F401
+
+            from turbo.core.services.embedding import get_embedding_service
 
-            # Load lightweight 22MB model
-            self.embedder = SentenceTransformer("all-MiniLM-L6-v2")
-            logger.info("Loaded sentence transformer model: all-MiniLM-L6-v2")
+            # Shared, cached model (lightweight 22MB all-MiniLM-L6-v2 by default)
+            self.embedder = get_embedding_service()
         except Exception as e:
             logger.warning(f"Failed to load embedder: {e}. Falling back to fuzzy matching only.")
             self.embedder = None
@@ -55,59 +118,32 @@ class ResumeDeduplicatorService:
         if not skills:
             return []
 
-        # Normalize AWS service names
-        normalized_skills = []
-        for skill in skills:
-            normalized = self._normalize_aws_skill(skill)
-            normalized_skills.append((skill, normalized))
+        normalized = [self._normalize_aws_skill(skill) for skill in skills]
 
-        # If graph available, check for existing skill nodes
-        skill_canonical_map = {}
+        # If graph available, look up every distinct skill concurrently
+        skill_canonical_map: dict[str, str] = {}
         if use_graph and self.kg_service:
-            for original, normalized in normalized_skills:
-                # Query graph for similar skills using vector similarity
-                try:
-                    related = await self.kg_service.find_related_entities(
-                        entity_id=normalized,
-                        entity_type="skill",
-                        limit=1,
+            distinct: dict[str, str] = {}
+            for name in normalized:
+                distinct.setdefault(name.lower(), name)
+            related = await asyncio.gather(
+                *(
+                    self.kg_service.find_related_entities(
+                        entity_id=name, entity_type="skill", limit=1
                     )
-                    if related:
-                        # Use canonical form from graph
-                        skill_canonical_map[normalized.lower()] = related[0].get(
-                            "name", normalized
-                        )
-                except Exception as e:
-                    logger.debug(f"Graph lookup failed for {normalized}: {e}")
-
-        # Group similar skills
-        unique_skills = []
-        seen_normalized = set()
-
-        for original, normalized in normalized_skills:
-            # Check canonical mapping from graph
-            canonical = skill_canonical_map.get(normalized.lower(), normalized)
-
-            # Check if we've seen this canonical form
-            if canonical.lower() in seen_normalized:
-                continue
-
-            # Check fuzzy match against existing unique skills
-            matches = process.extract(
-                canonical,
-                [s for _, s in unique_skills],
-                scorer=fuzz.token_sort_ratio,
-                limit=1,
+                    for name in distinct.values()
+                ),
+                return_exceptions=True,
             )
+            for name, result in zip(distinct.values(), related):
+                if isinstance(result, Exception):
+                    logger.debug(f"Graph lookup failed for {name}: {result}")
+                elif result:
+                    # Use canonical form from graph
+                    skill_canonical_map[name.lower()] = result[0].get("name", name)
 
-            if matches and matches[0][1] >= threshold:
-                # Similar to existing skill, skip
-                continue
-
-            unique_skills.append((original, canonical))
-            seen_normalized.add(canonical.lower())
-
-        return [original for original, _ in unique_skills]
+        canonical = [skill_canonical_map.get(n.lower(), n) for n in normalized]
+        return self._deduplicate_names(skills, canonical, threshold)
 
     def deduplicate_skills(
         self, skills: list[str], threshold: int = 90
@@ -124,37 +160,25 @@ class ResumeDeduplicatorService:
         if not skills:
             return []
 
-        # Normalize AWS service names
-        normalized_skills = []
-        for skill in skills:
-            normalized = self._normalize_aws_skill(skill)
-            normalized_skills.append((skill, normalized))
-
-        # Group similar skills
-        unique_skills = []
-        seen_normalized = set()
-
-        for original, normalized in normalized_skills:
-            # Check if we've seen this normalized form
-            if normalized.lower() in seen_normalized:
-                continue
+        normalized = [self._normalize_aws_skill(skill) for skill in skills]
+        return self._deduplicate_names(skills, normalized, threshold)
 
-            # Check fuzzy match against existing unique skills
-            matches = process.extract(
-                normalized,
-                [s for _, s in unique_skills],
-                scorer=fuzz.token_sort_ratio,
-                limit=1,
-            )
-
-            if matches and matches[0][1] >= threshold:
-                # Similar to existing skill, skip
-                continue
+    def _deduplicate_names(
+        self, originals: list[str], normalized: list[str], threshold: int
+    ) -> list[str]:
+        """Keep the first original of each group of matching normalized names.
 
-            unique_skills.append((original, normalized))
-            seen_normalized.add(normalized.lower())
+        Names match when equal ignoring case or when their token sort ratio
+        reaches ``threshold``.
+        """
+        # Exact matches first, so cdist only sees distinct names
+        first_seen: dict[str, int] = {}
+        for i, name in enumerate(normalized):
+            first_seen.setdefault(name.lower(), i)
+        distinct = list(first_seen.values())
 
-        return [original for original, _ in unique_skills]
+        scores = _score_matrix([normalized[i] for i in distinct])
+        return [originals[distinct[c[0]]] for c in _cluster(scores >= threshold)]
 
     def _normalize_aws_skill(self, skill: str) -> str:
         """Normalize AWS service names.
@@ -215,33 +239,21 @@ class ResumeDeduplicatorService:
         if not certifications:
             return []
 
-        unique_certs = []
-
+        normalized = []
         for cert in certifications:
             # Normalize certification names
-            normalized = cert.strip()
+            name = cert.strip()
 
             # AWS certification normalization
-            if "aws" in normalized.lower():
-                if "solutions architect" in normalized.lower() and "associate" in normalized.lower():
-                    normalized = "AWS Certified Solutions Architect - Associate"
-                elif "developer" in normalized.lower() and "associate" in normalized.lower():
-                    normalized = "AWS Certified Developer - Associate"
-
-            # Check fuzzy match
-            if unique_certs:
-                matches = process.extract(
-                    normalized,
-                    unique_certs,
-                    scorer=fuzz.token_sort_ratio,
-                    limit=1,
-                )
-                if matches and matches[0][1] >= threshold:
-                    continue
-
-            unique_certs.append(normalized)
+            if "aws" in name.lower():
+                if "solutions architect" in name.lower() and "associate" in name.lower():
+                    name = "AWS Certified Solutions Architect - Associate"
+                elif "developer" in name.lower() and "associate" in name.lower():
+                    name = "AWS Certified Developer - Associate"
+            normalized.append(name)
 
-        return unique_certs
+        scores = _score_matrix(normalized)
+        return [normalized[c[0]] for c in _cluster(scores >= threshold)]
 
     def deduplicate_experiences(
         self, experiences: list[dict[str, Any]], threshold: float = 0.8
@@ -258,37 +270,42 @@ class ResumeDeduplicatorService:
         if not experiences:
             return []
 
-        unique_experiences = []
+        # Only experiences at the same company starting on the same date can
+        # match, so titles are compared within those blocks
+        blocks: dict[tuple[str, str], list[int]] = {}
+        for i, exp in enumerate(experiences):
+            key = (
+                exp.get("company", "").lower().strip(),
+                exp.get("start_date", "").strip(),
+            )
+            blocks.setdefault(key, []).append(i)
+
+        clusters: dict[int, list[int]] = {}
+        for members in blocks.values():
+            if len(members) == 1:
+                clusters[members[0]] = members
+                continue
+            titles = [experiences[i].get("title", "").lower().strip() for i in members]
+            scores = cdist(
+                titles, titles, scorer=fuzz.ratio, processor=None, workers=-1
+            )
+            for cluster in _cluster(scores >= 85):
+                clusters[members[cluster[0]]] = [members[i] for i in cluster]
 
-        for exp in experiences:
-            company = exp.get("company", "").lower().strip()
-            title = exp.get("title", "").lower().strip()
-            start_date = exp.get("start_date", "").strip()
-            description = exp.get("description", "")
-
-            # Check for exact company+title+date match
-            is_duplicate = False
-            for unique_exp in unique_experiences:
-                unique_company = unique_exp.get("company", "").lower().strip()
-                unique_title = unique_exp.get("title", "").lower().strip()
-                unique_start = unique_exp.get("start_date", "").strip()
-
-                # Same company and similar title
-                if company == unique_company and fuzz.ratio(title, unique_title) >= 85:
-                    # Check if dates match or overlap
-                    if start_date == unique_start:
-                        # Merge descriptions (keep longer one)
-                        if len(description) > len(unique_exp.get("description", "")):
-                            unique_exp["description"] = description
-                            # Merge technologies
-                            unique_tech = set(unique_exp.get("technologies", []))
-                            new_tech = set(exp.get("technologies", []))
-                            unique_exp["technologies"] = list(unique_tech | new_tech)
-                        is_duplicate = True
-                        break
-
-            if not is_duplicate:
-                unique_experiences.append(exp)
+        unique_experiences = []
+        for first in sorted(clusters):
+            unique_exp = experiences[first]
+            for i in clusters[first][1:]:
+                exp = experiences[i]
+                description = exp.get("description", "")
+                # Merge descriptions (keep longer one)
+                if len(description) > len(unique_exp.get("description", "")):
+                    unique_exp["description"] = description
+                    # Merge technologies
+                    unique_tech = set(unique_exp.get("technologies", []))
+                    new_tech = set(exp.get("technologies", []))
+                    unique_exp["technologies"] = list(unique_tech | new_tech)
+            unique_experiences.append(unique_exp)
 
         return unique_experiences
 
@@ -311,101 +328,13 @@ class ResumeDeduplicatorService:
         if not projects:
             return []
 
-        # Generate embeddings for descriptions if semantic matching enabled
-        embeddings_map = {}
+        # Embed every description in one batch if semantic matching enabled
+        semantic = None
         if use_semantic and self.embedder:
-            for i, project in enumerate(projects):
-                desc = project.get("description", "")
-                if desc:
-                    try:
-                        embeddings_map[i] = self.embedder.encode(desc)
-                    except Exception as e:
-                        logger.debug(f"Failed to embed project {i}: {e}")
-
-        unique_projects = []
-
-        for i, project in enumerate(projects):
-            name = project.get("name", "").strip()
-            technologies = set(project.get("technologies", []))
-            current_embedding = embeddings_map.get(i)
-
-            # Check fuzzy match on name
-            is_duplicate = False
-            for j, unique_proj in enumerate(unique_projects):
-                unique_name = unique_proj.get("name", "").strip()
-                unique_tech = set(unique_proj.get("technologies", []))
-
-                # Check name similarity
-                name_similarity = fuzz.token_sort_ratio(name, unique_name)
-
-                # Check technology overlap (Jaccard similarity)
-                if technologies and unique_tech:
-                    tech_overlap = len(technologies & unique_tech) / len(
-                        technologies | unique_tech
-                    )
-                else:
-                    tech_overlap = 0
-
-                # Check semantic similarity of descriptions
-                semantic_similarity = 0.0
-                if current_embedding is not None:
-                    unique_embedding = embeddings_map.get(
-                        projects.index(unique_proj)
-                        if unique_proj in projects
-                        else None
-                    )
-                    if unique_embedding is not None:
-                        # Cosine similarity
-                        import numpy as np
-
-                        semantic_similarity = float(
-                            np.dot(current_embedding, unique_embedding)
-                            / (
-                                np.linalg.norm(current_embedding)
-                                * np.linalg.norm(unique_embedding)
-                            )
-                        )
-
-                # Duplicate if:
-                # 1. High name similarity (>= threshold)
-                # 2. Moderate name similarity (>= 60) + high tech overlap (>= 0.7)
-                # 3. High semantic similarity (>= 0.85) + some name/tech overlap
-                if (
-                    name_similarity >= threshold
-                    or (name_similarity >= 60 and tech_overlap >= 0.7)
-                    or (
-                        semantic_similarity >= 0.85
-                        and (name_similarity >= 50 or tech_overlap >= 0.5)
-                    )
-                ):
-                    # Merge descriptions (keep longer one)
-                    current_desc = project.get("description", "")
-                    unique_desc = unique_proj.get("description", "")
-                    if len(current_desc) > len(unique_desc):
-                        unique_proj["description"] = current_desc
-
-                    # Merge technologies
-                    unique_proj["technologies"] = list(unique_tech | technologies)
-
-                    # Prefer non-null dates
-                    if project.get("date") and not unique_proj.get("date"):
-                        unique_proj["date"] = project["date"]
-                    if project.get("url") and not unique_proj.get("url"):
-                        unique_proj["url"] = project["url"]
-
-                    logger.debug(
-                        f"Merged project '{name}' into '{unique_name}' "
-                        f"(name: {name_similarity}%, tech: {tech_overlap:.2f}, "
-                        f"semantic: {semantic_similarity:.2f})"
-                    )
-
-                    is_duplicate = True
-                    break
-
-            if not is_duplicate:
-                unique_projects.append(project)
+            semantic = self._description_similarity(projects)
 
-        return unique_projects
+        matches = self._project_matches(projects, threshold, semantic)
+        return self._merge_projects(projects, _cluster(matches))
 
     def deduplicate_projects(
         self, projects: list[dict[str, Any]], threshold: int = 80
@@ -422,54 +351,86 @@ class ResumeDeduplicatorService:
         if not projects:
             return []
 
-        unique_projects = []
-
-        for project in projects:
-            name = project.get("name", "").strip()
-            technologies = set(project.get("technologies", []))
+        matches = self._project_matches(projects, threshold)
+        return self._merge_projects(projects, _cluster(matches))
 
-            # Check fuzzy match on name
-            is_duplicate = False
-            for unique_proj in unique_projects:
-                unique_name = unique_proj.get("name", "").strip()
-                unique_tech = set(unique_proj.get("technologies", []))
-
-                # Check name similarity
-                name_similarity = fuzz.token_sort_ratio(name, unique_name)
+    def _description_similarity(
+        self, projects: list[dict[str, Any]]
+    ) -> np.ndarray | None:
+        """Cosine similarity of project descriptions; 0 where one is missing."""
+        described = [i for i, p in enumerate(projects) if p.get("description")]
+        if not described:
+            return None
+        try:
+            vectors = np.asarray(
+                self.embedder.encode(
+                    [projects[i]["description"] for i in described]
+                ),
+                dtype=np.float32,
+            )
+        except Exception as e:
+            logger.debug(f"Failed to embed project descriptions: {e}")
+            return None
 
-                # Check technology overlap
-                if technologies and unique_tech:
-                    tech_overlap = len(technologies & unique_tech) / len(
-                        technologies | unique_tech
-                    )
-                else:
-                    tech_overlap = 0
-
-                # Duplicate if high name similarity OR high tech overlap
-                if name_similarity >= threshold or (
-                    name_similarity >= 60 and tech_overlap >= 0.7
-                ):
-                    # Merge descriptions (keep longer one)
-                    current_desc = project.get("description", "")
-                    unique_desc = unique_proj.get("description", "")
-                    if len(current_desc) > len(unique_desc):
-                        unique_proj["description"] = current_desc
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms > 0, norms, 1)
+        similarity = np.zeros((len(projects), len(projects)), dtype=np.float32)
+        similarity[np.ix_(described, described)] = vectors @ vectors.T
+        return similarity
 
-                    # Merge technologies
-                    unique_proj["technologies"] = list(unique_tech | technologies)
+    def _project_matches(
+        self,
+        projects: list[dict[str, Any]],
+        threshold: int,
+        semantic: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Which pairs of projects are duplicates.
+
+        A pair matches with:
+        1. High name similarity (>= threshold)
+        2. Moderate name similarity (>= 60) + high tech overlap (>= 0.7)
+        3. High semantic similarity (>= 0.85) + some name/tech overlap
+        """
+        name = _score_matrix([p.get("name", "").strip() for p in projects])
+        tech = _jaccard_matrix([set(p.get("technologies", [])) for p in projects])
 
-                    # Prefer non-null dates
-                    if project.get("date") and not unique_proj.get("date"):
-                        unique_proj["date"] = project["date"]
-                    if project.get("url") and not unique_proj.get("url"):
-                        unique_proj["url"] = project["url"]
+        matches = (name >= threshold) | ((name >= 60) & (tech >= 0.7))
+        if semantic is not None:
+            matches |= (semantic >= 0.85) & ((name >= 50) | (tech >= 0.5))
+        return matches
 
-                    is_duplicate = True
-                    break
+    def _merge_projects(
+        self, projects: list[dict[str, Any]], clusters: list[list[int]]
+    ) -> list[dict[str, Any]]:
+        """Fold each cluster of duplicate projects into its first member."""
+        unique_projects = []
+        for cluster in clusters:
+            unique_proj = projects[cluster[0]]
+            for i in cluster[1:]:
+                project = projects[i]
+                # Merge descriptions (keep longer one)
+                current_desc = project.get("description", "")
+                unique_desc = unique_proj.get("description", "")
+                if len(current_desc) > len(unique_desc):
+                    unique_proj["description"] = current_desc
+
+                # Merge technologies
+                unique_proj["technologies"] = list(
+                    set(unique_proj.get("technologies", []))
+                    | set(project.get("technologies", []))
+                )
 
-            if not is_duplicate:
-                unique_projects.append(project)
+                # Prefer non-null dates
+                if project.get("date") and not unique_proj.get("date"):
+                    unique_proj["date"] = project["date"]
+                if project.get("url") and not unique_proj.get("url"):
+                    unique_proj["url"] = project["url"]
 
+                logger.debug(
+                    f"Merged project '{project.get('name', '')}' into "
+                    f"'{unique_proj.get('name', '')}'"
+                )
+            unique_projects.append(unique_proj)
         return unique_projects
 
     async def smart_deduplicate_async(
@@ -0,0 +1,184 @@
+"""Ranked full-text search across documents, issues and projects."""
+
+import re
+from types import SimpleNamespace
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from turbo.core.database.search_index import INDEXED_ENTITIES, TEXT_SEARCH_CONFIG
+from turbo.core.schemas.search import SearchResponse, SearchResult
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+
+_SQLITE_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+class SearchService:
+    """
+    Full-text search over the index built by ``install_search_index``.
+
+    Matching, ranking, counting and pagination all happen in SQL against
+    the index (GIN-indexed tsvectors ranked with ``ts_rank_cd`` on
+    PostgreSQL, FTS5 ranked with ``bm25`` on SQLite), and snippets are only
+    built for the returned page. Title matches outrank
+    body matches on both backends.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def search(
+        self,
+        query: str,
+        entity_types: list[str] | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> SearchResponse:
+        """Search entities, best match first."""
+        types = [t for t in (entity_types or INDEXED_ENTITIES) if t in INDEXED_ENTITIES]
+        empty = SearchResponse(query=query, results=[], total=0, limit=limit, offset=offset)
+        if not query.strip() or not types:
+            return empty
+
+        if self._session.bind.dialect.name == "postgresql":
+            rows = await self._search_postgres(query, types, limit, offset)
+        else:
+            match = self._sqlite_match_expression(query)
+            if not match:
+                return empty
+            rows = await self._search_sqlite(match, types, limit, offset)
+
+        results = [
+            SearchResult(
+                entity_type=row.entity_type,
+                entity_id=UUID(str(row.entity_id)),
+                title=row.title or "",
+                snippet=row.snippet or "",
+                rank=float(row.rank),
+            )
+            for row in rows
+        ]
+        total = rows[0].total if rows else await self._count_beyond_page(
+            query, types, offset
+        )
+        return SearchResponse(
+            query=query, results=results, total=total, limit=limit, offset=offset
+        )
+
+    async def search_ids(
+        self, query: str, entity_type: str, limit: int = 50
+    ) -> list[UUID]:
+        """Ids of one entity type's matches, best match first."""
+        response = await self.search(query, entity_types=[entity_type], limit=limit)
+        return [result.entity_id for result in response.results]
+
+    async def _count_beyond_page(self, query: str, types: list[str], offset: int) -> int:
+        """Total matches when the requested page is past the end."""
+        if offset == 0:
+            return 0
+        response = await self.search(query, entity_types=types, limit=1, offset=0)
+        return response.total
+
+    async def _search_postgres(
+        self, query: str, types: list[str], limit: int, offset: int
+    ):
+        selects = []
+        for entity_type in types:
+            table, title, body = INDEXED_ENTITIES[entity_type]
+            selects.append(
+                f"""
+                SELECT '{entity_type}' AS entity_type, t.id AS entity_id,
+                       t.{title} AS title, t.{body} AS body,
+                       ts_rank_cd(t.search_vector, q.query) AS rank
+                FROM {table} t, q
+                WHERE t.search_vector @@ q.query
+                """
+            )
+        matches = " UNION ALL ".join(selects)
+        statement = text(
+            f"""
+            WITH q AS (
+                SELECT websearch_to_tsquery('{TEXT_SEARCH_CONFIG}', :query) AS query
+            )
+            SELECT page.entity_type, page.entity_id, page.title, page.rank, page.total,
+                   ts_headline('{TEXT_SEARCH_CONFIG}', page.body, q.query,
+                               :headline_options) AS snippet
+            FROM (
+                SELECT hits.*, count(*) OVER () AS total
+                FROM ({matches}) hits
+                ORDER BY hits.rank DESC
+                LIMIT :limit OFFSET :offset
+            ) page, q
+            ORDER BY page.rank DESC
+            """
+        )
+        result = await self._session.execute(
+            statement,
+            {
+                "query": query,
+                "limit": limit,
+                "offset": offset,
+                "headline_options": (
+                    f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, "
+                    "MaxFragments=1, MaxWords=30, MinWords=10"
+                ),
+            },
+        )
+        return result.all()
+
+    async def _search_sqlite(
+        self, match: str, types: list[str], limit: int, offset: int
+    ):
+        # FTS5 auxiliary functions only work directly on the MATCH query, so
+        # rank in a subquery and build snippets for the page afterwards.
+        placeholders = ", ".join(f":type_{i}" for i in range(len(types)))
+        page_statement = text(
+            f"""
+            SELECT hits.*, count(*) OVER () AS total
+            FROM (
+                SELECT search_index.rowid AS row_id, r.entity_type, r.entity_id,
+                       search_index.title AS title,
+                       -bm25(search_index, 10.0, 1.0) AS rank
+                FROM search_index
+                JOIN search_index_rows r ON r.id = search_index.rowid
+                WHERE search_index MATCH :match
+                  AND r.entity_type IN ({placeholders})
+            ) hits
+            ORDER BY hits.rank DESC
+            LIMIT :limit OFFSET :offset
+            """
+        )
+        params = {"match": match, "limit": limit, "offset": offset}
+        params.update({f"type_{i}": entity_type for i, entity_type in enumerate(types)})
+        page = (await self._session.execute(page_statement, params)).all()
+        if not page:
+            return []
+
+        row_ids = ", ".join(str(int(row.row_id)) for row in page)
+        snippets = dict(
+            (
+                await self._session.execute(
+                    text(
+                        f"""
+                        SELECT rowid, snippet(search_index, 1, '{HIGHLIGHT_START}',
+                                              '{HIGHLIGHT_END}', '...', 16)
+                        FROM search_index
+                        WHERE search_index MATCH :match AND rowid IN ({row_ids})
+                        """
+                    ),
+                    {"match": match},
+                )
+            ).all()
+        )
+        return [
+            SimpleNamespace(**row._asdict(), snippet=snippets.get(row.row_id))
+            for row in page
+        ]
+
+    @staticmethod
+    def _sqlite_match_expression(query: str) -> str:
+        """Quote each word as an FTS5 prefix term so user input is never parsed as syntax."""
+        return " ".join(f'"{token}"*' for token in _SQLITE_TOKEN.findall(query))
@@ -1,19 +1,28 @@
 """Streaming service for real-time AI responses."""
 
+import asyncio
 import json
 import logging
 import os
+from dataclasses import dataclass
 from typing import AsyncGenerator
 from uuid import UUID
 
 import httpx
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from turbo.core.database.connection import get_db_session
+from turbo.core.database.connection import get_session_factory
+from turbo.core.models.settings import Setting
+from turbo.core.repositories.staff import StaffRepository
+from turbo.core.schemas.staff import StaffResponse
 from turbo.core.services.conversation_context import ConversationContextManager
 from turbo.core.services.conversation_memory import ConversationMemoryService
 from turbo.core.services.graph import GraphService
 from turbo.core.services.tools_registry import get_turbo_tools, filter_tools_by_capabilities
 from turbo.core.services.tool_executor import ToolExecutor
+from turbo.utils.exceptions import StaffNotFoundError
+from turbo.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -21,17 +30,17 @@ logger = logging.getLogger(__name__)
 TURBO_API_URL = os.getenv("TURBO_API_URL", "http://localhost:8001/api/v1")
 
 
-async def get_anthropic_api_key() -> str:
+async def get_anthropic_api_key(db: AsyncSession | None = None) -> str:
     """Retrieve Anthropic API key from database or environment."""
-    # Try to get from internal API endpoint (database)
+    # Try the settings table first
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{TURBO_API_URL}/settings/claude/api-key/raw")
-            if response.status_code == 200:
-                data = response.json()
-                api_key = data.get("api_key")
-                if api_key:
-                    return api_key
+        if db is not None:
+            api_key = await _get_stored_api_key(db)
+        else:
+            async with get_session_factory()() as session:
+                api_key = await _get_stored_api_key(session)
+        if api_key:
+            return api_key
     except Exception as e:
         logger.warning(f"Failed to get API key from database: {e}")
 
@@ -43,78 +52,70 @@ async def get_anthropic_api_key() -> str:
     raise ValueError("ANTHROPIC_API_KEY not configured. Please set it via the settings UI or environment variable.")
 
 
-async def get_streaming_response(
+async def _get_stored_api_key(db: AsyncSession) -> str | None:
+    result = await db.execute(select(Setting).where(Setting.key == "anthropic_api_key"))
+    setting = result.scalar_one_or_none()
+    return setting.value.get("api_key") if setting and setting.value else None
+
+
+@dataclass
+class ConversationPrompt:
+    """Everything needed to start a Claude request for one chat turn."""
+
+    entity: dict
+    system_prompt: str
+    user_prompt: str
+    tools: list[dict]
+    message_count: int
+
+
+async def build_conversation_prompt(
+    db: AsyncSession,
     entity_type: str,
     entity_id: UUID,
-    user_message_content: str
-) -> AsyncGenerator[str, None]:
+    user_message_content: str,
+    api_key: str
+) -> ConversationPrompt:
     """
-    Stream AI response for a conversation message.
+    Build the prompt for a chat turn from the database.
 
-    Args:
-        entity_type: Type of entity ("staff" - mentor is deprecated)
-        entity_id: UUID of the staff member
-        user_message_content: The user's message content
-
-    Yields:
-        String chunks of the AI response as they are generated
+    The staff member, conversation history and enhanced context are all
+    read through one session in this process.
     """
-    # Get API key from database or environment
-    ANTHROPIC_API_KEY = await get_anthropic_api_key()
-
-    # Fetch entity and build enhanced context
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        # Fetch staff member details
-        entity_response = await client.get(f"{TURBO_API_URL}/staff/{entity_id}")
-        entity_response.raise_for_status()
-        entity = entity_response.json()
-
-        # Get messages for context
-        messages_response = await client.get(
-            f"{TURBO_API_URL}/staff/{entity_id}/messages",
-            params={"limit": 100}
-        )
-        messages_response.raise_for_status()
-        messages_data = messages_response.json()
-        messages = messages_data.get("messages", [])
+    staff = await StaffRepository(db).get_by_id(entity_id)
+    if not staff:
+        raise StaffNotFoundError(entity_id)
+    entity = StaffResponse.model_validate(staff).model_dump(mode="json")
 
-    # Build enhanced context
-    async for db in get_db_session():
-        try:
-            graph_service = GraphService()
-            memory_service = ConversationMemoryService(db, ANTHROPIC_API_KEY)
-            context_manager = ConversationContextManager(db, memory_service, graph_service)
-
-            context = await context_manager.build_context(
-                entity_type=entity_type,
-                entity_id=entity_id,
-                current_message=user_message_content
-            )
-
-            # Trigger memory extraction every 10 messages
-            if len(messages) % 10 == 0 and len(messages) > 0:
-                await context_manager.trigger_memory_extraction(
-                    entity_type=entity_type,
-                    entity_id=entity_id
-                )
+    memory_service = ConversationMemoryService(db, api_key)
+    context_manager = ConversationContextManager(db, memory_service, GraphService())
 
-            break
-        except Exception as e:
-            logger.error(f"Failed to build enhanced context: {e}", exc_info=True)
-            context = None
-            break
+    # Build enhanced context
+    try:
+        context = await context_manager.build_context(
+            entity_type=entity_type,
+            entity_id=entity_id,
+            current_message=user_message_content
+        )
+    except Exception as e:
+        logger.error(f"Failed to build enhanced context: {e}", exc_info=True)
+        await db.rollback()
+        context = None
 
     # Build prompt from context
     from scripts.claude_webhook_server import build_enhanced_staff_prompt, build_basic_staff_prompt
 
     if context:
         user_prompt = build_enhanced_staff_prompt(entity, context)
+        message_count = context["total_message_count"]
     else:
         # Fallback to basic prompt
+        messages = await context_manager._get_messages(entity_type, entity_id, limit=100)
+        message_count = len(messages)
         conversation_lines = []
         for msg in messages[-20:]:
-            role = "User" if msg["message_type"] == "user" else "Staff"
-            conversation_lines.append(f"**{role}:** {msg['content']}\n")
+            role = "User" if msg.message_type == "user" else "Staff"
+            conversation_lines.append(f"**{role}:** {msg.content}\n")
         conversation_history = "\n".join(conversation_lines) if conversation_lines else "_No previous conversation_"
 
         user_prompt = build_basic_staff_prompt(entity, conversation_history)
@@ -140,6 +141,97 @@ async def get_streaming_response(
     entity_capabilities = entity.get("capabilities", [])
     filtered_tools = filter_tools_by_capabilities(all_tools, entity_capabilities)
 
+    return ConversationPrompt(
+        entity=entity,
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        tools=filtered_tools,
+        message_count=message_count,
+    )
+
+
+class MemoryExtractionWorker:
+    """
+    Runs conversation memory extraction in the background.
+
+    Extraction calls Claude and writes memories, so it runs on its own
+    session after the chat turn has started streaming. At most one
+    extraction per conversation runs at a time; requests while one is
+    running are dropped.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession] | None = None):
+        self._session_factory = session_factory
+        self._tasks: dict[tuple[str, UUID], asyncio.Task] = {}
+
+    def submit(self, entity_type: str, entity_id: UUID, api_key: str) -> asyncio.Task | None:
+        """Schedule extraction for a conversation unless one is already running."""
+        key = (entity_type, entity_id)
+        if key in self._tasks:
+            return None
+        task = asyncio.create_task(self._extract(entity_type, entity_id, api_key))
+        self._tasks[key] = task
+        task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return task
+
+    async def _extract(self, entity_type: str, entity_id: UUID, api_key: str) -> None:
+        session_factory = self._session_factory or get_session_factory()
+        try:
+            async with session_factory() as db:
+                memory_service = ConversationMemoryService(db, api_key)
+                context_manager = ConversationContextManager(db, memory_service)
+                await context_manager.trigger_memory_extraction(
+                    entity_type=entity_type,
+                    entity_id=entity_id
+                )
+        except Exception as e:
+            logger.error(f"Memory extraction failed for {entity_type} {entity_id}: {e}", exc_info=True)
+
+    async def stop(self) -> None:
+        """Cancel running extractions."""
+        for task in list(self._tasks.values()):
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+
+# Global singleton instance
+memory_extraction_worker = MemoryExtractionWorker()
+
+
+async def get_streaming_response(
+    entity_type: str,
+    entity_id: UUID,
+    user_message_content: str
+) -> AsyncGenerator[str, None]:
+    """
+    Stream AI response for a conversation message.
+
+    The prompt is built in-process on one short-lived session, which is
+    released before the Claude stream starts. Memory extraction (every 10
+    messages) runs in the background instead of delaying the first token.
+
+    Args:
+        entity_type: Type of entity ("staff" - mentor is deprecated)
+        entity_id: UUID of the staff member
+        user_message_content: The user's message content
+
+    Yields:
+        String chunks of the AI response as they are generated
+    """
+    async with get_session_factory()() as db:
+        # Get API key from database or environment
+        ANTHROPIC_API_KEY = await get_anthropic_api_key(db)
+        prompt = await build_conversation_prompt(
+            db, entity_type, entity_id, user_message_content, ANTHROPIC_API_KEY
+        )
+
+    # Trigger memory extraction every 10 messages
+    if prompt.message_count % 10 == 0 and prompt.message_count > 0:
+        memory_extraction_worker.submit(entity_type, entity_id, ANTHROPIC_API_KEY)
+
+    user_prompt = prompt.user_prompt
+    client = get_http_client()
+
     # Stream from Claude API
     headers = {
         "x-api-key": ANTHROPIC_API_KEY,
@@ -150,9 +242,9 @@ async def get_streaming_response(
     request_body = {
         "model": "claude-sonnet-4-5-20250929",
         "max_tokens": 4096,
-        "system": system_prompt,
+        "system": prompt.system_prompt,
         "messages": [{"role": "user", "content": user_prompt}],
-        "tools": filtered_tools,  # Add tools based on staff capabilities
+        "tools": prompt.tools,  # Add tools based on staff capabilities
         "stream": True  # Enable streaming
     }
 
@@ -164,158 +256,158 @@ async def get_streaming_response(
 
     # Maximum 5 tool use rounds to prevent infinite loops
     for round_num in range(5):
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            try:
-                async with client.stream(
-                    "POST",
-                    "https://api.anthropic.com/v1/messages",
-                    headers=headers,
-                    json=request_body
-                ) as response:
-                    # Check for HTTP errors
-                    if response.status_code != 200:
-                        # For streaming responses, read error from stream
-                        error_chunks = []
-                        async for chunk in response.aiter_bytes():
-                            error_chunks.append(chunk)
-                        error_text = b"".join(error_chunks).decode()
-                        logger.error(f"Claude API error {response.status_code}: {error_text}")
-                        yield f"\n\n_[Error: Claude API returned {response.status_code}. Check API key and request format.]_\n\n"
-                        return
-
-                    # Collect the full response
-                    assistant_content = []
-                    current_text = ""
-                    current_tool_use = None
-                    tool_input_json = ""
-
-                    # Parse SSE stream from Claude
-                    async for line in response.aiter_lines():
-                        if not line:
+        try:
+            async with client.stream(
+                "POST",
+                "https://api.anthropic.com/v1/messages",
+                headers=headers,
+                json=request_body,
+                timeout=120.0
+            ) as response:
+                # Check for HTTP errors
+                if response.status_code != 200:
+                    # For streaming responses, read error from stream
+                    error_chunks = []
+                    async for chunk in response.aiter_bytes():
+                        error_chunks.append(chunk)
+                    error_text = b"".join(error_chunks).decode()
+                    logger.error(f"Claude API error {response.status_code}: {error_text}")
+                    yield f"\n\n_[Error: Claude API returned {response.status_code}. Check API key and request format.]_\n\n"
+                    return
+
+                # Collect the full response
+                assistant_content = []
+                current_text = ""
+                current_tool_use = None
+                tool_input_json = ""
+
+                # Parse SSE stream from Claude
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+
+                    if line.startswith("data: "):
+                        data_str = line[6:]  # Remove "data: " prefix
+
+                        if data_str == "[DONE]":
+                            break
+
+                        try:
+                            data = json.loads(data_str)
+
+                            # Handle content block start
+                            if data.get("type") == "content_block_start":
+                                block = data.get("content_block", {})
+                                if block.get("type") == "text":
+                                    current_text = ""
+                                elif block.get("type") == "tool_use":
+                                    current_tool_use = {
+                                        "type": "tool_use",
+                                        "id": block.get("id"),
+                                        "name": block.get("name"),
+                                        "input": {}
+                                    }
+                                    tool_input_json = ""
+                                    # Notify user that tool is being used
+                                    yield f"\n\n_[Using tool: {block.get('name')}...]_\n\n"
+
+                            # Handle content deltas
+                            elif data.get("type") == "content_block_delta":
+                                delta = data.get("delta", {})
+
+                                if delta.get("type") == "text_delta":
+                                    # Stream text chunks
+                                    text = delta.get("text", "")
+                                    if text:
+                                        current_text += text
+                                        yield text
+
+                                elif delta.get("type") == "input_json_delta":
+                                    # Accumulate tool input JSON
+                                    tool_input_json += delta.get("partial_json", "")
+
+                            # Handle content block stop
+                            elif data.get("type") == "content_block_stop":
+                                if current_text:
+                                    assistant_content.append({
+                                        "type": "text",
+                                        "text": current_text
+                                    })
+                                    current_text = ""
+                                elif current_tool_use:
+                                    # Parse completed tool input
+                                    try:
+                                        current_tool_use["input"] = json.loads(tool_input_json)
+                                    except json.JSONDecodeError:
+                                        current_tool_use["input"] = {}
+                                    assistant_content.append(current_tool_use)
+                                    current_tool_use = None
+                                    tool_input_json = ""
+
+                        except json.JSONDecodeError:
+                            logger.warning(f"Failed to parse SSE data: {data_str}")
                             continue
 
-                        if line.startswith("data: "):
-                            data_str = line[6:]  # Remove "data: " prefix
-
-                            if data_str == "[DONE]":
-                                break
-
-                            try:
-                                data = json.loads(data_str)
-
-                                # Handle content block start
-                                if data.get("type") == "content_block_start":
-                                    block = data.get("content_block", {})
-                                    if block.get("type") == "text":
-                                        current_text = ""
-                                    elif block.get("type") == "tool_use":
-                                        current_tool_use = {
-                                            "type": "tool_use",
-                                            "id": block.get("id"),
-                                            "name": block.get("name"),
-                                            "input": {}
-                                        }
-                                        tool_input_json = ""
-                                        # Notify user that tool is being used
-                                        yield f"\n\n_[Using tool: {block.get('name')}...]_\n\n"
-
-                                # Handle content deltas
-                                elif data.get("type") == "content_block_delta":
-                                    delta = data.get("delta", {})
-
-                                    if delta.get("type") == "text_delta":
-                                        # Stream text chunks
-                                        text = delta.get("text", "")
-                                        if text:
-                                            current_text += text
-                                            yield text
-
-                                    elif delta.get("type") == "input_json_delta":
-                                        # Accumulate tool input JSON
-                                        tool_input_json += delta.get("partial_json", "")
-
-                                # Handle content block stop
-                                elif data.get("type") == "content_block_stop":
-                                    if current_text:
-                                        assistant_content.append({
-                                            "type": "text",
-                                            "text": current_text
-                                        })
-                                        current_text = ""
-                                    elif current_tool_use:
-                                        # Parse completed tool input
-                                        try:
-                                            current_tool_use["input"] = json.loads(tool_input_json)
-                                        except json.JSONDecodeError:
-                                            current_tool_use["input"] = {}
-                                        assistant_content.append(current_tool_use)
-                                        current_tool_use = None
-                                        tool_input_json = ""
-
-                            except json.JSONDecodeError:
-                                logger.warning(f"Failed to parse SSE data: {data_str}")
-                                continue
-
-                    # Check if any tools were used
-                    tool_uses = [block for block in assistant_content if block.get("type") == "tool_use"]
-
-                    if not tool_uses:
-                        # No tools used, we're done
-                        break
-
-                    # Execute tools and prepare next round
-                    tool_results = []
-                    for tool_use in tool_uses:
-                        tool_name = tool_use["name"]
-                        tool_input = tool_use["input"]
-                        tool_id = tool_use["id"]
-
-                        logger.info(f"Executing tool: {tool_name} with input: {tool_input}")
-                        result = await tool_executor.execute_tool(tool_name, tool_input)
-
-                        # Convert result to string and truncate if too large
-                        result_str = json.dumps(result)
-                        max_result_size = 10000  # 10k characters max per tool result
-
-                        if len(result_str) > max_result_size:
-                            # Truncate large results
-                            truncated_result = {
-                                "truncated": True,
-                                "size": len(result_str),
-                                "preview": result_str[:max_result_size],
-                                "message": f"Result too large ({len(result_str)} chars), showing first {max_result_size} chars"
-                            }
-                            result_content = json.dumps(truncated_result)
-                            logger.warning(f"Tool result truncated: {len(result_str)} chars -> {max_result_size} chars")
-                        else:
-                            result_content = result_str
-
-                        tool_results.append({
-                            "type": "tool_result",
-                            "tool_use_id": tool_id,
-                            "content": result_content
-                        })
-
-                        # Show tool result to user (truncated for display)
-                        display_result = result_str[:500] + "..." if len(result_str) > 500 else result_str
-                        yield f"_[Tool executed: {tool_name}]_\n\n"
-
-                    # Build next request with tool results
-                    conversation_messages.append({"role": "assistant", "content": assistant_content})
-                    conversation_messages.append({"role": "user", "content": tool_results})
-
-                    request_body["messages"] = conversation_messages
-
-            except httpx.HTTPStatusError as e:
-                # HTTP error from Claude API
-                logger.error(f"Claude API HTTP error: {e}", exc_info=True)
-                yield f"\n\n_[Error: Claude API request failed with status {e.response.status_code}]_\n\n"
-                return
-            except Exception as e:
-                # Other errors (timeout, network, etc.)
-                logger.error(f"Streaming error: {e}", exc_info=True)
-                yield f"\n\n_[Error: {str(e)}]_\n\n"
-                return
+                # Check if any tools were used
+                tool_uses = [block for block in assistant_content if block.get("type") == "tool_use"]
+
+                if not tool_uses:
+                    # No tools used, we're done
+                    break
+
+                # Execute tools and prepare next round
+                tool_results = []
+                for tool_use in tool_uses:
+                    tool_name = tool_use["name"]
+                    tool_input = tool_use["input"]
+                    tool_id = tool_use["id"]
+
+                    logger.info(f"Executing tool: {tool_name} with input: {tool_input}")
+                    result = await tool_executor.execute_tool(tool_name, tool_input)
+
+                    # Convert result to string and truncate if too large
+                    result_str = json.dumps(result)
+                    max_result_size = 10000  # 10k characters max per tool result
+
+                    if len(result_str) > max_result_size:
+                        # Truncate large results
+                        truncated_result = {
+                            "truncated": True,
+                            "size": len(result_str),
+                            "preview": result_str[:max_result_size],
+                            "message": f"Result too large ({len(result_str)} chars), showing first {max_result_size} chars"
+                        }
+                        result_content = json.dumps(truncated_result)
+                        logger.warning(f"Tool result truncated: {len(result_str)} chars -> {max_result_size} chars")
+                    else:
+                        result_content = result_str
+
+                    tool_results.append({
+                        "type": "tool_result",
+                        "tool_use_id": tool_id,
+                        "content": result_content
+                    })
+
+                    # Show tool result to user (truncated for display)
+                    display_result = result_str[:500] + "..." if len(result_str) > 500 else result_str
+                    yield f"_[Tool executed: {tool_name}]_\n\n"
+
+                # Build next request with tool results
+                conversation_messages.append({"role": "assistant", "content": assistant_content})
+                conversation_messages.append({"role": "user", "content": tool_results})
+
+                request_body["messages"] = conversation_messages
+
+        except httpx.HTTPStatusError as e:
+            # HTTP error from Claude API
+            logger.error(f"Claude API HTTP error: {e}", exc_info=True)
+            yield f"\n\n_[Error: Claude API request failed with status {e.response.status_code}]_\n\n"
+            return
+        except Exception as e:
+            # Other errors (timeout, network, etc.)
+            logger.error(f"Streaming error: {e}", exc_info=True)
+            yield f"\n\n_[Error: {str(e)}]_\n\n"
+            return
 
     # If we hit max rounds, warn user
     if round_num >= 4:
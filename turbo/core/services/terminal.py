@@ -17,10 +17,12 @@ from turbo.core.schemas.terminal import (
     TerminalSessionResponse,
     TerminalSessionUpdate,
 )
+from turbo.core.services.pty_bridge import PtyBridge
 
 # Global dict to store PTY processes across all service instances
 _active_sessions: Dict[str, ptyprocess.PtyProcess] = {}
 _session_tasks: Dict[str, asyncio.Task] = {}
+_bridges: Dict[str, PtyBridge] = {}
 
 
 class TerminalService:
@@ -32,6 +34,7 @@ class TerminalService:
         # Use global dicts instead of instance variables
         self.active_sessions = _active_sessions
         self.session_tasks = _session_tasks
+        self.bridges = _bridges
 
     async def create_session(
         self, create_data: TerminalSessionCreate
@@ -124,76 +127,19 @@ class TerminalService:
         sessions = result.scalars().all()
         return [TerminalSessionResponse.model_validate(s) for s in sessions]
 
-    async def write_to_session(self, session_id: str, data: str) -> bool:
+    async def write_to_session(self, session_id: str, data: str | bytes) -> bool:
         """Write data to terminal session."""
         pty = self.active_sessions.get(session_id)
         if not pty or not pty.isalive():
             return False
 
         try:
-            pty.write(data.encode("utf-8"))
+            pty.write(data.encode("utf-8") if isinstance(data, str) else data)
             # Don't update activity here - it causes database transaction conflicts
             return True
         except Exception:
             return False
 
-    async def read_from_session(
-        self, session_id: str, timeout: float = 0.1
-    ) -> Optional[str]:
-        """Read data from terminal session (non-blocking)."""
-        pty = self.active_sessions.get(session_id)
-        if not pty or not pty.isalive():
-            return None
-
-        try:
-            # Use os.read on the file descriptor in non-blocking mode
-            import os
-            import fcntl
-            import errno
-
-            # Get the file descriptor
-            fd = pty.fd
-
-            # Set non-blocking
-            flags = fcntl.fcntl(fd, fcntl.F_GETFL)
-            fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
-
-            # Read all available data in chunks until EAGAIN
-            chunks = []
-            read_count = 0
-            while True:
-                try:
-                    chunk = os.read(fd, 4096)
-                    read_count += 1
-                    if chunk:
-                        print(f"Read chunk {read_count}: {len(chunk)} bytes", flush=True)
-                        chunks.append(chunk)
-                    else:
-                        # Empty read means EOF
-                        print(f"Empty read on attempt {read_count}", flush=True)
-                        break
-                except OSError as e:
-                    # EAGAIN/EWOULDBLOCK means no more data available right now
-                    if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
-                        print(f"EAGAIN on attempt {read_count}, no data available", flush=True)
-                        break
-                    else:
-                        print(f"OSError reading from PTY: {e}", flush=True)
-                        break
-
-            if chunks:
-                data = b''.join(chunks)
-                print(f"Returning {len(data)} total bytes", flush=True)
-                # Don't update activity here - it causes database transaction conflicts
-                return data.decode("utf-8", errors="replace")
-            else:
-                print(f"No chunks read, returning None", flush=True)
-
-            return None
-        except Exception as e:
-            print(f"Exception reading from PTY: {type(e).__name__}: {e}", flush=True)
-            return None
-
     async def resize_session(self, session_id: str, rows: int, cols: int) -> bool:
         """Resize terminal session."""
         pty = self.active_sessions.get(session_id)
@@ -224,6 +170,10 @@ class TerminalService:
             # Remove from active sessions
             self.active_sessions.pop(session_id, None)
 
+        bridge = self.bridges.pop(session_id, None)
+        if bridge:
+            bridge.close()
+
         # Update database
         from sqlalchemy import select
 
@@ -266,3 +216,19 @@ class TerminalService:
     def get_pty(self, session_id: str) -> Optional[ptyprocess.PtyProcess]:
         """Get PTY process for a session (for WebSocket handlers)."""
         return self.active_sessions.get(session_id)
+
+    def get_bridge(self, session_id: str) -> Optional[PtyBridge]:
+        """Get the output bridge for a live session, starting it on first use.
+
+        One bridge serves every client of a session and outlives their
+        connections, so reconnecting clients can replay its scrollback.
+        """
+        pty = self.active_sessions.get(session_id)
+        if not pty or not pty.isalive():
+            return None
+
+        bridge = self.bridges.get(session_id)
+        if bridge is None or bridge.closed:
+            bridge = PtyBridge(pty.fd)
+            self.bridges[session_id] = bridge
+        return bridge
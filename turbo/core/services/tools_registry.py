@@ -255,7 +255,7 @@ def get_turbo_tools() -> list[dict[str, Any]]:
         },
         {
             "name": "get_work_queue",
-            "description": "Get all issues in the work queue, sorted by priority rank. Lower rank number = higher priority (rank 1 is most important). Only returns issues that have been explicitly ranked.",
+            "description": "Get all issues in the work queue, in queue order, most important first. work_rank is a sparse sort key (lower = higher priority), not a position. Only returns issues that have been explicitly ranked.",
             "input_schema": {
                 "type": "object",
                 "properties": {
@@ -283,7 +283,7 @@ def get_turbo_tools() -> list[dict[str, Any]]:
         },
         {
             "name": "get_next_issue",
-            "description": "Get THE next issue to work on. Returns the highest-ranked issue (work_rank=1) that is open or in_progress. Use this when asked 'what should I work on next' or 'work the next issue'. Returns null if no ranked issues exist.",
+            "description": "Get THE next issue to work on. Returns the first open or in_progress issue in the work queue. Use this when asked 'what should I work on next' or 'work the next issue'. Returns null if no ranked issues exist.",
             "input_schema": {
                 "type": "object",
                 "properties": {},
@@ -292,7 +292,7 @@ def get_turbo_tools() -> list[dict[str, Any]]:
         },
         {
             "name": "set_issue_rank",
-            "description": "Set the work queue rank for a specific issue. Rank 1 is highest priority. This manually positions an issue in the work queue.",
+            "description": "Move an issue to a position in the work queue. Position 1 is highest priority. This manually positions an issue in the work queue.",
             "input_schema": {
                 "type": "object",
                 "properties": {
@@ -302,7 +302,7 @@ def get_turbo_tools() -> list[dict[str, Any]]:
                     },
                     "work_rank": {
                         "type": "integer",
-                        "description": "New rank position (1=highest priority)"
+                        "description": "New queue position (1=highest priority)"
                     }
                 },
                 "required": ["issue_id", "work_rank"]
@@ -4,22 +4,30 @@ Transcription Service - Local audio-to-text transcription using Whisper.
 This service handles on-device transcription of podcast episodes using
 faster-whisper, a high-performance implementation of OpenAI's Whisper model,
 with speaker diarization using pyannote.audio.
+
+Decoding runs in a pool of worker processes, each holding its own loaded
+Whisper model, fed from a persisted job queue while the next episodes'
+audio downloads in the background.
 """
 
 import asyncio
 import logging
+import multiprocessing
 import os
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 from uuid import UUID
 
 import aiofiles
-import httpx
 from faster_whisper import WhisperModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
+logger = logging.getLogger(__name__)
+
 try:
     from pyannote.audio import Pipeline
     DIARIZATION_AVAILABLE = True
@@ -27,48 +35,46 @@ except ImportError:
     DIARIZATION_AVAILABLE = False
     logger.warning("pyannote.audio not available - speaker diarization disabled")
 
-from turbo.core.repositories.podcast import PodcastEpisodeRepository
-from turbo.core.models.podcast import PodcastEpisode
-
-logger = logging.getLogger(__name__)
+from turbo.core.models.podcast import PodcastEpisode, TranscriptionJob
+from turbo.core.repositories.podcast import (
+    PodcastEpisodeRepository,
+    TranscriptionJobRepository,
+)
+from turbo.utils.config import get_settings
+from turbo.utils.http_client import get_http_client
 
 
-class TranscriptionService:
+class WhisperTranscriber:
     """
-    Service for transcribing podcast episodes using local Whisper models.
+    Whisper model and diarization pipeline, with no database access.
 
-    Supports multiple model sizes: tiny, base, small, medium, large
-    - tiny: Fastest, lower quality (~1GB RAM)
-    - base: Fast, decent quality (~1.5GB RAM)
-    - small: Balanced speed/quality (~2GB RAM)
-    - medium: High quality, slower (~5GB RAM)
-    - large: Best quality, slowest (~10GB RAM)
+    Models load lazily on first use. Each TranscriptionWorkerPool process
+    keeps one instance for its lifetime, so a model is loaded once per
+    worker rather than once per episode.
     """
 
     def __init__(
         self,
-        session: AsyncSession,
         model_size: str = "base",
         device: str = "cpu",
         compute_type: str = "int8",
         enable_diarization: bool = True,
+        cpu_threads: int = 0,
     ):
         """
-        Initialize the transcription service.
+        Initialize the transcriber.
 
         Args:
-            session: Database session
             model_size: Whisper model size (tiny, base, small, medium, large)
             device: Device to run on ('cpu' or 'cuda')
             compute_type: Computation type for speed/accuracy tradeoff
-                         Options: int8, int8_float16, float16, float32
             enable_diarization: Enable speaker diarization (requires pyannote.audio)
+            cpu_threads: CTranslate2 threads for decoding (0 = library default)
         """
-        self.session = session
-        self.repository = PodcastEpisodeRepository(session)
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
         self.enable_diarization = enable_diarization and DIARIZATION_AVAILABLE
         self._model: Optional[WhisperModel] = None
         self._diarization_pipeline: Optional[Any] = None
@@ -89,6 +95,7 @@ class TranscriptionService:
                 self.model_size,
                 device=self.device,
                 compute_type=self.compute_type,
+                cpu_threads=self.cpu_threads,
             )
             logger.info("Whisper model loaded successfully")
         return self._model
@@ -119,39 +126,6 @@ class TranscriptionService:
 
         return self._diarization_pipeline
 
-    async def download_audio(
-        self, audio_url: str, temp_dir: Path
-    ) -> Path:
-        """
-        Download audio file from URL to temporary directory.
-
-        Args:
-            audio_url: URL of the audio file
-            temp_dir: Temporary directory to save audio
-
-        Returns:
-            Path to downloaded audio file
-
-        Raises:
-            httpx.HTTPError: If download fails
-        """
-        logger.info(f"Downloading audio from: {audio_url}")
-
-        # Extract filename from URL or use generic name
-        filename = audio_url.split("/")[-1].split("?")[0] or "audio.mp3"
-        audio_path = temp_dir / filename
-
-        async with httpx.AsyncClient(timeout=300.0, follow_redirects=True) as client:
-            response = await client.get(audio_url)
-            response.raise_for_status()
-
-            async with aiofiles.open(audio_path, "wb") as f:
-                await f.write(response.content)
-
-        file_size_mb = audio_path.stat().st_size / (1024 * 1024)
-        logger.info(f"Audio downloaded: {audio_path} ({file_size_mb:.2f} MB)")
-        return audio_path
-
     def transcribe_audio(
         self,
         audio_path: Path,
@@ -161,8 +135,8 @@ class TranscriptionService:
         """
         Transcribe audio file using Whisper model with speaker diarization.
 
-        This is a CPU-bound operation and runs in executor to avoid
-        blocking the async event loop.
+        This is a CPU-bound operation. TranscriptionService runs it in a
+        TranscriptionWorkerPool process so it never blocks the event loop.
 
         Args:
             audio_path: Path to audio file
@@ -361,6 +335,242 @@ class TranscriptionService:
 
         return speaker_labels
 
+
+# Per-process transcriber, created by _init_worker in each pool process
+_worker_transcriber: Optional[WhisperTranscriber] = None
+
+
+def _init_worker(config: dict[str, Any]) -> None:
+    """Create the worker process's transcriber (its model loads on first job)."""
+    global _worker_transcriber
+    _worker_transcriber = WhisperTranscriber(**config)
+
+
+def _transcribe_in_worker(
+    audio_path: str,
+    language: Optional[str],
+    beam_size: int,
+) -> tuple[str, dict[str, Any]]:
+    """Transcribe with the worker process's transcriber."""
+    return _worker_transcriber.transcribe_audio(Path(audio_path), language, beam_size)
+
+
+class TranscriptionWorkerPool:
+    """
+    Process pool running Whisper decoding, one loaded model per worker.
+
+    Cores are split between processes and CTranslate2 threads: by default
+    ``num_workers = cpu_count // cpu_threads``, so the pool fills the
+    machine without oversubscribing it. GPU pools default to one worker.
+    """
+
+    def __init__(
+        self,
+        model_size: str = "base",
+        device: str = "cpu",
+        compute_type: str = "int8",
+        enable_diarization: bool = True,
+        num_workers: Optional[int] = None,
+        cpu_threads: Optional[int] = None,
+    ):
+        """
+        Initialize the pool; worker processes start on first use.
+
+        Args:
+            model_size: Whisper model size
+            device: Device to run on
+            compute_type: Computation type
+            enable_diarization: Enable speaker diarization in workers
+            num_workers: Worker processes (defaults to settings)
+            cpu_threads: CTranslate2 threads per worker (defaults to settings)
+        """
+        settings = get_settings().transcription
+        self.cpu_threads = max(1, cpu_threads or settings.cpu_threads)
+        num_workers = num_workers or settings.num_workers
+        if not num_workers:
+            if device == "cpu":
+                num_workers = (os.cpu_count() or 1) // self.cpu_threads
+            else:
+                num_workers = 1
+        self.num_workers = max(1, num_workers)
+        self._config = {
+            "model_size": model_size,
+            "device": device,
+            "compute_type": compute_type,
+            "enable_diarization": enable_diarization,
+            "cpu_threads": self.cpu_threads,
+        }
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the worker processes if they are not running."""
+        if self._executor is None:
+            logger.info(
+                f"Starting {self.num_workers} transcription workers "
+                f"({self.cpu_threads} threads each)"
+            )
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.num_workers,
+                # Fresh interpreters: forking a process with live threads
+                # and an event loop is unsafe
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._config,),
+            )
+        return self._executor
+
+    async def transcribe(
+        self,
+        audio_path: Path,
+        language: Optional[str] = None,
+        beam_size: int = 5,
+    ) -> tuple[str, dict[str, Any]]:
+        """Transcribe an audio file in a worker process."""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._get_executor(),
+                _transcribe_in_worker,
+                str(audio_path),
+                language,
+                beam_size,
+            )
+        except BrokenProcessPool:
+            # A worker died (e.g. out of memory); start a fresh pool next time
+            self.shutdown(wait=False)
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+_worker_pools: dict[tuple, TranscriptionWorkerPool] = {}
+
+
+def get_transcription_pool(
+    model_size: str = "base",
+    device: str = "cpu",
+    compute_type: str = "int8",
+    enable_diarization: bool = True,
+) -> TranscriptionWorkerPool:
+    """Get the shared worker pool for a model configuration."""
+    key = (model_size, device, compute_type, enable_diarization)
+    if key not in _worker_pools:
+        _worker_pools[key] = TranscriptionWorkerPool(*key)
+    return _worker_pools[key]
+
+
+class TranscriptionService:
+    """
+    Service for transcribing podcast episodes using local Whisper models.
+
+    Supports multiple model sizes: tiny, base, small, medium, large
+    - tiny: Fastest, lower quality (~1GB RAM)
+    - base: Fast, decent quality (~1.5GB RAM)
+    - small: Balanced speed/quality (~2GB RAM)
+    - medium: High quality, slower (~5GB RAM)
+    - large: Best quality, slowest (~10GB RAM)
+    """
+
+    JOB_STATUSES = ("pending", "downloading", "transcribing", "completed", "failed")
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        model_size: str = "base",
+        device: str = "cpu",
+        compute_type: str = "int8",
+        enable_diarization: bool = True,
+        worker_pool: Optional[TranscriptionWorkerPool] = None,
+    ):
+        """
+        Initialize the transcription service.
+
+        Args:
+            session: Database session
+            model_size: Whisper model size (tiny, base, small, medium, large)
+            device: Device to run on ('cpu' or 'cuda')
+            compute_type: Computation type for speed/accuracy tradeoff
+                         Options: int8, int8_float16, float16, float32
+            enable_diarization: Enable speaker diarization (requires pyannote.audio)
+            worker_pool: Pool to decode in (defaults to the shared pool for
+                         this model configuration)
+        """
+        self.session = session
+        self.repository = PodcastEpisodeRepository(session)
+        self.job_repository = TranscriptionJobRepository(session)
+        self.model_size = model_size
+        self.device = device
+        self.compute_type = compute_type
+        self.enable_diarization = enable_diarization and DIARIZATION_AVAILABLE
+        self._worker_pool = worker_pool
+        self._transcriber: Optional[WhisperTranscriber] = None
+        # Serializes session use between concurrent job coroutines
+        self._db_lock = asyncio.Lock()
+
+    @property
+    def worker_pool(self) -> TranscriptionWorkerPool:
+        """Worker pool used for decoding."""
+        if self._worker_pool is None:
+            self._worker_pool = get_transcription_pool(
+                self.model_size, self.device, self.compute_type, self.enable_diarization
+            )
+        return self._worker_pool
+
+    async def download_audio(
+        self, audio_url: str, temp_dir: Path
+    ) -> Path:
+        """
+        Download audio file from URL to temporary directory.
+
+        Args:
+            audio_url: URL of the audio file
+            temp_dir: Temporary directory to save audio
+
+        Returns:
+            Path to downloaded audio file
+
+        Raises:
+            httpx.HTTPError: If download fails
+        """
+        logger.info(f"Downloading audio from: {audio_url}")
+
+        # Extract filename from URL or use generic name
+        filename = audio_url.split("/")[-1].split("?")[0] or "audio.mp3"
+        audio_path = temp_dir / filename
+
+        # Stream to disk over the shared client instead of buffering in memory
+        async with get_http_client().stream("GET", audio_url, timeout=300.0) as response:
+            response.raise_for_status()
+            async with aiofiles.open(audio_path, "wb") as f:
+                async for chunk in response.aiter_bytes():
+                    await f.write(chunk)
+
+        file_size_mb = audio_path.stat().st_size / (1024 * 1024)
+        logger.info(f"Audio downloaded: {audio_path} ({file_size_mb:.2f} MB)")
+        return audio_path
+
+    def transcribe_audio(
+        self,
+        audio_path: Path,
+        language: Optional[str] = None,
+        beam_size: int = 5,
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Transcribe an audio file in this process (blocking).
+
+        See WhisperTranscriber.transcribe_audio. Episode transcription goes
+        through the worker pool instead.
+        """
+        if self._transcriber is None:
+            self._transcriber = WhisperTranscriber(
+                self.model_size, self.device, self.compute_type, self.enable_diarization
+            )
+        return self._transcriber.transcribe_audio(audio_path, language, beam_size)
+
     async def transcribe_episode(
         self,
         episode_id: UUID,
@@ -406,14 +616,9 @@ class TranscriptionService:
             # Download audio
             audio_path = await self.download_audio(episode.audio_url, temp_path)
 
-            # Transcribe in executor (CPU-bound operation)
-            loop = asyncio.get_event_loop()
-            transcript, transcript_data = await loop.run_in_executor(
-                None,
-                self.transcribe_audio,
-                audio_path,
-                language,
-                beam_size,
+            # Transcribe in a worker process (CPU-bound operation)
+            transcript, transcript_data = await self.worker_pool.transcribe(
+                audio_path, language, beam_size
             )
 
         # Save transcript and structured data to database
@@ -436,7 +641,11 @@ class TranscriptionService:
         force: bool = False,
     ) -> dict[UUID, dict[str, any]]:
         """
-        Transcribe multiple episodes sequentially.
+        Transcribe multiple episodes in parallel through the job queue.
+
+        Episodes are queued as TranscriptionJobs and decoded by the worker
+        pool, one episode per worker, while the following episodes' audio
+        downloads. Progress survives restarts (see resume_jobs).
 
         Args:
             episode_ids: List of episode IDs to transcribe
@@ -454,31 +663,229 @@ class TranscriptionService:
                 }
             }
         """
-        results = {}
+        episode_ids = list(dict.fromkeys(episode_ids))
+        episodes = await self.repository.get_by_ids(episode_ids)
 
+        results = {}
+        to_queue = []
         for episode_id in episode_ids:
-            try:
-                episode = await self.transcribe_episode(
-                    episode_id, language, beam_size, force
+            episode = episodes.get(episode_id)
+            if not episode:
+                results[episode_id] = self._job_result(
+                    error=f"Episode not found: {episode_id}"
                 )
-                results[episode_id] = {
-                    "success": True,
-                    "episode": episode,
-                    "error": None,
-                }
-                logger.info(f"Successfully transcribed episode: {episode_id}")
-            except Exception as e:
-                results[episode_id] = {
-                    "success": False,
-                    "episode": None,
-                    "error": str(e),
-                }
-                logger.error(
-                    f"Failed to transcribe episode {episode_id}: {str(e)}"
+            elif not episode.audio_url:
+                results[episode_id] = self._job_result(
+                    error=f"Episode has no audio URL: {episode_id}"
+                )
+            elif episode.transcript_generated and not force:
+                results[episode_id] = self._job_result(episode=episode)
+            else:
+                to_queue.append(episode_id)
+
+        jobs = await self.enqueue_episodes(to_queue, language, beam_size)
+        for job in jobs:
+            if job.status != "pending":
+                results[job.episode_id] = self._job_result(
+                    error="Transcription already in progress"
                 )
+        results.update(
+            await self.run_jobs([job for job in jobs if job.status == "pending"])
+        )
+        return results
+
+    async def enqueue_episodes(
+        self,
+        episode_ids: list[UUID],
+        language: Optional[str] = None,
+        beam_size: int = 5,
+    ) -> list[TranscriptionJob]:
+        """
+        Queue episodes for transcription, reusing any unfinished job.
+
+        Args:
+            episode_ids: Episodes to queue
+            language: Language code for transcription
+            beam_size: Beam size for decoding quality
+
+        Returns:
+            One job per episode, in input order
+        """
+        episode_ids = list(dict.fromkeys(episode_ids))
+        jobs = await self.job_repository.get_active_by_episodes(episode_ids)
+        new_jobs = [
+            TranscriptionJob(
+                episode_id=episode_id,
+                status="pending",
+                model_size=self.model_size,
+                language=language,
+                beam_size=beam_size,
+                attempts=0,
+            )
+            for episode_id in episode_ids
+            if episode_id not in jobs
+        ]
+        if new_jobs:
+            self.session.add_all(new_jobs)
+            await self.session.commit()
+            jobs.update((job.episode_id, job) for job in new_jobs)
+        return [jobs[episode_id] for episode_id in episode_ids]
+
+    async def resume_jobs(self) -> dict[UUID, dict[str, Any]]:
+        """
+        Run every pending job, including ones interrupted by a restart.
+
+        Only call this when no other process is working the queue, since
+        jobs still marked as running are assumed to be abandoned.
+
+        Returns:
+            Results keyed by episode ID, as for transcribe_multiple_episodes
+        """
+        reset = await self.job_repository.reset_interrupted()
+        if reset:
+            logger.info(f"Resuming {reset} interrupted transcription jobs")
+        return await self.run_jobs(await self.job_repository.get_pending())
+
+    async def get_job_progress(self) -> dict[str, int]:
+        """
+        Count transcription jobs by status.
+
+        Returns:
+            Dictionary with a count per status and the total
+        """
+        counts = await self.job_repository.count_by_status()
+        progress = {status: counts.get(status, 0) for status in self.JOB_STATUSES}
+        progress["total"] = sum(counts.values())
+        return progress
+
+    async def run_jobs(
+        self, jobs: list[TranscriptionJob]
+    ) -> dict[UUID, dict[str, Any]]:
+        """
+        Download and transcribe queued jobs with the worker pool.
+
+        One coroutine downloads audio in queue order, at most ``prefetch``
+        episodes ahead, while one coroutine per worker process takes
+        downloaded episodes and decodes them. A failing job is recorded
+        and does not stop the others.
+
+        Args:
+            jobs: Pending jobs to run
+
+        Returns:
+            Results keyed by episode ID, as for transcribe_multiple_episodes
+        """
+        if not jobs:
+            return {}
+
+        episodes = await self.repository.get_by_ids([job.episode_id for job in jobs])
+        num_workers = self.worker_pool.num_workers
+        prefetch = get_settings().transcription.prefetch or num_workers
+        downloaded: asyncio.Queue = asyncio.Queue(maxsize=prefetch)
+        results: dict[UUID, dict[str, Any]] = {}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            async def download_all() -> None:
+                try:
+                    for job in jobs:
+                        audio = await self._download_job(
+                            job, episodes.get(job.episode_id), Path(temp_dir)
+                        )
+                        await downloaded.put((job, audio))
+                finally:
+                    for _ in range(num_workers):
+                        await downloaded.put(None)
+
+            async def transcribe_all() -> None:
+                while (item := await downloaded.get()) is not None:
+                    job, audio = item
+                    results[job.episode_id] = await self._transcribe_job(job, audio)
+
+            tasks = [
+                asyncio.ensure_future(download_all()),
+                *(asyncio.ensure_future(transcribe_all()) for _ in range(num_workers)),
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
 
         return results
 
+    async def _download_job(
+        self,
+        job: TranscriptionJob,
+        episode: Optional[PodcastEpisode],
+        temp_dir: Path,
+    ) -> Path | Exception:
+        """Mark a job as downloading and fetch its audio, returning any error."""
+        await self._update_job(
+            job,
+            status="downloading",
+            attempts=job.attempts + 1,
+            started_at=datetime.now(timezone.utc),
+            error_message=None,
+        )
+        try:
+            if not episode or not episode.audio_url:
+                raise ValueError(f"Episode has no audio URL: {job.episode_id}")
+            job_dir = temp_dir / str(job.id)
+            job_dir.mkdir()
+            return await self.download_audio(episode.audio_url, job_dir)
+        except Exception as e:
+            return e
+
+    async def _transcribe_job(
+        self, job: TranscriptionJob, audio: Path | Exception
+    ) -> dict[str, Any]:
+        """Decode a downloaded job in the pool and save the transcript."""
+        try:
+            if isinstance(audio, Exception):
+                raise audio
+            await self._update_job(job, status="transcribing")
+            try:
+                transcript, transcript_data = await self.worker_pool.transcribe(
+                    audio, job.language, job.beam_size
+                )
+            finally:
+                audio.unlink(missing_ok=True)
+
+            async with self._db_lock:
+                episode = await self.repository.add_transcript(
+                    job.episode_id, transcript, transcript_data
+                )
+                job.status = "completed"
+                job.completed_at = datetime.now(timezone.utc)
+                await self.session.commit()
+        except Exception as e:
+            logger.error(f"Failed to transcribe episode {job.episode_id}: {str(e)}")
+            await self._update_job(
+                job,
+                status="failed",
+                error_message=str(e),
+                completed_at=datetime.now(timezone.utc),
+            )
+            return self._job_result(error=str(e))
+
+        logger.info(f"Successfully transcribed episode: {job.episode_id}")
+        return self._job_result(episode=episode)
+
+    async def _update_job(self, job: TranscriptionJob, **values: Any) -> None:
+        """Persist job progress."""
+        async with self._db_lock:
+            for field, value in values.items():
+                setattr(job, field, value)
+            await self.session.commit()
+
+    @staticmethod
+    def _job_result(
+        episode: Optional[PodcastEpisode] = None, error: Optional[str] = None
+    ) -> dict[str, Any]:
+        """Build a per-episode result entry."""
+        return {"success": error is None, "episode": episode, "error": error}
+
     async def get_transcription_stats(self) -> dict[str, int]:
         """
         Get transcription statistics.
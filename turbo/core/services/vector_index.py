@@ -0,0 +1,271 @@
+"""In-process approximate nearest-neighbour index for knowledge graph embeddings.
+
+Used by GraphService when the Neo4j server has no native vector index
+(Neo4j < 5.11 or index creation not permitted). Vectors are L2-normalized
+and stored in one contiguous float32 matrix so a query is a single
+matrix-vector product. Past ``ivf_threshold`` rows the index trains a
+spherical k-means coarse quantizer (IVF) and only scores the ``nprobe``
+closest cells, which keeps top-k latency flat as the graph grows.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+IndexKey = tuple[str, str]  # (entity_type, entity_id)
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row of a matrix (zero rows are left as zeros)."""
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Return indices of the ``k`` highest scores, best first."""
+    if k <= 0 or scores.size == 0:
+        return np.empty(0, dtype=np.int64)
+    if k < scores.size:
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(scores.size)
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+class LocalVectorIndex:
+    """Incrementally maintained cosine-similarity index over entity embeddings."""
+
+    def __init__(
+        self,
+        ivf_threshold: int = 20_000,
+        nprobe: int = 16,
+        initial_capacity: int = 1024,
+    ) -> None:
+        """
+        Initialize an empty index.
+
+        Args:
+            ivf_threshold: Row count above which IVF partitioning is used
+            nprobe: Number of IVF cells scored per query
+            initial_capacity: Initial number of preallocated rows
+        """
+        self.ivf_threshold = ivf_threshold
+        self.nprobe = nprobe
+        self._initial_capacity = initial_capacity
+        self._reset()
+
+    def _reset(self) -> None:
+        self.loaded = False
+        self._dimensions: int | None = None
+        self._matrix = np.empty((0, 0), dtype=np.float32)
+        self._type_codes = np.empty(0, dtype=np.int32)
+        self._cells = np.empty(0, dtype=np.int32)
+        self._keys: list[IndexKey] = []
+        self._positions: dict[IndexKey, int] = {}
+        self._type_ids: dict[str, int] = {}
+
+        self._centroids: np.ndarray | None = None
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._positions
+
+    @property
+    def dimensions(self) -> int | None:
+        """Embedding dimensionality, fixed by the first inserted vector."""
+        return self._dimensions
+
+    @property
+    def is_partitioned(self) -> bool:
+        """Whether queries are currently served from IVF cells."""
+        return self._centroids is not None
+
+    def clear(self) -> None:
+        """Drop all vectors and the trained quantizer."""
+        self._reset()
+
+    def upsert(self, entity_type: str, entity_id: str, vector: list[float]) -> None:
+        """
+        Insert or replace the vector for an entity.
+
+        Args:
+            entity_type: Entity type (issue, project, document, ...)
+            entity_id: Entity ID as a string
+            vector: Embedding vector
+        """
+        row = normalize_rows(np.asarray(vector, dtype=np.float32))
+        if self._dimensions is None:
+            self._dimensions = row.shape[-1]
+            self._matrix = np.zeros(
+                (self._initial_capacity, self._dimensions), dtype=np.float32
+            )
+            self._type_codes = np.zeros(self._initial_capacity, dtype=np.int32)
+            self._cells = np.zeros(self._initial_capacity, dtype=np.int32)
+        elif row.shape[-1] != self._dimensions:
+            raise ValueError(
+                f"Vector has {row.shape[-1]} dimensions, index expects {self._dimensions}"
+            )
+
+        key = (entity_type, entity_id)
+        position = self._positions.get(key)
+        if position is None:
+            position = len(self._keys)
+            self._ensure_capacity(position + 1)
+            self._keys.append(key)
+            self._positions[key] = position
+
+        self._matrix[position] = row
+        self._type_codes[position] = self._type_ids.setdefault(
+            entity_type, len(self._type_ids)
+        )
+        if self._centroids is not None:
+            self._cells[position] = int(np.argmax(self._centroids @ row))
+
+        self._maybe_train()
+
+    def remove(self, entity_type: str, entity_id: str) -> bool:
+        """
+        Remove an entity's vector.
+
+        Returns:
+            True if the entity was indexed
+        """
+        position = self._positions.pop((entity_type, entity_id), None)
+        if position is None:
+            return False
+
+        last = len(self._keys) - 1
+        if position != last:
+            moved_key = self._keys[last]
+            self._matrix[position] = self._matrix[last]
+            self._type_codes[position] = self._type_codes[last]
+            self._cells[position] = self._cells[last]
+            self._keys[position] = moved_key
+            self._positions[moved_key] = position
+        self._keys.pop()
+        return True
+
+    def search(
+        self,
+        vector: list[float],
+        k: int,
+        entity_types: list[str] | None = None,
+        min_score: float = -1.0,
+        exclude: IndexKey | None = None,
+    ) -> list[tuple[str, str, float]]:
+        """
+        Find the entities most similar to a query vector.
+
+        Args:
+            vector: Query embedding
+            k: Maximum number of results
+            entity_types: Optional entity type filter (empty means no filter)
+            min_score: Minimum cosine similarity
+            exclude: Optional (entity_type, entity_id) to leave out
+
+        Returns:
+            List of (entity_type, entity_id, similarity) tuples, best first
+        """
+        size = len(self._keys)
+        if size == 0 or k <= 0:
+            return []
+
+        query = normalize_rows(np.asarray(vector, dtype=np.float32))
+        rows = self._candidate_rows(query)
+
+        if entity_types:
+            codes = [self._type_ids[t] for t in entity_types if t in self._type_ids]
+            if not codes:
+                return []
+            rows = rows[np.isin(self._type_codes[rows], codes)]
+
+        if exclude is not None and exclude in self._positions:
+            rows = rows[rows != self._positions[exclude]]
+
+        if rows.size == 0:
+            return []
+
+        scores = self._matrix[rows] @ query
+        results = []
+        for index in top_k_indices(scores, k):
+            score = float(scores[index])
+            if score < min_score:
+                break
+            entity_type, entity_id = self._keys[int(rows[index])]
+            results.append((entity_type, entity_id, score))
+        return results
+
+    def _candidate_rows(self, query: np.ndarray) -> np.ndarray:
+        """Rows worth scoring for a query: all rows, or the nprobe nearest cells."""
+        size = len(self._keys)
+        if self._centroids is None:
+            return np.arange(size)
+
+        cell_scores = self._centroids @ query
+        probes = top_k_indices(cell_scores, min(self.nprobe, len(cell_scores)))
+        return np.flatnonzero(np.isin(self._cells[:size], probes))
+
+    def _ensure_capacity(self, required: int) -> None:
+        capacity = self._matrix.shape[0]
+        if required <= capacity:
+            return
+        new_capacity = max(required, capacity * 2)
+        matrix = np.zeros((new_capacity, self._dimensions or 0), dtype=np.float32)
+        matrix[:capacity] = self._matrix
+        self._matrix = matrix
+        self._type_codes = np.resize(self._type_codes, new_capacity)
+        self._cells = np.resize(self._cells, new_capacity)
+
+    def _maybe_train(self) -> None:
+        """(Re)train the IVF quantizer when the index crosses a size threshold."""
+        size = len(self._keys)
+        if size < self.ivf_threshold:
+            return
+        if self._centroids is not None and size < self._trained_size * 4:
+            return
+        self.train()
+
+    def train(self, iterations: int = 10, seed: int = 0) -> None:
+        """
+        Train the IVF coarse quantizer with spherical k-means.
+
+        Args:
+            iterations: Number of k-means iterations
+            seed: Random seed for centroid initialization and sampling
+        """
+        size = len(self._keys)
+        if size == 0:
+            return
+
+        nlist = max(1, int(np.sqrt(size)))
+        rng = np.random.default_rng(seed)
+        data = self._matrix[:size]
+        sample = data[rng.choice(size, size=min(size, nlist * 64), replace=False)]
+        centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+
+        for _ in range(iterations):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            empty = ~np.any(sums, axis=1)
+            sums[empty] = centroids[empty]
+            centroids = normalize_rows(sums)
+
+        self._centroids = centroids.astype(np.float32)
+        chunk = 8192
+        for start in range(0, size, chunk):
+            block = data[start : start + chunk]
+            self._cells[start : start + len(block)] = np.argmax(
+                block @ self._centroids.T, axis=1
+            )
+        self._trained_size = size
+
+
+@lru_cache(maxsize=1)
+def get_entity_index() -> LocalVectorIndex:
+    """Get the process-wide local index of knowledge graph entities."""
+    return LocalVectorIndex()
@@ -0,0 +1,151 @@
+"""Background dispatcher that drains the webhook delivery outbox."""
+
+import asyncio
+import logging
+from collections import defaultdict
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from turbo.core.models.webhook import Webhook, WebhookDelivery
+from turbo.core.repositories.webhook import WebhookRepository
+from turbo.core.services.webhook_service import WebhookService, send_webhook
+from turbo.utils.config import WebhookSettings, get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class WebhookDispatcher:
+    """
+    Sends queued webhook deliveries outside the request cycle.
+
+    Each round leases due rows from ``webhook_deliveries``, groups them by
+    webhook (several events per request for webhooks with
+    ``batch_events``) and sends them over the shared HTTP pool, with at
+    most ``max_per_endpoint`` requests to one webhook and ``max_in_flight``
+    deliveries overall. Every request records its outcome in its own short
+    transaction, so a slow subscriber never holds up the others.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        settings: WebhookSettings | None = None,
+    ):
+        self._session_factory = session_factory
+        self._settings = settings or get_settings().webhook
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._sends: set[asyncio.Task] = set()
+        self._in_flight = 0
+        self._saturated = False
+        self._endpoint_limits: dict[UUID, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self._settings.max_per_endpoint)
+        )
+
+    def _sessions(self) -> async_sessionmaker[AsyncSession]:
+        if self._session_factory is None:
+            from turbo.core.database.connection import get_session_factory
+
+            self._session_factory = get_session_factory()
+        return self._session_factory
+
+    def wake(self) -> None:
+        """Scan the outbox now instead of at the next poll."""
+        self._wake.set()
+
+    async def start(self) -> None:
+        """Start the background dispatch loop."""
+        if self._task is None:
+            # Events are bound to the loop they are first awaited on
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop dispatching; unsent leased deliveries are retried after their lease."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for task in list(self._sends):
+            task.cancel()
+        await asyncio.gather(*self._sends, return_exceptions=True)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._wake.wait(), timeout=self._settings.poll_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+            try:
+                await self.dispatch_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Webhook dispatch round failed: {e}")
+
+    async def dispatch_due(self) -> list[asyncio.Task]:
+        """Lease due deliveries and start sending them; returns the send tasks."""
+        capacity = self._settings.max_in_flight - self._in_flight
+        if capacity <= 0:
+            return []
+
+        async with self._sessions()() as session:
+            deliveries = await WebhookRepository(session).claim_due_deliveries(
+                capacity, self._settings.lease_seconds
+            )
+        self._saturated = len(deliveries) == capacity
+        if not deliveries:
+            return []
+
+        tasks = []
+        for webhook, batch in self._group(deliveries):
+            self._in_flight += len(batch)
+            task = asyncio.create_task(self._deliver(webhook, batch))
+            self._sends.add(task)
+            task.add_done_callback(self._sends.discard)
+            tasks.append(task)
+        return tasks
+
+    def _group(
+        self, deliveries: list[WebhookDelivery]
+    ) -> list[tuple[Webhook, list[WebhookDelivery]]]:
+        """One request per delivery, or per chunk for batching webhooks."""
+        by_webhook: dict[UUID, list[WebhookDelivery]] = defaultdict(list)
+        for delivery in deliveries:
+            by_webhook[delivery.webhook_id].append(delivery)
+
+        requests = []
+        for batch in by_webhook.values():
+            webhook = batch[0].webhook
+            size = self._settings.max_batch_size if webhook.batch_events else 1
+            for start in range(0, len(batch), size):
+                requests.append((webhook, batch[start : start + size]))
+        return requests
+
+    async def _deliver(self, webhook: Webhook, deliveries: list[WebhookDelivery]) -> None:
+        try:
+            async with self._endpoint_limits[webhook.id]:
+                attempt = await send_webhook(webhook, deliveries)
+            async with self._sessions()() as session:
+                await WebhookService(WebhookRepository(session)).record_attempt(
+                    webhook, deliveries, attempt
+                )
+        except Exception as e:
+            logger.error(f"Failed to record delivery for webhook {webhook.id}: {e}")
+        finally:
+            self._in_flight -= len(deliveries)
+            if self._saturated:
+                # The last scan was cut short; freed capacity lets more through
+                self._wake.set()
+
+
+# Global singleton instance
+webhook_dispatcher = WebhookDispatcher()
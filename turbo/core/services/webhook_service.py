@@ -1,15 +1,16 @@
 """Webhook service for managing webhooks and emitting events."""
 
-import asyncio
 import hashlib
 import hmac
 import json
 import logging
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
-import httpx
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from turbo.core.models.webhook import Webhook, WebhookDelivery
 from turbo.core.repositories.webhook import WebhookRepository
@@ -18,11 +19,27 @@ from turbo.core.schemas.webhook import (
     WebhookUpdate,
     WebhookDeliveryCreate,
 )
+from turbo.utils.config import get_settings
 from turbo.utils.exceptions import WebhookNotFoundError
+from turbo.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
 
+@event.listens_for(Session, "after_commit")
+def _wake_dispatcher(session: Session) -> None:
+    # Deliveries queued in a caller's transaction become visible only now
+    if session.info.pop("webhook_deliveries_queued", False):
+        from turbo.core.services.webhook_dispatcher import webhook_dispatcher
+
+        webhook_dispatcher.wake()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_queued_deliveries(session: Session) -> None:
+    session.info.pop("webhook_deliveries_queued", None)
+
+
 class WebhookService:
     """Service for webhook operations and event emission."""
 
@@ -75,11 +92,21 @@ class WebhookService:
             webhook_id, limit=limit, offset=offset
         )
 
-    async def emit_event(self, event_type: str, payload: dict) -> None:
+    async def emit_event(
+        self, event_type: str, payload: dict, commit: bool = True
+    ) -> list[WebhookDelivery]:
         """
         Emit an event to all subscribed webhooks.
 
         This is the core event emission system that triggers webhooks.
+        Deliveries are written to the outbox (webhook_deliveries) and sent
+        by the background dispatcher, so the caller never waits on
+        subscribers.
+
+        Callers that change an entity should pass ``commit=False`` and emit
+        before their own commit: the deliveries are then written in the
+        same transaction, so the change and its event are kept or lost
+        together. The dispatcher is woken once the transaction commits.
         """
         logger.info(f"Emitting event: {event_type}")
 
@@ -88,143 +115,83 @@ class WebhookService:
         logger.info(f"Found {len(webhooks)} webhooks subscribed to {event_type}")
 
         if not webhooks:
-            return
-
-        # Fire webhooks asynchronously
-        tasks = [
-            self._fire_webhook(webhook, event_type, payload)
-            for webhook in webhooks
-        ]
-        await asyncio.gather(*tasks, return_exceptions=True)
+            return []
 
-    async def _fire_webhook(
-        self, webhook: Webhook, event_type: str, payload: dict
-    ) -> None:
-        """
-        Fire a single webhook with retry logic.
-
-        This creates a delivery record and attempts to send the webhook.
-        """
-        # Create delivery record
-        delivery = await self._repository.create_delivery(
-            WebhookDeliveryCreate(
-                webhook_id=webhook.id,
-                event_type=event_type,
-                payload=payload,
-                status="pending",
-            )
+        # Flag before writing, so a commit inside enqueue_deliveries wakes too
+        self._repository._session.info["webhook_deliveries_queued"] = True
+        return await self._repository.enqueue_deliveries(
+            webhooks, event_type, payload, commit=commit
         )
 
-        # Attempt delivery
-        await self._attempt_delivery(webhook, delivery)
-
-    async def _attempt_delivery(
-        self, webhook: Webhook, delivery: WebhookDelivery
+    async def record_attempt(
+        self,
+        webhook: Webhook,
+        deliveries: list[WebhookDelivery],
+        attempt: "DeliveryAttempt",
     ) -> None:
-        """
-        Attempt to deliver a webhook.
-
-        Handles HTTP request, HMAC signing, retries, and status updates.
-        """
-        try:
-            # Prepare payload
-            payload_json = json.dumps(delivery.payload)
-
-            # Generate HMAC signature
-            signature = self._generate_signature(payload_json, webhook.secret)
-
-            # Prepare headers
-            headers = {
-                "Content-Type": "application/json",
-                "X-Webhook-Signature": signature,
-                "X-Webhook-Event": delivery.event_type,
-                "X-Webhook-Delivery-Id": str(delivery.id),
-                **(webhook.headers or {}),
-            }
-
-            # Send webhook
-            async with httpx.AsyncClient(timeout=webhook.timeout_seconds) as client:
-                response = await client.post(
-                    webhook.url,
-                    content=payload_json,
-                    headers=headers,
-                )
-
-                # Update delivery status
-                if response.status_code >= 200 and response.status_code < 300:
-                    # Success
-                    await self._repository.update_delivery_status(
-                        delivery.id,
-                        status="success",
-                        response_status_code=response.status_code,
-                        response_body=response.text[:1000],  # Limit response size
-                        delivered_at=datetime.now(),
-                    )
-                    logger.info(
-                        f"Webhook {webhook.id} delivered successfully (status {response.status_code})"
-                    )
-                else:
-                    # Failed but might retry
-                    await self._handle_failed_delivery(
-                        webhook, delivery, response.status_code, response.text
-                    )
-
-        except Exception as e:
-            logger.error(f"Error delivering webhook {webhook.id}: {str(e)}")
-            await self._handle_failed_delivery(
-                webhook, delivery, error_message=str(e)
+        """Store the outcome of one request carrying ``deliveries``."""
+        response_body = attempt.response_body[:1000] if attempt.response_body else None
+
+        if attempt.succeeded:
+            delivered_at = datetime.now(timezone.utc)
+            await self._repository.save_delivery_results(
+                [
+                    {
+                        "id": delivery.id,
+                        "status": "success",
+                        "response_status_code": attempt.status_code,
+                        "response_body": response_body,
+                        "error_message": None,
+                        "delivered_at": delivered_at,
+                        "next_retry_at": None,
+                    }
+                    for delivery in deliveries
+                ]
             )
+            logger.info(
+                f"Webhook {webhook.id} delivered {len(deliveries)} event(s) (status {attempt.status_code})"
+            )
+            return
 
-    async def _handle_failed_delivery(
+        await self._repository.save_delivery_results(
+            [
+                self._handle_failed_delivery(webhook, delivery, attempt, response_body)
+                for delivery in deliveries
+            ]
+        )
+
+    def _handle_failed_delivery(
         self,
         webhook: Webhook,
         delivery: WebhookDelivery,
-        response_status_code: int | None = None,
-        response_body: str | None = None,
-        error_message: str | None = None,
-    ) -> None:
-        """Handle failed webhook delivery with retry logic."""
-        # Increment attempt number
-        delivery.attempt_number += 1
-
-        if delivery.attempt_number <= webhook.max_retries:
+        attempt: "DeliveryAttempt",
+        response_body: str | None,
+    ) -> dict:
+        """Build the retry or give-up update for a failed delivery."""
+        attempt_number = delivery.attempt_number + 1
+        values = {
+            "id": delivery.id,
+            "attempt_number": attempt_number,
+            "response_status_code": attempt.status_code,
+            "response_body": response_body,
+            "error_message": attempt.error_message,
+        }
+
+        if attempt_number <= webhook.max_retries:
             # Schedule retry with exponential backoff
-            retry_delay = 2 ** (delivery.attempt_number - 1) * 60  # Minutes
-            next_retry = datetime.now() + timedelta(minutes=retry_delay)
-
-            await self._repository.update_delivery_status(
-                delivery.id,
-                status="retrying",
-                response_status_code=response_status_code,
-                response_body=response_body[:1000] if response_body else None,
-                error_message=error_message,
-                next_retry_at=next_retry,
+            next_retry = datetime.now(timezone.utc) + timedelta(
+                seconds=retry_delay_seconds(attempt_number - 1)
             )
             logger.warning(
-                f"Webhook {webhook.id} failed (attempt {delivery.attempt_number}/{webhook.max_retries}), "
+                f"Webhook {webhook.id} failed (attempt {attempt_number}/{webhook.max_retries}), "
                 f"retrying at {next_retry}"
             )
-        else:
-            # Max retries exceeded
-            await self._repository.update_delivery_status(
-                delivery.id,
-                status="failed",
-                response_status_code=response_status_code,
-                response_body=response_body[:1000] if response_body else None,
-                error_message=error_message,
-            )
-            logger.error(
-                f"Webhook {webhook.id} failed permanently after {delivery.attempt_number} attempts"
-            )
+            return {**values, "status": "retrying", "next_retry_at": next_retry}
 
-    def _generate_signature(self, payload: str, secret: str) -> str:
-        """Generate HMAC-SHA256 signature for webhook payload."""
-        signature = hmac.new(
-            secret.encode("utf-8"),
-            payload.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
-        return f"sha256={signature}"
+        logger.error(
+            f"Webhook {webhook.id} failed permanently after {attempt_number} attempts"
+        )
+        return {**values, "status": "failed", "next_retry_at": None}
 
     async def test_webhook(self, webhook_id: UUID, test_payload: dict | None = None) -> WebhookDelivery:
         """Test fire a webhook with a test payload."""
@@ -247,11 +214,93 @@ class WebhookService:
             )
         )
 
-        # Fire webhook
-        await self._attempt_delivery(webhook, delivery)
+        # Fire webhook now so the caller sees the result
+        attempt = await send_webhook(webhook, [delivery])
+        await self.record_attempt(webhook, [delivery], attempt)
 
         # Refresh and return delivery
-        return await self._repository._session.get(WebhookDelivery, delivery.id)
+        await self._repository._session.refresh(delivery)
+        return delivery
+
+
+@dataclass
+class DeliveryAttempt:
+    """Result of one HTTP request to a webhook endpoint."""
+
+    status_code: int | None = None
+    response_body: str | None = None
+    error_message: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status_code is not None and 200 <= self.status_code < 300
+
+
+def retry_delay_seconds(retry: int) -> int:
+    """Backoff before the given retry (0-based): base * 2**retry, capped."""
+    settings = get_settings().webhook
+    return min(settings.retry_base_seconds * 2**retry, settings.retry_max_seconds)
+
+
+def generate_signature(payload: str, secret: str) -> str:
+    """Generate HMAC-SHA256 signature for webhook payload."""
+    signature = hmac.new(
+        secret.encode("utf-8"),
+        payload.encode("utf-8"),
+        hashlib.sha256,
+    ).hexdigest()
+    return f"sha256={signature}"
+
+
+async def send_webhook(
+    webhook: Webhook, deliveries: list[WebhookDelivery]
+) -> DeliveryAttempt:
+    """
+    POST deliveries to a webhook over the shared connection pool.
+
+    Webhooks with ``batch_events`` always receive an ``{"events": [...]}``
+    envelope; others get exactly one delivery's payload as the body. Never
+    raises: transport errors are returned as a failed attempt.
+    """
+    if webhook.batch_events:
+        body = {
+            "events": [
+                {
+                    "delivery_id": str(delivery.id),
+                    "event_type": delivery.event_type,
+                    "payload": delivery.payload,
+                }
+                for delivery in deliveries
+            ]
+        }
+        event_type = "batch"
+    else:
+        (delivery,) = deliveries
+        body = delivery.payload
+        event_type = delivery.event_type
+
+    payload_json = json.dumps(body)
+    headers = {
+        "Content-Type": "application/json",
+        "X-Webhook-Signature": generate_signature(payload_json, webhook.secret),
+        "X-Webhook-Event": event_type,
+        "X-Webhook-Delivery-Id": ",".join(str(delivery.id) for delivery in deliveries),
+        **(webhook.headers or {}),
+    }
+
+    try:
+        response = await get_http_client().post(
+            webhook.url,
+            content=payload_json,
+            headers=headers,
+            timeout=webhook.timeout_seconds,
+            follow_redirects=False,
+        )
+    except Exception as e:
+        logger.error(f"Error delivering webhook {webhook.id}: {str(e)}")
+        return DeliveryAttempt(error_message=str(e) or type(e).__name__)
+
+    return DeliveryAttempt(status_code=response.status_code, response_body=response.text)
 
 
 def create_webhook_service(session: AsyncSession) -> WebhookService:
@@ -1,72 +1,308 @@
-"""WebSocket connection manager for real-time updates."""
+"""WebSocket connection manager for real-time updates.
 
-from typing import Dict, List, Set
-from fastapi import WebSocket
+Broadcasts never wait on a socket. Each message is serialized once and
+placed on every recipient's bounded send queue, which a per-connection
+writer task drains. A slow client therefore only delays itself; when its
+queue fills up it either loses its oldest pending messages or is
+disconnected, depending on ``WEBSOCKET_SLOW_CONSUMER_POLICY``.
+
+Messages that only report the latest state (typing indicators, agent status
+updates) carry a coalescing key. If one with the same key is still waiting
+in a client's queue it is replaced in place rather than queued again.
+
+With several API workers, every broadcast is also published through the
+bound ``BroadcastBackend`` so peer workers deliver it to their sockets.
+"""
+
+import asyncio
+from collections import deque
+from dataclasses import asdict, dataclass
 import json
 import logging
+from typing import Any, Deque, Dict, Optional, Set
+
+from fastapi import WebSocket
+
+from turbo.core.services.broadcast_backend import BroadcastBackend
+from turbo.utils.config import WebSocketSettings, get_settings
 
 logger = logging.getLogger(__name__)
 
+AGENT_ACTIVITY_ROOM = "agents:activity"
+
+# Backend channel prefix for room broadcasts
+ROOM_CHANNEL_PREFIX = "ws:"
+
+# Close code for clients dropped because they could not keep up
+SLOW_CONSUMER_CLOSE_CODE = 1013  # Try Again Later
+
+# Socket closes still in flight; held so they aren't collected mid-close
+_closing: Set[asyncio.Task] = set()
+
+
+def serialize_message(message: dict) -> str:
+    """Encode a message once for every recipient."""
+    return json.dumps(message, default=str)
+
+
+@dataclass
+class ConnectionMetrics:
+    """Delivery counters for one connection."""
+
+    sent: int = 0
+    bytes_sent: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+
+
+@dataclass
+class RoomMetrics:
+    """Delivery counters for one room."""
+
+    broadcasts: int = 0
+    enqueued: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    slow_disconnects: int = 0
+
+
+class _Outbound:
+    """A queued payload; mutable so a coalesced update can replace it in place."""
+
+    __slots__ = ("payload", "coalesce_key")
+
+    def __init__(self, payload: str, coalesce_key: Optional[str]):
+        self.payload = payload
+        self.coalesce_key = coalesce_key
+
+
+class ClientConnection:
+    """One socket with its bounded send queue and writer task."""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        room_key: str,
+        room_metrics: RoomMetrics,
+        settings: WebSocketSettings,
+        on_close,
+    ):
+        self.websocket = websocket
+        self.room_key = room_key
+        self.metrics = ConnectionMetrics()
+        self._room_metrics = room_metrics
+        self._settings = settings
+        self._on_close = on_close
+        self._queue: Deque[_Outbound] = deque()
+        self._pending: Dict[str, _Outbound] = {}
+        self._ready = asyncio.Event()
+        self._closed = False
+        self._task = asyncio.create_task(self._drain())
+
+    @property
+    def closed(self) -> bool:
+        """Whether the connection has stopped accepting messages."""
+        return self._closed
+
+    def enqueue(self, payload: str, coalesce_key: Optional[str] = None) -> None:
+        """Queue a serialized message without waiting for the socket."""
+        if self._closed:
+            return
+
+        if coalesce_key is not None:
+            queued = self._pending.get(coalesce_key)
+            if queued is not None:
+                queued.payload = payload
+                self.metrics.coalesced += 1
+                self._room_metrics.coalesced += 1
+                return
+
+        if len(self._queue) >= self._settings.send_queue_size:
+            if self._settings.slow_consumer_policy == "disconnect":
+                logger.warning(f"Disconnecting slow client in {self.room_key}")
+                self._room_metrics.slow_disconnects += 1
+                self.close(code=SLOW_CONSUMER_CLOSE_CODE)
+                return
+            oldest = self._queue.popleft()
+            if oldest.coalesce_key is not None:
+                self._pending.pop(oldest.coalesce_key, None)
+            self.metrics.dropped += 1
+            self._room_metrics.dropped += 1
+
+        outbound = _Outbound(payload, coalesce_key)
+        self._queue.append(outbound)
+        if coalesce_key is not None:
+            self._pending[coalesce_key] = outbound
+        self._room_metrics.enqueued += 1
+        self.metrics.queue_depth = len(self._queue)
+        self.metrics.max_queue_depth = max(
+            self.metrics.max_queue_depth, self.metrics.queue_depth
+        )
+        self._ready.set()
+
+    def close(self, code: Optional[int] = None) -> None:
+        """Stop the writer and detach from the manager.
+
+        With ``code`` the socket itself is closed too; otherwise the caller
+        owns the socket (e.g. it has already disconnected).
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.clear()
+        self._pending.clear()
+        self.metrics.queue_depth = 0
+        self._on_close(self)
+
+        if asyncio.current_task() is not self._task:
+            self._task.cancel()
+        if code is not None:
+            task = asyncio.create_task(self._close_socket(code))
+            _closing.add(task)
+            task.add_done_callback(_closing.discard)
+
+    async def _close_socket(self, code: int) -> None:
+        try:
+            await self.websocket.close(code=code)
+        except Exception as e:
+            logger.debug(f"Error closing websocket in {self.room_key}: {e}")
+
+    async def _drain(self) -> None:
+        """Send queued payloads in order until the connection closes."""
+        try:
+            while not self._closed:
+                if not self._queue:
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+                outbound = self._queue.popleft()
+                if outbound.coalesce_key is not None:
+                    self._pending.pop(outbound.coalesce_key, None)
+                self.metrics.queue_depth = len(self._queue)
+
+                await asyncio.wait_for(
+                    self.websocket.send_text(outbound.payload),
+                    timeout=self._settings.send_timeout,
+                )
+                self.metrics.sent += 1
+                self.metrics.bytes_sent += len(outbound.payload)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Error sending message to client in {self.room_key}: {e}")
+            self.close(code=SLOW_CONSUMER_CLOSE_CODE)
+
 
 class ConnectionManager:
     """Manages WebSocket connections for real-time updates."""
 
-    def __init__(self):
-        # Dict mapping entity keys to sets of active connections
-        # Key format: "entity_type:entity_id"
-        self.active_connections: Dict[str, Set[WebSocket]] = {}
+    def __init__(self, settings: Optional[WebSocketSettings] = None):
+        self._settings = settings or get_settings().websocket
 
-        # Global agent activity connections
-        self.agent_activity_connections: Set[WebSocket] = set()
+        # Room key -> connections in that room
+        # Key format: "entity_type:entity_id"
+        self.rooms: Dict[str, Dict[WebSocket, ClientConnection]] = {}
+        self.room_metrics: Dict[str, RoomMetrics] = {}
+        self._backend: Optional[BroadcastBackend] = None
+
+    def bind_backend(self, backend: BroadcastBackend) -> None:
+        """Publish broadcasts to peer workers and deliver theirs locally."""
+        self._backend = backend
+        backend.subscribe(ROOM_CHANNEL_PREFIX, self._on_peer_message)
+
+    def _on_peer_message(self, room_key: str, data: dict) -> None:
+        self._fan_out(room_key, data["payload"], data.get("coalesce_key"))
+
+    def _publish(
+        self, room_key: str, payload: str, coalesce_key: Optional[str]
+    ) -> None:
+        """Deliver to local sockets, then hand the same payload to peers."""
+        self._fan_out(room_key, payload, coalesce_key)
+        if self._backend is not None:
+            self._backend.publish(
+                ROOM_CHANNEL_PREFIX + room_key,
+                {"payload": payload, "coalesce_key": coalesce_key},
+            )
 
     def _get_room_key(self, entity_type: str, entity_id: str) -> str:
         """Generate room key for entity."""
         return f"{entity_type}:{entity_id}"
 
-    async def connect(self, websocket: WebSocket, entity_type: str, entity_id: str):
-        """Accept new WebSocket connection and add to room."""
+    async def _join(self, websocket: WebSocket, room_key: str) -> ClientConnection:
         await websocket.accept()
-        room_key = self._get_room_key(entity_type, entity_id)
-
-        if room_key not in self.active_connections:
-            self.active_connections[room_key] = set()
+        metrics = self.room_metrics.setdefault(room_key, RoomMetrics())
+        connection = ClientConnection(
+            websocket, room_key, metrics, self._settings, self._remove
+        )
+        self.rooms.setdefault(room_key, {})[websocket] = connection
+        logger.info(
+            f"Client connected to {room_key}. Total connections: {len(self.rooms[room_key])}"
+        )
+        return connection
+
+    def _leave(self, websocket: WebSocket, room_key: str) -> None:
+        connection = self.rooms.get(room_key, {}).get(websocket)
+        if connection is not None:
+            connection.close()
+
+    def _remove(self, connection: ClientConnection) -> None:
+        """Detach a closed connection; empty rooms are cleaned up."""
+        room = self.rooms.get(connection.room_key)
+        if room is None or room.get(connection.websocket) is not connection:
+            return
+        del room[connection.websocket]
+        logger.info(
+            f"Client disconnected from {connection.room_key}. Total connections: {len(room)}"
+        )
+        if not room:
+            del self.rooms[connection.room_key]
+            self.room_metrics.pop(connection.room_key, None)
+
+    def _fan_out(
+        self, room_key: str, payload: str, coalesce_key: Optional[str] = None
+    ) -> None:
+        """Queue a serialized payload for every connection in a room."""
+        room = self.rooms.get(room_key)
+        if not room:
+            return
+        self.room_metrics[room_key].broadcasts += 1
+        # Snapshot: a full queue may disconnect a client mid-loop
+        for connection in list(room.values()):
+            connection.enqueue(payload, coalesce_key)
 
-        self.active_connections[room_key].add(websocket)
-        logger.info(f"Client connected to {room_key}. Total connections: {len(self.active_connections[room_key])}")
+    async def connect(self, websocket: WebSocket, entity_type: str, entity_id: str):
+        """Accept new WebSocket connection and add to room."""
+        await self._join(websocket, self._get_room_key(entity_type, entity_id))
 
     def disconnect(self, websocket: WebSocket, entity_type: str, entity_id: str):
         """Remove WebSocket connection from room."""
+        self._leave(websocket, self._get_room_key(entity_type, entity_id))
+
+    async def broadcast(
+        self,
+        entity_type: str,
+        entity_id: str,
+        message: dict,
+        coalesce_key: Optional[str] = None,
+    ):
+        """Broadcast message to all clients in room without waiting on sends."""
         room_key = self._get_room_key(entity_type, entity_id)
+        if room_key in self.rooms or self._backend is not None:
+            self._publish(room_key, serialize_message(message), coalesce_key)
 
-        if room_key in self.active_connections:
-            self.active_connections[room_key].discard(websocket)
-            logger.info(f"Client disconnected from {room_key}. Total connections: {len(self.active_connections[room_key])}")
-
-            # Clean up empty rooms
-            if not self.active_connections[room_key]:
-                del self.active_connections[room_key]
-
-    async def broadcast(self, entity_type: str, entity_id: str, message: dict):
-        """Broadcast message to all clients in room."""
-        room_key = self._get_room_key(entity_type, entity_id)
-
-        if room_key not in self.active_connections:
-            return
-
-        # Get snapshot of connections to avoid modification during iteration
-        connections = list(self.active_connections[room_key])
-        disconnected = []
+    async def send_personal(self, websocket: WebSocket, message: Any):
+        """Queue a message (dict, or text such as "pong") for one client.
 
-        for connection in connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error sending message to client: {e}")
-                disconnected.append(connection)
-
-        # Clean up disconnected clients
-        for connection in disconnected:
-            self.active_connections[room_key].discard(connection)
+        Going through the client's queue keeps it ordered with broadcasts.
+        """
+        payload = message if isinstance(message, str) else serialize_message(message)
+        for room in self.rooms.values():
+            connection = room.get(websocket)
+            if connection is not None:
+                connection.enqueue(payload)
+                return
 
     async def send_comment_created(self, entity_type: str, entity_id: str, comment_data: dict):
         """Send comment created event to all clients in room."""
@@ -94,46 +330,31 @@ class ConnectionManager:
         await self.broadcast(entity_type, entity_id, {
             "type": "ai_typing_start",
             "data": {"author_name": author_name}
-        })
+        }, coalesce_key=f"typing:{author_name}")
 
     async def send_ai_typing_stop(self, entity_type: str, entity_id: str, author_name: str = "Claude"):
         """Send AI typing stop event to all clients in room."""
         await self.broadcast(entity_type, entity_id, {
             "type": "ai_typing_stop",
             "data": {"author_name": author_name}
-        })
+        }, coalesce_key=f"typing:{author_name}")
 
     # Global Agent Activity Methods
 
     async def connect_agent_activity(self, websocket: WebSocket):
         """Connect client to global agent activity stream."""
-        await websocket.accept()
-        self.agent_activity_connections.add(websocket)
-        logger.info(f"Client connected to agent activity. Total: {len(self.agent_activity_connections)}")
+        await self._join(websocket, AGENT_ACTIVITY_ROOM)
 
     def disconnect_agent_activity(self, websocket: WebSocket):
         """Disconnect client from global agent activity stream."""
-        self.agent_activity_connections.discard(websocket)
-        logger.info(f"Client disconnected from agent activity. Total: {len(self.agent_activity_connections)}")
+        self._leave(websocket, AGENT_ACTIVITY_ROOM)
 
-    async def broadcast_agent_activity(self, message: dict):
+    async def broadcast_agent_activity(
+        self, message: dict, coalesce_key: Optional[str] = None
+    ):
         """Broadcast message to all agent activity subscribers."""
-        if not self.agent_activity_connections:
-            return
-
-        connections = list(self.agent_activity_connections)
-        disconnected = []
-
-        for connection in connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error sending agent activity to client: {e}")
-                disconnected.append(connection)
-
-        # Clean up disconnected clients
-        for connection in disconnected:
-            self.agent_activity_connections.discard(connection)
+        if AGENT_ACTIVITY_ROOM in self.rooms or self._backend is not None:
+            self._publish(AGENT_ACTIVITY_ROOM, serialize_message(message), coalesce_key)
 
     async def send_agent_started(self, session_data: dict):
         """Broadcast agent session started event."""
@@ -147,7 +368,7 @@ class ConnectionManager:
         await self.broadcast_agent_activity({
             "type": "agent_status_update",
             "data": session_data
-        })
+        }, coalesce_key=f"agent_status:{session_data.get('session_id')}")
 
     async def send_agent_completed(self, session_data: dict):
         """Broadcast agent session completed event."""
@@ -163,6 +384,18 @@ class ConnectionManager:
             "data": session_data
         })
 
+    # Metrics
+
+    def get_metrics(self) -> dict:
+        """Per-room and per-connection delivery counters."""
+        return {
+            room_key: {
+                **asdict(self.room_metrics[room_key]),
+                "connections": [asdict(c.metrics) for c in room.values()],
+            }
+            for room_key, room in self.rooms.items()
+        }
+
 
 # Global singleton instance
 manager = ConnectionManager()
@@ -0,0 +1,392 @@
+"""Incremental writers and readers for workspace export files.
+
+Writers receive rows one batch at a time and flush after each batch, so an
+export never holds more than one batch in memory. Readers yield
+``(entity_type, record)`` pairs lazily for the import path.
+"""
+
+from abc import ABC, abstractmethod
+import csv
+from collections.abc import Iterator, Sequence
+import json
+from pathlib import Path
+from typing import Any, TextIO
+
+from sqlalchemy import Boolean, Column, DateTime, Float, Integer
+
+# Marks which entity an NDJSON line belongs to
+ENTITY_FIELD = "_entity"
+
+PARQUET_COMPRESSION = "zstd"
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize datetimes as ISO 8601 and anything else (UUIDs) as text."""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _text_value(value: Any) -> Any:
+    """Flatten a column value for CSV and Parquet string columns."""
+    if value is None:
+        return None
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=_json_default)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def _project(row: dict[str, Any], names: list[str]) -> dict[str, Any]:
+    """The row's values for ``names``, in that order."""
+    return {name: row.get(name) for name in names}
+
+
+def entity_file_path(output_path: Path, entity_type: str) -> Path:
+    """Per-entity file next to ``output_path``, e.g. ``export_issues.csv``."""
+    return output_path.with_name(
+        f"{output_path.stem}_{entity_type}{output_path.suffix}"
+    )
+
+
+def infer_entity_type(path: Path, default: str = "projects") -> str:
+    """Recover the entity type from a per-entity file name."""
+    for entity_type in ("projects", "issues", "documents", "tags"):
+        if path.stem.endswith(f"_{entity_type}"):
+            return entity_type
+    return default
+
+
+class ExportWriter(ABC):
+    """Base writer: ``start`` an entity section, ``write`` batches, ``close``."""
+
+    def __init__(self, output_path: Path, metadata: dict[str, Any]):
+        self.output_path = output_path
+        self.metadata = metadata
+        self.files: list[Path] = []
+
+    @abstractmethod
+    def start(self, entity_type: str, columns: Sequence[Column]) -> None:
+        """Begin writing rows of ``entity_type`` with the given columns."""
+        pass
+
+    @abstractmethod
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        """Append one batch of rows to the current section."""
+        pass
+
+    def close(self) -> None:
+        """Finish the current section and close open files."""
+
+    def __enter__(self) -> "ExportWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class _SingleFileWriter(ExportWriter):
+    """Writer for formats that put every entity type into one file."""
+
+    def __init__(self, output_path: Path, metadata: dict[str, Any]):
+        super().__init__(output_path, metadata)
+        self._file: TextIO = open(output_path, "w", encoding="utf-8")
+        self.files.append(output_path)
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+
+class JSONExportWriter(_SingleFileWriter):
+    """One JSON object with a list per entity type, written as a stream."""
+
+    def __init__(self, output_path: Path, metadata: dict[str, Any]):
+        super().__init__(output_path, metadata)
+        self._file.write('{\n  "metadata": ')
+        self._file.write(json.dumps(metadata, default=_json_default))
+        self._in_section = False
+        self._first_row = True
+        self._names: list[str] = []
+
+    def start(self, entity_type: str, columns: Sequence[Column]) -> None:
+        self._end_section()
+        self._file.write(f',\n  "{entity_type}": [')
+        self._in_section = True
+        self._first_row = True
+        self._names = [column.name for column in columns]
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        for row in rows:
+            self._file.write("\n    " if self._first_row else ",\n    ")
+            self._file.write(
+                json.dumps(_project(row, self._names), default=_json_default)
+            )
+            self._first_row = False
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._end_section()
+            self._file.write("\n}\n")
+        super().close()
+
+    def _end_section(self) -> None:
+        if self._in_section:
+            self._file.write("]" if self._first_row else "\n  ]")
+            self._in_section = False
+
+
+class NDJSONExportWriter(_SingleFileWriter):
+    """One JSON object per line, tagged with its entity type."""
+
+    def __init__(self, output_path: Path, metadata: dict[str, Any]):
+        super().__init__(output_path, metadata)
+        self._file.write(
+            json.dumps({ENTITY_FIELD: "metadata", **metadata}, default=_json_default)
+            + "\n"
+        )
+        self._entity_type = ""
+        self._names: list[str] = []
+
+    def start(self, entity_type: str, columns: Sequence[Column]) -> None:
+        self._entity_type = entity_type
+        self._names = [column.name for column in columns]
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self._file.writelines(
+            json.dumps(
+                {ENTITY_FIELD: self._entity_type, **_project(row, self._names)},
+                default=_json_default,
+            )
+            + "\n"
+            for row in rows
+        )
+        self._file.flush()
+
+
+class TextExportWriter(_SingleFileWriter):
+    """Human-readable summary of each entity."""
+
+    FIELDS = {
+        "projects": ["name", "description", "status", "priority", "completion_percentage"],
+        "issues": ["title", "description", "status", "priority", "type", "assignee"],
+        "documents": ["title", "type", "content"],
+        "tags": ["name", "color", "description"],
+    }
+
+    def __init__(self, output_path: Path, metadata: dict[str, Any]):
+        super().__init__(output_path, metadata)
+        self._file.write("Turbo Workspace Export\n")
+        self._file.write(f"Export Date: {metadata['export_date']}\n")
+        self._file.write(f"Export Type: {metadata['export_type']}\n")
+        self._file.write("=" * 50 + "\n\n")
+        self._fields: list[str] = []
+
+    def start(self, entity_type: str, columns: Sequence[Column]) -> None:
+        names = {column.name for column in columns}
+        self._fields = [f for f in self.FIELDS[entity_type] if f in names]
+        self._file.write(f"{entity_type.upper()}\n")
+        self._file.write("-" * 20 + "\n")
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        for row in rows:
+            for name in self._fields:
+                label = name.replace("_", " ").title()
+                if name == "content":
+                    self._file.write(f"{label}:\n{row[name]}\n")
+                else:
+                    self._file.write(f"{label}: {row[name]}\n")
+            self._file.write("\n")
+        self._file.flush()
+
+
+class CSVExportWriter(ExportWriter):
+    """CSV, one file per entity type when more than one type is exported."""
+
+    def __init__(
+        self, output_path: Path, metadata: dict[str, Any], split_files: bool = False
+    ):
+        super().__init__(output_path, metadata)
+        self._split_files = split_files
+        self._file: TextIO | None = None
+        self._writer: csv.DictWriter | None = None
+
+    def start(self, entity_type: str, columns: Sequence[Column]) -> None:
+        self.close()
+        path = (
+            entity_file_path(self.output_path, entity_type)
+            if self._split_files
+            else self.output_path
+        )
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=[c.name for c in columns])
+        self._writer.writeheader()
+        self.files.append(path)
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self._writer.writerows(
+            {k: _text_value(v) for k, v in row.items()} for row in rows
+        )
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file and not self._file.closed:
+            self._file.close()
+
+
+def _arrow_type(column: Column) -> Any:
+    """Parquet column type; UUIDs, JSON and text are stored as strings."""
+    import pyarrow as pa
+
+    if isinstance(column.type, Boolean):
+        return pa.bool_()
+    if isinstance(column.type, Integer):
+        return pa.int64()
+    if isinstance(column.type, Float):
+        return pa.float64()
+    if isinstance(column.type, DateTime):
+        return pa.timestamp("us", tz="UTC")
+    return pa.string()
+
+
+class ParquetExportWriter(ExportWriter):
+    """Compressed columnar export, one row group per batch.
+
+    Requires pyarrow, the engine pandas uses for Parquet.
+    """
+
+    def __init__(
+        self, output_path: Path, metadata: dict[str, Any], split_files: bool = False
+    ):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise RuntimeError(
+                "Parquet export requires pyarrow: pip install 'turbo[parquet]'"
+            ) from e
+        super().__init__(output_path, metadata)
+        self._split_files = split_files
+        self._writer: Any = None
+        self._schema: Any = None
+
+    def start(self, entity_type: str, columns: Sequence[Column]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.close()
+        path = (
+            entity_file_path(self.output_path, entity_type)
+            if self._split_files
+            else self.output_path
+        )
+        self._schema = pa.schema(
+            [pa.field(c.name, _arrow_type(c), nullable=True) for c in columns],
+            metadata={"entity_type": entity_type},
+        )
+        self._writer = pq.ParquetWriter(
+            path, self._schema, compression=PARQUET_COMPRESSION
+        )
+        self.files.append(path)
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        import pyarrow as pa
+
+        if not rows:
+            return
+        strings = {
+            field.name for field in self._schema if pa.types.is_string(field.type)
+        }
+        table = pa.Table.from_pylist(
+            [
+                {k: _text_value(v) if k in strings else v for k, v in row.items()}
+                for row in rows
+            ],
+            schema=self._schema,
+        )
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def open_export_writer(
+    export_format: str, output_path: Path, metadata: dict[str, Any], split_files: bool
+) -> ExportWriter:
+    """Create the writer for ``export_format``.
+
+    ``split_files`` applies to CSV and Parquet, which hold a single table
+    per file.
+    """
+    if export_format == "json":
+        return JSONExportWriter(output_path, metadata)
+    if export_format == "ndjson":
+        return NDJSONExportWriter(output_path, metadata)
+    if export_format == "txt":
+        return TextExportWriter(output_path, metadata)
+    if export_format == "csv":
+        return CSVExportWriter(output_path, metadata, split_files)
+    if export_format == "parquet":
+        return ParquetExportWriter(output_path, metadata, split_files)
+    raise ValueError(f"Unsupported export format: {export_format}")
+
+
+def read_import_records(
+    path: Path, import_type: str = "all", batch_size: int = 500
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield ``(entity_type, record)`` pairs from an export file.
+
+    NDJSON, CSV and Parquet are read incrementally. JSON exports are a single
+    document and are loaded whole. CSV and Parquet files hold one entity
+    type, taken from ``import_type`` or else from the file name.
+
+    Raises:
+        ValueError: If the file extension is not a supported format
+    """
+    suffix = path.suffix.lower()
+    file_type = import_type if import_type != "all" else infer_entity_type(path)
+
+    if suffix == ".json":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        for entity_type, records in data.items():
+            if entity_type != "metadata" and isinstance(records, list):
+                for record in records:
+                    yield entity_type, record
+
+    elif suffix in (".ndjson", ".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                entity_type = record.pop(ENTITY_FIELD, file_type)
+                if entity_type != "metadata":
+                    yield entity_type, record
+
+    elif suffix == ".csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            for record in csv.DictReader(f):
+                yield file_type, record
+
+    elif suffix == ".parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError(
+                "Parquet import requires pyarrow: pip install 'turbo[parquet]'"
+            ) from e
+        parquet_file = pq.ParquetFile(path)
+        schema_metadata = parquet_file.schema_arrow.metadata or {}
+        entity_type = schema_metadata.get(b"entity_type", b"").decode() or file_type
+        for batch in parquet_file.iter_batches(batch_size=batch_size):
+            for record in batch.to_pylist():
+                yield entity_type, record
+
+    else:
+        raise ValueError(f"Unsupported file format: {path.suffix}")
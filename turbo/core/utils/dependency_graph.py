@@ -0,0 +1,128 @@
+"""In-memory issue dependency graph utilities."""
+
+from collections import defaultdict, deque
+from collections.abc import Iterable
+from uuid import UUID
+
+
+class DependencyGraph:
+    """
+    Adjacency view of the ``issue_dependencies`` table.
+
+    Edges point from the blocking issue to the blocked issue, so an issue's
+    "dependents" are the issues it blocks and its "blockers" are the issues
+    that block it.
+    """
+
+    def __init__(self, edges: Iterable[tuple[UUID, UUID]] = ()) -> None:
+        self._dependents: dict[UUID, set[UUID]] = defaultdict(set)
+        self._blockers: dict[UUID, set[UUID]] = defaultdict(set)
+        for blocking_id, blocked_id in edges:
+            self.add_edge(blocking_id, blocked_id)
+
+    def add_edge(self, blocking_id: UUID, blocked_id: UUID) -> None:
+        """Record that ``blocking_id`` blocks ``blocked_id``."""
+        self._dependents[blocking_id].add(blocked_id)
+        self._blockers[blocked_id].add(blocking_id)
+
+    def remove_edge(self, blocking_id: UUID, blocked_id: UUID) -> None:
+        """Remove a dependency edge if present."""
+        self._dependents.get(blocking_id, set()).discard(blocked_id)
+        self._blockers.get(blocked_id, set()).discard(blocking_id)
+
+    def blockers_of(self, issue_id: UUID) -> set[UUID]:
+        """Issues that directly block the given issue."""
+        return set(self._blockers.get(issue_id, ()))
+
+    def dependents_of(self, issue_id: UUID) -> set[UUID]:
+        """Issues directly blocked by the given issue."""
+        return set(self._dependents.get(issue_id, ()))
+
+    def ancestors(self, issue_id: UUID) -> set[UUID]:
+        """Every issue that transitively blocks the given issue."""
+        return self._reachable(issue_id, self._blockers)
+
+    def descendants(self, issue_id: UUID) -> set[UUID]:
+        """Every issue the given issue transitively blocks."""
+        return self._reachable(issue_id, self._dependents)
+
+    def has_path(self, from_issue: UUID, to_issue: UUID) -> bool:
+        """Whether ``from_issue`` transitively blocks ``to_issue`` (or is it)."""
+        return from_issue == to_issue or to_issue in self.descendants(from_issue)
+
+    @staticmethod
+    def _reachable(start: UUID, adjacency: dict[UUID, set[UUID]]) -> set[UUID]:
+        """Iterative breadth-first traversal, safe on deep chains and cycles."""
+        seen: set[UUID] = set()
+        queue = deque(adjacency.get(start, ()))
+        while queue:
+            node = queue.popleft()
+            if node in seen:
+                continue
+            seen.add(node)
+            queue.extend(adjacency.get(node, ()))
+        seen.discard(start)
+        return seen
+
+    @property
+    def nodes(self) -> set[UUID]:
+        """Every issue that appears in at least one edge."""
+        return {n for n, edges in self._dependents.items() if edges} | {
+            n for n, edges in self._blockers.items() if edges
+        }
+
+    def descendant_counts(self) -> dict[UUID, int]:
+        """
+        Count the issues each issue transitively blocks.
+
+        Reachability sets are accumulated as integer bitsets in reverse
+        topological order, so the whole graph is processed in one pass.
+
+        Returns:
+            Mapping of issue ID to number of distinct downstream issues
+        """
+        nodes = list(self.nodes)
+        bit = {node: 1 << index for index, node in enumerate(nodes)}
+        reach: dict[UUID, int] = {}
+
+        for node in reversed(self.topological_order(nodes)):
+            mask = 0
+            for child in self._dependents.get(node, ()):
+                mask |= bit[child] | reach.get(child, 0)
+            reach[node] = mask
+
+        return {node: mask.bit_count() for node, mask in reach.items()}
+
+    def topological_order(self, nodes: Iterable[UUID] | None = None) -> list[UUID]:
+        """
+        Order issues so every blocker comes before the issues it blocks.
+
+        Uses Kahn's algorithm. Should the data contain a cycle, the issues on
+        it are appended at the end in arbitrary order rather than dropped.
+
+        Args:
+            nodes: Issues to order (defaults to every issue in the graph)
+
+        Returns:
+            Issue IDs in dependency order
+        """
+        selected = set(self.nodes if nodes is None else nodes)
+        in_degree = {
+            node: len(self._blockers.get(node, set()) & selected) for node in selected
+        }
+        ready = [node for node, degree in in_degree.items() if degree == 0]
+        order: list[UUID] = []
+
+        while ready:
+            node = ready.pop()
+            order.append(node)
+            for child in self._dependents.get(node, ()):
+                if child in in_degree:
+                    in_degree[child] -= 1
+                    if in_degree[child] == 0:
+                        ready.append(child)
+
+        if len(order) < len(selected):
+            placed = set(order)
+            order.extend(node for node in selected if node not in placed)
+        return order
@@ -30,6 +30,8 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Keyset-paginated list endpoints return the next page's cursor here
+        expose_headers=["X-Next-Cursor"],
     )
 
     # Add API routes
@@ -49,11 +51,36 @@ def create_app() -> FastAPI:
 
     @app.on_event("startup")
     async def startup_event():
-        """Initialize database and agent tracker on startup."""
+        """Initialize database, agent tracker, broadcast backend, memory access buffer and webhook dispatcher on startup."""
         from turbo.core.database import init_database
         from turbo.core.services.agent_activity import tracker
+        from turbo.core.services.broadcast_backend import get_broadcast_backend
+        from turbo.core.services.conversation_memory import memory_access_buffer
+        from turbo.core.services.webhook_dispatcher import webhook_dispatcher
+        from turbo.core.services.websocket_manager import manager
         await init_database()
         await tracker.start()
+        backend = get_broadcast_backend()
+        manager.bind_backend(backend)
+        tracker.bind_backend(backend)
+        await backend.start()
+        await memory_access_buffer.start()
+        if settings.webhook.dispatcher_enabled:
+            await webhook_dispatcher.start()
+
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        """Stop background workers and release pooled outbound HTTP connections."""
+        from turbo.core.services.broadcast_backend import get_broadcast_backend
+        from turbo.core.services.conversation_memory import memory_access_buffer
+        from turbo.core.services.streaming import memory_extraction_worker
+        from turbo.core.services.webhook_dispatcher import webhook_dispatcher
+        from turbo.utils.http_client import close_http_client
+        await webhook_dispatcher.stop()
+        await get_broadcast_backend().stop()
+        await memory_extraction_worker.stop()
+        await memory_access_buffer.stop()
+        await close_http_client()
 
     # Mount documentation if site directory exists
     site_dir = Path("site")
@@ -13,6 +13,7 @@ class DatabaseSettings(BaseSettings):
     echo: bool = False
     pool_size: int = 5
     max_overflow: int = 10
+    dependency_graph_cache: bool = False  # Cache issue_dependencies adjacency in-process
 
     model_config = {"env_prefix": "DATABASE_", "env_file": ".env", "extra": "ignore"}
 
@@ -98,10 +99,77 @@ class GraphSettings(BaseSettings):
     database: str = "neo4j"
     embedding_model: str = "all-MiniLM-L6-v2"  # Fast, high-quality embeddings
     enabled: bool = True
+    use_vector_index: bool = True  # Native Neo4j vector index (5.11+), else local ANN
+    vector_index_name: str = "entity_embedding"
 
     model_config = {"env_prefix": "NEO4J_", "env_file": ".env", "extra": "ignore"}
 
 
+class EmbeddingSettings(BaseSettings):
+    """Shared sentence embedding service configuration settings."""
+
+    model: str = "all-MiniLM-L6-v2"
+    cache_size: int = 10000  # Vectors kept in the in-memory LRU
+    disk_cache: bool = True
+    cache_dir: str = ".turbo/embeddings"
+    batch_size: int = 64
+    batch_window_ms: float = 5.0  # Time to coalesce concurrent requests
+    workers: int = 1
+
+    model_config = {"env_prefix": "EMBEDDING_", "env_file": ".env", "extra": "ignore"}
+
+
+class SearchSettings(BaseSettings):
+    """Hybrid (full-text + semantic) search configuration settings."""
+
+    rrf_k: int = 60  # Reciprocal rank fusion damping constant
+    candidate_pool: int = 50  # Top-k taken from each ranker before fusion
+    semantic_min_relevance: float = 0.3
+    cache_ttl_seconds: float = 30.0
+    cache_size: int = 256
+
+    model_config = {"env_prefix": "SEARCH_", "env_file": ".env", "extra": "ignore"}
+
+
+class TranscriptionSettings(BaseSettings):
+    """Podcast transcription worker pool configuration settings."""
+
+    num_workers: int = 0  # Worker processes; 0 = CPU cores // cpu_threads
+    cpu_threads: int = 2  # CTranslate2 threads per worker process
+    prefetch: int = 0  # Episodes downloaded ahead of the workers; 0 = num_workers
+
+    model_config = {"env_prefix": "TRANSCRIPTION_", "env_file": ".env", "extra": "ignore"}
+
+
+class WebhookSettings(BaseSettings):
+    """Webhook outbox dispatcher configuration settings."""
+
+    dispatcher_enabled: bool = True
+    max_in_flight: int = 50  # Deliveries being sent at once across all endpoints
+    max_per_endpoint: int = 4  # Concurrent requests to one webhook URL
+    max_batch_size: int = 20  # Events per request for webhooks with batch_events
+    poll_interval: float = 5.0  # Seconds between outbox scans when idle
+    lease_seconds: int = 300  # Claimed deliveries are retried after this if unfinished
+    retry_base_seconds: int = 60  # First retry delay; doubles per attempt
+    retry_max_seconds: int = 3600
+
+    model_config = {"env_prefix": "WEBHOOK_", "env_file": ".env", "extra": "ignore"}
+
+
+class WebSocketSettings(BaseSettings):
+    """WebSocket broadcast configuration settings."""
+
+    send_queue_size: int = 256  # Outbound messages buffered per connection
+    slow_consumer_policy: str = "drop_oldest"  # drop_oldest | disconnect
+    send_timeout: float = 10.0  # A single send taking longer drops the client
+    broadcast_backend: str = "memory"  # memory | postgres | unix (for multiple workers)
+    broadcast_channel: str = "turbo_broadcast"  # NOTIFY channel for the postgres backend
+    broadcast_socket_path: str = "/tmp/turbo-broadcast.sock"  # Relay for the unix backend
+    broadcast_queue_size: int = 10000  # Messages waiting to be published to peers
+
+    model_config = {"env_prefix": "WEBSOCKET_", "env_file": ".env", "extra": "ignore"}
+
+
 class LLMSettings(BaseSettings):
     """LLM (Ollama) configuration settings."""
 
@@ -140,6 +208,11 @@ class Settings(BaseSettings):
     security: SecuritySettings = SecuritySettings()
     features: FeatureSettings = FeatureSettings()
     graph: GraphSettings = GraphSettings()
+    embedding: EmbeddingSettings = EmbeddingSettings()
+    search: SearchSettings = SearchSettings()
+    transcription: TranscriptionSettings = TranscriptionSettings()
+    webhook: WebhookSettings = WebhookSettings()
+    websocket: WebSocketSettings = WebSocketSettings()
     llm: LLMSettings = LLMSettings()
     anthropic: AnthropicSettings = AnthropicSettings()
 
@@ -6,18 +6,23 @@ from typing import Optional
 from urllib.parse import urlparse
 
 import feedparser
-import httpx
 from bs4 import BeautifulSoup
 from readability import Document
 
+from turbo.utils.http_client import get_http_client
+
 
 async def fetch_rss_feed(feed_url: str) -> list[dict]:
     """Fetch and parse RSS feed."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(feed_url)
-        response.raise_for_status()
+    response = await get_http_client().get(feed_url)
+    response.raise_for_status()
 
     feed = feedparser.parse(response.text)
+    return parse_feed_articles(feed, feed_url)
+
+
+def parse_feed_articles(feed: feedparser.FeedParserDict, feed_url: str) -> list[dict]:
+    """Convert parsed feed entries to literature article dicts."""
     articles = []
 
     for entry in feed.entries:
@@ -38,15 +43,9 @@ async def fetch_rss_feed(feed_url: str) -> list[dict]:
 
 async def extract_article_content(url: str) -> dict:
     """Extract clean article content from URL using readability."""
-    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-        response = await client.get(
-            url,
-            headers={
-                "User-Agent": "Mozilla/5.0 (compatible; TurboBot/1.0; +https://turbo.dev)"
-            },
-        )
-        response.raise_for_status()
-        html = response.text
+    response = await get_http_client().get(url)
+    response.raise_for_status()
+    html = response.text
 
     # Use readability to extract main content
     doc = Document(html)
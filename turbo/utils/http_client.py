@@ -0,0 +1,42 @@
+"""Shared pooled HTTP client for outbound fetches."""
+
+import asyncio
+import weakref
+
+import httpx
+
+USER_AGENT = "Mozilla/5.0 (compatible; TurboBot/1.0; +https://turbo.dev)"
+DEFAULT_TIMEOUT = 30.0
+
+# One client per event loop: httpx connection pools are bound to the loop
+# they were created on, and tests or CLI commands may run several loops.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the pooled client for the running event loop, creating it on first use.
+
+    The client follows redirects and keeps connections alive between calls,
+    so repeated fetches to the same host reuse TLS sessions. Callers must
+    not close it; use :func:`close_http_client` at shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            follow_redirects=True,
+            headers={"User-Agent": USER_AGENT},
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the pooled client for the running event loop, if any."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()